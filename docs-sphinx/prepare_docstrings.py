@@ -295,6 +295,7 @@ for filename in sorted(glob.glob("../src/awkward1/**/*.py", recursive=True),
                         "ak.layout.ArrayGenerator.rst",
                         "ak.layout.SliceGenerator.rst",
                         "ak.layout.ArrayCache.rst",
+                        "ak.layout.LRUArrayCache.rst",
                         "ak.layout.Iterator.rst",
                         "ak.layout.ArrayBuilder.rst",
                         "ak.layout.Index.rst",
@@ -3,6 +3,7 @@
 #ifndef AWKWARD_REDUCER_H_
 #define AWKWARD_REDUCER_H_
 
+#include <functional>
 #include <memory>
 
 #include "awkward/Index.h"
@@ -34,6 +35,66 @@ namespace awkward {
     virtual bool
       returns_positions() const;
 
+    /// @brief Function that applies a reducer to the data starting at
+    /// element `dataoffset`, grouped by `parents`, for #apply_parallel.
+    typedef std::function<const std::shared_ptr<void>(
+      int64_t dataoffset,
+      const Index64& parents,
+      int64_t outlength)> ApplyFunction;
+
+    /// @brief Applies `apply` (which calls one of the `apply_*` methods)
+    /// to all of the data, possibly splitting the work across threads.
+    ///
+    /// @param apply Function that reduces a range of the data.
+    /// @param parents An integer array indicating which group each element
+    /// belongs to.
+    /// @param outlength The length of the output array (equal to the number
+    /// of groups).
+    /// @param given_dtype The dtype of the data, used to determine the
+    /// #return_dtype of the output.
+    ///
+    /// If #parallel_threads is greater than `1`, `parents` has at least
+    /// #parallel_threshold elements, and `parents` is non-decreasing (as it
+    /// is for all reductions over a list's contiguous content), the
+    /// parent-index space is split into contiguous ranges with about the
+    /// same number of elements each. Each thread reduces its range into a
+    /// partial output and the partial outputs are merged into the final
+    /// output, with index positions adjusted for reducers that
+    /// #returns_positions. Otherwise, `apply` is called once on the whole
+    /// array.
+    const std::shared_ptr<void>
+      apply_parallel(const ApplyFunction& apply,
+                     const Index64& parents,
+                     int64_t outlength,
+                     util::dtype given_dtype) const;
+
+    /// @brief The maximum number of threads used by #apply_parallel, as
+    /// set by #set_parallel; `1` (the default) means that all reducers run
+    /// serially and `0` means one thread per hardware thread.
+    static int64_t
+      parallel_threads();
+
+    /// @brief The #parallel_threads with `0` resolved to the number of
+    /// hardware threads (`std::thread::hardware_concurrency`).
+    static int64_t
+      parallel_numthreads();
+
+    /// @brief The minimum number of elements for which #apply_parallel
+    /// uses more than one thread.
+    static int64_t
+      parallel_threshold();
+
+    /// @brief Sets the #parallel_threads and #parallel_threshold for all
+    /// reducers.
+    ///
+    /// @param threads The maximum number of threads; `0` means the number
+    /// of hardware threads (`std::thread::hardware_concurrency`) and `1`
+    /// means serial execution.
+    /// @param threshold The minimum number of elements for which more than
+    /// one thread is used.
+    static void
+      set_parallel(int64_t threads, int64_t threshold);
+
     /// @brief Apply the reducer algorithm to an array of boolean values.
     ///
     /// @param data The array to reduce.
@@ -554,6 +554,38 @@ namespace awkward {
     const ContentPtr
       numbers_to_type(const std::string& name) const override;
 
+    /// @brief The maximum number of threads used to sort or argsort the
+    /// lists of a NumpyArray, as set by #set_sort_parallel; `1` (the
+    /// default) means that all sorting is serial and `0` means one thread
+    /// per hardware thread.
+    ///
+    /// Lists (the ranges between changes of `parents` in #sort_next and
+    /// #argsort_next) are distributed among threads in contiguous groups
+    /// with about the same number of elements each; each list is sorted
+    /// entirely within one thread.
+    static int64_t
+      sort_parallel_threads();
+
+    /// @brief The #sort_parallel_threads with `0` resolved to the number of
+    /// hardware threads (`std::thread::hardware_concurrency`).
+    static int64_t
+      sort_parallel_numthreads();
+
+    /// @brief The minimum number of elements for which sorting uses more
+    /// than one thread.
+    static int64_t
+      sort_parallel_threshold();
+
+    /// @brief Sets the #sort_parallel_threads and #sort_parallel_threshold.
+    ///
+    /// @param threads The maximum number of threads; `0` means the number
+    /// of hardware threads (`std::thread::hardware_concurrency`) and `1`
+    /// means serial execution.
+    /// @param threshold The minimum number of elements for which more than
+    /// one thread is used.
+    static void
+      set_sort_parallel(int64_t threads, int64_t threshold);
+
   protected:
     /// @brief Internal function to merge two byte arrays without promoting
     /// the types to int64.
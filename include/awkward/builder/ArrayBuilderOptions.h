@@ -22,7 +22,9 @@ namespace awkward {
     /// @param resize The factor with which a GrowableBuffer is resized
     /// when its {@link GrowableBuffer#length length} reaches its
     /// {@link GrowableBuffer#reserved reserved}.
-    ArrayBuilderOptions(int64_t initial, double resize);
+    /// @param chunked If true, a GrowableBuffer grows by adding panels
+    /// instead of reallocating and copying; see #chunked.
+    ArrayBuilderOptions(int64_t initial, double resize, bool chunked = false);
 
     /// @brief The initial number of
     /// {@link GrowableBuffer#reserved reserved} entries for a GrowableBuffer.
@@ -35,11 +37,28 @@ namespace awkward {
     double
       resize() const;
 
+    /// @brief If true, a GrowableBuffer that runs out of space allocates a
+    /// new panel for the additional
+    /// {@link ArrayBuilderOptions#resize resize} fraction of its
+    /// {@link GrowableBuffer#reserved reserved} and leaves the old data in
+    /// place, rather than allocating a larger buffer and copying the old data
+    /// into it.
+    ///
+    /// The panels are concatenated (and released, one by one) the first time
+    /// a contiguous {@link GrowableBuffer#ptr ptr} is needed, such as in
+    /// {@link ArrayBuilder#snapshot ArrayBuilder::snapshot}, so each item is
+    /// copied once, rather than a logarithmic number of times, and the peak
+    /// memory use is close to the size of the final buffer.
+    bool
+      chunked() const;
+
   private:
     /// See #initial.
     int64_t initial_;
     /// See #resize.
     double resize_;
+    /// See #chunked.
+    bool chunked_;
   };
 }
 
@@ -5,6 +5,7 @@
 
 #include <cmath>
 #include <cstring>
+#include <vector>
 
 #include "awkward/common.h"
 #include "awkward/builder/ArrayBuilderOptions.h"
@@ -39,6 +40,11 @@ namespace awkward {
   /// delete or take advantage of. However, many operations require buffers
   /// to be rewritten; under normal circumstances, it would soon be replaced
   /// by a more appropriately sized buffer.
+  ///
+  /// If {@link ArrayBuilderOptions#chunked ArrayBuilderOptions::chunked} is
+  /// true, the GrowableBuffer does not reallocate as it grows: it keeps a
+  /// list of full panels and appends to a new one, and the panels are
+  /// concatenated only when a contiguous #ptr is requested.
   template <typename T>
   class LIBAWKWARD_EXPORT_SYMBOL GrowableBuffer {
   public:
@@ -102,6 +108,10 @@ namespace awkward {
     GrowableBuffer(const ArrayBuilderOptions& options);
 
     /// @brief Reference-counted pointer to the array buffer.
+    ///
+    /// If the data are in more than one panel (see
+    /// {@link ArrayBuilderOptions#chunked ArrayBuilderOptions::chunked}),
+    /// they are first concatenated into a single buffer.
     const std::shared_ptr<T>
       ptr() const;
 
@@ -158,13 +168,29 @@ namespace awkward {
       getitem_at_nowrap(int64_t at) const;
 
   private:
+    /// @brief Moves the full #ptr_ into #panels_ and allocates a new panel
+    /// for the next `resize - 1` fraction of the #length.
+    void
+      addpanel();
+
+    /// @brief Concatenates #panels_ and #ptr_ into a single buffer.
+    void
+      concatenate() const;
+
     const ArrayBuilderOptions options_;
-    // @brief See #ptr.
-    std::shared_ptr<T> ptr_;
+    // @brief See #ptr; if there are #panels_, this is only the last panel.
+    mutable std::shared_ptr<T> ptr_;
     // @brief See #length.
     int64_t length_;
-    // @brief See #reserved.
-    int64_t reserved_;
+    // @brief Number of elements allocated in #ptr_.
+    mutable int64_t reserved_;
+    // @brief Full panels that precede #ptr_ (only if
+    // ArrayBuilderOptions::chunked).
+    mutable std::vector<std::shared_ptr<T>> panels_;
+    // @brief Number of elements in each of the #panels_.
+    mutable std::vector<int64_t> panel_lengths_;
+    // @brief Total number of elements in #panels_.
+    mutable int64_t panels_length_;
   };
 }
 
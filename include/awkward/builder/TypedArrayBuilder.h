@@ -0,0 +1,261 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+#ifndef AWKWARD_TYPEDARRAYBUILDER_H_
+#define AWKWARD_TYPEDARRAYBUILDER_H_
+
+#include <string>
+#include <vector>
+
+#include "awkward/common.h"
+#include "awkward/Content.h"
+#include "awkward/builder/ArrayBuilderOptions.h"
+
+namespace awkward {
+  /// @class TypedArrayBuilder
+  ///
+  /// @brief Counterpart of ArrayBuilder for data whose structure is known in
+  /// advance: the tree of buffers is fixed by a Form when the
+  /// TypedArrayBuilder is constructed, and each call appends directly to the
+  /// buffer it belongs to.
+  ///
+  /// Unlike ArrayBuilder, there is no type discovery: an integer appended
+  /// where the Form expects `float64` is converted, but a value that does not
+  /// fit the Form (e.g. a string where a number is expected, or `null` where
+  /// the Form is not an option type) raises an exception. The snapshot
+  /// always has the given Form, except that VirtualForm is not allowed and
+  /// Form keys are not preserved.
+  ///
+  /// The method names are the same as ArrayBuilder's, so that the same
+  /// drivers (e.g. JSON parsers) can fill either one.
+  class LIBAWKWARD_EXPORT_SYMBOL TypedArrayBuilder {
+  public:
+    /// @brief Creates a TypedArrayBuilder from a full set of parameters.
+    ///
+    /// @param form The Form of the array to build.
+    /// @param options Configuration options for building an array;
+    /// these are passed to every GrowableBuffer's constructor.
+    TypedArrayBuilder(const FormPtr& form, const ArrayBuilderOptions& options);
+
+    /// @brief The Form of the array being built.
+    const FormPtr
+      form() const;
+
+    /// @brief Returns a string representation of this array (single-line XML
+    /// indicating the length and type).
+    const std::string
+      tostring() const;
+
+    /// @brief Current length of the accumulated array.
+    int64_t
+      length() const;
+
+    /// @brief Removes all accumulated data and any unfinished lists or
+    /// records.
+    void
+      clear();
+
+    /// @brief Turns the accumulated data into a Content array.
+    ///
+    /// As with ArrayBuilder, the buffers are shared with the Content, so
+    /// this is a constant-time operation for all nodes except those whose
+    /// Index type is not 64-bit (ListForm, ListOffsetForm, IndexedForm and
+    /// IndexedOptionForm with `i32` or `u32` indexes) and BitMaskedForm,
+    /// which are converted.
+    const ContentPtr
+      snapshot() const;
+
+    /// @brief Adds a `null` value to the accumulated data, which must be
+    /// at an option-type position in the Form.
+    void
+      null();
+
+    /// @brief Adds a boolean value `x`, which must be at a `bool` position.
+    void
+      boolean(bool x);
+
+    /// @brief Adds an integer value `x`, which must be at an integer or
+    /// floating-point position.
+    void
+      integer(int64_t x);
+
+    /// @brief Adds an unsigned integer value `x`, which must be at an
+    /// integer or floating-point position whose type can hold it (values
+    /// above the `int64` range only fit `uint64` and floating-point types).
+    void
+      unsigned_integer(uint64_t x);
+
+    /// @brief Adds a real value `x`, which must be at a floating-point
+    /// position.
+    void
+      real(double x);
+
+    /// @brief Adds an unencoded bytestring `x`, which must be at a list
+    /// position with `"__array__"` equal to `"bytestring"`.
+    void
+      bytestring(const char* x, int64_t length);
+
+    /// @brief Adds a UTF-8 encoded string `x`, which must be at a list
+    /// position with `"__array__"` equal to `"string"`.
+    void
+      string(const char* x, int64_t length);
+
+    /// @brief Begins building a nested list, which must be at a ListForm,
+    /// ListOffsetForm, or RegularForm position.
+    void
+      beginlist();
+
+    /// @brief Ends a nested list; for RegularForm, checks its length.
+    void
+      endlist();
+
+    /// @brief Begins building a tuple with `numfields` fields, which must be
+    /// at a RecordForm position without keys and with this many fields.
+    void
+      begintuple(int64_t numfields);
+
+    /// @brief Sets the pointer to a given tuple field `index`; the next
+    /// command will fill that slot.
+    void
+      index(int64_t index);
+
+    /// @brief Ends a tuple.
+    void
+      endtuple();
+
+    /// @brief Begins building a record, which must be at a RecordForm
+    /// position with keys.
+    void
+      beginrecord();
+
+    /// @brief Sets the pointer to a given record field `key`; the next
+    /// command will fill that slot.
+    ///
+    /// Keys are checked with `strcmp`, starting with the field after the
+    /// previous one, so records whose keys are in Form order are fastest.
+    void
+      field_check(const char* key);
+
+    /// @brief Ends a record. Fields that were not filled are `null` if
+    /// they are option-type; otherwise, a missing field raises an
+    /// exception.
+    void
+      endrecord();
+
+    class Node;
+
+  private:
+    struct Frame {
+      Node* node;
+      int64_t field;
+      int64_t start;
+    };
+
+    Node*
+      target();
+
+    Node*
+      resolve(Node* node);
+
+    void
+      pushframe(Node* node);
+
+    const FormPtr form_;
+    std::shared_ptr<Node> root_;
+    std::vector<Frame> stack_;
+  };
+}
+
+extern "C" {
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#length TypedArrayBuilder::length}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_length(void* typedarraybuilder,
+                                     int64_t* result);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#clear TypedArrayBuilder::clear}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_clear(void* typedarraybuilder);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#null TypedArrayBuilder::null}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_null(void* typedarraybuilder);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#boolean TypedArrayBuilder::boolean}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_boolean(void* typedarraybuilder,
+                                      bool x);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#integer TypedArrayBuilder::integer}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_integer(void* typedarraybuilder,
+                                      int64_t x);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#real TypedArrayBuilder::real}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_real(void* typedarraybuilder,
+                                   double x);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#bytestring TypedArrayBuilder::bytestring}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_bytestring_length(void* typedarraybuilder,
+                                                const char* x,
+                                                int64_t length);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#string TypedArrayBuilder::string}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_string_length(void* typedarraybuilder,
+                                            const char* x,
+                                            int64_t length);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#beginlist TypedArrayBuilder::beginlist}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_beginlist(void* typedarraybuilder);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#endlist TypedArrayBuilder::endlist}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_endlist(void* typedarraybuilder);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#begintuple TypedArrayBuilder::begintuple}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_begintuple(void* typedarraybuilder,
+                                         int64_t numfields);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#index TypedArrayBuilder::index}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_index(void* typedarraybuilder,
+                                    int64_t index);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#endtuple TypedArrayBuilder::endtuple}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_endtuple(void* typedarraybuilder);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#beginrecord TypedArrayBuilder::beginrecord}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_beginrecord(void* typedarraybuilder);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#field_check TypedArrayBuilder::field_check}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_field_check(void* typedarraybuilder,
+                                          const char* key);
+
+  /// @brief C interface to
+  /// {@link awkward::TypedArrayBuilder#endrecord TypedArrayBuilder::endrecord}.
+  LIBAWKWARD_EXPORT_SYMBOL uint8_t
+    awkward_TypedArrayBuilder_endrecord(void* typedarraybuilder);
+}
+
+#endif // AWKWARD_TYPEDARRAYBUILDER_H_
@@ -4,7 +4,10 @@
 #define AWKWARD_IO_JSON_H_
 
 #include <cstdio>
+#include <functional>
+#include <memory>
 #include <string>
+#include <vector>
 
 #include "awkward/builder/ArrayBuilderOptions.h"
 #include "awkward/common.h"
@@ -12,6 +15,8 @@
 
 namespace awkward {
   class Content;
+  class Form;
+  using FormPtr = std::shared_ptr<Form>;
 
   /// @brief Convert a JSON-encoded string into a Content array using an
   /// ArrayBuilder.
@@ -22,6 +27,21 @@ namespace awkward {
   LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
     FromJsonString(const char* source, const ArrayBuilderOptions& options);
 
+  /// @brief Convert a JSON-encoded string into a Content array with a
+  /// given Form, using a TypedArrayBuilder.
+  ///
+  /// @param source Null-terminated string containing JSON data that
+  /// matches the Form.
+  /// @param form The Form of the items of the output array: a top-level
+  /// JSON array is the output array and a top-level JSON object is an
+  /// array of length 1.
+  /// @param options Configuration options for building an array with a
+  /// TypedArrayBuilder.
+  LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
+    FromJsonString(const char* source,
+                   const FormPtr& form,
+                   const ArrayBuilderOptions& options);
+
   /// @brief Convert a JSON-encoded file into a Content array using an
   /// ArrayBuilder.
   ///
@@ -34,6 +54,116 @@ namespace awkward {
                  const ArrayBuilderOptions& options,
                  int64_t buffersize);
 
+  /// @brief Convert a JSON-encoded file into a Content array with a
+  /// given Form, using a TypedArrayBuilder.
+  ///
+  /// @param source C file handle to a file containing JSON data that
+  /// matches the Form.
+  /// @param form The Form of the items of the output array (see
+  /// #FromJsonString).
+  /// @param options Configuration options for building an array with a
+  /// TypedArrayBuilder.
+  /// @param buffersize Number of bytes for an intermediate buffer.
+  LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
+    FromJsonFile(FILE* source,
+                 const FormPtr& form,
+                 const ArrayBuilderOptions& options,
+                 int64_t buffersize);
+
+  /// @brief Convert a JSON-encoded string into a Content array using
+  /// simdjson's On-Demand parser to drive an ArrayBuilder.
+  ///
+  /// @param source String containing any valid JSON data (need not be
+  /// null-terminated).
+  /// @param length Number of bytes in `source`.
+  /// @param form If not `nullptr`, the Form of the items of the output
+  /// array, which is built with a TypedArrayBuilder instead of an
+  /// ArrayBuilder.
+  /// @param options Configuration options for building an array with an
+  /// ArrayBuilder.
+  ///
+  /// The output is the same as that of #FromJsonString.
+  LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
+    FromJsonStringSimdjson(const char* source,
+                           int64_t length,
+                           const FormPtr& form,
+                           const ArrayBuilderOptions& options);
+
+  /// @brief Convert a JSON-encoded file into a Content array using
+  /// simdjson's On-Demand parser to drive an ArrayBuilder.
+  ///
+  /// @param filename Name of a file containing any valid JSON data. The
+  /// whole file is loaded into memory before parsing.
+  /// @param form If not `nullptr`, the Form of the items of the output
+  /// array, which is built with a TypedArrayBuilder instead of an
+  /// ArrayBuilder.
+  /// @param options Configuration options for building an array with an
+  /// ArrayBuilder.
+  ///
+  /// The output is the same as that of #FromJsonFile.
+  LIBAWKWARD_EXPORT_SYMBOL const ContentPtr
+    FromJsonFileSimdjson(const std::string& filename,
+                         const FormPtr& form,
+                         const ArrayBuilderOptions& options);
+
+  /// @brief Convert a JSON-Lines (newline-delimited JSON) string into
+  /// Content arrays, one per chunk, parsing the chunks in parallel.
+  ///
+  /// @param source String containing one JSON value per line (need not be
+  /// null-terminated).
+  /// @param length Number of bytes in `source`.
+  /// @param form If not `nullptr`, the Form of each line, which is built
+  /// with a TypedArrayBuilder; otherwise, each chunk has its own
+  /// ArrayBuilder, so their types may differ.
+  /// @param options Configuration options for building each array.
+  /// @param chunksize Approximate number of bytes in each chunk (chunks are
+  /// extended to the end of the line); if `0` or negative, `source` is split
+  /// into `numthreads` chunks.
+  /// @param numthreads Number of threads, including the calling thread.
+  /// @param simdjson If `true`, parse with simdjson; otherwise, rapidjson.
+  LIBAWKWARD_EXPORT_SYMBOL const std::vector<ContentPtr>
+    FromJsonLinesString(const char* source,
+                        int64_t length,
+                        const FormPtr& form,
+                        const ArrayBuilderOptions& options,
+                        int64_t chunksize,
+                        int64_t numthreads,
+                        bool simdjson);
+
+  /// @brief Convert a JSON-Lines (newline-delimited JSON) file into
+  /// Content arrays, one per chunk, reading and parsing the chunks in
+  /// parallel.
+  ///
+  /// Each chunk opens the file and reads only its own byte range.
+  ///
+  /// See #FromJsonLinesString for a description of the other parameters.
+  LIBAWKWARD_EXPORT_SYMBOL const std::vector<ContentPtr>
+    FromJsonLinesFile(const std::string& filename,
+                      const FormPtr& form,
+                      const ArrayBuilderOptions& options,
+                      int64_t chunksize,
+                      int64_t numthreads,
+                      bool simdjson);
+
+  /// @brief Writes `content` as JSON Lines: one JSON value per item, each
+  /// followed by a newline.
+  ///
+  /// @param content The array to write.
+  /// @param maxdecimals Maximum number of decimals for floating-point
+  /// numbers or `-1` for full precision.
+  /// @param chunksize Number of items formatted as one block of text.
+  /// @param numthreads Number of threads that format blocks; if greater than
+  /// one, they run concurrently with the calling thread, which only calls
+  /// `write`, and at most `2 * numthreads` blocks are held at a time.
+  /// @param write Called with each block of text, in order, on the calling
+  /// thread.
+  LIBAWKWARD_EXPORT_SYMBOL void
+    ToJsonLines(const ContentPtr& content,
+                int64_t maxdecimals,
+                int64_t chunksize,
+                int64_t numthreads,
+                const std::function<void(const std::string&)>& write);
+
   /// @class ToJson
   ///
   /// Abstract base class for producing JSON data.
@@ -7,6 +7,7 @@
 #include <pybind11/stl.h>
 
 #include "awkward/builder/ArrayBuilder.h"
+#include "awkward/builder/TypedArrayBuilder.h"
 #include "awkward/Iterator.h"
 #include "awkward/Content.h"
 #include "awkward/array/EmptyArray.h"
@@ -62,6 +63,11 @@ ak::Slice
 py::class_<ak::ArrayBuilder>
   make_ArrayBuilder(const py::handle& m, const std::string& name);
 
+/// @brief Makes a TypedArrayBuilder class in Python that mirrors the one in
+/// C++.
+py::class_<ak::TypedArrayBuilder>
+  make_TypedArrayBuilder(const py::handle& m, const std::string& name);
+
 /// @brief Makes an Iterator class in Python that mirrors the one in C++.
 py::class_<ak::Iterator, std::shared_ptr<ak::Iterator>>
   make_Iterator(const py::handle& m, const std::string& name);
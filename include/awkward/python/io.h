@@ -10,6 +10,12 @@ namespace py = pybind11;
 void
 make_fromjson(py::module& m, const std::string& name);
 
+void
+make_fromjsonlines(py::module& m, const std::string& name);
+
+void
+make_tojsonlines(py::module& m, const std::string& name);
+
 void
 make_fromroot_nestedvector(py::module& m, const std::string& name);
 
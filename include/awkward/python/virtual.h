@@ -97,4 +97,9 @@ private:
 py::class_<PyArrayCache, std::shared_ptr<PyArrayCache>>
 make_PyArrayCache(const py::handle& m, const std::string& name);
 
+////////// LRUArrayCache
+
+py::class_<ak::LRUArrayCache, std::shared_ptr<ak::LRUArrayCache>>
+make_LRUArrayCache(const py::handle& m, const std::string& name);
+
 #endif // AWKWARDPY_VIRTUAL_H_
@@ -7,6 +7,7 @@
 #include <vector>
 #include <map>
 #include <memory>
+#include <functional>
 
 #include "awkward/common.h"
 
@@ -99,6 +100,16 @@ namespace awkward {
                  const std::string &classname = std::string(""),
                  const Identities *id = nullptr);
 
+    /// @brief Runs `fcn(0)` through `fcn(numthreads - 1)` in separate threads
+    /// (`fcn(0)` in the calling thread), waits for all of them to finish, and
+    /// rethrows the first exception raised by any of them.
+    ///
+    /// @param numthreads The number of threads, including the calling thread.
+    /// @param fcn The function to call with each thread number.
+    void
+      run_parallel(int64_t numthreads,
+                   const std::function<void(int64_t)>& fcn);
+
     /// @brief Puts quotation marks around a string and escapes the appropriate
     /// characters.
     ///
@@ -3,6 +3,11 @@
 #ifndef AWKWARD_ARRAYCACHE_H_
 #define AWKWARD_ARRAYCACHE_H_
 
+#include <list>
+#include <map>
+#include <mutex>
+#include <unordered_map>
+
 #include "awkward/Content.h"
 
 namespace awkward {
@@ -41,10 +46,170 @@ namespace awkward {
 
   using ArrayCachePtr = std::shared_ptr<ArrayCache>;
 
+  /// @class CacheStatistics
+  ///
+  /// @brief Process-wide counters of VirtualArray materializations and
+  /// cache evictions, for tuning cache sizes and finding arrays that are
+  /// generated more often than expected.
+  ///
+  /// Every request for a VirtualArray's array is either a hit (found in its
+  /// ArrayCache) or a miss (generated by its ArrayGenerator, including all
+  /// requests of VirtualArrays without a cache). Misses are timed and the
+  /// Content#nbytes of the generated arrays are summed. Counts by cache key
+  /// are only collected if #set_per_key is enabled, since the number of keys
+  /// can grow without bound.
+  class LIBAWKWARD_EXPORT_SYMBOL CacheStatistics {
+  public:
+    /// @brief Counts for a single cache key.
+    struct KeyCounts {
+      int64_t hits;
+      int64_t misses;
+      int64_t generate_nanoseconds;
+      int64_t evictions;
+      int64_t bytes_evicted;
+    };
+
+    /// @brief Records that the array at `key` was found in a cache.
+    static void
+      hit(const std::string& key);
+
+    /// @brief Records that the array at `key` was generated, which took
+    /// `nanoseconds` and produced `nbytes`.
+    static void
+      miss(const std::string& key, int64_t nanoseconds, int64_t nbytes);
+
+    /// @brief Records that the array at `key`, with `nbytes`, was evicted
+    /// from a cache.
+    static void
+      eviction(const std::string& key, int64_t nbytes);
+
+    /// @brief Number of requests that were found in a cache.
+    static int64_t
+      hits();
+
+    /// @brief Number of requests that called an ArrayGenerator.
+    static int64_t
+      misses();
+
+    /// @brief Total wall time spent in ArrayGenerators, in nanoseconds.
+    static int64_t
+      generate_nanoseconds();
+
+    /// @brief Total Content#nbytes of all generated arrays.
+    static int64_t
+      bytes_generated();
+
+    /// @brief Number of arrays evicted from LRUArrayCaches.
+    static int64_t
+      evictions();
+
+    /// @brief Total Content#nbytes of all evicted arrays.
+    static int64_t
+      bytes_evicted();
+
+    /// @brief If `true`, counts are also collected by cache key.
+    static bool
+      per_key();
+
+    /// @brief Turns the collection of counts by cache key on or off.
+    static void
+      set_per_key(bool per_key);
+
+    /// @brief Counts by cache key (empty unless #per_key).
+    static const std::map<std::string, KeyCounts>
+      key_counts();
+
+    /// @brief Sets all counters to zero and forgets all cache keys.
+    static void
+      reset();
+  };
+
   // Note: if you're creating a pure C++ cache (and it's not ridiculously
   // large), define it in this file and implement it in
   // src/libawkward/virtual/ArrayCache.cpp.
 
+  /// @class LRUArrayCache
+  ///
+  /// @brief ArrayCache with a fixed budget of bytes that evicts the least
+  /// recently used arrays when the budget is exceeded.
+  ///
+  /// The size of each array is its Content#nbytes, so arrays that share
+  /// buffers are counted more than once. An array that is larger than the
+  /// whole budget is not stored at all.
+  ///
+  /// Unlike PyArrayCache, this cache never calls back into Python, and all
+  /// of its methods are protected by a mutex so that it may be shared among
+  /// threads.
+  class LIBAWKWARD_EXPORT_SYMBOL LRUArrayCache: public ArrayCache {
+  public:
+    /// @brief Creates an empty LRUArrayCache.
+    ///
+    /// @param max_bytes The maximum total #nbytes of all arrays in the
+    /// cache; must be non-negative.
+    LRUArrayCache(int64_t max_bytes);
+
+    /// @brief The maximum total #nbytes of all arrays in the cache.
+    int64_t
+      max_bytes() const;
+
+    /// @brief The current total #nbytes of all arrays in the cache.
+    int64_t
+      nbytes() const;
+
+    /// @brief The number of arrays in the cache.
+    int64_t
+      length() const;
+
+    /// @brief The keys in the cache, from most recently used to least
+    /// recently used.
+    const std::vector<std::string>
+      keys() const;
+
+    /// @brief Returns `true` if `key` is in the cache without affecting
+    /// the order of eviction.
+    bool
+      has(const std::string& key) const;
+
+    /// @brief Attempts to get an array; may be `nullptr` if not available.
+    ///
+    /// A successful lookup makes `key` the most recently used.
+    ContentPtr
+      get(const std::string& key) const override;
+
+    /// @brief Writes or overwrites an array at `key`, evicting the least
+    /// recently used arrays until the cache is within #max_bytes.
+    void
+      set(const std::string& key, const ContentPtr& value) override;
+
+    /// @brief Removes the array at `key`, returning `false` if there was
+    /// no such key.
+    bool
+      remove(const std::string& key);
+
+    /// @brief Removes all arrays from the cache.
+    void
+      clear();
+
+    const std::string
+      tostring_part(const std::string& indent,
+                    const std::string& pre,
+                    const std::string& post) const override;
+
+  private:
+    using Entry = std::pair<std::string, std::pair<ContentPtr, int64_t>>;
+
+    /// @brief Removes least recently used entries until #nbytes is no
+    /// greater than #max_bytes; assumes that the mutex is locked.
+    void
+      evict();
+
+    const int64_t max_bytes_;
+    int64_t nbytes_;
+    mutable std::list<Entry> entries_;
+    std::unordered_map<std::string, std::list<Entry>::iterator> lookup_;
+    mutable std::mutex mutex_;
+  };
+
 }
 
 #endif // AWKWARD_ARRAYCACHE_H_
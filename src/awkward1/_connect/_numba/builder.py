@@ -35,13 +35,15 @@ def globalstring(context, builder, pyvalue):
 
 
 class ArrayBuilderType(numba.types.Type):
-    def __init__(self, behavior):
+    def __init__(self, behavior, typed=False):
         super(ArrayBuilderType, self).__init__(
-            name="awkward1.ArrayBuilderType({0})".format(
-                awkward1._connect._numba.repr_behavior(behavior)
+            name="awkward1.{0}ArrayBuilderType({1})".format(
+                "Typed" if typed else "",
+                awkward1._connect._numba.repr_behavior(behavior),
             )
         )
         self.behavior = behavior
+        self.typed = typed
 
 
 @numba.extending.register_model(ArrayBuilderType)
@@ -100,6 +102,15 @@ def box_ArrayBuilder(arraybuildertype, arraybuilderval, c):
     return out
 
 
+def libfcn(arraybuildertype, name):
+    if arraybuildertype.typed:
+        if name == "field_fast":
+            name = "field_check"
+        return getattr(awkward1._libawkward, "TypedArrayBuilder_" + name)
+    else:
+        return getattr(awkward1._libawkward, "ArrayBuilder_" + name)
+
+
 def call(context, builder, fcn, args):
     numbatype = numba.core.typing.ctypes_utils.make_function_type(fcn)
     fcntype = context.get_function_pointer_type(numbatype)
@@ -137,7 +148,7 @@ def lower_len(context, builder, sig, args):
     call(
         context,
         builder,
-        awkward1._libawkward.ArrayBuilder_length,
+        libfcn(arraybuildertype, "length"),
         (proxyin.rawptr, result),
     )
     return awkward1._connect._numba.castint(
@@ -321,11 +332,17 @@ class type_methods(numba.core.typing.templates.AttributeTemplate):
                 (
                     awkward1._connect._numba.arrayview.ArrayViewType,
                     awkward1._connect._numba.arrayview.RecordViewType,
-                    numba.types.Boolean,
-                    numba.types.Integer,
-                    numba.types.Float,
                 ),
             )
+            and not arraybuildertype.typed
+        ):
+            return numba.types.none(args[0])
+        elif (
+            len(args) == 1
+            and len(kwargs) == 0
+            and isinstance(
+                args[0], (numba.types.Boolean, numba.types.Integer, numba.types.Float),
+            )
         ):
             return numba.types.none(args[0])
         elif (
@@ -349,6 +366,7 @@ class type_methods(numba.core.typing.templates.AttributeTemplate):
             and len(kwargs) == 0
             and isinstance(args[0], awkward1._connect._numba.arrayview.ArrayViewType)
             and isinstance(args[1], numba.types.Integer)
+            and not arraybuildertype.typed
         ):
             return numba.types.none(args[0], args[1])
         else:
@@ -382,6 +400,7 @@ class type_methods(numba.core.typing.templates.AttributeTemplate):
             len(args) == 1
             and len(kwargs) == 0
             and isinstance(args[0], awkward1._connect._numba.arrayview.ArrayViewType)
+            and not arraybuildertype.typed
         ):
             return numba.types.none(args[0])
         else:
@@ -396,7 +415,7 @@ def lower_clear(context, builder, sig, args):
     (arraybuildertype,) = sig.args
     (arraybuilderval,) = args
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
-    call(context, builder, awkward1._libawkward.ArrayBuilder_clear, (proxyin.rawptr,))
+    call(context, builder, libfcn(arraybuildertype, "clear"), (proxyin.rawptr,))
     return context.get_dummy_value()
 
 
@@ -405,7 +424,7 @@ def lower_null(context, builder, sig, args):
     (arraybuildertype,) = sig.args
     (arraybuilderval,) = args
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
-    call(context, builder, awkward1._libawkward.ArrayBuilder_null, (proxyin.rawptr,))
+    call(context, builder, libfcn(arraybuildertype, "null"), (proxyin.rawptr,))
     return context.get_dummy_value()
 
 
@@ -416,7 +435,7 @@ def lower_boolean(context, builder, sig, args):
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
     x = builder.zext(xval, context.get_value_type(numba.uint8))
     call(
-        context, builder, awkward1._libawkward.ArrayBuilder_boolean, (proxyin.rawptr, x)
+        context, builder, libfcn(arraybuildertype, "boolean"), (proxyin.rawptr, x)
     )
     return context.get_dummy_value()
 
@@ -428,7 +447,7 @@ def lower_integer(context, builder, sig, args):
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
     x = awkward1._connect._numba.castint(context, builder, xtype, numba.int64, xval)
     call(
-        context, builder, awkward1._libawkward.ArrayBuilder_integer, (proxyin.rawptr, x)
+        context, builder, libfcn(arraybuildertype, "integer"), (proxyin.rawptr, x)
     )
     return context.get_dummy_value()
 
@@ -449,7 +468,7 @@ def lower_real(context, builder, sig, args):
         x = builder.fptrunc(xval, context.get_value_type(numba.types.float64))
     else:
         x = xval
-    call(context, builder, awkward1._libawkward.ArrayBuilder_real, (proxyin.rawptr, x))
+    call(context, builder, libfcn(arraybuildertype, "real"), (proxyin.rawptr, x))
     return context.get_dummy_value()
 
 
@@ -459,7 +478,7 @@ def lower_beginlist(context, builder, sig, args):
     (arraybuilderval,) = args
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
     call(
-        context, builder, awkward1._libawkward.ArrayBuilder_beginlist, (proxyin.rawptr,)
+        context, builder, libfcn(arraybuildertype, "beginlist"), (proxyin.rawptr,)
     )
     return context.get_dummy_value()
 
@@ -469,7 +488,7 @@ def lower_endlist(context, builder, sig, args):
     (arraybuildertype,) = sig.args
     (arraybuilderval,) = args
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
-    call(context, builder, awkward1._libawkward.ArrayBuilder_endlist, (proxyin.rawptr,))
+    call(context, builder, libfcn(arraybuildertype, "endlist"), (proxyin.rawptr,))
     return context.get_dummy_value()
 
 
@@ -484,7 +503,7 @@ def lower_begintuple(context, builder, sig, args):
     call(
         context,
         builder,
-        awkward1._libawkward.ArrayBuilder_begintuple,
+        libfcn(arraybuildertype, "begintuple"),
         (proxyin.rawptr, numfields),
     )
     return context.get_dummy_value()
@@ -501,7 +520,7 @@ def lower_index(context, builder, sig, args):
     call(
         context,
         builder,
-        awkward1._libawkward.ArrayBuilder_index,
+        libfcn(arraybuildertype, "index"),
         (proxyin.rawptr, index),
     )
     return arraybuilderval
@@ -513,7 +532,7 @@ def lower_endtuple(context, builder, sig, args):
     (arraybuilderval,) = args
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
     call(
-        context, builder, awkward1._libawkward.ArrayBuilder_endtuple, (proxyin.rawptr,)
+        context, builder, libfcn(arraybuildertype, "endtuple"), (proxyin.rawptr,)
     )
     return context.get_dummy_value()
 
@@ -526,7 +545,7 @@ def lower_beginrecord(context, builder, sig, args):
     call(
         context,
         builder,
-        awkward1._libawkward.ArrayBuilder_beginrecord,
+        libfcn(arraybuildertype, "beginrecord"),
         (proxyin.rawptr,),
     )
     return context.get_dummy_value()
@@ -539,13 +558,21 @@ def lower_beginrecord_field(context, builder, sig, args):
     arraybuildertype, nametype = sig.args
     arraybuilderval, nameval = args
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
-    name = globalstring(context, builder, nametype.literal_value)
-    call(
-        context,
-        builder,
-        awkward1._libawkward.ArrayBuilder_beginrecord_fast,
-        (proxyin.rawptr, name),
-    )
+    if arraybuildertype.typed:
+        call(
+            context,
+            builder,
+            awkward1._libawkward.TypedArrayBuilder_beginrecord,
+            (proxyin.rawptr,),
+        )
+    else:
+        name = globalstring(context, builder, nametype.literal_value)
+        call(
+            context,
+            builder,
+            awkward1._libawkward.ArrayBuilder_beginrecord_fast,
+            (proxyin.rawptr, name),
+        )
     return context.get_dummy_value()
 
 
@@ -558,7 +585,7 @@ def lower_field(context, builder, sig, args):
     call(
         context,
         builder,
-        awkward1._libawkward.ArrayBuilder_field_fast,
+        libfcn(arraybuildertype, "field_fast"),
         (proxyin.rawptr, key),
     )
     return arraybuilderval
@@ -570,7 +597,7 @@ def lower_endrecord(context, builder, sig, args):
     (arraybuilderval,) = args
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
     call(
-        context, builder, awkward1._libawkward.ArrayBuilder_endrecord, (proxyin.rawptr,)
+        context, builder, libfcn(arraybuildertype, "endrecord"), (proxyin.rawptr,)
     )
     return context.get_dummy_value()
 
@@ -620,12 +647,12 @@ def lower_append_array(context, builder, sig, args):
 
     proxyin = context.make_helper(builder, arraybuildertype, arraybuilderval)
     call(
-        context, builder, awkward1._libawkward.ArrayBuilder_beginlist, (proxyin.rawptr,)
+        context, builder, libfcn(arraybuildertype, "beginlist"), (proxyin.rawptr,)
     )
 
     lower_extend_array(context, builder, sig, args)
 
-    call(context, builder, awkward1._libawkward.ArrayBuilder_endlist, (proxyin.rawptr,))
+    call(context, builder, libfcn(arraybuildertype, "endlist"), (proxyin.rawptr,))
 
     return context.get_dummy_value()
 
@@ -253,7 +253,9 @@ class PandasMixin(PandasNotImportedYet):
     def _concat_same_type(cls, to_concat):
         # https://pandas.pydata.org/pandas-docs/version/1.0.0/reference/api/pandas.api.extensions.ExtensionArray._concat_same_type.html
         vote()
-        return awkward1.operations.structure.concatenate(to_concat)
+        return awkward1.operations.structure.concatenate(
+            to_concat, partitioned=False
+        )
 
     # RECOMMENDED for performance:
 
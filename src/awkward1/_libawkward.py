@@ -138,3 +138,94 @@ ArrayBuilder_append_nowrap = lib.awkward_ArrayBuilder_append_nowrap
 ArrayBuilder_append_nowrap.name = "ArrayBuilder.append_nowrap"
 ArrayBuilder_append_nowrap.argtypes = [ctypes.c_voidp, ctypes.c_voidp, ctypes.c_int64]
 ArrayBuilder_append_nowrap.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_length(void* typedarraybuilder,
+#                                          int64_t* result);
+TypedArrayBuilder_length = lib.awkward_TypedArrayBuilder_length
+TypedArrayBuilder_length.name = "TypedArrayBuilder.length"
+TypedArrayBuilder_length.argtypes = [ctypes.c_voidp, ctypes.POINTER(ctypes.c_int64)]
+TypedArrayBuilder_length.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_clear(void* typedarraybuilder);
+TypedArrayBuilder_clear = lib.awkward_TypedArrayBuilder_clear
+TypedArrayBuilder_clear.name = "TypedArrayBuilder.clear"
+TypedArrayBuilder_clear.argtypes = [ctypes.c_voidp]
+TypedArrayBuilder_clear.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_null(void* typedarraybuilder);
+TypedArrayBuilder_null = lib.awkward_TypedArrayBuilder_null
+TypedArrayBuilder_null.name = "TypedArrayBuilder.null"
+TypedArrayBuilder_null.argtypes = [ctypes.c_voidp]
+TypedArrayBuilder_null.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_boolean(void* typedarraybuilder,
+#                                           bool x);
+TypedArrayBuilder_boolean = lib.awkward_TypedArrayBuilder_boolean
+TypedArrayBuilder_boolean.name = "TypedArrayBuilder.boolean"
+TypedArrayBuilder_boolean.argtypes = [ctypes.c_voidp, ctypes.c_uint8]
+TypedArrayBuilder_boolean.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_integer(void* typedarraybuilder,
+#                                           int64_t x);
+TypedArrayBuilder_integer = lib.awkward_TypedArrayBuilder_integer
+TypedArrayBuilder_integer.name = "TypedArrayBuilder.integer"
+TypedArrayBuilder_integer.argtypes = [ctypes.c_voidp, ctypes.c_int64]
+TypedArrayBuilder_integer.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_real(void* typedarraybuilder,
+#                                        double x);
+TypedArrayBuilder_real = lib.awkward_TypedArrayBuilder_real
+TypedArrayBuilder_real.name = "TypedArrayBuilder.real"
+TypedArrayBuilder_real.argtypes = [ctypes.c_voidp, ctypes.c_double]
+TypedArrayBuilder_real.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_beginlist(void* typedarraybuilder);
+TypedArrayBuilder_beginlist = lib.awkward_TypedArrayBuilder_beginlist
+TypedArrayBuilder_beginlist.name = "TypedArrayBuilder.beginlist"
+TypedArrayBuilder_beginlist.argtypes = [ctypes.c_voidp]
+TypedArrayBuilder_beginlist.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_endlist(void* typedarraybuilder);
+TypedArrayBuilder_endlist = lib.awkward_TypedArrayBuilder_endlist
+TypedArrayBuilder_endlist.name = "TypedArrayBuilder.endlist"
+TypedArrayBuilder_endlist.argtypes = [ctypes.c_voidp]
+TypedArrayBuilder_endlist.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_begintuple(void* typedarraybuilder,
+#                                              int64_t numfields);
+TypedArrayBuilder_begintuple = lib.awkward_TypedArrayBuilder_begintuple
+TypedArrayBuilder_begintuple.name = "TypedArrayBuilder.begintuple"
+TypedArrayBuilder_begintuple.argtypes = [ctypes.c_voidp, ctypes.c_int64]
+TypedArrayBuilder_begintuple.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_index(void* typedarraybuilder,
+#                                         int64_t index);
+TypedArrayBuilder_index = lib.awkward_TypedArrayBuilder_index
+TypedArrayBuilder_index.name = "TypedArrayBuilder.index"
+TypedArrayBuilder_index.argtypes = [ctypes.c_voidp, ctypes.c_int64]
+TypedArrayBuilder_index.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_endtuple(void* typedarraybuilder);
+TypedArrayBuilder_endtuple = lib.awkward_TypedArrayBuilder_endtuple
+TypedArrayBuilder_endtuple.name = "TypedArrayBuilder.endtuple"
+TypedArrayBuilder_endtuple.argtypes = [ctypes.c_voidp]
+TypedArrayBuilder_endtuple.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_beginrecord(void* typedarraybuilder);
+TypedArrayBuilder_beginrecord = lib.awkward_TypedArrayBuilder_beginrecord
+TypedArrayBuilder_beginrecord.name = "TypedArrayBuilder.beginrecord"
+TypedArrayBuilder_beginrecord.argtypes = [ctypes.c_voidp]
+TypedArrayBuilder_beginrecord.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_field_check(void* typedarraybuilder,
+#                                               const char* key);
+TypedArrayBuilder_field_check = lib.awkward_TypedArrayBuilder_field_check
+TypedArrayBuilder_field_check.name = "TypedArrayBuilder.field_check"
+TypedArrayBuilder_field_check.argtypes = [ctypes.c_voidp, ctypes.c_voidp]
+TypedArrayBuilder_field_check.restype = ctypes.c_uint8
+
+# uint8_t awkward_TypedArrayBuilder_endrecord(void* typedarraybuilder);
+TypedArrayBuilder_endrecord = lib.awkward_TypedArrayBuilder_endrecord
+TypedArrayBuilder_endrecord.name = "TypedArrayBuilder.endrecord"
+TypedArrayBuilder_endrecord.argtypes = [ctypes.c_voidp]
+TypedArrayBuilder_endrecord.restype = ctypes.c_uint8
@@ -6,6 +6,7 @@ import inspect
 import re
 import sys
 import os
+import threading
 
 try:
     from collections.abc import Mapping
@@ -427,6 +428,94 @@ def key2index(keys, key):
 key2index._pattern = re.compile(r"^[1-9][0-9]*$")
 
 
+def parse_bytes(size):
+    m = parse_bytes._pattern.match(size)
+    if m is None:
+        raise ValueError(
+            "size must be a number of bytes with units, like '100 MB' or "
+            "'1 GiB', not {0}".format(repr(size))
+            + exception_suffix(__file__)
+        )
+    return int(float(m.group(1)) * parse_bytes._units[m.group(2).lower()])
+
+
+parse_bytes._pattern = re.compile(
+    r"^\s*([0-9]+(?:\.[0-9]*)?|\.[0-9]+)\s*([kKMGT]i?B|B)\s*$"
+)
+parse_bytes._units = {
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000 ** 2,
+    "gb": 1000 ** 3,
+    "tb": 1000 ** 4,
+    "kib": 1024,
+    "mib": 1024 ** 2,
+    "gib": 1024 ** 3,
+    "tib": 1024 ** 4,
+}
+
+
+def threadmap(function, items, threads):
+    items = list(items)
+    if threads is None or threads <= 1 or len(items) <= 1:
+        return [function(x) for x in items]
+
+    results = [None] * len(items)
+    errors = []
+    lock = threading.Lock()
+    nextindex = [0]
+
+    def work():
+        while True:
+            with lock:
+                index = nextindex[0]
+                if index >= len(items) or len(errors) != 0:
+                    return
+                nextindex[0] += 1
+            try:
+                results[index] = function(items[index])
+            except Exception as err:
+                with lock:
+                    errors.append((index, err))
+                return
+
+    workers = [
+        threading.Thread(target=work) for i in range(min(threads, len(items)))
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    if len(errors) != 0:
+        raise min(errors, key=lambda x: x[0])[1]
+    return results
+
+
+def pickle_buffers(container):
+    import pickle
+
+    numpy = awkward1.nplike.Numpy.instance()
+    out = {}
+    for key, value in container.items():
+        value = numpy.asarray(value)
+        if not value.flags["C_CONTIGUOUS"]:
+            value = value.copy()
+        out[key] = (pickle.PickleBuffer(value), value.dtype.str, value.shape)
+    return out
+
+
+def unpickle_buffers(container):
+    numpy = awkward1.nplike.Numpy.instance()
+    out = {}
+    for key, value in container.items():
+        if isinstance(value, tuple):
+            buffer, dtype, shape = value
+            value = numpy.frombuffer(buffer, dtype=dtype).reshape(shape)
+        out[key] = value
+    return out
+
+
 def completely_flatten(array):
     if isinstance(array, awkward1.partition.PartitionedArray):
         out = []
@@ -454,7 +543,10 @@ def completely_flatten(array):
         return completely_flatten(array.project())
 
     elif isinstance(array, listtypes):
-        return completely_flatten(array.flatten(axis=1))
+        # lists that already start at zero are flattened without being trimmed
+        offsets, flattened = array.offsets_and_flatten(axis=1)
+        stop = awkward1.nplike.of(array).asarray(offsets)[-1]
+        return completely_flatten(flattened[:stop])
 
     elif isinstance(array, recordtypes):
         out = []
@@ -472,6 +564,157 @@ def completely_flatten(array):
         )
 
 
+def form_itemsize(form):
+    # bytes per element of a Form, or None if it has variable-length lists
+    if isinstance(form, awkward1.forms.NumpyForm):
+        out = form.itemsize
+        for x in form.inner_shape:
+            out *= x
+        return out
+
+    elif isinstance(form, awkward1.forms.EmptyForm):
+        return 0
+
+    elif isinstance(form, awkward1.forms.RegularForm):
+        out = form_itemsize(form.content)
+        return None if out is None else out * form.size
+
+    elif isinstance(form, awkward1.forms.RecordForm):
+        out = 0
+        for x in form.contents.values():
+            tmp = form_itemsize(x)
+            if tmp is None:
+                return None
+            out += tmp
+        return out
+
+    elif isinstance(form, awkward1.forms.UnionForm):
+        out = 0
+        for x in form.contents:
+            tmp = form_itemsize(x)
+            if tmp is None:
+                return None
+            out = max(out, tmp)
+        return out + 1 + int(form.index[1:]) // 8
+
+    elif isinstance(
+        form, (awkward1.forms.IndexedForm, awkward1.forms.IndexedOptionForm)
+    ):
+        out = form_itemsize(form.content)
+        return None if out is None else out + int(form.index[1:]) // 8
+
+    elif isinstance(form, awkward1.forms.ByteMaskedForm):
+        out = form_itemsize(form.content)
+        return None if out is None else out + 1
+
+    elif isinstance(form, awkward1.forms.BitMaskedForm):
+        out = form_itemsize(form.content)
+        return None if out is None else out + 0.125
+
+    elif isinstance(form, awkward1.forms.UnmaskedForm):
+        return form_itemsize(form.content)
+
+    elif isinstance(form, awkward1.forms.VirtualForm):
+        return None if form.form is None else form_itemsize(form.form)
+
+    else:
+        return None
+
+
+def estimate_nbytes(layout):
+    """
+    Number of bytes in the buffers that `layout` actually uses (unlike
+    `nbytes`, only the ranges that are reachable from its elements).
+
+    VirtualArrays are not materialized if they are already in their cache or
+    if their generator's Form has no variable-length lists and their length is
+    known.
+    """
+    if isinstance(layout, awkward1.partition.PartitionedArray):
+        return sum(estimate_nbytes(x) for x in layout.partitions)
+
+    elif isinstance(layout, virtualtypes):
+        array = layout.peek_array
+        if array is not None:
+            return estimate_nbytes(array)
+        form, length = layout.generator.form, layout.generator.length
+        itemsize = None if form is None else form_itemsize(form)
+        if itemsize is not None and length is not None:
+            return int(itemsize * length)
+        else:
+            return estimate_nbytes(layout.array)
+
+    elif isinstance(layout, unknowntypes):
+        return 0
+
+    elif isinstance(layout, awkward1.layout.NumpyArray):
+        return awkward1.nplike.of(layout).asarray(layout).nbytes
+
+    nplike = awkward1.nplike.of(layout)
+
+    def scaled(content, length):
+        if len(content) == 0:
+            return 0
+        else:
+            return estimate_nbytes(content) * length // len(content)
+
+    if isinstance(layout, awkward1.layout.RegularArray):
+        return estimate_nbytes(layout.content[: len(layout) * layout.size])
+
+    elif isinstance(
+        layout,
+        (
+            awkward1.layout.ListOffsetArray32,
+            awkward1.layout.ListOffsetArrayU32,
+            awkward1.layout.ListOffsetArray64,
+        ),
+    ):
+        offsets = nplike.asarray(layout.offsets)
+        return offsets.nbytes + estimate_nbytes(
+            layout.content[offsets[0] : offsets[-1]]
+        )
+
+    elif isinstance(layout, listtypes):
+        starts = nplike.asarray(layout.starts)
+        stops = nplike.asarray(layout.stops)
+        return (
+            starts.nbytes
+            + stops.nbytes
+            + scaled(layout.content, int(nplike.sum(stops - starts)))
+        )
+
+    elif isinstance(layout, indexedtypes + indexedoptiontypes):
+        index = nplike.asarray(layout.index)
+        return index.nbytes + scaled(
+            layout.content, int(nplike.count_nonzero(index >= 0))
+        )
+
+    elif isinstance(layout, optiontypes):
+        out = estimate_nbytes(layout.content[: len(layout)])
+        if not isinstance(layout, awkward1.layout.UnmaskedArray):
+            out += nplike.asarray(layout.mask).nbytes
+        return out
+
+    elif isinstance(layout, recordtypes):
+        return sum(
+            estimate_nbytes(layout.field(i)[: len(layout)])
+            for i in range(layout.numfields)
+        )
+
+    elif isinstance(layout, uniontypes):
+        tags = nplike.asarray(layout.tags)
+        out = tags.nbytes + nplike.asarray(layout.index).nbytes
+        for i in range(layout.numcontents):
+            out += scaled(layout.content(i), int(nplike.count_nonzero(tags == i)))
+        return out
+
+    else:
+        raise RuntimeError(
+            "cannot estimate nbytes of {0}".format(type(layout))
+            + exception_suffix(__file__)
+        )
+
+
 def broadcast_and_apply(inputs, getfunction, behavior):
     def checklength(inputs):
         length = len(inputs[0])
@@ -839,17 +1082,19 @@ def broadcast_and_apply(inputs, getfunction, behavior):
                     break
             nextinputs = awkward1.partition.partition_as(sample, inputs)
 
-            outputs = []
-            for part_inputs in awkward1.partition.iterate(
-                sample.numpartitions, nextinputs
-            ):
+            def apply_part(part_inputs):
                 isscalar = []
                 part = apply(broadcast_pack(part_inputs, isscalar), 0)
                 assert isinstance(part, tuple)
-                outputs.append(tuple(broadcast_unpack(x, isscalar) for x in part))
+                return tuple(broadcast_unpack(x, isscalar) for x in part)
+
+            outputs = awkward1.partition.execute(
+                apply_part,
+                awkward1.partition.iterate(sample.numpartitions, nextinputs),
+            )
 
             out = ()
-            for i in range(len(part)):
+            for i in range(len(outputs[0])):
                 out = out + (
                     awkward1.partition.IrregularlyPartitionedArray(
                         [x[i] for x in outputs]
@@ -3,6 +3,8 @@
 from __future__ import absolute_import
 
 import re
+import json
+import pickle
 import keyword
 import warnings
 
@@ -1427,10 +1429,27 @@ class Array(
             behavior = self._behavior
         return form, container, num_partitions, behavior
 
+    def __reduce_ex__(self, protocol):
+        """
+        With pickle protocol 5 or later, the buffers of the array are
+        pickled as `pickle.PickleBuffer` objects, which can be transported
+        out-of-band (without copying) if the pickler has a `buffer_callback`.
+        The Form and partitioning are always in-band.
+        """
+        out = super(Array, self).__reduce_ex__(protocol)
+        if protocol >= 5 and hasattr(pickle, "PickleBuffer"):
+            state = list(out[2])
+            state[1] = awkward1._util.pickle_buffers(state[1])
+            out = out[:2] + (tuple(state),) + out[3:]
+        return out
+
     def __setstate__(self, state):
         form, container, num_partitions, behavior = state
         layout = awkward1.from_arrayset(
-            form, container, num_partitions, highlevel=False
+            form,
+            awkward1._util.unpickle_buffers(container),
+            num_partitions,
+            highlevel=False,
         )
         if self.__class__ is Array:
             self.__class__ = awkward1._util.arrayclass(layout, behavior)
@@ -2050,10 +2069,27 @@ class Record(awkward1._connect._numpy.NDArrayOperatorsMixin):
             behavior = self._behavior
         return form, container, num_partitions, behavior, self._layout.at
 
+    def __reduce_ex__(self, protocol):
+        """
+        With pickle protocol 5 or later, the buffers of the array are
+        pickled as `pickle.PickleBuffer` objects, which can be transported
+        out-of-band (without copying) if the pickler has a `buffer_callback`.
+        The Form and partitioning are always in-band.
+        """
+        out = super(Record, self).__reduce_ex__(protocol)
+        if protocol >= 5 and hasattr(pickle, "PickleBuffer"):
+            state = list(out[2])
+            state[1] = awkward1._util.pickle_buffers(state[1])
+            out = out[:2] + (tuple(state),) + out[3:]
+        return out
+
     def __setstate__(self, state):
         form, container, num_partitions, behavior, at = state
         array = awkward1.from_arrayset(
-            form, container, num_partitions, highlevel=False
+            form,
+            awkward1._util.unpickle_buffers(container),
+            num_partitions,
+            highlevel=False,
         )
         layout = awkward1.layout.Record(array, at)
         if self.__class__ is Record:
@@ -2073,6 +2109,12 @@ class ArrayBuilder(Iterable, Sized):
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        form (None, #ak.forms.Form, str, or dict): If not None, the Form of
+            the array to build (as an object, JSON string, or JSON-like dict);
+            see below.
+        chunked (bool): If True, buffers grow by adding panels, which are
+            concatenated once when a #snapshot is taken, rather than by
+            reallocating and copying (see #ak.layout.ArrayBuilderOptions).
 
     General tool for building arrays of nested data structures from a sequence
     of commands. Most data types can be constructed by calling commands in the
@@ -2182,17 +2224,54 @@ class ArrayBuilder(Iterable, Sized):
     Note that this is a *general* method for building arrays; if the type is
     known in advance, more specialized procedures can be faster. This should
     be considered the "least effort" approach.
+
+    If the type is known in advance, passing its `form` makes an ArrayBuilder
+    backed by #ak.layout.TypedArrayBuilder, whose tree of buffers is fixed
+    when it is constructed: there is no type discovery, each command appends
+    directly to the buffer it belongs to, and the #snapshot always has the
+    given Form. Integers are converted where the Form expects floating-point
+    numbers, but a command that does not fit the Form (such as #null where
+    the Form is not an option type or an unknown #field) raises ValueError.
+
+        >>> builder = ak.ArrayBuilder(form={
+        ...     "class": "RecordArray",
+        ...     "contents": {"x": "float64", "y": {"class": "ListOffsetArray64",
+        ...                  "offsets": "i64", "content": "int32"}}})
+        >>> builder.append({"x": 1, "y": [1, 2]})
+        >>> ak.type(builder.snapshot())
+        1 * {"x": float64, "y": var * int32}
+
+    Typed ArrayBuilders can also be used in Numba, with the same commands,
+    but they cannot #append or #extend by reference to an existing #ak.Array
+    or #ak.Record, and the name passed to #begin_record is ignored (the
+    record name is the Form's `"__record__"` parameter).
     """
 
-    def __init__(self, behavior=None, initial=1024, resize=1.5):
-        self._layout = awkward1.layout.ArrayBuilder(initial=initial, resize=resize)
+    def __init__(
+        self, behavior=None, initial=1024, resize=1.5, form=None, chunked=False
+    ):
+        if form is None:
+            self._layout = awkward1.layout.ArrayBuilder(
+                initial=initial, resize=resize, chunked=chunked
+            )
+        else:
+            if isinstance(form, str) or (
+                awkward1._util.py27 and isinstance(form, awkward1._util.unicode)
+            ):
+                form = awkward1.forms.Form.fromjson(form)
+            elif isinstance(form, dict):
+                form = awkward1.forms.Form.fromjson(json.dumps(form))
+            self._layout = awkward1.layout.TypedArrayBuilder(
+                form, initial=initial, resize=resize, chunked=chunked
+            )
         self.behavior = behavior
 
     @classmethod
     def _wrap(cls, layout, behavior=None):
         """
         Args:
-            layout (#ak.layout.ArrayBuilder): Low-level builder to wrap.
+            layout (#ak.layout.ArrayBuilder or #ak.layout.TypedArrayBuilder):
+                Low-level builder to wrap.
             behavior (None or dict): Custom #ak.behavior for arrays built by
                 this ArrayBuilder.
 
@@ -2203,7 +2282,10 @@ class ArrayBuilder(Iterable, Sized):
         with no accumulated data, but Numba needs to wrap existing data
         when returning from a lowered function.
         """
-        assert isinstance(layout, awkward1.layout.ArrayBuilder)
+        assert isinstance(
+            layout,
+            (awkward1.layout.ArrayBuilder, awkward1.layout.TypedArrayBuilder),
+        )
         out = cls.__new__(cls)
         out._layout = layout
         out.behavior = behavior
@@ -2354,7 +2436,10 @@ class ArrayBuilder(Iterable, Sized):
         awkward1._connect._numba.register_and_check()
         import awkward1._connect._numba.builder
 
-        return awkward1._connect._numba.builder.ArrayBuilderType(self._behavior)
+        return awkward1._connect._numba.builder.ArrayBuilderType(
+            self._behavior,
+            isinstance(self._layout, awkward1.layout.TypedArrayBuilder),
+        )
 
     def snapshot(self):
         """
@@ -2571,7 +2656,19 @@ class ArrayBuilder(Iterable, Sized):
 
         If `obj` is an #ak.Array and `at` is an int, this method fills the
         ArrayBuilder with a reference to `obj[at]` instead of `obj`.
+
+        ArrayBuilders with a `form` can only append Python objects.
         """
+        if isinstance(self._layout, awkward1.layout.TypedArrayBuilder):
+            if at is not None or isinstance(obj, (Array, Record)):
+                raise TypeError(
+                    "an ArrayBuilder with a form can only append Python "
+                    "objects, not references to an ak.Array or ak.Record"
+                    + awkward1._util.exception_suffix(__file__)
+                )
+            self._layout.fromiter(obj)
+            return
+
         if at is None:
             if isinstance(obj, Record):
                 self._layout.append(obj.layout.array, obj.layout.at)
@@ -2600,6 +2697,11 @@ class ArrayBuilder(Iterable, Sized):
 
         Appends every value from `obj`, by reference (see #append).
         """
+        if isinstance(self._layout, awkward1.layout.TypedArrayBuilder):
+            raise TypeError(
+                "an ArrayBuilder with a form cannot extend by reference"
+                + awkward1._util.exception_suffix(__file__)
+            )
         if isinstance(obj, Array):
             self._layout.extend(obj.layout)
         else:
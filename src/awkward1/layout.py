@@ -2,6 +2,11 @@
 
 from __future__ import absolute_import
 
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
 from awkward1._ext import Index8
 from awkward1._ext import IndexU8
 from awkward1._ext import Index32
@@ -13,6 +18,7 @@ from awkward1._ext import Identities64
 
 from awkward1._ext import Iterator
 from awkward1._ext import ArrayBuilder
+from awkward1._ext import TypedArrayBuilder
 from awkward1._ext import _PersistentSharedPtr
 
 from awkward1._ext import Content
@@ -52,5 +58,8 @@ from awkward1._ext import VirtualArray
 from awkward1._ext import ArrayGenerator
 from awkward1._ext import SliceGenerator
 from awkward1._ext import ArrayCache
+from awkward1._ext import LRUArrayCache
 
 from awkward1._ext import kernel_lib
+
+MutableMapping.register(LRUArrayCache)
@@ -280,6 +280,10 @@ class Numpy(NumpyLike):
     def ma(self):
         return self._module.ma
 
+    def memmap(self, *args, **kwargs):
+        # filename, dtype=, mode=, offset=, shape=
+        return self._module.memmap(*args, **kwargs)
+
 
 class Cupy(NumpyLike):
     def __init__(self):
@@ -4,10 +4,17 @@ from __future__ import absolute_import
 
 import numbers
 import json
+import io
 import collections
 import math
+import os
 import threading
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
 try:
     from collections.abc import Iterable
 except ImportError:
@@ -662,7 +669,14 @@ def to_kernels(array, kernels, highlevel=True, behavior=None):
 
 
 def from_iter(
-    iterable, highlevel=True, behavior=None, allow_record=True, initial=1024, resize=1.5
+    iterable,
+    highlevel=True,
+    behavior=None,
+    allow_record=True,
+    initial=1024,
+    resize=1.5,
+    form=None,
+    chunked=False,
 ):
     """
     Args:
@@ -679,6 +693,14 @@ def from_iter(
         resize (float): Resize multiplier for buffers used by
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
+        form (None, #ak.forms.Form, str, or dict): If not None, the Form of
+            the output array (as an object, JSON string, or JSON-like dict),
+            which is filled by an #ak.layout.TypedArrayBuilder instead of
+            discovering the type (see #ak.ArrayBuilder).
+        chunked (bool): If True, buffers grow by adding panels, which are
+            concatenated once at the end, rather than by reallocating and
+            copying (see #ak.layout.ArrayBuilderOptions). This reduces the
+            peak memory use for large arrays.
 
     Converts Python data into an Awkward Array.
 
@@ -704,6 +726,11 @@ def from_iter(
        * iterable, including np.ndarray: converted into
          #ak.layout.ListOffsetArray.
 
+    The whole `iterable` is passed to the builder in one call, and exact
+    built-in types (and NumPy arrays of booleans and numbers, which are read
+    directly from their buffers) are recognized without any Python-level
+    dispatch.
+
     See also #ak.to_list.
     """
     if isinstance(iterable, dict):
@@ -714,15 +741,29 @@ def from_iter(
                 behavior=behavior,
                 initial=initial,
                 resize=resize,
+                form=form,
+                chunked=chunked,
             )[0]
         else:
             raise ValueError(
                 "cannot produce an array from a dict"
                 + awkward1._util.exception_suffix(__file__)
             )
-    out = awkward1.layout.ArrayBuilder(initial=initial, resize=resize)
-    for x in iterable:
-        out.fromiter(x)
+    if form is None:
+        out = awkward1.layout.ArrayBuilder(
+            initial=initial, resize=resize, chunked=chunked
+        )
+    else:
+        if isinstance(form, str) or (
+            awkward1._util.py27 and isinstance(form, awkward1._util.unicode)
+        ):
+            form = awkward1.forms.Form.fromjson(form)
+        elif isinstance(form, dict):
+            form = awkward1.forms.Form.fromjson(json.dumps(form))
+        out = awkward1.layout.TypedArrayBuilder(
+            form, initial=initial, resize=resize, chunked=chunked
+        )
+    out.fromiter_items(iterable)
     layout = out.snapshot()
     if highlevel:
         return awkward1._util.wrap(layout, behavior)
@@ -750,6 +791,10 @@ def to_list(array):
        * #ak.types.RecordArray with field names: converted into dict.
        * #ak.types.UnionArray: Python data are naturally heterogeneous.
 
+    Awkward Arrays are converted in C++ by visiting each node of the layout
+    once (not once per element), so the time is dominated by the creation
+    of the Python objects themselves.
+
     See also #ak.from_iter and #ak.Array.tolist.
     """
     import awkward1.highlevel
@@ -775,31 +820,32 @@ def to_list(array):
     elif awkward1.operations.describe.parameters(array).get("__array__") == "char":
         return awkward1.behaviors.string.CharBehavior(array).__str__()
 
-    elif isinstance(array, awkward1.highlevel.Array):
-        return [to_list(x) for x in array]
-
-    elif isinstance(array, awkward1.highlevel.Record):
+    elif isinstance(array, (awkward1.highlevel.Array, awkward1.highlevel.Record)):
         return to_list(array.layout)
 
     elif isinstance(array, awkward1.highlevel.ArrayBuilder):
         return to_list(array.snapshot())
 
-    elif isinstance(array, awkward1.layout.Record) and array.istuple:
-        return tuple(to_list(x) for x in array.fields())
-
-    elif isinstance(array, awkward1.layout.Record):
-        return {n: to_list(x) for n, x in array.fielditems()}
-
-    elif isinstance(array, awkward1.layout.ArrayBuilder):
-        return [to_list(x) for x in array.snapshot()]
-
-    elif isinstance(array, awkward1.layout.NumpyArray):
-        return awkward1.nplike.of(array).asarray(array).tolist()
-
     elif isinstance(
-        array, (awkward1.layout.Content, awkward1.partition.PartitionedArray)
+        array,
+        (
+            awkward1.layout.Content,
+            awkward1.layout.Record,
+            awkward1.layout.ArrayBuilder,
+            awkward1.layout.TypedArrayBuilder,
+        ),
     ):
-        return [to_list(x) for x in array]
+        if isinstance(
+            array, (awkward1.layout.ArrayBuilder, awkward1.layout.TypedArrayBuilder)
+        ):
+            array = array.snapshot()
+        return array.tolist()
+
+    elif isinstance(array, awkward1.partition.PartitionedArray):
+        out = []
+        for x in array.partitions:
+            out.extend(x.tolist())
+        return out
 
     elif isinstance(array, dict):
         return dict((n, to_list(x)) for n, x in array.items())
@@ -815,7 +861,18 @@ def to_list(array):
 
 
 def from_json(
-    source, highlevel=True, behavior=None, initial=1024, resize=1.5, buffersize=65536
+    source,
+    highlevel=True,
+    behavior=None,
+    initial=1024,
+    resize=1.5,
+    buffersize=65536,
+    engine="rapidjson",
+    form=None,
+    lines=False,
+    threads=None,
+    chunk_size=None,
+    partitioned=True,
 ):
     """
     Args:
@@ -830,7 +887,24 @@ def from_json(
             #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
             should be strictly greater than 1.
         buffersize (int): Size (in bytes) of the buffer used by the JSON
-            parser.
+            parser (only used by the `"rapidjson"` engine).
+        engine (str): JSON parser to use: `"rapidjson"` (the default) or
+            `"simdjson"`, which is faster but loads whole files into memory.
+        form (None, #ak.forms.Form, str, or dict): If not None, the Form of
+            the items of the output array (as an object, JSON string, or
+            JSON-like dict); see below.
+        lines (bool): If True, `source` is JSON Lines (one JSON value per
+            line, also known as newline-delimited JSON) and each line is an
+            item of the output array; see below.
+        threads (None or int): Number of threads used to parse JSON Lines;
+            None is 1. Only used if `lines=True`.
+        chunk_size (None, int, or str): Size of each chunk of JSON Lines
+            input, in bytes or as a string like `"100 MB"`; None splits
+            the input into one chunk per thread. Only used if `lines=True`.
+        partitioned (bool): If True and JSON Lines input is parsed in more
+            than one chunk, the chunks become the partitions of an
+            #ak.partition.IrregularlyPartitionedArray (if they all have the
+            same Form); otherwise, they are concatenated.
 
     Converts a JSON string into an Awkward Array.
 
@@ -840,10 +914,106 @@ def from_json(
     and deeply nested JSON can be converted, but the output will never have
     regular-typed array lengths.
 
+    Both engines produce the same output; `"simdjson"` uses SIMD instructions
+    to tokenize, which is usually the bottleneck for large JSON files.
+
+    If the structure of the data is known in advance, passing its `form`
+    skips type discovery: values are parsed directly into buffers of the
+    types that the Form specifies (e.g. integers into a `float64` array
+    without promotion) and the output layout has exactly that Form. Any
+    value that does not match the Form raises a ValueError, as do record
+    fields that are not in the Form, while record fields missing from the
+    JSON are None if they are option-type.
+
+        >>> form = {
+        ...     "class": "RecordArray",
+        ...     "contents": {
+        ...         "x": "float64",
+        ...         "y": {"class": "ListOffsetArray64", "offsets": "i64",
+        ...               "content": "int32"},
+        ...     },
+        ... }
+        >>> array = ak.from_json('[{"x": 1, "y": [1, 2]}, {"x": 2.2, "y": []}]',
+        ...                      form=form)
+        >>> ak.type(array)
+        2 * {"x": float64, "y": var * int32}
+
+    The `form` describes the items of a JSON array, so a single JSON object
+    becomes an #ak.Record. Union types are not supported.
+
+    With `lines=True`, the input is split into chunks at line boundaries
+    and each chunk is parsed by its own builder, `threads` at a time, outside
+    of the Python GIL. Blank lines are skipped. A parsing error reports its
+    position as a byte offset in the whole input.
+
+        >>> array = ak.from_json("example.jsonl", lines=True, threads=8,
+        ...                      chunk_size="64 MB")
+
+    Without a `form`, each chunk discovers its own type, so chunks may differ
+    in type (e.g. `int64` in one chunk and `float64` in another); such
+    chunks are concatenated, rather than partitioned, which merges types as
+    #ak.concatenate does. With a `form`, all chunks have the same type.
+
     See also #ak.to_json.
     """
+    if engine not in ("rapidjson", "simdjson"):
+        raise ValueError(
+            "engine must be 'rapidjson' or 'simdjson', not {0}".format(repr(engine))
+            + awkward1._util.exception_suffix(__file__)
+        )
+
+    if isinstance(form, str) or (
+        awkward1._util.py27 and isinstance(form, awkward1._util.unicode)
+    ):
+        form = awkward1.forms.Form.fromjson(form)
+    elif isinstance(form, dict):
+        form = awkward1.forms.Form.fromjson(json.dumps(form))
+
+    if lines:
+        if threads is None:
+            threads = 1
+        if chunk_size is None:
+            chunk_size = 0
+        elif isinstance(chunk_size, str) or (
+            awkward1._util.py27 and isinstance(chunk_size, awkward1._util.unicode)
+        ):
+            chunk_size = awkward1._util.parse_bytes(chunk_size)
+        if threads < 1 or chunk_size < 0:
+            raise ValueError(
+                "threads must be at least 1 and chunk_size must be non-negative"
+                + awkward1._util.exception_suffix(__file__)
+            )
+        partitions = awkward1._ext.fromjsonlines(
+            source,
+            initial=initial,
+            resize=resize,
+            chunksize=chunk_size,
+            threads=threads,
+            engine=engine,
+            form=form,
+        )
+        if len(partitions) == 1:
+            layout = partitions[0]
+        elif partitioned and all(
+            x.form == partitions[0].form for x in partitions[1:]
+        ):
+            layout = awkward1.partition.IrregularlyPartitionedArray(partitions)
+        else:
+            layout = awkward1.operations.structure.concatenate(
+                partitions, highlevel=False, partitioned=False
+            )
+        if highlevel:
+            return awkward1._util.wrap(layout, behavior)
+        else:
+            return layout
+
     layout = awkward1._ext.fromjson(
-        source, initial=initial, resize=resize, buffersize=buffersize
+        source,
+        initial=initial,
+        resize=resize,
+        buffersize=buffersize,
+        engine=engine,
+        form=form,
     )
     if highlevel:
         return awkward1._util.wrap(layout, behavior)
@@ -851,19 +1021,37 @@ def from_json(
         return layout
 
 
-def to_json(array, destination=None, pretty=False, maxdecimals=None, buffersize=65536):
+def to_json(
+    array,
+    destination=None,
+    pretty=False,
+    maxdecimals=None,
+    buffersize=65536,
+    lines=False,
+    threads=None,
+    chunk_size=None,
+):
     """
     Args:
         array: Data to convert to JSON.
-        destination (None or str): If None, this function returns a JSON str;
-            if a str, it uses that as a file name and writes (overwrites) that
-            file (returning None).
+        destination (None, str, or file-like object): If None, this function
+            returns a JSON str; if a str, it uses that as a file name and
+            writes (overwrites) that file (returning None); if an object with
+            a `write` method (binary or text), it writes to that object
+            (returning None).
         pretty (bool): If True, indent the output for human readability; if
             False, output compact JSON without spaces.
         maxdecimals (None or int): If an int, limit the number of
             floating-point decimals to this number; if None, write all digits.
         buffersize (int): Size (in bytes) of the buffer used by the JSON
             parser.
+        lines (bool): If True, write JSON Lines (one JSON value per item of
+            `array`, each followed by a newline), rather than a single JSON
+            array; see below.
+        threads (None or int): Number of threads used to format JSON Lines;
+            None is 1. Only used if `lines=True`.
+        chunk_size (None or int): Number of items formatted as one block of
+            JSON Lines; None is 10000. Only used if `lines=True`.
 
     Converts `array` (many types supported, including all Awkward Arrays and
     Records) into a JSON string or file.
@@ -882,6 +1070,16 @@ def to_json(array, destination=None, pretty=False, maxdecimals=None, buffersize=
        * #ak.types.RecordArray with field names: converted into JSON objects.
        * #ak.types.UnionArray: JSON data are naturally heterogeneous.
 
+    With `lines=True`, the items are formatted in blocks of `chunk_size` by
+    `threads` worker threads, outside of the Python GIL, and the blocks are
+    written to `destination` in order as they become available, so that the
+    whole output is never in memory at once. Partitioned arrays are written
+    partition by partition, without concatenating them. This mode can write
+    to any file-like object, such as `gzip.open("out.jsonl.gz", "wb")`.
+
+        >>> with gzip.open("out.jsonl.gz", "wb") as file:
+        ...     ak.to_json(array, file, lines=True, threads=4)
+
     See also #ak.from_json and #ak.Array.tojson.
     """
     import awkward1.highlevel
@@ -924,14 +1122,77 @@ def to_json(array, destination=None, pretty=False, maxdecimals=None, buffersize=
             + awkward1._util.exception_suffix(__file__)
         )
 
-    if destination is None:
+    if lines:
+        return _to_json_lines(out, destination, pretty, maxdecimals, threads, chunk_size)
+
+    elif destination is None:
         return out.tojson(pretty=pretty, maxdecimals=maxdecimals)
+
+    elif hasattr(destination, "write"):
+        data = out.tojson(pretty=pretty, maxdecimals=maxdecimals)
+        if isinstance(destination, io.TextIOBase):
+            destination.write(data)
+        else:
+            destination.write(data.encode("utf-8"))
+
     else:
         return out.tojson(
             destination, pretty=pretty, maxdecimals=maxdecimals, buffersize=buffersize
         )
 
 
+def _to_json_lines(layout, destination, pretty, maxdecimals, threads, chunk_size):
+    if isinstance(layout, awkward1.layout.Record):
+        raise ValueError(
+            "JSON Lines output requires an array, not a record"
+            + awkward1._util.exception_suffix(__file__)
+        )
+    if pretty:
+        raise ValueError(
+            "JSON Lines output cannot be pretty-printed"
+            + awkward1._util.exception_suffix(__file__)
+        )
+    if threads is None:
+        threads = 1
+    if chunk_size is None:
+        chunk_size = 10000
+    if threads < 1 or chunk_size < 1:
+        raise ValueError(
+            "threads and chunk_size must be at least 1"
+            + awkward1._util.exception_suffix(__file__)
+        )
+
+    if isinstance(layout, awkward1.partition.PartitionedArray):
+        partitions = layout.partitions
+    else:
+        partitions = [layout]
+
+    def write_all(write):
+        for partition in partitions:
+            awkward1._ext.tojsonlines(
+                partition,
+                write,
+                maxdecimals=maxdecimals,
+                chunksize=chunk_size,
+                threads=threads,
+            )
+
+    if destination is None:
+        blocks = []
+        write_all(blocks.append)
+        return b"".join(blocks).decode("utf-8")
+
+    elif hasattr(destination, "write"):
+        if isinstance(destination, io.TextIOBase):
+            write_all(lambda data: destination.write(data.decode("utf-8")))
+        else:
+            write_all(destination.write)
+
+    else:
+        with open(destination, "wb") as file:
+            write_all(file.write)
+
+
 def from_awkward0(
     array,
     keep_layout=False,
@@ -1276,7 +1537,9 @@ def from_awkward0(
                 )
             else:
                 return awkward1.operations.structure.concatenate(
-                    [recurse(x, level + 1) for x in array.chunks], highlevel=False
+                    [recurse(x, level + 1) for x in array.chunks],
+                    highlevel=False,
+                    partitioned=False,
                 )
 
         elif isinstance(array, awkward0.AppendableArray):
@@ -2028,6 +2291,9 @@ def to_arrow(array):
         elif isinstance(layout, (awkward1.layout.UnmaskedArray)):
             return recurse(layout.content)
 
+        elif isinstance(layout, awkward1._util.virtualtypes):
+            return recurse(layout.array, mask)
+
         else:
             raise TypeError(
                 "unrecognized array type: {0}".format(repr(layout))
@@ -2050,32 +2316,57 @@ def from_arrow(array, highlevel=True, behavior=None):
 
     Converts an Apache Arrow array into an Awkward Array.
 
+    The layout depends only on the Arrow schema, not on the data, so that it
+    can be predicted before reading (see #ak.from_parquet with `lazy=True`):
+    nullable fields become #ak.layout.BitMaskedArray (with all entries valid
+    if the Arrow array has no validity buffer) and non-nullable fields become
+    #ak.layout.UnmaskedArray. Arrays without a schema are nullable if they
+    have any missing values.
+
     See also #ak.to_arrow.
     """
 
     import pyarrow
 
-    def popbuffers(array, tpe, buffers, length):
+    def popmask(mask, out, nullable, length):
+        if not nullable:
+            return awkward1.layout.UnmaskedArray(out)
+        if mask is None:
+            mask = numpy.full((length + 7) // 8, 255, dtype=np.uint8)
+        else:
+            mask = numpy.frombuffer(mask, dtype=np.uint8)
+        return awkward1.layout.BitMaskedArray(
+            awkward1.layout.IndexU8(mask), out, True, length, True
+        )
+
+    def popbuffers(array, tpe, buffers, length, nullable):
         if isinstance(tpe, pyarrow.lib.DictionaryType):
             index = popbuffers(
                 None if array is None else array.indices,
                 tpe.index_type,
                 buffers,
                 length,
+                nullable,
             )
             if array is not None:
-                content = recurse(array.dictionary)
+                content = recurse(array.dictionary, False)
             else:
                 raise NotImplementedError(
                     "Arrow dictionary inside of UnionArray"
                     + awkward1._util.exception_suffix(__file__)
                 )
+            # missing values are only expressed by the index's mask
+            if isinstance(content, awkward1.layout.UnmaskedArray):
+                content = content.content
 
             if isinstance(index, awkward1.layout.BitMaskedArray):
-                if isinstance(content, awkward1.layout.UnmaskedArray):
-                    content = content.content
+                mask = index.mask
+                if array.dictionary.null_count > 0:
+                    mask = _arrow_dictionary_mask(
+                        mask, index.content, array.dictionary, length
+                    )
                 return awkward1.layout.BitMaskedArray(
-                    index.mask,
+                    mask,
                     awkward1.layout.IndexedArray32(
                         awkward1.layout.Index32(index.content),
                         content,
@@ -2087,7 +2378,7 @@ def from_arrow(array, highlevel=True, behavior=None):
                 )
             else:
                 return awkward1.layout.IndexedArray32(
-                    awkward1.layout.Index32(index),
+                    awkward1.layout.Index32(index.content),
                     content,
                     parameters={"__array__": "categorical"},
                 )
@@ -2104,18 +2395,13 @@ def from_arrow(array, highlevel=True, behavior=None):
                         tpe[i].type,
                         buffers,
                         length,
+                        tpe[i].nullable,
                     )
                 )
                 keys.append(tpe[i].name)
 
-            out = awkward1.layout.RecordArray(child_arrays, keys)
-            if mask is not None:
-                mask = awkward1.layout.IndexU8(
-                    numpy.frombuffer(mask, dtype=np.uint8)
-                )
-                return awkward1.layout.BitMaskedArray(mask, out, True, length, True)
-            else:
-                return awkward1.layout.UnmaskedArray(out)
+            out = awkward1.layout.RecordArray(child_arrays, keys, length)
+            return popmask(mask, out, nullable, length)
 
         elif isinstance(tpe, pyarrow.lib.ListType):
             assert tpe.num_buffers == 2
@@ -2128,16 +2414,11 @@ def from_arrow(array, highlevel=True, behavior=None):
                 tpe.value_type,
                 buffers,
                 offsets[-1],
+                tpe.value_field.nullable,
             )
 
             out = awkward1.layout.ListOffsetArray32(offsets, content)
-            if mask is not None:
-                mask = awkward1.layout.IndexU8(
-                    numpy.frombuffer(mask, dtype=np.uint8)
-                )
-                return awkward1.layout.BitMaskedArray(mask, out, True, length, True)
-            else:
-                return awkward1.layout.UnmaskedArray(out)
+            return popmask(mask, out, nullable, length)
 
         elif isinstance(tpe, pyarrow.lib.LargeListType):
             assert tpe.num_buffers == 2
@@ -2150,16 +2431,11 @@ def from_arrow(array, highlevel=True, behavior=None):
                 tpe.value_type,
                 buffers,
                 offsets[-1],
+                tpe.value_field.nullable,
             )
 
             out = awkward1.layout.ListOffsetArray64(offsets, content)
-            if mask is not None:
-                mask = awkward1.layout.IndexU8(
-                    numpy.frombuffer(mask, dtype=np.uint8)
-                )
-                return awkward1.layout.BitMaskedArray(mask, out, True, length, True)
-            else:
-                return awkward1.layout.UnmaskedArray(out)
+            return popmask(mask, out, nullable, length)
 
         elif isinstance(tpe, pyarrow.lib.UnionType) and tpe.mode == "sparse":
             assert tpe.num_buffers == 2
@@ -2173,7 +2449,9 @@ def from_arrow(array, highlevel=True, behavior=None):
                     sublength = index[tags == i][-1] + 1
                 except IndexError:
                     sublength = 0
-                contents.append(popbuffers(None, tpe[i].type, buffers, sublength))
+                contents.append(
+                    popbuffers(None, tpe[i].type, buffers, sublength, tpe[i].nullable)
+                )
             for i in range(len(contents)):
                 these = index[tags == i]
                 if len(these) == 0:
@@ -2205,7 +2483,9 @@ def from_arrow(array, highlevel=True, behavior=None):
                     sublength = index[tags == i].max() + 1
                 except ValueError:
                     sublength = 0
-                contents.append(popbuffers(None, tpe[i].type, buffers, sublength))
+                contents.append(
+                    popbuffers(None, tpe[i].type, buffers, sublength, tpe[i].nullable)
+                )
             for i in range(len(contents)):
                 these = index[tags == i]
                 if len(these) == 0:
@@ -2239,15 +2519,7 @@ def from_arrow(array, highlevel=True, behavior=None):
             awk_arr = awkward1.layout.ListOffsetArray32(offsets, contents)
             awk_arr.setparameter("__array__", "string")
 
-            if mask is None:
-                return awkward1.layout.UnmaskedArray(awk_arr)
-            else:
-                awk_mask = awkward1.layout.IndexU8(
-                    numpy.frombuffer(mask, dtype=np.uint8)
-                )
-                return awkward1.layout.BitMaskedArray(
-                    awk_mask, awk_arr, True, len(offsets) - 1, True
-                )
+            return popmask(mask, awk_arr, nullable, len(offsets) - 1)
 
         elif tpe == pyarrow.large_string():
             assert tpe.num_buffers == 3
@@ -2264,15 +2536,7 @@ def from_arrow(array, highlevel=True, behavior=None):
             awk_arr = awkward1.layout.ListOffsetArray64(offsets, contents)
             awk_arr.setparameter("__array__", "string")
 
-            if mask is None:
-                return awkward1.layout.UnmaskedArray(awk_arr)
-            else:
-                awk_mask = awkward1.layout.IndexU8(
-                    numpy.frombuffer(mask, dtype=np.uint8)
-                )
-                return awkward1.layout.BitMaskedArray(
-                    awk_mask, awk_arr, True, len(offsets) - 1, True
-                )
+            return popmask(mask, awk_arr, nullable, len(offsets) - 1)
 
         elif tpe == pyarrow.binary():
             assert tpe.num_buffers == 3
@@ -2289,15 +2553,7 @@ def from_arrow(array, highlevel=True, behavior=None):
             awk_arr = awkward1.layout.ListOffsetArray32(offsets, contents)
             awk_arr.setparameter("__array__", "bytestring")
 
-            if mask is None:
-                return awkward1.layout.UnmaskedArray(awk_arr)
-            else:
-                awk_mask = awkward1.layout.IndexU8(
-                    numpy.frombuffer(mask, dtype=np.uint8)
-                )
-                return awkward1.layout.BitMaskedArray(
-                    awk_mask, awk_arr, True, len(offsets) - 1, True
-                )
+            return popmask(mask, awk_arr, nullable, len(offsets) - 1)
 
         elif tpe == pyarrow.large_binary():
             assert tpe.num_buffers == 3
@@ -2314,15 +2570,7 @@ def from_arrow(array, highlevel=True, behavior=None):
             awk_arr = awkward1.layout.ListOffsetArray64(offsets, contents)
             awk_arr.setparameter("__array__", "bytestring")
 
-            if mask is None:
-                return awkward1.layout.UnmaskedArray(awk_arr)
-            else:
-                awk_mask = awkward1.layout.IndexU8(
-                    numpy.frombuffer(mask, dtype=np.uint8)
-                )
-                return awkward1.layout.BitMaskedArray(
-                    awk_mask, awk_arr, True, len(offsets) - 1, True
-                )
+            return popmask(mask, awk_arr, nullable, len(offsets) - 1)
 
         elif tpe == pyarrow.bool_():
             assert tpe.num_buffers == 2
@@ -2331,14 +2579,7 @@ def from_arrow(array, highlevel=True, behavior=None):
             out = numpy.frombuffer(data, dtype=np.uint8)
             out = numpy.unpackbits(out).reshape(-1, 8)[:, ::-1].reshape(-1)
             out = awkward1.layout.NumpyArray(out[:length].view(np.bool_))
-            if mask is not None:
-                awk_mask = awkward1.layout.IndexU8(
-                    numpy.frombuffer(mask, dtype=np.uint8)
-                )
-                mask = numpy.frombuffer(mask, dtype=np.uint8)
-                return awkward1.layout.BitMaskedArray(awk_mask, out, True, length, True)
-            else:
-                return awkward1.layout.UnmaskedArray(out)
+            return popmask(mask, out, nullable, length)
 
         elif isinstance(tpe, pyarrow.lib.DataType):
             assert tpe.num_buffers == 2
@@ -2346,13 +2587,7 @@ def from_arrow(array, highlevel=True, behavior=None):
             out = awkward1.layout.NumpyArray(
                 numpy.frombuffer(buffers.pop(0), dtype=tpe.to_pandas_dtype())[:length]
             )
-            if mask is not None:
-                mask = awkward1.layout.IndexU8(
-                    numpy.frombuffer(mask, dtype=np.uint8)
-                )
-                return awkward1.layout.BitMaskedArray(mask, out, True, length, True)
-            else:
-                return awkward1.layout.UnmaskedArray(out)
+            return popmask(mask, out, nullable, length)
 
         else:
             raise TypeError(
@@ -2360,24 +2595,38 @@ def from_arrow(array, highlevel=True, behavior=None):
                 + awkward1._util.exception_suffix(__file__)
             )
 
-    def recurse(obj):
+    def recurse(obj, nullable=None):
+        # without a schema, an array is nullable if it has missing values
+        if nullable is None and isinstance(
+            obj, (pyarrow.lib.Array, pyarrow.lib.ChunkedArray)
+        ):
+            nullable = obj.null_count > 0 or (
+                isinstance(obj, pyarrow.lib.DictionaryArray)
+                and obj.dictionary.null_count > 0
+            )
+
         if isinstance(obj, pyarrow.lib.Array):
             buffers = obj.buffers()
-            out = popbuffers(obj, obj.type, buffers, len(obj))
+            out = popbuffers(obj, obj.type, buffers, len(obj), nullable)
             assert len(buffers) == 0
             return out
 
         elif isinstance(obj, pyarrow.lib.ChunkedArray):
             chunks = [x for x in obj.chunks if len(x) > 0]
             if len(chunks) == 1:
-                return recurse(chunks[0])
+                return recurse(chunks[0], nullable)
             else:
                 return awkward1.operations.structure.concatenate(
-                    [recurse(x) for x in chunks], highlevel=False
+                    [recurse(x, nullable) for x in chunks],
+                    highlevel=False,
+                    partitioned=False,
                 )
 
         elif isinstance(obj, pyarrow.lib.RecordBatch):
-            child_array = [recurse(obj.column(x)) for x in range(obj.num_columns)]
+            child_array = [
+                recurse(obj.column(x), obj.schema.field(x).nullable)
+                for x in range(obj.num_columns)
+            ]
             keys = obj.schema.names
             awk_arr = awkward1.layout.RecordArray(child_array, keys)
             return awk_arr
@@ -2392,7 +2641,7 @@ def from_arrow(array, highlevel=True, behavior=None):
                 return chunks[0]
             else:
                 return awkward1.operations.structure.concatenate(
-                    chunks, highlevel=False
+                    chunks, highlevel=False, partitioned=False
                 )
 
         else:
@@ -2406,7 +2655,144 @@ def from_arrow(array, highlevel=True, behavior=None):
     else:
         return recurse(array)
 
-def to_parquet(array, where, explode_records=False, **options):
+
+def _arrow_dictionary_mask(mask, index, dictionary, length):
+    # moves missing values of the dictionary into the mask of the index
+    valid = numpy.unpackbits(numpy.asarray(mask)).reshape(-1, 8)[:, ::-1].reshape(-1)
+    valid = valid[:length].astype(np.bool_)
+
+    dictmask = numpy.frombuffer(dictionary.buffers()[0], dtype=np.uint8)
+    dictvalid = numpy.unpackbits(dictmask).reshape(-1, 8)[:, ::-1].reshape(-1)
+    dictvalid = dictvalid[: len(dictionary)].astype(np.bool_)
+
+    index = numpy.asarray(index)[:length]
+    valid[valid] &= dictvalid[index[valid]]
+
+    padded = numpy.zeros(len(mask) * 8, dtype=np.bool_)
+    padded[:length] = valid
+    return awkward1.layout.IndexU8(
+        numpy.packbits(padded.reshape(-1, 8)[:, ::-1].reshape(-1))
+    )
+
+
+def _arrow_to_form(tpe, nullable):
+    import pyarrow
+
+    def option(content):
+        if nullable:
+            return {
+                "class": "BitMaskedArray",
+                "mask": "u8",
+                "content": content,
+                "valid_when": True,
+                "lsb_order": True,
+            }
+        else:
+            return {"class": "UnmaskedArray", "content": content}
+
+    def strings(offsets, array, item):
+        return option(
+            {
+                "class": "ListOffsetArray" + offsets[1:],
+                "offsets": offsets,
+                "content": {
+                    "class": "NumpyArray",
+                    "primitive": "uint8",
+                    "parameters": {"__array__": item},
+                },
+                "parameters": {"__array__": array},
+            }
+        )
+
+    if isinstance(tpe, pyarrow.lib.DictionaryType):
+        categorical = {
+            "class": "IndexedArray32",
+            "index": "i32",
+            "content": _arrow_to_form(tpe.value_type, False)["content"],
+            "parameters": {"__array__": "categorical"},
+        }
+        if nullable:
+            return option(categorical)
+        else:
+            return categorical
+
+    elif isinstance(tpe, pyarrow.lib.StructType):
+        contents = collections.OrderedDict()
+        for i in range(tpe.num_fields):
+            contents[tpe[i].name] = _arrow_to_form(tpe[i].type, tpe[i].nullable)
+        return option({"class": "RecordArray", "contents": contents})
+
+    elif isinstance(tpe, (pyarrow.lib.ListType, pyarrow.lib.LargeListType)):
+        offsets = "i32" if isinstance(tpe, pyarrow.lib.ListType) else "i64"
+        return option(
+            {
+                "class": "ListOffsetArray" + offsets[1:],
+                "offsets": offsets,
+                "content": _arrow_to_form(tpe.value_type, tpe.value_field.nullable),
+            }
+        )
+
+    elif isinstance(tpe, pyarrow.lib.UnionType):
+        contents = [
+            _arrow_to_form(tpe[i].type, tpe[i].nullable) for i in range(tpe.num_fields)
+        ]
+        return {
+            "class": "UnmaskedArray",
+            "content": {
+                "class": "UnionArray8_32",
+                "tags": "i8",
+                "index": "i32",
+                "contents": contents,
+            },
+        }
+
+    elif tpe == pyarrow.string():
+        return strings("i32", "string", "char")
+    elif tpe == pyarrow.large_string():
+        return strings("i64", "string", "char")
+    elif tpe == pyarrow.binary():
+        return strings("i32", "bytestring", "byte")
+    elif tpe == pyarrow.large_binary():
+        return strings("i64", "bytestring", "byte")
+
+    elif tpe == pyarrow.bool_():
+        return option("bool")
+
+    elif isinstance(tpe, pyarrow.lib.DataType):
+        try:
+            dtype = np.dtype(tpe.to_pandas_dtype())
+        except NotImplementedError:
+            dtype = None
+        if dtype is None or dtype.kind not in "iuf":
+            raise TypeError(
+                "no Form for Arrow type: {0}".format(repr(tpe))
+                + awkward1._util.exception_suffix(__file__)
+            )
+        return option(dtype.name)
+
+    else:
+        raise TypeError(
+            "unrecognized Arrow array type: {0}".format(repr(tpe))
+            + awkward1._util.exception_suffix(__file__)
+        )
+
+
+def _arrow_schema_to_forms(schema):
+    out = collections.OrderedDict()
+    for i, name in enumerate(schema.names):
+        field = schema.field(i)
+        try:
+            form = _arrow_to_form(field.type, field.nullable)
+        except TypeError:
+            out[name] = None
+        else:
+            out[name] = awkward1.forms.Form.fromjson(json.dumps(form))
+    return out
+
+
+def to_parquet(
+    array, where, explode_records=False, row_group_size=None, overlap=False, **options
+):
     """
     Args:
         array: Data to write to a Parquet file.
@@ -2414,6 +2800,14 @@ def to_parquet(array, where, explode_records=False, **options):
         explode_records (bool): If True, lists of records are written as
             records of lists, so that nested keys become top-level fields
             (which can be zipped when read back).
+        row_group_size (None, int, or str): If None, each partition is written
+            as one row group; if an int, each partition is sliced into row
+            groups of at most this many entries; if a str, like `"100 MB"`,
+            the number of entries per row group is estimated from the
+            partition's #ak.nbytes.
+        overlap (bool): If True, the conversion of each row group to Arrow
+            happens in a background thread while the previous row group is
+            being written.
         options: All other options are passed to pyarrow.parquet.ParquetWriter.
             In particular, if no `schema` is given, a schema is derived from
             the array type.
@@ -2423,6 +2817,14 @@ def to_parquet(array, where, explode_records=False, **options):
         >>> array1 = ak.Array([[1, 2, 3], [], [4, 5], [], [], [6, 7, 8, 9]])
         >>> awkward1.to_parquet(array1, "array1.parquet")
 
+    Row groups are slices of the original array, so they are made without
+    copying; they are the units that #ak.from_parquet and #ak.iterate_parquet
+    can read independently (and in parallel).
+
+        >>> awkward1.to_parquet(array1, "array2.parquet", row_group_size=2)
+        >>> pyarrow.parquet.ParquetFile("array2.parquet").num_row_groups
+        3
+
     See also #ak.to_arrow, which is used as an intermediate step.
     See also #ak.from_parquet.
     """
@@ -2430,46 +2832,105 @@ def to_parquet(array, where, explode_records=False, **options):
     import pyarrow
     import pyarrow.parquet
 
+    if row_group_size is None or isinstance(
+        row_group_size, (numbers.Integral, np.integer)
+    ):
+        if row_group_size is not None and row_group_size <= 0:
+            raise ValueError(
+                "row_group_size must be positive"
+                + awkward1._util.exception_suffix(__file__)
+            )
+        step_bytes = None
+    else:
+        step_bytes = awkward1._util.parse_bytes(row_group_size)
+
     options["where"] = where
 
-    def batch_iterator(layout):
+    def row_groups(layout):
         if isinstance(layout, awkward1.partition.PartitionedArray):
             for partition in layout.partitions:
-                for x in batch_iterator(partition):
+                for x in row_groups(partition):
                     yield x
-        elif isinstance(layout, awkward1.layout.RecordArray):
+        elif row_group_size is None or len(layout) == 0:
+            yield layout
+        else:
+            if step_bytes is None:
+                step = row_group_size
+            else:
+                nbytes = awkward1._util.estimate_nbytes(layout)
+                step = max(1, int(step_bytes * len(layout) // max(1, nbytes)))
+            for start in range(0, len(layout), step):
+                yield layout[start : start + step]
+
+    def batch(layout):
+        if isinstance(layout, awkward1.layout.RecordArray):
             names = layout.keys()
             fields = [to_arrow(layout[name]) for name in names]
-            yield pyarrow.RecordBatch.from_arrays(fields, names)
+            return pyarrow.RecordBatch.from_arrays(fields, names)
         elif explode_records:
             names = layout.keys()
             fields = [layout[name] for name in names]
-            layout = awkward1.layout.RecordArray(fields, names, len(layout))
-            for x in batch_iterator(layout):
-                yield x
+            return batch(awkward1.layout.RecordArray(fields, names, len(layout)))
         else:
-            yield pyarrow.RecordBatch.from_arrays([to_arrow(layout)], [""])
+            return pyarrow.RecordBatch.from_arrays([to_arrow(layout)], [""])
 
     layout = to_layout(array, allow_record=False, allow_other=False)
-    iterator = batch_iterator(layout)
-    first = next(iterator)
+    batches = (batch(x) for x in row_groups(layout))
+    if overlap:
+        batches = _background_iterator(batches)
+
+    try:
+        first = next(batches)
+
+        if "schema" not in options:
+            options["schema"] = first.schema
+
+        writer = pyarrow.parquet.ParquetWriter(**options)
+        try:
+            writer.write_table(pyarrow.Table.from_batches([first]))
+            for record_batch in batches:
+                writer.write_table(pyarrow.Table.from_batches([record_batch]))
+        finally:
+            writer.close()
+    finally:
+        batches.close()
 
-    if "schema" not in options:
-        options["schema"] = first.schema
 
-    writer = pyarrow.parquet.ParquetWriter(**options)
-    writer.write_table(pyarrow.Table.from_batches([first]))
+def _background_iterator(iterator):
+    results = queue.Queue(maxsize=1)
+    stopping = []
 
+    def work():
+        try:
+            for x in iterator:
+                if len(stopping) != 0:
+                    return
+                results.put((True, x))
+        except Exception as err:
+            results.put((False, err))
+        else:
+            results.put((False, None))
+
+    worker = threading.Thread(target=work)
+    worker.daemon = True
+    worker.start()
     try:
         while True:
-            try:
-                record_batch = next(iterator)
-            except StopIteration:
+            ok, x = results.get()
+            if ok:
+                yield x
+            elif x is None:
                 break
             else:
-                writer.write_table(pyarrow.Table.from_batches([record_batch]))
+                raise x
     finally:
-        writer.close()
+        stopping.append(True)
+        while worker.is_alive():
+            try:
+                results.get(timeout=0.01)
+            except queue.Empty:
+                pass
+        worker.join()
 
 
 class _ParquetState(object):
@@ -2497,6 +2958,125 @@ class _ParquetState(object):
         self.file = pyarrow.parquet.ParquetFile(self.source, **self.options)
 
 
+_parquet_filter_operators = ("==", "=", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def _parquet_filter_clauses(filter):
+    if isinstance(filter, tuple):
+        filter = [filter]
+    if len(filter) != 0 and all(isinstance(x, tuple) for x in filter):
+        filter = [filter]
+    out = []
+    for conjunction in filter:
+        clauses = []
+        for clause in conjunction:
+            if (
+                not isinstance(clause, tuple)
+                or len(clause) != 3
+                or clause[1] not in _parquet_filter_operators
+            ):
+                raise ValueError(
+                    "filter must be a list of (column, operator, value) tuples "
+                    "or a list of such lists, with operators {0}; not {1}".format(
+                        ", ".join(repr(x) for x in _parquet_filter_operators),
+                        repr(clause),
+                    )
+                    + awkward1._util.exception_suffix(__file__)
+                )
+            clauses.append(clause)
+        out.append(clauses)
+    return out
+
+
+def _parquet_clause_may_match(statistics, op, value):
+    if statistics is None or not statistics.has_min_max:
+        return True
+    low, high = statistics.min, statistics.max
+    try:
+        if op == "==" or op == "=":
+            return low <= value <= high
+        elif op == "!=":
+            return not (low == high == value)
+        elif op == "<":
+            return low < value
+        elif op == "<=":
+            return low <= value
+        elif op == ">":
+            return high > value
+        elif op == ">=":
+            return high >= value
+        elif op == "in":
+            return any(low <= x <= high for x in value)
+        elif op == "not in":
+            return not (low == high and low in value)
+    except TypeError:
+        return True
+
+
+def _parquet_row_group_may_match(metadata, row_group, filter):
+    rg = metadata.row_group(row_group)
+    statistics = {}
+    for i in range(rg.num_columns):
+        column = rg.column(i)
+        statistics[column.path_in_schema] = (
+            column.statistics if column.is_stats_set else None
+        )
+
+    for conjunction in filter:
+        for column, op, value in conjunction:
+            if not _parquet_clause_may_match(statistics.get(column), op, value):
+                break
+        else:
+            return True
+    return False
+
+
+def _parquet_selection(file, source, columns, row_groups, filter):
+    all_columns = file.schema.to_arrow_schema().names
+
+    if columns is None:
+        columns = all_columns
+    for x in columns:
+        if x not in all_columns:
+            raise ValueError(
+                "column {0} does not exist in file {1}".format(repr(x), repr(source))
+                + awkward1._util.exception_suffix(__file__)
+            )
+
+    if row_groups is None:
+        row_groups = range(file.num_row_groups)
+    elif isinstance(row_groups, (numbers.Integral, np.integer)):
+        row_groups = [row_groups]
+    row_groups = list(row_groups)
+    for row_group in row_groups:
+        if not 0 <= row_group < file.num_row_groups:
+            raise ValueError(
+                "row group {0} does not exist in file {1}".format(
+                    repr(row_group), repr(source)
+                )
+                + awkward1._util.exception_suffix(__file__)
+            )
+
+    if filter is not None and len(filter) != 0:
+        filter = _parquet_filter_clauses(filter)
+        for conjunction in filter:
+            for column, op, value in conjunction:
+                if column not in all_columns:
+                    raise ValueError(
+                        "filter column {0} does not exist in file {1}".format(
+                            repr(column), repr(source)
+                        )
+                        + awkward1._util.exception_suffix(__file__)
+                    )
+        row_groups = [
+            x
+            for x in row_groups
+            if _parquet_row_group_may_match(file.metadata, x, filter)
+        ]
+
+    return columns, row_groups
+
+
 _from_parquet_key_number = 0
 _from_parquet_key_lock = threading.Lock()
 
@@ -2517,6 +3097,8 @@ def from_parquet(
     lazy=False,
     lazy_cache="attach",
     lazy_cache_key=None,
+    threads=None,
+    filter=None,
     highlevel=True,
     behavior=None,
     **options
@@ -2534,13 +3116,32 @@ def from_parquet(
         lazy (bool): If True, read columns in row groups on demand (as
             #ak.layout.VirtualArray, possibly in #ak.partition.PartitionedArray
             if the file has more than one row group); if False, read all
-            requested data immediately.
+            requested data immediately. The Form of each column is derived
+            from the Arrow schema, so the type of a lazy array is known
+            without reading any data.
         lazy_cache (None, "attach", or MutableMapping): If lazy, pass this
             cache to the VirtualArrays. If "attach", a new dict is created
             and attached to the output array as a "cache" parameter on
-            #ak.Array.
+            #ak.Array. An #ak.layout.LRUArrayCache bounds the cache by the
+            number of bytes it holds.
         lazy_cache_key (None or str): If lazy, pass this cache_key to the
             VirtualArrays. If None, a process-unique string is constructed.
+        threads (None or int): If not lazy and greater than 1, read and
+            convert up to this many row groups at a time, each in its own
+            thread, and return an #ak.partition.PartitionedArray with one
+            partition per row group. This limits the number of row groups
+            being decoded at once, not the size of the output. (To overlap
+            reading with processing in lazy mode, see #ak.prefetch.)
+        filter (None, list of tuples, or list of lists of tuples): If not
+            None or empty, skip row groups whose min/max statistics show
+            that they contain no rows satisfying this predicate. Each tuple
+            is `(column, operator, value)` with an operator among `"=="`,
+            `"!="`, `"<"`, `"<="`, `">"`, `">="`, `"in"`, and `"not in"`;
+            a list of tuples is their conjunction (AND) and a list of lists
+            is the disjunction (OR) of those conjunctions, as in pyarrow's
+            `filters`. Only whole row groups are skipped: the rows that
+            are read are not filtered. Columns without statistics (or that
+            are nested) never cause a row group to be skipped.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
         behavior (bool): Custom #ak.behavior for the output array, if
@@ -2563,16 +3164,11 @@ def from_parquet(
     schema = file.schema.to_arrow_schema()
     all_columns = schema.names
 
-    if columns is None:
-        columns = all_columns
-    for x in columns:
-        if x not in all_columns:
-            raise ValueError(
-                "column {0} does not exist in file {1}".format(repr(x), repr(source))
-                + awkward1._util.exception_suffix(__file__)
-            )
+    columns, row_groups = _parquet_selection(
+        file, source, columns, row_groups, filter
+    )
 
-    if file.num_row_groups == 0:
+    if file.num_row_groups == 0 or len(row_groups) == 0:
         out = awkward1.layout.RecordArray(
             [awkward1.layout.EmptyArray() for x in columns], columns, 0
         )
@@ -2590,17 +3186,21 @@ def from_parquet(
         else:
             toattach = None
 
-        if lazy_cache is None:
-            cache = None
+        if lazy_cache is None or isinstance(
+            lazy_cache, (awkward1.layout.ArrayCache, awkward1.layout.LRUArrayCache)
+        ):
+            cache = lazy_cache
         else:
             cache = awkward1.layout.ArrayCache(lazy_cache)
 
         if lazy_cache_key is None:
             lazy_cache_key = "ak.from_parquet:{0}".format(_from_parquet_key())
 
+        forms = _arrow_schema_to_forms(schema)
+
         partitions = []
         offsets = [0]
-        for row_group in range(file.num_row_groups):
+        for row_group in row_groups:
             length = file.metadata.row_group(row_group).num_rows
             offsets.append(offsets[-1] + length)
 
@@ -2609,7 +3209,7 @@ def from_parquet(
                 generator = awkward1.layout.ArrayGenerator(
                     state,
                     (row_group, column),
-                    # form=???      # FIXME: need Arrow schema -> Awkward Forms
+                    form=forms[column],
                     length=length,
                 )
                 if all_columns == [""]:
@@ -2635,18 +3235,177 @@ def from_parquet(
         else:
             return out
 
+    elif threads is not None and threads > 1 and len(row_groups) > 1:
+
+        def read(row_group):
+            return from_arrow(
+                file.read_row_group(row_group, columns, use_threads=use_threads),
+                highlevel=False,
+            )
+
+        partitions = awkward1._util.threadmap(read, row_groups, threads)
+        stops = numpy.cumsum([len(x) for x in partitions]).tolist()
+        out = awkward1.partition.IrregularlyPartitionedArray(partitions, stops)
+        if highlevel:
+            out = awkward1._util.wrap(out, behavior)
+        if all_columns == [""]:
+            return out[""]
+        else:
+            return out
+
     else:
-        out = from_arrow(
-            file.read(columns, use_threads=use_threads),
-            highlevel=highlevel,
-            behavior=behavior,
-        )
+        if row_groups == list(range(file.num_row_groups)):
+            table = file.read(columns, use_threads=use_threads)
+        else:
+            table = file.read_row_groups(row_groups, columns, use_threads=use_threads)
+        out = from_arrow(table, highlevel=highlevel, behavior=behavior)
         if all_columns == [""]:
             return out[""]
         else:
             return out
 
 
+def iterate_parquet(
+    source,
+    columns=None,
+    step_size="100 MB",
+    row_groups=None,
+    filter=None,
+    use_threads=True,
+    highlevel=True,
+    behavior=None,
+    **options
+):
+    """
+    Args:
+        source (str, Path, file-like object, pyarrow.NativeFile): Where to
+            get the Parquet file.
+        columns (None or list of str): If None, read all columns; otherwise,
+            read a specified set of columns.
+        step_size (int or str): If an int, the number of rows in each
+            chunk; if a str, the approximate number of bytes in each chunk
+            (in memory, after conversion), with units such as `"100 MB"` or
+            `"1 GiB"`.
+        row_groups (None, int, or list of int): If None, read all row groups;
+            otherwise, read a single or list of row groups.
+        filter (None, list of tuples, or list of lists of tuples): Skip row
+            groups whose statistics rule out this predicate; see
+            #ak.from_parquet.
+        use_threads (bool): Passed to the pyarrow.parquet.ParquetFile.read
+            functions; if True, do multithreaded reading.
+        highlevel (bool): If True, yield #ak.Array; otherwise, yield
+            low-level #ak.layout.Content subclasses.
+        behavior (bool): Custom #ak.behavior for the output arrays, if
+            high-level.
+        options: All other options are passed to pyarrow.parquet.ParquetFile.
+
+    Iterates over a Parquet file in chunks of `step_size`, reading one row
+    group at a time. Row groups are split or merged as needed to make chunks
+    of the requested size (all but the last chunk have exactly `step_size`
+    rows if `step_size` is an int). Only the row group being read and the
+    unused remainder of the previous one are held by this iterator, so
+    memory use is bounded if the chunks are not kept.
+
+        >>> for chunk in ak.iterate_parquet("big.parquet", ["x", "y"], 1000000):
+        ...     process(chunk)
+
+    See also #ak.from_parquet.
+    """
+    import pyarrow
+    import pyarrow.parquet
+
+    if isinstance(step_size, (numbers.Integral, np.integer)):
+        if step_size <= 0:
+            raise ValueError(
+                "step_size must be positive"
+                + awkward1._util.exception_suffix(__file__)
+            )
+        step_bytes = None
+    else:
+        step_bytes = awkward1._util.parse_bytes(step_size)
+
+    file = pyarrow.parquet.ParquetFile(source, **options)
+    all_columns = file.schema.to_arrow_schema().names
+    columns, row_groups = _parquet_selection(
+        file, source, columns, row_groups, filter
+    )
+    return _iterate_parquet(
+        file,
+        columns,
+        all_columns == [""],
+        row_groups,
+        step_size,
+        step_bytes,
+        use_threads,
+        highlevel,
+        behavior,
+    )
+
+
+def _iterate_parquet(
+    file,
+    columns,
+    unnamed,
+    row_groups,
+    step_size,
+    step_bytes,
+    use_threads,
+    highlevel,
+    behavior,
+):
+    pending = []
+    pending_length = 0
+
+    def take(length):
+        pieces = []
+        while length > 0:
+            piece = pending[0]
+            if len(piece) <= length:
+                pieces.append(pending.pop(0))
+                length -= len(piece)
+            else:
+                pieces.append(piece[:length])
+                pending[0] = piece[length:]
+                length = 0
+        if len(pieces) == 1:
+            out = pieces[0]
+        else:
+            out = awkward1.operations.structure.concatenate(
+                pieces, highlevel=False, partitioned=False
+            )
+        if highlevel:
+            return awkward1._util.wrap(out, behavior)
+        else:
+            return out
+
+    for row_group in row_groups:
+        layout = from_arrow(
+            file.read_row_group(row_group, columns, use_threads=use_threads),
+            highlevel=False,
+        )
+        if unnamed:
+            layout = layout[""]
+        if len(layout) == 0:
+            continue
+
+        if step_bytes is None:
+            rows = step_size
+        else:
+            nbytes = awkward1._util.estimate_nbytes(layout)
+            rows = max(1, int(step_bytes * len(layout) // max(1, nbytes)))
+
+        pending.append(layout)
+        pending_length += len(layout)
+        del layout
+
+        while pending_length >= rows:
+            pending_length -= rows
+            yield take(rows)
+
+    if pending_length > 0:
+        yield take(pending_length)
+
+
 def _arrayset_key(
     form_key,
     attribute,
@@ -3647,7 +4406,8 @@ def from_arrayset(
         lazy_cache (None, "attach", or MutableMapping): If lazy, pass this
             cache to the VirtualArrays. If "attach", a new dict is created
             and attached to the output array as a "cache" parameter on
-            #ak.Array.
+            #ak.Array. An #ak.layout.LRUArrayCache bounds the cache by the
+            number of bytes it holds.
         lazy_cache_key (None or str): If lazy, pass this cache_key to the
             VirtualArrays. If None, a process-unique string is constructed.
         lazy_lengths (None, int, or iterable of ints): If lazy and
@@ -3690,7 +4450,8 @@ def from_arrayset(
     dict attached to the output #ak.Array as `cache` if not specified). The
     `lazy_lengths` argument is required.
 
-    See #ak.to_arrayset for examples.
+    See #ak.to_arrayset for examples, and #ak.from_arrayset_file for a
+    built-in on-disk container that is memory-mapped.
     """
 
     if isinstance(form, str) or (
@@ -3722,7 +4483,9 @@ def from_arrayset(
         else:
             toattach = None
 
-        if lazy_cache is not None:
+        if lazy_cache is not None and not isinstance(
+            lazy_cache, (awkward1.layout.ArrayCache, awkward1.layout.LRUArrayCache)
+        ):
             lazy_cache = awkward1.layout.ArrayCache(lazy_cache)
 
         if lazy_cache_key is None:
@@ -3808,6 +4571,195 @@ def from_arrayset(
         return out
 
 
+_arrayset_file_magic = b"AKARRSET"
+
+
+class _ArraysetFileWriter(object):
+    def __init__(self, destination, directory, alignment):
+        self.destination = destination
+        self.directory = directory
+        self.alignment = alignment
+        self.buffers = {}
+        if directory:
+            if not os.path.exists(destination):
+                os.makedirs(destination)
+            self.file = None
+        else:
+            self.file = open(destination, "wb")
+            self.file.write(_arrayset_file_magic)
+
+    def __setitem__(self, key, value):
+        value = numpy.asarray(value)
+        if not value.flags["C_CONTIGUOUS"]:
+            value = numpy.array(value)
+        if self.directory:
+            with open(os.path.join(self.destination, key + ".bin"), "wb") as file:
+                value.tofile(file)
+            self.buffers[key] = None
+        else:
+            position = self.file.tell()
+            padding = -position % self.alignment
+            self.file.write(b"\x00" * padding)
+            self.buffers[key] = [position + padding, value.nbytes]
+            value.tofile(self.file)
+
+    def close(self, header):
+        header = json.dumps(dict(header, buffers=self.buffers)).encode("utf-8")
+        if self.directory:
+            with open(os.path.join(self.destination, "header.json"), "wb") as file:
+                file.write(header)
+        else:
+            self.file.write(header)
+            self.file.write(numpy.array([len(header)], np.dtype("<u8")).tobytes())
+            self.file.write(_arrayset_file_magic)
+            self.file.close()
+
+    def abort(self):
+        if self.file is not None:
+            self.file.close()
+
+
+class _ArraysetFileReader(object):
+    def __init__(self, source):
+        self.source = source
+        self.directory = os.path.isdir(source)
+        if self.directory:
+            with open(os.path.join(source, "header.json"), "rb") as file:
+                header = file.read()
+        else:
+            with open(source, "rb") as file:
+                magic = file.read(len(_arrayset_file_magic))
+                file.seek(-8 - len(_arrayset_file_magic), os.SEEK_END)
+                footer = file.read()
+                if (
+                    magic != _arrayset_file_magic
+                    or footer[8:] != _arrayset_file_magic
+                ):
+                    raise ValueError(
+                        "file {0} is not an arrayset file".format(repr(source))
+                        + awkward1._util.exception_suffix(__file__)
+                    )
+                length = int(numpy.frombuffer(footer[:8], np.dtype("<u8"))[0])
+                file.seek(-8 - len(_arrayset_file_magic) - length, os.SEEK_END)
+                header = file.read(length)
+        self.header = json.loads(header.decode("utf-8"))
+
+    def __getitem__(self, key):
+        if self.directory:
+            filename = os.path.join(self.source, key + ".bin")
+            offset = 0
+            nbytes = os.path.getsize(filename)
+        else:
+            filename = self.source
+            offset, nbytes = self.header["buffers"][key]
+        if nbytes == 0:
+            return numpy.zeros(0, np.uint8)
+        else:
+            return numpy.memmap(
+                filename, dtype=np.uint8, mode="r", offset=offset, shape=(nbytes,)
+            )
+
+
+def to_arrayset_file(array, destination, directory=False, alignment=64):
+    """
+    Args:
+        array: Data to write to an arrayset file.
+        destination (str): Name of the file (or directory) to write.
+        directory (bool): If True, `destination` is a directory containing a
+            `header.json` file and one raw `.bin` file per buffer; if False,
+            it is a single file.
+        alignment (int): Alignment in bytes of each buffer in a single file.
+
+    Writes an array in a built-in on-disk format for #ak.to_arrayset's Form
+    and named buffers: a JSON header with the Form, number of partitions,
+    and lengths, plus the raw buffers, aligned so that
+    #ak.from_arrayset_file can memory-map them.
+
+    A single file starts with the magic bytes `AKARRSET` and is followed by
+    the buffers, the JSON header, the header's length as a little-endian
+    64-bit integer, and `AKARRSET` again. (Since the header is at the end,
+    partitions can be written one at a time, without holding the whole
+    array in memory.)
+
+    See also #ak.from_arrayset_file and #ak.to_arrayset.
+    """
+    if not isinstance(alignment, numbers.Integral) or alignment < 1:
+        raise ValueError(
+            "alignment must be a positive integer"
+            + awkward1._util.exception_suffix(__file__)
+        )
+
+    layout = to_layout(array, allow_record=False, allow_other=False)
+    if isinstance(layout, awkward1.partition.PartitionedArray):
+        lengths = [len(x) for x in layout.partitions]
+    else:
+        lengths = len(layout)
+
+    writer = _ArraysetFileWriter(destination, directory, alignment)
+    try:
+        form, container, num_partitions = to_arrayset(layout, container=writer)
+    except Exception:
+        writer.abort()
+        raise
+    writer.close(
+        {
+            "form": json.loads(form.tojson()),
+            "num_partitions": num_partitions,
+            "lengths": lengths,
+        }
+    )
+
+
+def from_arrayset_file(
+    source,
+    lazy=False,
+    lazy_cache="attach",
+    lazy_cache_key=None,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        source (str): Name of a file or directory written by
+            #ak.to_arrayset_file.
+        lazy (bool): If True, read the array or its partitions on demand (as
+            #ak.layout.VirtualArray); see #ak.from_arrayset.
+        lazy_cache (None, "attach", or MutableMapping): If lazy, pass this
+            cache to the VirtualArrays; see #ak.from_arrayset.
+        lazy_cache_key (None or str): If lazy, pass this cache_key to the
+            VirtualArrays; see #ak.from_arrayset.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (bool): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Opens an array written by #ak.to_arrayset_file.
+
+    The buffers are memory-mapped (with `numpy.memmap`, read-only) rather
+    than read, so opening takes a constant time, only the pages of buffers
+    that are actually used are read from disk, and processes on the same
+    machine that open the same file share the operating system's page cache.
+
+    The lengths are stored in the header, so `lazy=True` does not need any
+    `lazy_lengths`.
+
+    See also #ak.to_arrayset_file and #ak.from_arrayset.
+    """
+    container = _ArraysetFileReader(source)
+    header = container.header
+    return from_arrayset(
+        header["form"],
+        container,
+        num_partitions=header["num_partitions"],
+        lazy=lazy,
+        lazy_cache=lazy_cache,
+        lazy_cache_key=lazy_cache_key,
+        lazy_lengths=header["lengths"],
+        highlevel=highlevel,
+        behavior=behavior,
+    )
+
+
 def to_pandas(
     array, how="inner", levelname=lambda i: "sub" * i + "entry", anonymous="values"
 ):
@@ -4037,9 +4989,12 @@ __all__ = [
         "absolute_import",
         "numbers",
         "json",
+        "io",
         "collections",
         "math",
+        "os",
         "threading",
+        "queue",
         "Iterable",
         "numpy",
         "np",
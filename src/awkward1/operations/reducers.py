@@ -2,6 +2,8 @@
 
 from __future__ import absolute_import
 
+import operator
+
 import awkward1._util
 import awkward1._connect._numpy
 import awkward1.layout
@@ -12,6 +14,160 @@ import awkward1.nplike
 np = awkward1.nplike.NumpyMetadata.instance()
 
 
+def _tree_reduce(states, combine):
+    # merges neighbors pairwise, so that the order of the states is preserved
+    # and rounding errors grow with the depth of the tree, not the length
+    while len(states) > 1:
+        tmp = []
+        for i in range(0, len(states) - 1, 2):
+            tmp.append(combine(states[i], states[i + 1]))
+        if len(states) % 2 == 1:
+            tmp.append(states[-1])
+        states = tmp
+    return states[0]
+
+
+def _reduce_partitions(layout, partial, combine):
+    # computes the partial states of each partition concurrently, so only a
+    # partition at a time (per worker) needs to be materialized
+    states = awkward1.partition.execute(partial, layout.partitions)
+    return _tree_reduce(states, combine)
+
+
+def _partition_groups(*arrays):
+    layouts = [
+        awkward1.operations.convert.to_layout(
+            x, allow_record=False, allow_other=True
+        )
+        for x in arrays
+    ]
+    sample = None
+    for x in layouts:
+        if isinstance(x, awkward1.partition.PartitionedArray):
+            sample = x
+            break
+    if sample is None:
+        return None
+
+    behavior = awkward1._util.behaviorof(*arrays)
+    layouts = awkward1.partition.partition_as(sample, layouts)
+    out = []
+    for group in awkward1.partition.iterate(sample.numpartitions, layouts):
+        out.append(
+            tuple(
+                awkward1._util.wrap(x, behavior)
+                if isinstance(x, awkward1.layout.Content)
+                else x
+                for x in group
+            )
+        )
+    return out
+
+
+def _add_states(one, two):
+    return tuple(a + b for a, b in zip(one, two))
+
+
+def _weighted_sums(x, weight, *values):
+    if weight is None:
+        return (count(x),) + tuple(sum(v) for v in values)
+    else:
+        return (sum(x * 0 + weight),) + tuple(sum(v * weight) for v in values)
+
+
+def _centered_state(group):
+    # (number of values, sum of weights, weighted means of x and y, and
+    # weighted sums of products of deviations from the means)
+    x, y, weight = group
+    n = count(x)
+    if n == 0:
+        return (n, 0, 0, 0, 0, 0, 0)
+    if y is None:
+        y = x * 0
+    xmean = mean(x, weight=weight)
+    ymean = mean(y, weight=weight)
+    sumw, sumwxx, sumwyy, sumwxy = _weighted_sums(
+        x, weight, (x - xmean) ** 2, (y - ymean) ** 2, (x - xmean) * (y - ymean)
+    )
+    return (n, sumw, xmean, ymean, sumwxx, sumwyy, sumwxy)
+
+
+def _merge_centered(one, two):
+    # Chan, Golub, and LeVeque's update for combining moments of two samples
+    if one[0] == 0:
+        return two
+    if two[0] == 0:
+        return one
+    n1, w1, xmean1, ymean1, xx1, yy1, xy1 = one
+    n2, w2, xmean2, ymean2, xx2, yy2, xy2 = two
+    w = w1 + w2
+    dx = xmean2 - xmean1
+    dy = ymean2 - ymean1
+    factor = w1 * w2 / w
+    return (
+        n1 + n2,
+        w,
+        xmean1 + dx * w2 / w,
+        ymean1 + dy * w2 / w,
+        xx1 + xx2 + dx * dx * factor,
+        yy1 + yy2 + dy * dy * factor,
+        xy1 + xy2 + dx * dy * factor,
+    )
+
+
+def _centered_partitions(x, y, weight):
+    groups = _partition_groups(x, y, weight)
+    if groups is None:
+        return None
+    else:
+        states = awkward1.partition.execute(_centered_state, groups)
+        return _tree_reduce(states, _merge_centered)
+
+
+def _min_state(one, two):
+    if one is None:
+        return two
+    elif two is None:
+        return one
+    else:
+        return one if not two < one else two
+
+
+def _max_state(one, two):
+    if one is None:
+        return two
+    elif two is None:
+        return one
+    else:
+        return one if not two > one else two
+
+
+def _arg_state(one, two, better):
+    # states are (best position and value or None, number of flattened values)
+    best1, num1 = one
+    best2, num2 = two
+    if best1 is None:
+        best = None if best2 is None else (num1 + best2[0], best2[1])
+    elif best2 is None or not better(best2[1], best1[1]):
+        best = best1
+    else:
+        best = (num1 + best2[0], best2[1])
+    return (best, num1 + num2)
+
+
+def _arg_partial(partition, name, better):
+    best = None
+    num = 0
+    for tmp in awkward1._util.completely_flatten(partition):
+        if len(tmp) > 0:
+            out = getattr(awkward1.nplike.of(tmp), name)(tmp, axis=None)
+            best, num = _arg_state((best, num), ((out, tmp[out]), len(tmp)), better)
+        else:
+            num += len(tmp)
+    return (best, num)
+
+
+
 def count(array, axis=None, keepdims=False, mask_identity=False):
     """
     Args:
@@ -85,6 +241,8 @@ def count(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
+        if isinstance(layout, awkward1.partition.PartitionedArray):
+            return _reduce_partitions(layout, count, operator.add)
 
         def reduce(xs):
             if len(xs) == 1:
@@ -139,6 +297,8 @@ def count_nonzero(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
+        if isinstance(layout, awkward1.partition.PartitionedArray):
+            return _reduce_partitions(layout, count_nonzero, operator.add)
 
         def reduce(xs):
             if len(xs) == 1:
@@ -334,6 +494,8 @@ def sum(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
+        if isinstance(layout, awkward1.partition.PartitionedArray):
+            return _reduce_partitions(layout, sum, operator.add)
 
         def reduce(xs):
             if len(xs) == 1:
@@ -384,6 +546,8 @@ def prod(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
+        if isinstance(layout, awkward1.partition.PartitionedArray):
+            return _reduce_partitions(layout, prod, operator.mul)
 
         def reduce(xs):
             if len(xs) == 1:
@@ -436,6 +600,8 @@ def any(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
+        if isinstance(layout, awkward1.partition.PartitionedArray):
+            return _reduce_partitions(layout, any, lambda one, two: one or two)
 
         def reduce(xs):
             if len(xs) == 1:
@@ -488,6 +654,8 @@ def all(array, axis=None, keepdims=False, mask_identity=False):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
+        if isinstance(layout, awkward1.partition.PartitionedArray):
+            return _reduce_partitions(layout, all, lambda one, two: one and two)
 
         def reduce(xs):
             if len(xs) == 1:
@@ -541,6 +709,8 @@ def min(array, axis=None, keepdims=False, mask_identity=True):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
+        if isinstance(layout, awkward1.partition.PartitionedArray):
+            return _reduce_partitions(layout, min, _min_state)
 
         def reduce(xs):
             if len(xs) == 0:
@@ -595,6 +765,8 @@ def max(array, axis=None, keepdims=False, mask_identity=True):
         array, allow_record=False, allow_other=False
     )
     if axis is None:
+        if isinstance(layout, awkward1.partition.PartitionedArray):
+            return _reduce_partitions(layout, max, _max_state)
 
         def reduce(xs):
             if len(xs) == 0:
@@ -655,17 +827,12 @@ def argmin(array, axis=None, keepdims=False, mask_identity=True):
 
     if axis is None:
         if isinstance(layout, awkward1.partition.PartitionedArray):
-            start = 0
-            best_index = None
-            best_value = None
-            for partition in layout.partitions:
-                for tmp in awkward1._util.completely_flatten(partition):
-                    out = awkward1.nplike.of(tmp).argmin(tmp, axis=None)
-                    if best_index is None or tmp[out] < best_value:
-                        best_index = start + out
-                        best_value = tmp[out]
-                start += len(partition)
-            return best_index
+            out = _reduce_partitions(
+                layout,
+                lambda partition: _arg_partial(partition, "argmin", operator.lt),
+                lambda one, two: _arg_state(one, two, operator.lt),
+            )
+            return None if out[0] is None else out[0][0]
 
         else:
             best_index = None
@@ -725,17 +892,12 @@ def argmax(array, axis=None, keepdims=False, mask_identity=True):
 
     if axis is None:
         if isinstance(layout, awkward1.partition.PartitionedArray):
-            start = 0
-            best_index = None
-            best_value = None
-            for partition in layout.partitions:
-                for tmp in awkward1._util.completely_flatten(partition):
-                    out = awkward1.nplike.of(tmp).argmax(tmp, axis=None)
-                    if best_index is None or tmp[out] > best_value:
-                        best_index = start + out
-                        best_value = tmp[out]
-                start += len(partition)
-            return best_index
+            out = _reduce_partitions(
+                layout,
+                lambda partition: _arg_partial(partition, "argmax", operator.gt),
+                lambda one, two: _arg_state(one, two, operator.gt),
+            )
+            return None if out[0] is None else out[0][0]
 
         else:
             best_index = None
@@ -801,6 +963,21 @@ def moment(x, n, weight=None, axis=None, keepdims=False, mask_identity=True):
     non-reducer.
     """
     with np.errstate(invalid="ignore"):
+        groups = _partition_groups(x, weight) if axis is None else None
+        if groups is not None:
+
+            def partial(group):
+                x, weight = group
+                if weight is None:
+                    return (count(x), sum(x ** n))
+                else:
+                    return (sum(x * 0 + weight), sum((x * weight) ** n))
+
+            sumw, sumwxn = _tree_reduce(
+                awkward1.partition.execute(partial, groups), _add_states
+            )
+            return awkward1.nplike.of(sumwxn, sumw).true_divide(sumwxn, sumw)
+
         if weight is None:
             sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
             sumwxn = sum(
@@ -885,6 +1062,16 @@ def mean(x, weight=None, axis=None, keepdims=False, mask_identity=True):
     missing values (None) in reducers.
     """
     with np.errstate(invalid="ignore"):
+        groups = _partition_groups(x, weight) if axis is None else None
+        if groups is not None:
+            sumw, sumwx = _tree_reduce(
+                awkward1.partition.execute(
+                    lambda group: _weighted_sums(group[0], group[1], group[0]), groups
+                ),
+                _add_states,
+            )
+            return awkward1.nplike.of(sumwx, sumw).true_divide(sumwx, sumw)
+
         if weight is None:
             sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
             sumwx = sum(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
@@ -951,30 +1138,40 @@ def var(x, weight=None, ddof=0, axis=None, keepdims=False, mask_identity=True):
     non-reducer.
     """
     with np.errstate(invalid="ignore"):
-        xmean = mean(
-            x, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-        )
-        if weight is None:
-            sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwxx = sum(
-                (x - xmean) ** 2,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
+        state = _centered_partitions(x, None, weight) if axis is None else None
+        if state is not None:
+            sumw, sumwxx = state[1], state[4]
         else:
-            sumw = sum(
-                x * 0 + weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwxx = sum(
-                (x - xmean) ** 2 * weight,
+            xmean = mean(
+                x,
+                weight=weight,
                 axis=axis,
                 keepdims=keepdims,
                 mask_identity=mask_identity,
             )
+            if weight is None:
+                sumw = count(
+                    x, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+                )
+                sumwxx = sum(
+                    (x - xmean) ** 2,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+            else:
+                sumw = sum(
+                    x * 0 + weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwxx = sum(
+                    (x - xmean) ** 2 * weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
         if ddof != 0:
             return (
                 awkward1.nplike.of(sumwxx, sumw).true_divide(sumwxx, sumw)
@@ -1079,33 +1276,47 @@ def covar(x, y, weight=None, axis=None, keepdims=False, mask_identity=True):
     non-reducer.
     """
     with np.errstate(invalid="ignore"):
-        xmean = mean(
-            x, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-        )
-        ymean = mean(
-            y, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-        )
-        if weight is None:
-            sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
-            sumwxy = sum(
-                (x - xmean) * (y - ymean),
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
+        state = _centered_partitions(x, y, weight) if axis is None else None
+        if state is not None:
+            sumw, sumwxy = state[1], state[6]
         else:
-            sumw = sum(
-                x * 0 + weight,
+            xmean = mean(
+                x,
+                weight=weight,
                 axis=axis,
                 keepdims=keepdims,
                 mask_identity=mask_identity,
             )
-            sumwxy = sum(
-                (x - xmean) * (y - ymean) * weight,
+            ymean = mean(
+                y,
+                weight=weight,
                 axis=axis,
                 keepdims=keepdims,
                 mask_identity=mask_identity,
             )
+            if weight is None:
+                sumw = count(
+                    x, axis=axis, keepdims=keepdims, mask_identity=mask_identity
+                )
+                sumwxy = sum(
+                    (x - xmean) * (y - ymean),
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+            else:
+                sumw = sum(
+                    x * 0 + weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwxy = sum(
+                    (x - xmean) * (y - ymean) * weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
         return awkward1.nplike.of(sumwxy, sumw).true_divide(sumwxy, sumw)
 
 
@@ -1150,43 +1361,64 @@ def corr(x, y, weight=None, axis=None, keepdims=False, mask_identity=True):
     non-reducer.
     """
     with np.errstate(invalid="ignore"):
-        xmean = mean(
-            x, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-        )
-        ymean = mean(
-            y, weight=weight, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-        )
-        xdiff = x - xmean
-        ydiff = y - ymean
-        if weight is None:
-            sumwxx = sum(
-                xdiff ** 2, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-            sumwyy = sum(
-                ydiff ** 2, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
-            sumwxy = sum(
-                xdiff * ydiff, axis=axis, keepdims=keepdims, mask_identity=mask_identity
-            )
+        state = _centered_partitions(x, y, weight) if axis is None else None
+        if state is not None:
+            sumwxx, sumwyy, sumwxy = state[4:]
         else:
-            sumwxx = sum(
-                (xdiff ** 2) * weight,
-                axis=axis,
-                keepdims=keepdims,
-                mask_identity=mask_identity,
-            )
-            sumwyy = sum(
-                (ydiff ** 2) * weight,
+            xmean = mean(
+                x,
+                weight=weight,
                 axis=axis,
                 keepdims=keepdims,
                 mask_identity=mask_identity,
             )
-            sumwxy = sum(
-                (xdiff * ydiff) * weight,
+            ymean = mean(
+                y,
+                weight=weight,
                 axis=axis,
                 keepdims=keepdims,
                 mask_identity=mask_identity,
             )
+            xdiff = x - xmean
+            ydiff = y - ymean
+            if weight is None:
+                sumwxx = sum(
+                    xdiff ** 2,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwyy = sum(
+                    ydiff ** 2,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwxy = sum(
+                    xdiff * ydiff,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+            else:
+                sumwxx = sum(
+                    (xdiff ** 2) * weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwyy = sum(
+                    (ydiff ** 2) * weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
+                sumwxy = sum(
+                    (xdiff * ydiff) * weight,
+                    axis=axis,
+                    keepdims=keepdims,
+                    mask_identity=mask_identity,
+                )
         nplike = awkward1.nplike.of(sumwxy, sumwxx, sumwyy)
         return nplike.true_divide(sumwxy, nplike.sqrt(sumwxx * sumwyy))
 
@@ -1246,7 +1478,23 @@ def linear_fit(x, y, weight=None, axis=None, keepdims=False, mask_identity=True)
     """
     with np.errstate(invalid="ignore"):
         nplike = awkward1.nplike.of(x, y, weight)
-        if weight is None:
+        groups = _partition_groups(x, y, weight) if axis is None else None
+        if groups is not None:
+            sumw, sumwx, sumwy, sumwxx, sumwxy = _tree_reduce(
+                awkward1.partition.execute(
+                    lambda group: _weighted_sums(
+                        group[0],
+                        group[2],
+                        group[0],
+                        group[1],
+                        group[0] ** 2,
+                        group[0] * group[1],
+                    ),
+                    groups,
+                ),
+                _add_states,
+            )
+        elif weight is None:
             sumw = count(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
             sumwx = sum(x, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
             sumwy = sum(y, axis=axis, keepdims=keepdims, mask_identity=mask_identity)
@@ -1430,6 +1678,44 @@ def softmax(x, axis=None, keepdims=False, mask_identity=False):
         return nplike.true_divide(expx, denom)
 
 
+def parallel_reducers(threads=None, threshold=None):
+    """
+    Args:
+        threads (None or int): Maximum number of threads used by each
+            reducer; `1` runs all reducers serially (the default) and `0`
+            uses one thread per hardware thread. If None, this setting is
+            not changed.
+        threshold (None or int): Minimum number of values to reduce before
+            more than one thread is used. If None, this setting is not
+            changed.
+
+    Configures the parallel execution mode of all reducers (#ak.count,
+    #ak.sum, #ak.argmax, etc.) and returns the previous `(threads, threshold)`
+    as a tuple, so that they can be restored. With no arguments, this
+    function only returns the current settings.
+
+    In parallel mode, reductions over lists of at least `threshold` values
+    divide the lists into `threads` contiguous ranges with about the same
+    number of values each, reduce each range in a separate thread, and
+    merge the results. The results are identical to serial execution
+    (including floating-point sums, which are accumulated in the same
+    order within each list).
+
+    For example,
+
+        >>> previous = ak.parallel_reducers(threads=8, threshold=1000000)
+        >>> ak.sum(array, axis=-1)      # uses up to 8 threads
+        >>> ak.parallel_reducers(*previous)
+    """
+    previous = awkward1._ext._reducer_parallel()
+    if threads is None:
+        threads = previous[0]
+    if threshold is None:
+        threshold = previous[1]
+    awkward1._ext._set_reducer_parallel(threads, threshold)
+    return previous
+
+
 __all__ = [
     x
     for x in list(globals())
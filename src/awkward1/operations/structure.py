@@ -3,7 +3,14 @@
 from __future__ import absolute_import
 
 import numbers
+import math
 import json
+import threading
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 try:
     from collections.abc import Iterable
@@ -703,8 +710,40 @@ def broadcast_arrays(*arrays, **kwargs):
         return list(out)
 
 
+_concatenate_partitioned_nbytes = 128 * 1024 ** 2
+
+
+def _concatenate_types(contents, behavior):
+    typestrs = awkward1._util.typestrs(behavior)
+    out = None
+    for x in contents:
+        try:
+            tpe = x.type(typestrs)
+        except ValueError:
+            # a PartitionedArray whose partitions have different types
+            return False
+        if out is None:
+            out = tpe
+        elif out != tpe:
+            return False
+    return True
+
+
+def _concatenate_partitioned(contents, behavior):
+    if not _concatenate_types(contents, behavior):
+        return False
+    if any(isinstance(x, awkward1.partition.PartitionedArray) for x in contents):
+        return True
+    total = 0
+    for x in contents:
+        total += awkward1._util.estimate_nbytes(x)
+        if total >= _concatenate_partitioned_nbytes:
+            return True
+    return False
+
+
 @awkward1._connect._numpy.implements("concatenate")
-def concatenate(arrays, axis=0, mergebool=True, highlevel=True):
+def concatenate(arrays, axis=0, mergebool=True, highlevel=True, partitioned=None):
     """
     Args:
         arrays: Arrays to concatenate along any dimension.
@@ -718,11 +757,24 @@ def concatenate(arrays, axis=0, mergebool=True, highlevel=True):
             distinct types (using an #ak.layout.UnionArray8_64).
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
+        partitioned (None or bool): If True, return an
+            #ak.partition.IrregularlyPartitionedArray whose partitions are the
+            `arrays` (or their partitions), without copying them; if False,
+            merge them into a single array. If None, the result is
+            partitioned if the `arrays` all have the same type and either
+            one of them is already partitioned or together they have at least
+            128 MiB.
 
     Returns an array with `arrays` concatenated. For `axis=0`, this means that
     one whole array follows another. For `axis=1`, it means that the `arrays`
     must have the same lengths and nested lists are each concatenated,
     element for element, and similarly for deeper levels.
+
+    Merging copies every buffer into a new array, so concatenating many large
+    arrays needs twice their memory. A partitioned result only refers to the
+    original arrays, but they must have the same type (which is checked from
+    their Forms, so lazy #ak.layout.VirtualArray inputs with known Forms are
+    not read), and it behaves like any other partitioned array.
     """
     if axis != 0:
         raise NotImplementedError(
@@ -734,27 +786,53 @@ def concatenate(arrays, axis=0, mergebool=True, highlevel=True):
         awkward1.operations.convert.to_layout(x, allow_record=False) for x in arrays
     ]
 
-    contents = [
-        x.toContent() if isinstance(x, awkward1.partition.PartitionedArray) else x
-        for x in contents
-    ]
-
     if len(contents) == 0:
         raise ValueError(
             "need at least one array to concatenate"
             + awkward1._util.exception_suffix(__file__)
         )
-    out = contents[0]
-    for x in contents[1:]:
-        if not out.mergeable(x, mergebool=mergebool):
-            out = out.merge_as_union(x)
-        else:
-            out = out.merge(x)
-        if isinstance(out, awkward1._util.uniontypes):
-            out = out.simplify(mergebool=mergebool)
+
+    behavior = awkward1._util.behaviorof(*arrays)
+    if partitioned is None:
+        partitioned = _concatenate_partitioned(contents, behavior)
+
+    if partitioned:
+        if not _concatenate_types(contents, behavior):
+            raise ValueError(
+                "cannot concatenate arrays of different types into a "
+                "partitioned array; use partitioned=False to merge them"
+                + awkward1._util.exception_suffix(__file__)
+            )
+        partitions = []
+        stops = []
+        stop = 0
+        for x in contents:
+            for partition in awkward1.partition.every(x):
+                if len(partition) > 0:
+                    stop += len(partition)
+                    partitions.append(partition)
+                    stops.append(stop)
+        if len(partitions) == 0:
+            partitions.append(awkward1.partition.every(contents[0])[0])
+            stops.append(0)
+        out = awkward1.partition.IrregularlyPartitionedArray(partitions, stops)
+
+    else:
+        contents = [
+            x.toContent() if isinstance(x, awkward1.partition.PartitionedArray) else x
+            for x in contents
+        ]
+        out = contents[0]
+        for x in contents[1:]:
+            if not out.mergeable(x, mergebool=mergebool):
+                out = out.merge_as_union(x)
+            else:
+                out = out.merge(x)
+            if isinstance(out, awkward1._util.uniontypes):
+                out = out.simplify(mergebool=mergebool)
 
     if highlevel:
-        return awkward1._util.wrap(out, behavior=awkward1._util.behaviorof(*arrays))
+        return awkward1._util.wrap(out, behavior=behavior)
     else:
         return out
 
@@ -855,11 +933,10 @@ def where(condition, *args, **kwargs):
             akcondition, x, y = awkward1.partition.partition_as(
                 sample, (akcondition, x, y)
             )
-            output = []
-            for part in awkward1.partition.iterate(
-                sample.numpartitions, (akcondition, x, y)
-            ):
-                output.append(do_one(*part))
+            output = awkward1.partition.execute(
+                lambda part: do_one(*part),
+                awkward1.partition.iterate(sample.numpartitions, (akcondition, x, y)),
+            )
 
             out = awkward1.partition.IrregularlyPartitionedArray(output)
 
@@ -1121,6 +1198,45 @@ def argsort(array, axis=-1, ascending=True, stable=True, highlevel=True):
         return out
 
 
+def parallel_sorting(threads=None, threshold=None):
+    """
+    Args:
+        threads (None or int): Maximum number of threads used by each sort;
+            `1` sorts serially (the default) and `0` uses one thread per
+            hardware thread. If None, this setting is not changed.
+        threshold (None or int): Minimum number of values to sort before
+            more than one thread is used. If None, this setting is not
+            changed.
+
+    Configures the parallel execution mode of #ak.sort and #ak.argsort and
+    returns the previous `(threads, threshold)` as a tuple, so that they
+    can be restored. With no arguments, this function only returns the
+    current settings.
+
+    In parallel mode, the lists being sorted are divided among `threads`
+    groups of consecutive lists with about the same number of values each,
+    and each group is sorted in a separate thread. This helps the most
+    for arrays with many small lists; each list is still sorted by one
+    thread. (Independently of this setting, long lists of integers are
+    sorted by radix, rather than by comparison.)
+
+    For example,
+
+        >>> previous = ak.parallel_sorting(threads=8, threshold=1000000)
+        >>> ak.sort(array, axis=-1)     # uses up to 8 threads
+        >>> ak.parallel_sorting(*previous)
+
+    See also #ak.parallel_reducers.
+    """
+    previous = awkward1._ext._sort_parallel()
+    if threads is None:
+        threads = previous[0]
+    if threshold is None:
+        threshold = previous[1]
+    awkward1._ext._set_sort_parallel(threads, threshold)
+    return previous
+
+
 def pad_none(array, target, axis=1, clip=False, highlevel=True):
     """
     Args:
@@ -1287,8 +1403,10 @@ def fill_none(array, value, highlevel=True):
     nplike = awkward1.nplike.of(arraylayout)
 
     if isinstance(arraylayout, awkward1.partition.PartitionedArray):
-        out = awkward1.partition.apply(
-            lambda x: fill_none(x, value, highlevel=False), arraylayout
+        out = awkward1.partition.IrregularlyPartitionedArray(
+            awkward1.partition.execute(
+                lambda x: fill_none(x, value, highlevel=False), arraylayout.partitions
+            )
         )
 
     else:
@@ -1363,8 +1481,10 @@ def is_none(array, highlevel=True):
     layout = awkward1.operations.convert.to_layout(array, allow_record=False)
 
     if isinstance(layout, awkward1.partition.PartitionedArray):
-        out = awkward1.partition.apply(
-            lambda x: awkward1.layout.NumpyArray(apply(x)), layout
+        out = awkward1.partition.IrregularlyPartitionedArray(
+            awkward1.partition.execute(
+                lambda x: awkward1.layout.NumpyArray(apply(x)), layout.partitions
+            )
         )
     else:
         out = awkward1.layout.NumpyArray(apply(layout))
@@ -1770,20 +1890,17 @@ def cartesian(
 
         partition_arrays = awkward1.partition.partition_as(sample, new_arrays)
 
-        output = []
-        for part_arrays in awkward1.partition.iterate(
-            sample.numpartitions, partition_arrays
-        ):
-            output.append(
-                cartesian(
-                    part_arrays,
-                    axis=axis,
-                    nested=nested,
-                    parameters=parameters,
-                    with_name=None,  # already set: see above
-                    highlevel=False,
-                )
-            )
+        output = awkward1.partition.execute(
+            lambda part_arrays: cartesian(
+                part_arrays,
+                axis=axis,
+                nested=nested,
+                parameters=parameters,
+                with_name=None,  # already set: see above
+                highlevel=False,
+            ),
+            awkward1.partition.iterate(sample.numpartitions, partition_arrays),
+        )
 
         result = awkward1.partition.IrregularlyPartitionedArray(output)
 
@@ -2282,7 +2399,44 @@ def partitioned(generate, numpartitions, highlevel=True, behavior=None):
         return out
 
 
-def repartition(array, lengths, highlevel=True):
+def _nbytes_lengths(layout, nbytes):
+    if isinstance(layout, awkward1.partition.PartitionedArray):
+        partitions = [
+            (layout.lengths[i], layout.partition(i))
+            for i in range(layout.numpartitions)
+        ]
+    else:
+        partitions = [(len(layout), layout)]
+
+    lengths = []
+    length = 0
+    size = 0
+    for partition_length, partition in partitions:
+        if partition_length == 0:
+            continue
+        itemsize = float(awkward1._util.estimate_nbytes(partition)) / partition_length
+        remaining = partition_length
+        while remaining > 0:
+            if itemsize == 0:
+                take = remaining + 1
+            else:
+                take = max(1, int(math.ceil((nbytes - size) / itemsize)))
+            if take <= remaining:
+                lengths.append(length + take)
+                length = 0
+                size = 0
+                remaining -= take
+            else:
+                length += remaining
+                size += remaining * itemsize
+                remaining = 0
+
+    if length > 0 or len(lengths) == 0:
+        lengths.append(length)
+    return lengths
+
+
+def repartition(array, lengths=None, highlevel=True, nbytes=None):
     """
     Args:
         array: A possibly-partitioned array.
@@ -2296,9 +2450,12 @@ def repartition(array, lengths, highlevel=True):
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content or #ak.partition.PartitionedArray
             subclass.
+        nbytes (None or int): If not None, split or repartition into
+            partitions of about this many bytes each (`lengths` must be
+            None).
 
-    Returns a possibly-partitioned array: unpartitioned if `lengths` is None;
-    partitioned otherwise.
+    Returns a possibly-partitioned array: unpartitioned if `lengths` and
+    `nbytes` are None; partitioned otherwise.
 
     Partitioning is an internal aspect of an array: it should behave
     identically to a non-partitioned array, but possibly with different
@@ -2306,11 +2463,32 @@ def repartition(array, lengths, highlevel=True):
 
     Arrays can only be partitioned in the first dimension; it is intended
     for performing calculations in memory-sized chunks.
+
+    With `nbytes`, the size of each original partition is estimated from the
+    parts of its buffers that it uses, assuming that its entries all have
+    the same size, and the new partitions are cut wherever they reach
+    `nbytes`. Lazy partitions (#ak.layout.VirtualArray) are not read if
+    their Form and length are known and the Form has no variable-length
+    lists. This is useful to give caches and parallel workers evenly sized
+    units of work, regardless of how the data were originally partitioned.
     """
     layout = awkward1.operations.convert.to_layout(
         array, allow_record=False, allow_other=False
     )
 
+    if nbytes is not None:
+        if lengths is not None:
+            raise ValueError(
+                "only one of lengths and nbytes may be specified"
+                + awkward1._util.exception_suffix(__file__)
+            )
+        if nbytes < 1:
+            raise ValueError(
+                "nbytes must be at least 1 (and probably considerably more)"
+                + awkward1._util.exception_suffix(__file__)
+            )
+        lengths = _nbytes_lengths(layout, nbytes)
+
     if lengths is None:
         if isinstance(layout, awkward1.partition.PartitionedArray):
             out = layout.toContent()
@@ -2390,7 +2568,8 @@ def virtual(
             mapping with `__setitem__`, retrieved with `__getitem__`, and only
             re-generated if `__getitem__` raises a `KeyError`. This mapping may
             evict elements according to any caching algorithm (LRU, LFR, RR,
-            TTL, etc.).
+            TTL, etc.). An #ak.layout.LRUArrayCache is used directly, without
+            calling back into Python.
         cache_key (None or str): If None, a unique string is generated for this
             virtual array for use with the `cache` (unique per Python process);
             otherwise, the explicitly provided key is used (which ought to
@@ -2441,7 +2620,9 @@ def virtual(
     gen = awkward1.layout.ArrayGenerator(
         generate, args, kwargs, form=form, length=length
     )
-    if cache is not None:
+    if cache is not None and not isinstance(
+        cache, (awkward1.layout.ArrayCache, awkward1.layout.LRUArrayCache)
+    ):
         cache = awkward1.layout.ArrayCache(cache)
 
     out = awkward1.layout.VirtualArray(
@@ -2525,7 +2706,9 @@ def with_cache(array, cache, chain=None, highlevel=True):
             + awkward1._util.exception_suffix(__file__)
         )
 
-    if not isinstance(cache, awkward1.layout.ArrayCache):
+    if not isinstance(
+        cache, (awkward1.layout.ArrayCache, awkward1.layout.LRUArrayCache)
+    ):
         cache = awkward1.layout.ArrayCache(cache)
 
     def getfunction(layout, depth):
@@ -2597,6 +2780,158 @@ class _CacheChain(MutableMapping):
         return len(set(self.first).union(set(self.last)))
 
 
+def cache_statistics(reset=False, per_key=None):
+    """
+    Args:
+        reset (bool): If True, set all counters to zero (and forget all cache
+            keys) after reading them.
+        per_key (None or bool): If True, start collecting counts for each
+            `cache_key` separately; if False, stop. If None, this setting is
+            not changed.
+
+    Returns a dict of process-wide counters of #ak.layout.VirtualArray
+    materializations:
+
+       * `"hits"`: number of times an array was found in a cache;
+       * `"misses"`: number of times an array was generated, including every
+         request of a virtual array that has no cache;
+       * `"generate_seconds"`: total wall time spent in generators;
+       * `"bytes_generated"`: total `nbytes` of all generated arrays;
+       * `"evictions"`: number of arrays evicted from any
+         #ak.layout.LRUArrayCache;
+       * `"bytes_evicted"`: total `nbytes` of all evicted arrays;
+       * `"keys"`: a dict from `cache_key` to a dict of `"hits"`, `"misses"`,
+         `"generate_seconds"`, `"evictions"`, and `"bytes_evicted"` for that
+         key, only filled while `per_key` is enabled (since the number of
+         distinct keys is unbounded).
+
+    The number of bytes currently held by a cache is its `nbytes` property,
+    both for #ak.layout.LRUArrayCache and #ak.layout.ArrayCache.
+
+    For example, to check that a lazily read file is not read twice:
+
+        >>> ak.cache_statistics(reset=True, per_key=True)
+        >>> array = ak.from_parquet("file.parquet", lazy=True, lazy_cache=cache)
+        >>> ak.sum(array.x), ak.max(array.x)
+        >>> stats = ak.cache_statistics(per_key=False)
+        >>> [key for key, counts in stats["keys"].items() if counts["misses"] > 1]
+        []
+    """
+    out = awkward1._ext._cache_statistics()
+    if reset:
+        awkward1._ext._reset_cache_statistics()
+    if per_key is not None:
+        awkward1._ext._set_cache_statistics_per_key(per_key)
+    return out
+
+
+def prefetch(array, columns=None, ahead=1, threads=1, highlevel=True):
+    """
+    Args:
+        array: A possibly-partitioned array containing virtual arrays, such
+            as the output of #ak.from_parquet or #ak.from_arrayset with
+            `lazy=True`.
+        columns (None or iterable of str): Names of the record fields to
+            prefetch; if None, all virtual arrays are prefetched.
+        ahead (int): Number of partitions after the current one to prefetch.
+        threads (int): Number of background threads that run generators.
+        highlevel (bool): If True, yield #ak.Array partitions; otherwise,
+            yield low-level #ak.layout.Content subclasses.
+
+    Iterates over the partitions of `array` while generating the virtual
+    arrays of the next `ahead` partitions in background threads, so that
+    reading and decompression overlap with the processing of each
+    partition.
+
+    Generated arrays are put into the cache of each #ak.layout.VirtualArray
+    (as though they had been accessed), so virtual arrays without a cache
+    are not prefetched. The cache must be large enough to hold `ahead + 1`
+    partitions of the requested `columns`, or prefetched arrays may be
+    evicted before they are used.
+
+    For example,
+
+        >>> cache = ak.layout.LRUArrayCache(2**30)
+        >>> array = ak.from_parquet("file.parquet", lazy=True, lazy_cache=cache)
+        >>> for partition in ak.prefetch(array, columns=["x", "y"], ahead=2):
+        ...     process(partition.x, partition.y)
+
+    Errors raised by generators in the background are ignored; they are
+    raised again when the array is accessed in the main thread.
+    """
+    if ahead < 0 or threads < 1:
+        raise ValueError(
+            "ak.prefetch requires ahead >= 0 and threads >= 1"
+            + awkward1._util.exception_suffix(__file__)
+        )
+    if columns is not None:
+        columns = set(columns)
+
+    behavior = awkward1._util.behaviorof(array)
+    layout = awkward1.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    partitions = awkward1.partition.every(layout)
+    return _prefetch_partitions(partitions, columns, ahead, threads, highlevel, behavior)
+
+
+def _prefetch_partitions(partitions, columns, ahead, threads, highlevel, behavior):
+    tasks = queue.Queue()
+    done = [threading.Event() for x in partitions]
+    stopping = threading.Event()
+
+    def work():
+        while True:
+            partitionid = tasks.get()
+            if partitionid is None:
+                return
+            try:
+                if not stopping.is_set():
+                    _prefetch_virtual(partitions[partitionid], columns)
+            except Exception:
+                pass
+            finally:
+                done[partitionid].set()
+
+    workers = [threading.Thread(target=work) for x in range(threads)]
+    for worker in workers:
+        worker.daemon = True
+        worker.start()
+
+    try:
+        scheduled = 0
+        for partitionid, partition in enumerate(partitions):
+            while scheduled < len(partitions) and scheduled <= partitionid + ahead:
+                tasks.put(scheduled)
+                scheduled += 1
+            done[partitionid].wait()
+            if highlevel:
+                yield awkward1._util.wrap(partition, behavior)
+            else:
+                yield partition
+    finally:
+        stopping.set()
+        for worker in workers:
+            tasks.put(None)
+        for worker in workers:
+            worker.join()
+
+
+def _prefetch_virtual(layout, columns):
+    if isinstance(layout, awkward1.layout.VirtualArray):
+        if layout.cache is not None:
+            _prefetch_virtual(layout.array, columns)
+    elif isinstance(layout, awkward1.layout.RecordArray):
+        for key in layout.keys():
+            if columns is None or key in columns:
+                _prefetch_virtual(layout.field(key), None)
+    elif isinstance(layout, awkward1._util.uniontypes):
+        for content in layout.contents:
+            _prefetch_virtual(content, columns)
+    elif hasattr(layout, "content"):
+        _prefetch_virtual(layout.content, columns)
+
+
 @awkward1._connect._numpy.implements("size")
 def size(array, axis=None):
     """
@@ -2797,7 +3132,10 @@ __all__ = [
     if not x.startswith("_") and x not in (
         "absolute_import",
         "numbers",
+        "math",
         "json",
+        "threading",
+        "queue",
         "Iterable",
         "MutableMapping",
         "np",
@@ -3,12 +3,20 @@
 from __future__ import absolute_import
 
 import numbers
+import threading
+import contextlib
+import traceback
 
 try:
     from collections.abc import Iterable
 except ImportError:
     from collections import Iterable
 
+try:
+    import concurrent.futures
+except ImportError:
+    concurrent = None
+
 import awkward1._ext
 import awkward1._util
 
@@ -93,8 +101,397 @@ def iterate(numpartitions, arrays):
             yield out
 
 
-def apply(function, array):
-    return IrregularlyPartitionedArray([function(x) for x in array.partitions])
+_executor = "threads"
+_executor_pools = {}
+_executor_lock = threading.Lock()
+_executor_local = threading.local()
+
+
+def set_executor(executor):
+    """
+    Args:
+        executor (None, "serial", "threads", "processes", or executor): How
+            independent partitions are processed: None or "serial" for one
+            at a time, "threads" for a shared
+            `concurrent.futures.ThreadPoolExecutor`, "processes" for a
+            shared `concurrent.futures.ProcessPoolExecutor`, or any object
+            with a `map(function, items)` method, such as a
+            `concurrent.futures.Executor`.
+
+    Sets the executor used by operations on #ak.partition.PartitionedArray
+    (ufuncs and other broadcasting operations, reducers that do not combine
+    partitions, slicing, field projection, #ak.partition.apply, etc.) and
+    returns the previous one, so that it can be restored. The default is
+    "threads".
+
+    Threads only run concurrently where the work releases the GIL, such as
+    reading lazy partitions from files. Processes can only be used for
+    functions that can be pickled, so operations whose per-partition work
+    is a closure use the thread pool instead; #ak.partition.apply sends its
+    partitions to processes as arraysets (see #ak.to_arrayset).
+
+    See also #ak.partition.executor for a temporary override.
+    """
+    global _executor
+    if not (
+        executor is None
+        or executor in ("serial", "threads", "processes")
+        or hasattr(executor, "map")
+    ):
+        raise ValueError(
+            "executor must be None, 'serial', 'threads', 'processes', or an "
+            "object with a 'map' method, not {0}".format(repr(executor))
+            + awkward1._util.exception_suffix(__file__)
+        )
+    previous = _executor
+    _executor = executor
+    return previous
+
+
+@contextlib.contextmanager
+def executor(executor):
+    """
+    Args:
+        executor (None, "serial", "threads", "processes", or executor): See
+            #ak.partition.set_executor.
+
+    Context manager that sets the partition executor within a `with` block.
+    For example,
+
+        >>> with ak.partition.executor("serial"):
+        ...     result = np.sqrt(array.x)
+
+    runs this computation one partition at a time, regardless of the
+    global setting.
+    """
+    previous = set_executor(executor)
+    try:
+        yield
+    finally:
+        set_executor(previous)
+
+
+def _pool(kind):
+    with _executor_lock:
+        if kind not in _executor_pools:
+            if kind == "threads":
+                _executor_pools[kind] = concurrent.futures.ThreadPoolExecutor()
+            else:
+                _executor_pools[kind] = concurrent.futures.ProcessPoolExecutor()
+        return _executor_pools[kind]
+
+
+class _InWorker(object):
+    # marks the calling thread as a worker, so that partitioned operations
+    # nested in `function` run serially instead of waiting on the same pool
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, item):
+        previous = getattr(_executor_local, "inside", False)
+        _executor_local.inside = True
+        try:
+            return self.function(item)
+        finally:
+            _executor_local.inside = previous
+
+
+def execute(function, items, executor=None, picklable=False):
+    """
+    Args:
+        function (callable): Function to apply to each item.
+        items (iterable): Independent items, usually partitions or tuples
+            of partitions.
+        executor (None, "serial", "threads", "processes", or executor): If
+            None, the global setting (#ak.partition.set_executor) is used.
+        picklable (bool): If True, `function` and `items` can be sent to
+            other processes; otherwise, process-based executors are
+            replaced by the thread pool.
+
+    Returns a list of `function` applied to each of the `items`, possibly
+    computed concurrently. Calls within a worker of a thread-based executor
+    (the thread pool or any executor other than a process pool) are always
+    serial, so nested partitioned operations cannot deadlock.
+    """
+    items = list(items)
+    if executor is None:
+        executor = _executor
+
+    if (
+        executor is None
+        or executor == "serial"
+        or len(items) <= 1
+        or getattr(_executor_local, "inside", False)
+        or concurrent is None and isinstance(executor, str)
+    ):
+        return [function(x) for x in items]
+
+    if executor == "processes" or (
+        concurrent is not None
+        and isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+    ):
+        if picklable:
+            if executor == "processes":
+                executor = _pool("processes")
+            return list(executor.map(function, items))
+        executor = "threads"
+
+    if executor == "threads":
+        executor = _pool("threads")
+    return list(executor.map(_InWorker(function), items))
+
+
+class _ArraysetTask(object):
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, packed):
+        return _pack(self.function(_unpack(packed)))
+
+
+class _Packed(object):
+    def __init__(self, form, container):
+        self.form = form
+        self.container = container
+
+
+def _pack(layout):
+    import awkward1.operations.convert
+
+    if isinstance(layout, awkward1.layout.Content):
+        form, container, num_partitions = awkward1.operations.convert.to_arrayset(
+            layout
+        )
+        return _Packed(form, container)
+    else:
+        return layout
+
+
+def _unpack(packed):
+    import awkward1.operations.convert
+
+    if isinstance(packed, _Packed):
+        return awkward1.operations.convert.from_arrayset(
+            packed.form, packed.container, highlevel=False
+        )
+    else:
+        return packed
+
+
+def apply(function, array, executor=None):
+    """
+    Args:
+        function (callable): Function from one partition (#ak.layout.Content)
+            to a new partition.
+        array (#ak.partition.PartitionedArray): Array to transform.
+        executor (None, "serial", "threads", "processes", or executor): If
+            None, the global setting (#ak.partition.set_executor) is used.
+
+    Returns an #ak.partition.IrregularlyPartitionedArray of `function`
+    applied to each partition of `array`, possibly concurrently.
+
+    With a process-based executor, `function` must be picklable; the
+    partitions are sent to the processes and back as arraysets.
+    """
+    if executor is None:
+        executor = _executor
+    if executor == "processes" or (
+        concurrent is not None
+        and isinstance(executor, concurrent.futures.ProcessPoolExecutor)
+    ):
+        partitions = execute(
+            _ArraysetTask(function),
+            [_pack(x) for x in array.partitions],
+            executor,
+            picklable=True,
+        )
+        partitions = [_unpack(x) for x in partitions]
+    else:
+        partitions = execute(function, array.partitions, executor)
+    return IrregularlyPartitionedArray(partitions)
+
+
+def _shared_arrayset(layout, name=None):
+    import multiprocessing.shared_memory
+    import awkward1.operations.convert
+
+    form, container, num_partitions = awkward1.operations.convert.to_arrayset(
+        layout
+    )
+    buffers = {}
+    total = 0
+    for key, value in container.items():
+        value = numpy.asarray(value)
+        total += -total % 64
+        buffers[key] = (total, value.nbytes)
+        total += value.nbytes
+
+    shm = multiprocessing.shared_memory.SharedMemory(create=True, size=max(total, 1))
+    try:
+        for key, value in container.items():
+            offset, nbytes = buffers[key]
+            destination = numpy.frombuffer(
+                shm.buf, dtype=np.uint8, count=nbytes, offset=offset
+            )
+            destination[:] = numpy.asarray(value).reshape(-1).view(np.uint8)
+            del destination
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+    finally:
+        # to_arrayset's recursive closure keeps the container alive until the
+        # next garbage collection; drop its views of the layout's buffers now
+        container.clear()
+
+    return shm, (form, shm.name, buffers)
+
+
+def _from_shared_arrayset(shm, description, copy=False):
+    import awkward1.operations.convert
+
+    form, name, buffers = description
+    container = {}
+    for key, (offset, nbytes) in buffers.items():
+        container[key] = numpy.frombuffer(
+            shm.buf, dtype=np.uint8, count=nbytes, offset=offset
+        )
+        if copy:
+            container[key] = numpy.array(container[key])
+    return awkward1.operations.convert.from_arrayset(
+        form, container, highlevel=False
+    )
+
+
+def _map_processes_task(args):
+    import multiprocessing.shared_memory
+
+    function, description, behavior = args
+    shm = multiprocessing.shared_memory.SharedMemory(name=description[1])
+    try:
+        layout = _from_shared_arrayset(shm, description)
+        result = function(awkward1._util.wrap(layout, behavior))
+        result = awkward1.operations.convert.to_layout(
+            result, allow_record=False, allow_other=False
+        )
+        if isinstance(result, PartitionedArray):
+            result = result.toContent()
+        # the result is copied out of the input segment, and the parent
+        # process takes ownership of the output segment
+        out, outdescription = _shared_arrayset(result)
+        out.close()
+        del layout, result
+    except Exception as err:
+        # the traceback's frames hold views of the input segment
+        traceback.clear_frames(err.__traceback__)
+        layout = result = None
+        shm.close()
+        raise
+    shm.close()
+    return outdescription
+
+
+def map_processes(function, array, workers=None, highlevel=True, behavior=None):
+    """
+    Args:
+        function (callable): Picklable function from an #ak.Array (one
+            partition) to an array-like result.
+        array: Data to process, one partition at a time (an unpartitioned
+            array is a single partition).
+        workers (None or int): Number of worker processes; if None, one per
+            CPU.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.partition.IrregularlyPartitionedArray.
+        behavior (None or dict): Custom #ak.behavior for the output array,
+            if high-level.
+
+    Applies `function` to each partition of `array` in a pool of worker
+    processes and gathers the results into an
+    #ak.partition.IrregularlyPartitionedArray. Unlike threads, processes are
+    not limited by the GIL, so this is the way to parallelize Python-heavy
+    work.
+
+    Instead of being pickled, each partition is decomposed into buffers
+    (#ak.to_arrayset) that are copied once into a
+    `multiprocessing.shared_memory` segment, and the workers reconstruct it
+    with #ak.from_arrayset as views of that segment, without copying. The
+    results come back the same way and are copied once out of their
+    segments. Only the Forms, segment names, and offsets are pickled.
+    Because the inputs are views, `function` must not keep references to
+    its argument after it returns; if it does, the worker cannot release the
+    segment and a BufferError is raised. If any worker raises, the exception
+    is raised here after all segments have been released.
+
+    Requires Python 3.8 or later.
+    """
+    try:
+        import multiprocessing.shared_memory
+        import concurrent.futures
+    except ImportError:
+        raise ImportError(
+            "ak.partition.map_processes requires Python 3.8 or later "
+            "(multiprocessing.shared_memory)"
+            + awkward1._util.exception_suffix(__file__)
+        )
+    import awkward1.operations.convert
+
+    layout = awkward1.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    inbehavior = awkward1._util.behaviorof(array)
+
+    inputs = []
+    descriptions = []
+    try:
+        tasks = []
+        for partition in every(layout):
+            shm, description = _shared_arrayset(partition)
+            inputs.append(shm)
+            tasks.append((function, description, inbehavior))
+        descriptions = [None] * len(tasks)
+
+        error = None
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            futures = dict(
+                (pool.submit(_map_processes_task, task), i)
+                for i, task in enumerate(tasks)
+            )
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    descriptions[futures[future]] = future.result()
+                except Exception as err:
+                    if error is None:
+                        error = err
+                        for x in futures:
+                            x.cancel()
+        if error is not None:
+            raise error
+
+        partitions = []
+        for i, description in enumerate(descriptions):
+            shm = multiprocessing.shared_memory.SharedMemory(name=description[1])
+            try:
+                partitions.append(_from_shared_arrayset(shm, description, copy=True))
+            finally:
+                descriptions[i] = None
+                shm.close()
+                shm.unlink()
+
+    finally:
+        for shm in inputs:
+            shm.close()
+            shm.unlink()
+        for description in descriptions:
+            if description is not None:
+                shm = multiprocessing.shared_memory.SharedMemory(name=description[1])
+                shm.close()
+                shm.unlink()
+
+    out = IrregularlyPartitionedArray(partitions)
+    if highlevel:
+        return awkward1._util.wrap(out, behavior)
+    else:
+        return out
 
 
 class PartitionedArray(object):
@@ -225,17 +622,21 @@ class PartitionedArray(object):
         if first(self).axis_wrap_if_negative(axis) == 0:
             return sum(x.num(axis) for x in self.partitions)
         else:
-            return self.replace_partitions([x.num(axis) for x in self.partitions])
+            return self.replace_partitions(
+                execute(lambda x: x.num(axis), self.partitions)
+            )
 
     def flatten(self, *args, **kwargs):
-        return apply(lambda x: x.flatten(*args, **kwargs), self)
+        return IrregularlyPartitionedArray(
+            execute(lambda x: x.flatten(*args, **kwargs), self.partitions)
+        )
 
     def rpad(self, length, axis):
         if first(self).axis_wrap_if_negative(axis) == 0:
             return self.toContent().rpad(length, axis)
         else:
             return self.replace_partitions(
-                [x.rpad(length, axis) for x in self.partitions]
+                execute(lambda x: x.rpad(length, axis), self.partitions)
             )
 
     def rpad_and_clip(self, length, axis):
@@ -243,7 +644,7 @@ class PartitionedArray(object):
             return self.toContent().rpad_and_clip(length, axis)
         else:
             return self.replace_partitions(
-                [x.rpad_and_clip(length, axis) for x in self.partitions]
+                execute(lambda x: x.rpad_and_clip(length, axis), self.partitions)
             )
 
     def reduce(self, name, axis, mask, keepdims):
@@ -255,7 +656,9 @@ class PartitionedArray(object):
             return getattr(self.toContent(), name)(axis, mask, keepdims)
         else:
             return self.replace_partitions(
-                [getattr(x, name)(axis, mask, keepdims) for x in self.partitions]
+                execute(
+                    lambda x: getattr(x, name)(axis, mask, keepdims), self.partitions
+                )
             )
 
     def count(self, axis, mask, keepdims):
@@ -303,7 +706,7 @@ class PartitionedArray(object):
 
         else:
             return self.replace_partitions(
-                [x.localindex(axis) for x in self.partitions]
+                execute(lambda x: x.localindex(axis), self.partitions)
             )
 
     def combinations(self, n, replacement, keys, parameters, axis):
@@ -311,10 +714,10 @@ class PartitionedArray(object):
             return self.toContent().combinations(n, replacement, keys, parameters, axis)
         else:
             return self.replace_partitions(
-                [
-                    x.combinations(n, replacement, keys, parameters, axis)
-                    for x in self.partitions
-                ]
+                execute(
+                    lambda x: x.combinations(n, replacement, keys, parameters, axis),
+                    self.partitions,
+                )
             )
 
     def __len__(self):
@@ -373,7 +776,9 @@ class PartitionedArray(object):
         elif isinstance(where, str) or (
             awkward1._util.py27 and isinstance(where, awkward1._util.unicode)
         ):
-            return self.replace_partitions([x[where] for x in self.partitions])
+            return self.replace_partitions(
+                execute(lambda x: x[where], self.partitions)
+            )
 
         elif isinstance(where, tuple) and len(where) == 0:
             return self
@@ -389,7 +794,9 @@ class PartitionedArray(object):
                 for x in where
             )
         ):
-            return self.replace_partitions([x[where] for x in self.partitions])
+            return self.replace_partitions(
+                execute(lambda x: x[where], self.partitions)
+            )
 
         else:
             if not isinstance(where, tuple):
@@ -414,18 +821,20 @@ class PartitionedArray(object):
                     head.start, head.stop, head.step
                 ).partitions
                 return IrregularlyPartitionedArray(
-                    [x[(slice(None),) + tail] for x in partitions]
+                    execute(lambda x: x[(slice(None),) + tail], partitions)
                 )
 
             elif head is Ellipsis:
                 return IrregularlyPartitionedArray(
-                    [x[(head,) + tail] for x in self.partitions]
+                    execute(lambda x: x[(head,) + tail], self.partitions)
                 )
 
             elif isinstance(head, str) or (
                 awkward1._util.py27 and isinstance(head, awkward1._util.unicode)
             ):
-                y = IrregularlyPartitionedArray([x[head] for x in self.partitions])
+                y = IrregularlyPartitionedArray(
+                    execute(lambda x: x[head], self.partitions)
+                )
                 if len(tail) == 0:
                     return y
                 else:
@@ -439,7 +848,7 @@ class PartitionedArray(object):
                 for x in head
             ):
                 y = IrregularlyPartitionedArray(
-                    [x[list(head)] for x in self.partitions]
+                    execute(lambda x: x[list(head)], self.partitions)
                 )
                 if len(tail) == 0:
                     return y
@@ -496,11 +905,10 @@ class PartitionedArray(object):
                         layout = IrregularlyPartitionedArray.toPartitioned(
                             layout, stops
                         )
-                    inparts = self.partitions
-                    headparts = layout.partitions
-                    outparts = []
-                    for i in range(len(inparts)):
-                        outparts.append(inparts[i][(headparts[i],) + tail])
+                    outparts = execute(
+                        lambda x: x[0][(x[1],) + tail],
+                        zip(self.partitions, layout.partitions),
+                    )
                     return IrregularlyPartitionedArray(outparts, stops)
 
 
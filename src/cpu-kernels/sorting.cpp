@@ -5,10 +5,88 @@
 #include <algorithm>
 #include <cstring>
 #include <numeric>
+#include <type_traits>
 #include <vector>
 
 #include "awkward/kernels/sorting.h"
 
+// Ranges shorter than this are sorted by comparison; longer ranges of
+// integers are sorted by radix.
+const int64_t kRadixSortMinLength = 512;
+
+// Sorts index[0], ..., index[length - 1] by the integer values they point to
+// in fromptr, one 8-bit digit at a time (least significant first). Each pass
+// is a stable counting sort, so the whole sort is stable (for ascending and
+// descending order). Returns false (doing nothing) if the range is too short
+// for a radix sort to be worthwhile.
+template <typename T>
+typename std::enable_if<std::is_integral<T>::value  &&
+                        !std::is_same<T, bool>::value, bool>::type
+radix_sort_index(
+  int64_t* index,
+  int64_t length,
+  const T* fromptr,
+  bool ascending) {
+  if (length < kRadixSortMinLength) {
+    return false;
+  }
+  typedef typename std::make_unsigned<T>::type U;
+  // Flipping the sign bit puts signed values in unsigned order; flipping
+  // all bits reverses the order.
+  const U signbit = std::is_signed<T>::value ?
+                    (U)((U)1 << (8*sizeof(T) - 1)) : (U)0;
+  const U flip = ascending ? (U)0 : (U)~(U)0;
+
+  std::vector<U> keys((size_t)length);
+  std::vector<U> keysbuffer((size_t)length);
+  std::vector<int64_t> indexbuffer((size_t)length);
+  for (int64_t i = 0;  i < length;  i++) {
+    keys[i] = (U)((U)fromptr[index[i]] ^ signbit ^ flip);
+  }
+  U* fromkeys = keys.data();
+  U* tokeys = keysbuffer.data();
+  int64_t* fromindex = index;
+  int64_t* toindex = indexbuffer.data();
+
+  for (size_t shift = 0;  shift < 8*sizeof(T);  shift += 8) {
+    int64_t counts[257];
+    std::fill(counts, counts + 257, 0);
+    for (int64_t i = 0;  i < length;  i++) {
+      counts[((fromkeys[i] >> shift) & 0xff) + 1]++;
+    }
+    // Skip this digit if all values have the same one.
+    if (std::find(counts, counts + 257, length) != counts + 257) {
+      continue;
+    }
+    for (int64_t d = 1;  d < 257;  d++) {
+      counts[d] += counts[d - 1];
+    }
+    for (int64_t i = 0;  i < length;  i++) {
+      int64_t j = counts[(fromkeys[i] >> shift) & 0xff]++;
+      tokeys[j] = fromkeys[i];
+      toindex[j] = fromindex[i];
+    }
+    std::swap(fromkeys, tokeys);
+    std::swap(fromindex, toindex);
+  }
+
+  if (fromindex != index) {
+    std::copy(fromindex, fromindex + length, index);
+  }
+  return true;
+}
+
+template <typename T>
+typename std::enable_if<!std::is_integral<T>::value  ||
+                        std::is_same<T, bool>::value, bool>::type
+radix_sort_index(
+  int64_t* index,
+  int64_t length,
+  const T* fromptr,
+  bool ascending) {
+  return false;
+}
+
 ERROR awkward_sorting_ranges(
   int64_t* toindex,
   int64_t tolength,
@@ -59,7 +137,13 @@ ERROR awkward_argsort(
     auto start = std::next(result.begin(), offsets[i]);
     auto stop = std::next(result.begin(), offsets[i + 1]);
 
-    if (ascending  &&  stable) {
+    if (radix_sort_index(result.data() + offsets[i],
+                         offsets[i + 1] - offsets[i],
+                         fromptr,
+                         ascending)) {
+      // long range of integers: already sorted by radix
+    }
+    else if (ascending  &&  stable) {
       std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
         return fromptr[i1] < fromptr[i2];
       });
@@ -306,7 +390,13 @@ ERROR awkward_sort(
     auto start = std::next(index.begin(), offsets[i]);
     auto stop = std::next(index.begin(), offsets[i + 1]);
 
-    if (ascending  &&  stable) {
+    if (radix_sort_index(index.data() + offsets[i],
+                         offsets[i + 1] - offsets[i],
+                         fromptr,
+                         ascending)) {
+      // long range of integers: already sorted by radix
+    }
+    else if (ascending  &&  stable) {
       std::stable_sort(start, stop, [&fromptr](int64_t i1, int64_t i2) {
         return fromptr[i1] < fromptr[i2];
       });
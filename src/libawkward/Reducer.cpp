@@ -1,12 +1,22 @@
 // BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
 
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/Reducer.cpp", line)
+
+#include <algorithm>
+#include <atomic>
+#include <cstring>
 #include <limits>
+#include <thread>
+#include <vector>
 
 #include "awkward/kernels/reducers.h"
 
 #include "awkward/Reducer.h"
 
 namespace awkward {
+  std::atomic<int64_t> reducer_parallel_threads{1};
+  std::atomic<int64_t> reducer_parallel_threshold{1048576};
+
   util::dtype
   Reducer::return_dtype(util::dtype given_dtype) const {
     return given_dtype;
@@ -17,6 +27,135 @@ namespace awkward {
     return false;
   }
 
+  const std::shared_ptr<void>
+  Reducer::apply_parallel(const ApplyFunction& apply,
+                          const Index64& parents,
+                          int64_t outlength,
+                          util::dtype given_dtype) const {
+    int64_t lenparents = parents.length();
+    int64_t numthreads = std::min(parallel_numthreads(), outlength);
+    if (numthreads <= 1  ||
+        lenparents < parallel_threshold()  ||
+        lenparents < numthreads  ||
+        parents.ptr_lib() != kernel::lib::cpu) {
+      return apply(0, parents, outlength);
+    }
+    const int64_t* rawparents = parents.data();
+
+    // Each thread can only own a contiguous range of the output if the
+    // parents are non-decreasing (and in bounds); otherwise, run serially.
+    std::vector<char> sorted((size_t)numthreads, true);
+    util::run_parallel(numthreads, [&](int64_t k) -> void {
+      int64_t start = (lenparents * k) / numthreads;
+      int64_t stop = (lenparents * (k + 1)) / numthreads;
+      if (rawparents[start] < 0  ||  rawparents[stop - 1] >= outlength  ||
+          (start != 0  &&  rawparents[start - 1] > rawparents[start])) {
+        sorted[(size_t)k] = false;
+        return;
+      }
+      for (int64_t i = start + 1;  i < stop;  i++) {
+        if (rawparents[i - 1] > rawparents[i]) {
+          sorted[(size_t)k] = false;
+          return;
+        }
+      }
+    });
+    for (auto x : sorted) {
+      if (!x) {
+        return apply(0, parents, outlength);
+      }
+    }
+
+    // Split the parent-index space at the parents of evenly spaced elements,
+    // so that each range has about the same number of elements to reduce.
+    std::vector<int64_t> outstarts({ 0 });
+    std::vector<int64_t> datastarts({ 0 });
+    for (int64_t k = 1;  k < numthreads;  k++) {
+      int64_t cut = rawparents[(lenparents * k) / numthreads];
+      if (cut > outstarts.back()) {
+        outstarts.push_back(cut);
+        datastarts.push_back(
+          std::lower_bound(rawparents, rawparents + lenparents, cut)
+          - rawparents);
+      }
+    }
+    outstarts.push_back(outlength);
+    datastarts.push_back(lenparents);
+    int64_t numranges = (int64_t)outstarts.size() - 1;
+
+    util::dtype dtype = return_dtype(given_dtype);
+    int64_t itemsize = util::dtype_to_itemsize(dtype);
+    std::shared_ptr<void> out = kernel::malloc<void>(kernel::lib::cpu,
+                                                     outlength*itemsize);
+    bool positions = returns_positions();
+
+    util::run_parallel(numranges, [&](int64_t k) -> void {
+      int64_t outstart = outstarts[(size_t)k];
+      int64_t outstop = outstarts[(size_t)k + 1];
+      int64_t datastart = datastarts[(size_t)k];
+      int64_t datastop = datastarts[(size_t)k + 1];
+
+      Index64 localparents(datastop - datastart);
+      int64_t* rawlocal = localparents.data();
+      for (int64_t i = datastart;  i < datastop;  i++) {
+        rawlocal[i - datastart] = rawparents[i] - outstart;
+      }
+
+      std::shared_ptr<void> partial = apply(datastart,
+                                            localparents,
+                                            outstop - outstart);
+
+      // The ranges are disjoint, so merging is a copy into place.
+      uint8_t* dst = reinterpret_cast<uint8_t*>(out.get()) + outstart*itemsize;
+      std::memcpy(dst, partial.get(), (size_t)((outstop - outstart)*itemsize));
+      if (positions) {
+        int64_t* pos = reinterpret_cast<int64_t*>(dst);
+        for (int64_t i = 0;  i < outstop - outstart;  i++) {
+          if (pos[i] >= 0) {
+            pos[i] += datastart;
+          }
+        }
+      }
+    });
+
+    return out;
+  }
+
+  int64_t
+  Reducer::parallel_threads() {
+    return reducer_parallel_threads.load();
+  }
+
+  int64_t
+  Reducer::parallel_numthreads() {
+    int64_t threads = reducer_parallel_threads.load();
+    if (threads == 0) {
+      threads = (int64_t)std::thread::hardware_concurrency();
+    }
+    return threads < 1 ? 1 : threads;
+  }
+
+  int64_t
+  Reducer::parallel_threshold() {
+    return reducer_parallel_threshold.load();
+  }
+
+  void
+  Reducer::set_parallel(int64_t threads, int64_t threshold) {
+    if (threads < 0) {
+      throw std::invalid_argument(
+        std::string("number of reducer threads must be non-negative")
+        + FILENAME(__LINE__));
+    }
+    if (threshold < 0) {
+      throw std::invalid_argument(
+        std::string("reducer parallel threshold must be non-negative")
+        + FILENAME(__LINE__));
+    }
+    reducer_parallel_threads.store(threads);
+    reducer_parallel_threshold.store(threshold);
+  }
+
   ////////// count
 
   const std::string
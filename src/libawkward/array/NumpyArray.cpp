@@ -4,10 +4,12 @@
 #define FILENAME_C(line) FILENAME_FOR_EXCEPTIONS_C("src/libawkward/array/NumpyArray.cpp", line)
 
 #include <algorithm>
+#include <atomic>
 #include <iomanip>
 #include <numeric>
 #include <sstream>
 #include <stdexcept>
+#include <thread>
 
 #include "awkward/kernels/identities.h"
 #include "awkward/kernels/getitem.h"
@@ -3137,89 +3139,88 @@ namespace awkward {
                                                  keepdims);
     }
     else {
-      std::shared_ptr<void> ptr;
-      switch (dtype_) {
-      case util::dtype::boolean:
-        ptr = reducer.apply_bool(reinterpret_cast<bool*>(data()),
-                                 parents,
-                                 outlength);
-        break;
-      case util::dtype::int8:
-        ptr = reducer.apply_int8(reinterpret_cast<int8_t*>(data()),
-                                 parents,
-                                 outlength);
-        break;
-      case util::dtype::int16:
-        ptr = reducer.apply_int16(reinterpret_cast<int16_t*>(data()),
-                                  parents,
-                                  outlength);
-        break;
-      case util::dtype::int32:
-        ptr = reducer.apply_int32(reinterpret_cast<int32_t*>(data()),
-                                  parents,
-                                  outlength);
-        break;
-      case util::dtype::int64:
-        ptr = reducer.apply_int64(reinterpret_cast<int64_t*>(data()),
-                                  parents,
-                                  outlength);
-        break;
-      case util::dtype::uint8:
-        ptr = reducer.apply_uint8(reinterpret_cast<uint8_t*>(data()),
-                                  parents,
-                                  outlength);
-        break;
-      case util::dtype::uint16:
-        ptr = reducer.apply_uint16(reinterpret_cast<uint16_t*>(data()),
-                                   parents,
-                                   outlength);
-        break;
-      case util::dtype::uint32:
-        ptr = reducer.apply_uint32(reinterpret_cast<uint32_t*>(data()),
-                                   parents,
-                                   outlength);
-        break;
-      case util::dtype::uint64:
-        ptr = reducer.apply_uint64(reinterpret_cast<uint64_t*>(data()),
-                                   parents,
-                                   outlength);
-        break;
-      case util::dtype::float16:
-        throw std::runtime_error(
-          std::string("FIXME: reducers on float16") + FILENAME(__LINE__));
-      case util::dtype::float32:
-        ptr = reducer.apply_float32(reinterpret_cast<float*>(data()),
-                                    parents,
-                                    outlength);
-        break;
-      case util::dtype::float64:
-        ptr = reducer.apply_float64(reinterpret_cast<double*>(data()),
-                                    parents,
-                                    outlength);
-        break;
-      case util::dtype::float128:
-        throw std::runtime_error(
-          std::string("FIXME: reducers on float128") + FILENAME(__LINE__));
-      case util::dtype::complex64:
-        throw std::runtime_error(
-          std::string("FIXME: reducers on complex64") + FILENAME(__LINE__));
-      case util::dtype::complex128:
-        throw std::runtime_error(
-          std::string("FIXME: reducers on complex128") + FILENAME(__LINE__));
-      case util::dtype::complex256:
-        throw std::runtime_error(
-          std::string("FIXME: reducers on complex256") + FILENAME(__LINE__));
-      // case util::dtype::datetime64:
-      //   throw std::runtime_error(
-      //     std::string("FIXME: reducers on datetime64") + FILENAME(__LINE__));
-      // case util::dtype:::timedelta64:
-      //   throw std::runtime_error(
-      //     std:string("FIXME: reducers on timedelta64") + FILENAME(__LINE__));
-      default:
-        throw std::invalid_argument(
-          std::string("cannot apply reducers to NumpyArray with format \"")
-          + format_ + std::string("\"") + FILENAME(__LINE__));
-      }
+      Reducer::ApplyFunction apply = [&](int64_t dataoffset,
+                                         const Index64& localparents,
+                                         int64_t localoutlength)
+                                         -> const std::shared_ptr<void> {
+        void* rangedata = reinterpret_cast<void*>(
+          reinterpret_cast<uint8_t*>(data()) + dataoffset*itemsize_);
+        switch (dtype_) {
+        case util::dtype::boolean:
+          return reducer.apply_bool(reinterpret_cast<bool*>(rangedata),
+                                    localparents,
+                                    localoutlength);
+        case util::dtype::int8:
+          return reducer.apply_int8(reinterpret_cast<int8_t*>(rangedata),
+                                    localparents,
+                                    localoutlength);
+        case util::dtype::int16:
+          return reducer.apply_int16(reinterpret_cast<int16_t*>(rangedata),
+                                     localparents,
+                                     localoutlength);
+        case util::dtype::int32:
+          return reducer.apply_int32(reinterpret_cast<int32_t*>(rangedata),
+                                     localparents,
+                                     localoutlength);
+        case util::dtype::int64:
+          return reducer.apply_int64(reinterpret_cast<int64_t*>(rangedata),
+                                     localparents,
+                                     localoutlength);
+        case util::dtype::uint8:
+          return reducer.apply_uint8(reinterpret_cast<uint8_t*>(rangedata),
+                                     localparents,
+                                     localoutlength);
+        case util::dtype::uint16:
+          return reducer.apply_uint16(reinterpret_cast<uint16_t*>(rangedata),
+                                      localparents,
+                                      localoutlength);
+        case util::dtype::uint32:
+          return reducer.apply_uint32(reinterpret_cast<uint32_t*>(rangedata),
+                                      localparents,
+                                      localoutlength);
+        case util::dtype::uint64:
+          return reducer.apply_uint64(reinterpret_cast<uint64_t*>(rangedata),
+                                      localparents,
+                                      localoutlength);
+        case util::dtype::float16:
+          throw std::runtime_error(
+            std::string("FIXME: reducers on float16") + FILENAME(__LINE__));
+        case util::dtype::float32:
+          return reducer.apply_float32(reinterpret_cast<float*>(rangedata),
+                                       localparents,
+                                       localoutlength);
+        case util::dtype::float64:
+          return reducer.apply_float64(reinterpret_cast<double*>(rangedata),
+                                       localparents,
+                                       localoutlength);
+        case util::dtype::float128:
+          throw std::runtime_error(
+            std::string("FIXME: reducers on float128") + FILENAME(__LINE__));
+        case util::dtype::complex64:
+          throw std::runtime_error(
+            std::string("FIXME: reducers on complex64") + FILENAME(__LINE__));
+        case util::dtype::complex128:
+          throw std::runtime_error(
+            std::string("FIXME: reducers on complex128") + FILENAME(__LINE__));
+        case util::dtype::complex256:
+          throw std::runtime_error(
+            std::string("FIXME: reducers on complex256") + FILENAME(__LINE__));
+        // case util::dtype::datetime64:
+        //   throw std::runtime_error(
+        //     std::string("FIXME: reducers on datetime64") + FILENAME(__LINE__));
+        // case util::dtype:::timedelta64:
+        //   throw std::runtime_error(
+        //     std:string("FIXME: reducers on timedelta64") + FILENAME(__LINE__));
+        default:
+          throw std::invalid_argument(
+            std::string("cannot apply reducers to NumpyArray with format \"")
+            + format_ + std::string("\"") + FILENAME(__LINE__));
+        }
+      };
+      std::shared_ptr<void> ptr = reducer.apply_parallel(apply,
+                                                         parents,
+                                                         outlength,
+                                                         dtype_);
 
       if (reducer.returns_positions()) {
         struct Error err3;
@@ -5027,6 +5028,82 @@ namespace awkward {
     }
   }
 
+  std::atomic<int64_t> numpyarray_sort_threads{1};
+  std::atomic<int64_t> numpyarray_sort_threshold{1048576};
+
+  int64_t
+  NumpyArray::sort_parallel_threads() {
+    return numpyarray_sort_threads.load();
+  }
+
+  int64_t
+  NumpyArray::sort_parallel_numthreads() {
+    int64_t threads = numpyarray_sort_threads.load();
+    if (threads == 0) {
+      threads = (int64_t)std::thread::hardware_concurrency();
+    }
+    return threads < 1 ? 1 : threads;
+  }
+
+  int64_t
+  NumpyArray::sort_parallel_threshold() {
+    return numpyarray_sort_threshold.load();
+  }
+
+  void
+  NumpyArray::set_sort_parallel(int64_t threads, int64_t threshold) {
+    if (threads < 0) {
+      throw std::invalid_argument(
+        std::string("number of sorting threads must be non-negative")
+        + FILENAME(__LINE__));
+    }
+    if (threshold < 0) {
+      throw std::invalid_argument(
+        std::string("sorting parallel threshold must be non-negative")
+        + FILENAME(__LINE__));
+    }
+    numpyarray_sort_threads.store(threads);
+    numpyarray_sort_threshold.store(threshold);
+  }
+
+  namespace {
+    /// @brief Splits `ranges` (from `kernel::sorting_ranges`) into at most
+    /// `numthreads` groups of consecutive ranges with about the same number
+    /// of elements each, returning the positions in `ranges` where each
+    /// group starts (and, last, where the final group stops).
+    std::vector<int64_t>
+    split_sorting_ranges(const int64_t* ranges,
+                         int64_t ranges_length,
+                         int64_t numthreads) {
+      int64_t total = ranges[ranges_length - 1];
+      std::vector<int64_t> cuts({ 0 });
+      for (int64_t k = 1;  k < numthreads;  k++) {
+        int64_t target = (total * k) / numthreads;
+        int64_t cut = std::lower_bound(ranges,
+                                       ranges + ranges_length - 1,
+                                       target) - ranges;
+        if (cut > cuts.back()) {
+          cuts.push_back(cut);
+        }
+      }
+      if (ranges_length - 1 > cuts.back()) {
+        cuts.push_back(ranges_length - 1);
+      }
+      return cuts;
+    }
+
+    /// @brief Number of threads to use for sorting `length` elements in
+    /// `ranges_length - 1` lists.
+    int64_t
+    sort_numthreads(int64_t length, int64_t ranges_length) {
+      if (length < NumpyArray::sort_parallel_threshold()) {
+        return 1;
+      }
+      return std::min(NumpyArray::sort_parallel_numthreads(),
+                      ranges_length - 1);
+    }
+  }
+
   template<typename T>
   const std::shared_ptr<void>
   NumpyArray::index_sort(const T* data,
@@ -5060,16 +5137,46 @@ namespace awkward {
       parents.length());
     util::handle_error(err2, classname(), nullptr);
 
-    struct Error err3 = kernel::NumpyArray_argsort<T>(
-      kernel::lib::cpu,   // DERIVE
-      ptr.get(),
-      data,
-      length,
-      outranges.data(),
-      ranges_length,
-      ascending,
-      stable);
-    util::handle_error(err3, classname(), nullptr);
+    int64_t numthreads = sort_numthreads(length, ranges_length);
+    if (numthreads <= 1  ||  length != parents.length()) {
+      struct Error err3 = kernel::NumpyArray_argsort<T>(
+        kernel::lib::cpu,   // DERIVE
+        ptr.get(),
+        data,
+        length,
+        outranges.data(),
+        ranges_length,
+        ascending,
+        stable);
+      util::handle_error(err3, classname(), nullptr);
+      return ptr;
+    }
+
+    // Argsort indexes are relative to the start of each list, so each group
+    // of lists can be sorted independently into its own part of the output.
+    const int64_t* ranges = outranges.data();
+    std::vector<int64_t> cuts = split_sorting_ranges(ranges,
+                                                     ranges_length,
+                                                     numthreads);
+    util::run_parallel((int64_t)cuts.size() - 1, [&](int64_t k) -> void {
+      int64_t first = cuts[(size_t)k];
+      int64_t last = cuts[(size_t)k + 1];
+      int64_t start = ranges[first];
+      std::vector<int64_t> localranges(ranges + first, ranges + last + 1);
+      for (auto& x : localranges) {
+        x -= start;
+      }
+      struct Error err3 = kernel::NumpyArray_argsort<T>(
+        kernel::lib::cpu,   // DERIVE
+        ptr.get() + start,
+        data + start,
+        ranges[last] - start,
+        localranges.data(),
+        last - first + 1,
+        ascending,
+        stable);
+      util::handle_error(err3, classname(), nullptr);
+    });
 
     return ptr;
   }
@@ -5107,17 +5214,46 @@ namespace awkward {
       parents.length());
     util::handle_error(err2, classname(), nullptr);
 
-    struct Error err3 = kernel::NumpyArray_sort<T>(
-      kernel::lib::cpu,   // DERIVE
-      ptr.get(),
-      data,
-      length,
-      outranges.data(),
-      ranges_length,
-      parents.length(),
-      ascending,
-      stable);
-    util::handle_error(err3, classname(), nullptr);
+    int64_t numthreads = sort_numthreads(length, ranges_length);
+    if (numthreads <= 1  ||  length != parents.length()) {
+      struct Error err3 = kernel::NumpyArray_sort<T>(
+        kernel::lib::cpu,   // DERIVE
+        ptr.get(),
+        data,
+        length,
+        outranges.data(),
+        ranges_length,
+        parents.length(),
+        ascending,
+        stable);
+      util::handle_error(err3, classname(), nullptr);
+      return ptr;
+    }
+
+    const int64_t* ranges = outranges.data();
+    std::vector<int64_t> cuts = split_sorting_ranges(ranges,
+                                                     ranges_length,
+                                                     numthreads);
+    util::run_parallel((int64_t)cuts.size() - 1, [&](int64_t k) -> void {
+      int64_t first = cuts[(size_t)k];
+      int64_t last = cuts[(size_t)k + 1];
+      int64_t start = ranges[first];
+      std::vector<int64_t> localranges(ranges + first, ranges + last + 1);
+      for (auto& x : localranges) {
+        x -= start;
+      }
+      struct Error err3 = kernel::NumpyArray_sort<T>(
+        kernel::lib::cpu,   // DERIVE
+        ptr.get() + start,
+        data + start,
+        ranges[last] - start,
+        localranges.data(),
+        last - first + 1,
+        ranges[last] - start,
+        ascending,
+        stable);
+      util::handle_error(err3, classname(), nullptr);
+    });
 
     return ptr;
   }
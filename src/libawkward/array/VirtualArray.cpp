@@ -3,6 +3,7 @@
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/array/VirtualArray.cpp", line)
 #define FILENAME_C(line) FILENAME_FOR_EXCEPTIONS_C("src/libawkward/array/VirtualArray.cpp", line)
 
+#include <chrono>
 #include <iomanip>
 #include <sstream>
 #include <stdexcept>
@@ -256,6 +257,16 @@ namespace awkward {
       }
     }
 
+    else if (compatibility_check  &&  form_.get() != nullptr) {
+      // Slices of arrays with virtual fields (e.g. in repartitioning) may
+      // materialize those fields; the materialized Form is still compatible.
+      return form_.get()->equal(other,
+                                check_identities,
+                                check_parameters,
+                                check_form_key,
+                                compatibility_check);
+    }
+
     else {
       return false;
     }
@@ -336,6 +347,9 @@ namespace awkward {
   VirtualArray::array() const {
     ContentPtr out(nullptr);
     kernel::lib src_ptrlib = check_key(cache_key_);
+    // statistics use the key under which the array is cached (and evicted)
+    const std::string fully_qualified_key =
+      kernel::fully_qualified_cache_key(ptr_lib_, cache_key());
     if (cache_.get() != nullptr) {
       if (src_ptrlib != ptr_lib_) {
         out = cache_.get()->get(cache_key())->copy_to(ptr_lib_);
@@ -345,16 +359,25 @@ namespace awkward {
       }
     }
     if (out.get() == nullptr) {
+      auto start = std::chrono::steady_clock::now();
       if (src_ptrlib != ptr_lib_) {
         out = generator_.get()->generate_and_check()->copy_to(src_ptrlib);
       }
       else {
         out = generator_.get()->generate_and_check();
       }
+      auto stop = std::chrono::steady_clock::now();
+      CacheStatistics::miss(
+        fully_qualified_key,
+        std::chrono::duration_cast<std::chrono::nanoseconds>(
+          stop - start).count(),
+        out.get()->nbytes());
+    }
+    else {
+      CacheStatistics::hit(fully_qualified_key);
     }
     if (cache_.get() != nullptr) {
-      cache_.get()->set(kernel::fully_qualified_cache_key(ptr_lib_, cache_key()),
-                        out);
+      cache_.get()->set(fully_qualified_key, out);
     }
     return out;
   }
@@ -59,7 +59,8 @@ namespace awkward {
       : options_(options)
       , ptr_(ptr)
       , length_(length)
-      , reserved_(reserved) { }
+      , reserved_(reserved)
+      , panels_length_(0) { }
 
   template <typename T>
   GrowableBuffer<T>::GrowableBuffer(const ArrayBuilderOptions& options)
@@ -72,6 +73,7 @@ namespace awkward {
   template <typename T>
   const std::shared_ptr<T>
   GrowableBuffer<T>::ptr() const {
+    concatenate();
     return ptr_;
   }
 
@@ -84,6 +86,7 @@ namespace awkward {
   template <typename T>
   void
   GrowableBuffer<T>::set_length(int64_t newlength) {
+    concatenate();
     if (newlength > reserved_) {
       set_reserved(newlength);
     }
@@ -93,13 +96,14 @@ namespace awkward {
   template <typename T>
   int64_t
   GrowableBuffer<T>::reserved() const {
-    return reserved_;
+    return panels_length_ + reserved_;
   }
 
   template <typename T>
   void
   GrowableBuffer<T>::set_reserved(int64_t minreserved) {
-    if (minreserved > reserved_) {
+    if (minreserved > panels_length_ + reserved_) {
+      concatenate();
       std::shared_ptr<T> ptr(new T[(size_t)minreserved],
                              kernel::array_deleter<T>());
       memcpy(ptr.get(), ptr_.get(), (size_t)length_ * sizeof(T));
@@ -111,6 +115,9 @@ namespace awkward {
   template <typename T>
   void
   GrowableBuffer<T>::clear() {
+    panels_.clear();
+    panel_lengths_.clear();
+    panels_length_ = 0;
     length_ = 0;
     reserved_ = options_.initial();
     ptr_ = std::shared_ptr<T>(new T[(size_t)options_.initial()],
@@ -120,21 +127,84 @@ namespace awkward {
   template <typename T>
   void
   GrowableBuffer<T>::append(T datum) {
-    if (length_ == reserved_) {
-      set_reserved((int64_t)ceil(reserved_ * options_.resize()));
+    if (length_ == panels_length_ + reserved_) {
+      if (options_.chunked()  &&  length_ > 0) {
+        addpanel();
+      }
+      else {
+        set_reserved((int64_t)ceil(reserved_ * options_.resize()));
+      }
     }
-    ptr_.get()[length_] = datum;
+    ptr_.get()[length_ - panels_length_] = datum;
     length_++;
   }
 
   template <typename T>
   T
   GrowableBuffer<T>::getitem_at_nowrap(int64_t at) const {
+    if (at >= panels_length_) {
+      return ptr_.get()[at - panels_length_];
+    }
+    for (size_t i = 0;  i < panels_.size();  i++) {
+      if (at < panel_lengths_[i]) {
+        return panels_[i].get()[at];
+      }
+      at -= panel_lengths_[i];
+    }
     return ptr_.get()[at];
   }
 
+  template <typename T>
+  void
+  GrowableBuffer<T>::addpanel() {
+    int64_t size = (int64_t)ceil(length_ * (options_.resize() - 1.0));
+    if (size < options_.initial()) {
+      size = options_.initial();
+    }
+    if (size < 1) {
+      size = 1;
+    }
+    panels_.push_back(ptr_);
+    panel_lengths_.push_back(reserved_);
+    panels_length_ += reserved_;
+    ptr_ = std::shared_ptr<T>(new T[(size_t)size], kernel::array_deleter<T>());
+    reserved_ = size;
+  }
+
+  template <typename T>
+  void
+  GrowableBuffer<T>::concatenate() const {
+    if (!panels_.empty()) {
+      std::shared_ptr<T> ptr(new T[(size_t)length_],
+                             kernel::array_deleter<T>());
+      int64_t pos = 0;
+      for (size_t i = 0;  i < panels_.size();  i++) {
+        memcpy(ptr.get() + pos,
+               panels_[i].get(),
+               (size_t)panel_lengths_[i] * sizeof(T));
+        pos += panel_lengths_[i];
+        // release each panel as soon as it is copied, to limit peak memory
+        panels_[i].reset();
+      }
+      memcpy(ptr.get() + pos,
+             ptr_.get(),
+             (size_t)(length_ - pos) * sizeof(T));
+      panels_.clear();
+      panel_lengths_.clear();
+      panels_length_ = 0;
+      ptr_ = ptr;
+      reserved_ = length_;
+    }
+  }
+
   template class EXPORT_TEMPLATE_INST GrowableBuffer<int8_t>;
   template class EXPORT_TEMPLATE_INST GrowableBuffer<uint8_t>;
+  template class EXPORT_TEMPLATE_INST GrowableBuffer<int16_t>;
+  template class EXPORT_TEMPLATE_INST GrowableBuffer<uint16_t>;
+  template class EXPORT_TEMPLATE_INST GrowableBuffer<int32_t>;
+  template class EXPORT_TEMPLATE_INST GrowableBuffer<uint32_t>;
   template class EXPORT_TEMPLATE_INST GrowableBuffer<int64_t>;
+  template class EXPORT_TEMPLATE_INST GrowableBuffer<uint64_t>;
+  template class EXPORT_TEMPLATE_INST GrowableBuffer<float>;
   template class EXPORT_TEMPLATE_INST GrowableBuffer<double>;
 }
@@ -0,0 +1,1332 @@
+// BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/builder/TypedArrayBuilder.cpp", line)
+
+#include <cstring>
+#include <limits>
+#include <sstream>
+#include <stdexcept>
+#include <type_traits>
+
+#include "awkward/Identities.h"
+#include "awkward/Index.h"
+#include "awkward/array/NumpyArray.h"
+#include "awkward/array/EmptyArray.h"
+#include "awkward/array/ListArray.h"
+#include "awkward/array/ListOffsetArray.h"
+#include "awkward/array/RegularArray.h"
+#include "awkward/array/RecordArray.h"
+#include "awkward/array/IndexedArray.h"
+#include "awkward/array/ByteMaskedArray.h"
+#include "awkward/array/BitMaskedArray.h"
+#include "awkward/array/UnmaskedArray.h"
+#include "awkward/array/UnionArray.h"
+#include "awkward/array/VirtualArray.h"
+#include "awkward/builder/GrowableBuffer.h"
+
+#include "awkward/builder/TypedArrayBuilder.h"
+
+namespace awkward {
+  ////////// nodes (one per Form node)
+
+  class TypedArrayBuilder::Node {
+  public:
+    Node(const FormPtr& form): form_(form) { }
+
+    virtual ~Node() = default;
+
+    const FormPtr
+      form() const {
+      return form_;
+    }
+
+    virtual int64_t
+      length() const = 0;
+
+    virtual void
+      clear() = 0;
+
+    virtual const ContentPtr
+      snapshot() const = 0;
+
+    /// @brief Appends a placeholder for a masked-out value.
+    virtual void
+      append_default() = 0;
+
+    /// @brief True for nodes that can accept `null`.
+    virtual bool
+      isoption() const {
+      return false;
+    }
+
+    /// @brief For option-type and IndexedForm nodes, records that a value
+    /// will be appended to the content and returns the content; otherwise
+    /// returns `nullptr`.
+    virtual Node*
+      valid() {
+      return nullptr;
+    }
+
+    virtual void
+      null() {
+      throw mismatch("null");
+    }
+
+    virtual void
+      boolean(bool x) {
+      throw mismatch("boolean");
+    }
+
+    virtual void
+      integer(int64_t x) {
+      throw mismatch("integer");
+    }
+
+    virtual void
+      unsigned_integer(uint64_t x) {
+      if (x > (uint64_t)std::numeric_limits<int64_t>::max()) {
+        throw mismatch(std::string("out-of-range integer ")
+                       + std::to_string(x));
+      }
+      integer((int64_t)x);
+    }
+
+    virtual void
+      real(double x) {
+      throw mismatch("real number");
+    }
+
+    virtual void
+      string(const char* x, int64_t length, bool isstring) {
+      throw mismatch(isstring ? "string" : "bytestring");
+    }
+
+    /// @brief For list-type nodes, the content; otherwise `nullptr`.
+    virtual Node*
+      listcontent() {
+      return nullptr;
+    }
+
+    virtual void
+      endlist(int64_t start) { }
+
+    /// @brief For RecordForm nodes, the number of fields; otherwise `-1`.
+    virtual int64_t
+      numfields() const {
+      return -1;
+    }
+
+    virtual bool
+      istuple() const {
+      return false;
+    }
+
+    virtual int64_t
+      fieldindex(const char* key, int64_t hint) const {
+      return -1;
+    }
+
+    virtual Node*
+      field(int64_t fieldindex) {
+      return nullptr;
+    }
+
+    virtual void
+      endrecord() { }
+
+    const std::invalid_argument
+      mismatch(const std::string& what) const {
+      return std::invalid_argument(
+        std::string("expected ")
+        + form_.get()->type(util::TypeStrs()).get()->tostring()
+        + std::string(" according to the Form, but got ") + what
+        + FILENAME(__LINE__));
+    }
+
+  protected:
+    const FormPtr form_;
+  };
+
+  using NodePtr = std::shared_ptr<TypedArrayBuilder::Node>;
+
+  NodePtr
+  makenode(const FormPtr& form, const ArrayBuilderOptions& options);
+
+  /// @brief Returns `true` if `x` can be stored as a `T` without wrapping
+  /// around (always `true` for floating-point `T`).
+  template <typename T>
+  bool
+  integer_fits(int64_t x) {
+    if (!std::is_integral<T>::value) {
+      return true;
+    }
+    else if (std::is_signed<T>::value) {
+      return x >= (int64_t)std::numeric_limits<T>::min()  &&
+             x <= (int64_t)std::numeric_limits<T>::max();
+    }
+    else {
+      return x >= 0  &&
+             (uint64_t)x <= (uint64_t)std::numeric_limits<T>::max();
+    }
+  }
+
+  template <typename T>
+  class NumpyNode: public TypedArrayBuilder::Node {
+  public:
+    NumpyNode(const FormPtr& form,
+              const ArrayBuilderOptions& options,
+              util::dtype dtype)
+        : Node(form)
+        , buffer_(options)
+        , dtype_(dtype) { }
+
+    int64_t
+      length() const override {
+      return buffer_.length();
+    }
+
+    void
+      clear() override {
+      buffer_.clear();
+    }
+
+    const ContentPtr
+      snapshot() const override {
+      std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(T) };
+      return std::make_shared<NumpyArray>(
+               Identities::none(),
+               form_.get()->parameters(),
+               buffer_.ptr(),
+               shape,
+               strides,
+               0,
+               sizeof(T),
+               util::dtype_to_format(dtype_),
+               dtype_,
+               kernel::lib::cpu);
+    }
+
+    void
+      append_default() override {
+      buffer_.append((T)0);
+    }
+
+    void
+      boolean(bool x) override {
+      if (dtype_ != util::dtype::boolean) {
+        throw mismatch("boolean");
+      }
+      buffer_.append((T)x);
+    }
+
+    void
+      integer(int64_t x) override {
+      if (dtype_ == util::dtype::boolean) {
+        throw mismatch("integer");
+      }
+      if (!integer_fits<T>(x)) {
+        throw mismatch(std::string("out-of-range integer ")
+                       + std::to_string(x));
+      }
+      buffer_.append((T)x);
+    }
+
+    void
+      unsigned_integer(uint64_t x) override {
+      if (x <= (uint64_t)std::numeric_limits<int64_t>::max()) {
+        integer((int64_t)x);
+      }
+      else if (dtype_ == util::dtype::uint64  ||
+               dtype_ == util::dtype::float32  ||
+               dtype_ == util::dtype::float64) {
+        buffer_.append((T)x);
+      }
+      else {
+        throw mismatch(std::string("out-of-range integer ")
+                       + std::to_string(x));
+      }
+    }
+
+    void
+      real(double x) override {
+      if (dtype_ != util::dtype::float32  &&  dtype_ != util::dtype::float64) {
+        throw mismatch("real number");
+      }
+      buffer_.append((T)x);
+    }
+
+    void
+      extend(const char* x, int64_t length) {
+      for (int64_t i = 0;  i < length;  i++) {
+        buffer_.append((T)x[i]);
+      }
+    }
+
+  private:
+    GrowableBuffer<T> buffer_;
+    const util::dtype dtype_;
+  };
+
+  NodePtr
+  makenumpy(const std::shared_ptr<NumpyForm>& form,
+            const ArrayBuilderOptions& options) {
+    if (!form.get()->inner_shape().empty()) {
+      throw std::invalid_argument(
+        std::string("TypedArrayBuilder does not support NumpyForm with "
+                    "inner_shape; use RegularForm instead")
+        + FILENAME(__LINE__));
+    }
+    util::dtype dtype = form.get()->dtype();
+    switch (dtype) {
+      case util::dtype::boolean:
+        return std::make_shared<NumpyNode<uint8_t>>(form, options, dtype);
+      case util::dtype::int8:
+        return std::make_shared<NumpyNode<int8_t>>(form, options, dtype);
+      case util::dtype::int16:
+        return std::make_shared<NumpyNode<int16_t>>(form, options, dtype);
+      case util::dtype::int32:
+        return std::make_shared<NumpyNode<int32_t>>(form, options, dtype);
+      case util::dtype::int64:
+        return std::make_shared<NumpyNode<int64_t>>(form, options, dtype);
+      case util::dtype::uint8:
+        return std::make_shared<NumpyNode<uint8_t>>(form, options, dtype);
+      case util::dtype::uint16:
+        return std::make_shared<NumpyNode<uint16_t>>(form, options, dtype);
+      case util::dtype::uint32:
+        return std::make_shared<NumpyNode<uint32_t>>(form, options, dtype);
+      case util::dtype::uint64:
+        return std::make_shared<NumpyNode<uint64_t>>(form, options, dtype);
+      case util::dtype::float32:
+        return std::make_shared<NumpyNode<float>>(form, options, dtype);
+      case util::dtype::float64:
+        return std::make_shared<NumpyNode<double>>(form, options, dtype);
+      default:
+        throw std::invalid_argument(
+          std::string("TypedArrayBuilder does not support NumpyForm with "
+                      "format ") + form.get()->format()
+          + FILENAME(__LINE__));
+    }
+  }
+
+  /// @brief Copies (or shares, if 64-bit) part of a GrowableBuffer as an
+  /// Index of the type the Form asks for.
+  template <typename T>
+  const IndexOf<T>
+  toindex(const GrowableBuffer<int64_t>& buffer,
+          int64_t offset,
+          int64_t length) {
+    IndexOf<T> out(length);
+    T* outptr = out.data();
+    int64_t* inptr = buffer.ptr().get();
+    for (int64_t i = 0;  i < length;  i++) {
+      outptr[i] = (T)inptr[offset + i];
+    }
+    return out;
+  }
+
+  template <>
+  const IndexOf<int64_t>
+  toindex<int64_t>(const GrowableBuffer<int64_t>& buffer,
+          int64_t offset,
+          int64_t length) {
+    return Index64(buffer.ptr(), offset, length, kernel::lib::cpu);
+  }
+
+  class EmptyNode: public TypedArrayBuilder::Node {
+  public:
+    EmptyNode(const FormPtr& form): Node(form) { }
+
+    int64_t
+      length() const override {
+      return 0;
+    }
+
+    void
+      clear() override { }
+
+    const ContentPtr
+      snapshot() const override {
+      return std::make_shared<EmptyArray>(Identities::none(),
+                                          form_.get()->parameters());
+    }
+
+    void
+      append_default() override {
+      throw mismatch("a missing value");
+    }
+  };
+
+  /// @brief Shared by ListForm and ListOffsetForm: both accumulate offsets.
+  class ListNode: public TypedArrayBuilder::Node {
+  public:
+    ListNode(const FormPtr& form,
+             const ArrayBuilderOptions& options,
+             Index::Form index,
+             const FormPtr& content,
+             bool isoffsets)
+        : Node(form)
+        , offsets_(options)
+        , index_(index)
+        , content_(makenode(content, options))
+        , isoffsets_(isoffsets)
+        , stringlike_(0) {
+      offsets_.append(0);
+      if (index != Index::Form::i32  &&  index != Index::Form::u32  &&
+          index != Index::Form::i64) {
+        throw std::invalid_argument(
+          std::string("list offsets must be i32, u32, or i64")
+          + FILENAME(__LINE__));
+      }
+      std::string array = form.get()->parameter("__array__");
+      if (array == std::string("\"string\"")) {
+        stringlike_ = 1;
+      }
+      else if (array == std::string("\"bytestring\"")) {
+        stringlike_ = 2;
+      }
+      NumpyForm* raw = dynamic_cast<NumpyForm*>(content.get());
+      if (stringlike_ != 0  &&
+          (raw == nullptr  ||  raw->dtype() != util::dtype::uint8)) {
+        throw std::invalid_argument(
+          std::string("string and bytestring Forms must have uint8 content")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    int64_t
+      length() const override {
+      return offsets_.length() - 1;
+    }
+
+    void
+      clear() override {
+      offsets_.clear();
+      offsets_.append(0);
+      content_.get()->clear();
+    }
+
+    const ContentPtr
+      snapshot() const override {
+      ContentPtr content = content_.get()->snapshot();
+      int64_t len = length();
+      switch (index_) {
+        case Index::Form::i32:
+          return make<int32_t>(content, len);
+        case Index::Form::u32:
+          return make<uint32_t>(content, len);
+        default:
+          return make<int64_t>(content, len);
+      }
+    }
+
+    void
+      append_default() override {
+      offsets_.append(content_.get()->length());
+    }
+
+    void
+      string(const char* x, int64_t length, bool isstring) override {
+      if (stringlike_ != (isstring ? 1 : 2)) {
+        throw mismatch(isstring ? "string" : "bytestring");
+      }
+      NumpyNode<uint8_t>* content =
+        dynamic_cast<NumpyNode<uint8_t>*>(content_.get());
+      content->extend(x, length);
+      offsets_.append(content->length());
+    }
+
+    Node*
+      listcontent() override {
+      return content_.get();
+    }
+
+    void
+      endlist(int64_t start) override {
+      offsets_.append(content_.get()->length());
+    }
+
+  private:
+    template <typename T>
+    const ContentPtr
+      make(const ContentPtr& content, int64_t len) const {
+      if (isoffsets_) {
+        return std::make_shared<ListOffsetArrayOf<T>>(
+          Identities::none(),
+          form_.get()->parameters(),
+          toindex<T>(offsets_, 0, len + 1),
+          content);
+      }
+      else {
+        return std::make_shared<ListArrayOf<T>>(
+          Identities::none(),
+          form_.get()->parameters(),
+          toindex<T>(offsets_, 0, len),
+          toindex<T>(offsets_, 1, len),
+          content);
+      }
+    }
+
+    GrowableBuffer<int64_t> offsets_;
+    const Index::Form index_;
+    NodePtr content_;
+    const bool isoffsets_;
+    int64_t stringlike_;
+  };
+
+  class RegularNode: public TypedArrayBuilder::Node {
+  public:
+    RegularNode(const std::shared_ptr<RegularForm>& form,
+                const ArrayBuilderOptions& options)
+        : Node(form)
+        , content_(makenode(form.get()->content(), options))
+        , size_(form.get()->size())
+        , length_(0) { }
+
+    int64_t
+      length() const override {
+      return length_;
+    }
+
+    void
+      clear() override {
+      content_.get()->clear();
+      length_ = 0;
+    }
+
+    const ContentPtr
+      snapshot() const override {
+      return std::make_shared<RegularArray>(Identities::none(),
+                                            form_.get()->parameters(),
+                                            content_.get()->snapshot(),
+                                            size_);
+    }
+
+    void
+      append_default() override {
+      for (int64_t i = 0;  i < size_;  i++) {
+        content_.get()->append_default();
+      }
+      length_++;
+    }
+
+    Node*
+      listcontent() override {
+      return content_.get();
+    }
+
+    void
+      endlist(int64_t start) override {
+      int64_t size = content_.get()->length() - start;
+      if (size != size_) {
+        throw std::invalid_argument(
+          std::string("expected a list of length ") + std::to_string(size_)
+          + std::string(" according to the Form, but got a list of length ")
+          + std::to_string(size) + FILENAME(__LINE__));
+      }
+      length_++;
+    }
+
+  private:
+    NodePtr content_;
+    const int64_t size_;
+    int64_t length_;
+  };
+
+  class RecordNode: public TypedArrayBuilder::Node {
+  public:
+    RecordNode(const std::shared_ptr<RecordForm>& form,
+               const ArrayBuilderOptions& options)
+        : Node(form)
+        , recordlookup_(form.get()->recordlookup())
+        , length_(0) {
+      for (auto content : form.get()->contents()) {
+        contents_.push_back(makenode(content, options));
+      }
+    }
+
+    int64_t
+      length() const override {
+      return length_;
+    }
+
+    void
+      clear() override {
+      for (auto content : contents_) {
+        content.get()->clear();
+      }
+      length_ = 0;
+    }
+
+    const ContentPtr
+      snapshot() const override {
+      ContentPtrVec contents;
+      for (auto content : contents_) {
+        contents.push_back(content.get()->snapshot());
+      }
+      return std::make_shared<RecordArray>(Identities::none(),
+                                           form_.get()->parameters(),
+                                           contents,
+                                           recordlookup_,
+                                           length_);
+    }
+
+    void
+      append_default() override {
+      for (auto content : contents_) {
+        content.get()->append_default();
+      }
+      length_++;
+    }
+
+    int64_t
+      numfields() const override {
+      return (int64_t)contents_.size();
+    }
+
+    bool
+      istuple() const override {
+      return recordlookup_.get() == nullptr;
+    }
+
+    int64_t
+      fieldindex(const char* key, int64_t hint) const override {
+      int64_t numfields = (int64_t)contents_.size();
+      if (istuple()) {
+        return -1;
+      }
+      for (int64_t j = 1;  j <= numfields;  j++) {
+        int64_t i = (hint + j) % numfields;
+        if (strcmp(recordlookup_.get()->at((size_t)i).c_str(), key) == 0) {
+          return i;
+        }
+      }
+      return -1;
+    }
+
+    Node*
+      field(int64_t fieldindex) override {
+      return contents_[(size_t)fieldindex].get();
+    }
+
+    void
+      endrecord() override {
+      for (size_t i = 0;  i < contents_.size();  i++) {
+        Node* content = contents_[i].get();
+        int64_t len = content->length();
+        if (len == length_) {
+          if (content->isoption()) {
+            content->null();
+          }
+          else {
+            throw std::invalid_argument(
+              std::string("missing field ")
+              + (istuple() ? std::to_string(i)
+                           : std::string("\"") + recordlookup_.get()->at(i)
+                             + std::string("\""))
+              + std::string(", which is not option-type in the Form")
+              + FILENAME(__LINE__));
+          }
+        }
+        else if (len != length_ + 1) {
+          throw std::invalid_argument(
+            std::string("field ")
+            + (istuple() ? std::to_string(i)
+                         : std::string("\"") + recordlookup_.get()->at(i)
+                           + std::string("\""))
+            + std::string(" was filled more than once in the same record")
+            + FILENAME(__LINE__));
+        }
+      }
+      length_++;
+    }
+
+  private:
+    const util::RecordLookupPtr recordlookup_;
+    std::vector<NodePtr> contents_;
+    int64_t length_;
+  };
+
+  /// @brief IndexedForm and IndexedOptionForm: the index points to the
+  /// position where each value is appended to the content.
+  class IndexedNode: public TypedArrayBuilder::Node {
+  public:
+    IndexedNode(const FormPtr& form,
+                const ArrayBuilderOptions& options,
+                Index::Form index,
+                const FormPtr& content,
+                bool isoption)
+        : Node(form)
+        , index_(options)
+        , indextype_(index)
+        , content_(makenode(content, options))
+        , isoption_(isoption) {
+      if (index != Index::Form::i32  &&  index != Index::Form::i64  &&
+          (isoption  ||  index != Index::Form::u32)) {
+        throw std::invalid_argument(
+          std::string(isoption ? "IndexedOptionForm index must be i32 or i64"
+                               : "IndexedForm index must be i32, u32, or i64")
+          + FILENAME(__LINE__));
+      }
+    }
+
+    int64_t
+      length() const override {
+      return index_.length();
+    }
+
+    void
+      clear() override {
+      index_.clear();
+      content_.get()->clear();
+    }
+
+    const ContentPtr
+      snapshot() const override {
+      ContentPtr content = content_.get()->snapshot();
+      switch (indextype_) {
+        case Index::Form::i32:
+          return isoption_ ? make<int32_t, true>(content)
+                           : make<int32_t, false>(content);
+        case Index::Form::u32:
+          return make<uint32_t, false>(content);
+        default:
+          return isoption_ ? make<int64_t, true>(content)
+                           : make<int64_t, false>(content);
+      }
+    }
+
+    void
+      append_default() override {
+      if (isoption_) {
+        index_.append(-1);
+      }
+      else {
+        index_.append(content_.get()->length());
+        content_.get()->append_default();
+      }
+    }
+
+    bool
+      isoption() const override {
+      return isoption_;
+    }
+
+    Node*
+      valid() override {
+      index_.append(content_.get()->length());
+      return content_.get();
+    }
+
+    void
+      null() override {
+      if (!isoption_) {
+        throw mismatch("null");
+      }
+      index_.append(-1);
+    }
+
+  private:
+    template <typename T, bool ISOPTION>
+    const ContentPtr
+      make(const ContentPtr& content) const {
+      return std::make_shared<IndexedArrayOf<T, ISOPTION>>(
+        Identities::none(),
+        form_.get()->parameters(),
+        toindex<T>(index_, 0, index_.length()),
+        content);
+    }
+
+    GrowableBuffer<int64_t> index_;
+    const Index::Form indextype_;
+    NodePtr content_;
+    const bool isoption_;
+  };
+
+  /// @brief ByteMaskedForm, BitMaskedForm, and UnmaskedForm: the content
+  /// has an entry (possibly a placeholder) for every entry in the mask.
+  class MaskedNode: public TypedArrayBuilder::Node {
+  public:
+    enum class Masking {bytes, bits, none};
+
+    MaskedNode(const FormPtr& form,
+               const ArrayBuilderOptions& options,
+               Masking masking,
+               const FormPtr& content,
+               bool valid_when,
+               bool lsb_order)
+        : Node(form)
+        , mask_(options)
+        , masking_(masking)
+        , content_(makenode(content, options))
+        , valid_when_(valid_when)
+        , lsb_order_(lsb_order) { }
+
+    int64_t
+      length() const override {
+      return content_.get()->length();
+    }
+
+    void
+      clear() override {
+      mask_.clear();
+      content_.get()->clear();
+    }
+
+    const ContentPtr
+      snapshot() const override {
+      ContentPtr content = content_.get()->snapshot();
+      if (masking_ == Masking::bytes) {
+        return std::make_shared<ByteMaskedArray>(
+          Identities::none(),
+          form_.get()->parameters(),
+          Index8(mask_.ptr(), 0, mask_.length(), kernel::lib::cpu),
+          content,
+          valid_when_);
+      }
+      else if (masking_ == Masking::bits) {
+        int64_t length = mask_.length();
+        IndexU8 bits((length + 7) / 8);
+        uint8_t* bitsptr = bits.data();
+        int8_t* maskptr = mask_.ptr().get();
+        for (int64_t i = 0;  i < (length + 7) / 8;  i++) {
+          bitsptr[i] = 0;
+        }
+        for (int64_t i = 0;  i < length;  i++) {
+          if (maskptr[i] != 0) {
+            bitsptr[i / 8] |= (uint8_t)(lsb_order_ ? (1 << (i % 8))
+                                                   : (128 >> (i % 8)));
+          }
+        }
+        return std::make_shared<BitMaskedArray>(
+          Identities::none(),
+          form_.get()->parameters(),
+          bits,
+          content,
+          valid_when_,
+          length,
+          lsb_order_);
+      }
+      else {
+        return std::make_shared<UnmaskedArray>(
+          Identities::none(), form_.get()->parameters(), content);
+      }
+    }
+
+    void
+      append_default() override {
+      if (masking_ == Masking::none) {
+        content_.get()->append_default();
+      }
+      else {
+        null();
+      }
+    }
+
+    bool
+      isoption() const override {
+      return masking_ != Masking::none;
+    }
+
+    Node*
+      valid() override {
+      if (masking_ != Masking::none) {
+        mask_.append((int8_t)valid_when_);
+      }
+      return content_.get();
+    }
+
+    void
+      null() override {
+      if (masking_ == Masking::none) {
+        throw mismatch("null");
+      }
+      mask_.append((int8_t)!valid_when_);
+      content_.get()->append_default();
+    }
+
+  private:
+    GrowableBuffer<int8_t> mask_;
+    const Masking masking_;
+    NodePtr content_;
+    const bool valid_when_;
+    const bool lsb_order_;
+  };
+
+  NodePtr
+  makenode(const FormPtr& form, const ArrayBuilderOptions& options) {
+    Form* raw = form.get();
+    if (dynamic_cast<NumpyForm*>(raw) != nullptr) {
+      return makenumpy(std::dynamic_pointer_cast<NumpyForm>(form), options);
+    }
+    else if (dynamic_cast<EmptyForm*>(raw) != nullptr) {
+      return std::make_shared<EmptyNode>(form);
+    }
+    else if (ListOffsetForm* f = dynamic_cast<ListOffsetForm*>(raw)) {
+      return std::make_shared<ListNode>(
+        form, options, f->offsets(), f->content(), true);
+    }
+    else if (ListForm* f = dynamic_cast<ListForm*>(raw)) {
+      return std::make_shared<ListNode>(
+        form, options, f->starts(), f->content(), false);
+    }
+    else if (dynamic_cast<RegularForm*>(raw) != nullptr) {
+      return std::make_shared<RegularNode>(
+        std::dynamic_pointer_cast<RegularForm>(form), options);
+    }
+    else if (dynamic_cast<RecordForm*>(raw) != nullptr) {
+      return std::make_shared<RecordNode>(
+        std::dynamic_pointer_cast<RecordForm>(form), options);
+    }
+    else if (IndexedOptionForm* f = dynamic_cast<IndexedOptionForm*>(raw)) {
+      return std::make_shared<IndexedNode>(
+        form, options, f->index(), f->content(), true);
+    }
+    else if (IndexedForm* f = dynamic_cast<IndexedForm*>(raw)) {
+      return std::make_shared<IndexedNode>(
+        form, options, f->index(), f->content(), false);
+    }
+    else if (ByteMaskedForm* f = dynamic_cast<ByteMaskedForm*>(raw)) {
+      return std::make_shared<MaskedNode>(
+        form, options, MaskedNode::Masking::bytes, f->content(),
+        f->valid_when(), false);
+    }
+    else if (BitMaskedForm* f = dynamic_cast<BitMaskedForm*>(raw)) {
+      return std::make_shared<MaskedNode>(
+        form, options, MaskedNode::Masking::bits, f->content(),
+        f->valid_when(), f->lsb_order());
+    }
+    else if (UnmaskedForm* f = dynamic_cast<UnmaskedForm*>(raw)) {
+      return std::make_shared<MaskedNode>(
+        form, options, MaskedNode::Masking::none, f->content(), true, false);
+    }
+    else if (VirtualForm* f = dynamic_cast<VirtualForm*>(raw)) {
+      if (f->has_form()) {
+        return makenode(f->form(), options);
+      }
+      throw std::invalid_argument(
+        std::string("TypedArrayBuilder needs a VirtualForm to have a form")
+        + FILENAME(__LINE__));
+    }
+    else {
+      throw std::invalid_argument(
+        std::string("TypedArrayBuilder does not support ")
+        + form.get()->tostring() + FILENAME(__LINE__));
+    }
+  }
+
+  ////////// TypedArrayBuilder
+
+  TypedArrayBuilder::TypedArrayBuilder(const FormPtr& form,
+                                       const ArrayBuilderOptions& options)
+      : form_(form)
+      , root_(makenode(form, options)) { }
+
+  const FormPtr
+  TypedArrayBuilder::form() const {
+    return form_;
+  }
+
+  const std::string
+  TypedArrayBuilder::tostring() const {
+    util::TypeStrs typestrs;
+    typestrs["char"] = "char";
+    typestrs["string"] = "string";
+    std::stringstream out;
+    out << "<TypedArrayBuilder length=\"" << length() << "\" type=\""
+        << form_.get()->type(typestrs).get()->tostring() << "\"/>";
+    return out.str();
+  }
+
+  int64_t
+  TypedArrayBuilder::length() const {
+    return root_.get()->length();
+  }
+
+  void
+  TypedArrayBuilder::clear() {
+    root_.get()->clear();
+    stack_.clear();
+  }
+
+  const ContentPtr
+  TypedArrayBuilder::snapshot() const {
+    return root_.get()->snapshot();
+  }
+
+  TypedArrayBuilder::Node*
+  TypedArrayBuilder::target() {
+    if (stack_.empty()) {
+      return root_.get();
+    }
+    Frame& frame = stack_.back();
+    if (frame.node->numfields() < 0) {
+      return frame.node->listcontent();
+    }
+    if (frame.field < 0) {
+      throw std::invalid_argument(
+        std::string(frame.node->istuple()
+                      ? "called a fill method before 'index' in a tuple"
+                      : "called a fill method before 'field' in a record")
+        + FILENAME(__LINE__));
+    }
+    return frame.node->field(frame.field);
+  }
+
+  TypedArrayBuilder::Node*
+  TypedArrayBuilder::resolve(Node* node) {
+    while (Node* content = node->valid()) {
+      node = content;
+    }
+    return node;
+  }
+
+  void
+  TypedArrayBuilder::pushframe(Node* node) {
+    Node* content = node->listcontent();
+    stack_.push_back(
+      { node, -1, content == nullptr ? 0 : content->length() });
+  }
+
+  void
+  TypedArrayBuilder::null() {
+    Node* node = target();
+    while (!node->isoption()) {
+      Node* content = node->valid();
+      if (content == nullptr) {
+        break;
+      }
+      node = content;
+    }
+    node->null();
+  }
+
+  void
+  TypedArrayBuilder::boolean(bool x) {
+    resolve(target())->boolean(x);
+  }
+
+  void
+  TypedArrayBuilder::integer(int64_t x) {
+    resolve(target())->integer(x);
+  }
+
+  void
+  TypedArrayBuilder::unsigned_integer(uint64_t x) {
+    resolve(target())->unsigned_integer(x);
+  }
+
+  void
+  TypedArrayBuilder::real(double x) {
+    resolve(target())->real(x);
+  }
+
+  void
+  TypedArrayBuilder::bytestring(const char* x, int64_t length) {
+    resolve(target())->string(x, length, false);
+  }
+
+  void
+  TypedArrayBuilder::string(const char* x, int64_t length) {
+    resolve(target())->string(x, length, true);
+  }
+
+  void
+  TypedArrayBuilder::beginlist() {
+    Node* node = resolve(target());
+    if (node->listcontent() == nullptr) {
+      throw node->mismatch("list");
+    }
+    pushframe(node);
+  }
+
+  void
+  TypedArrayBuilder::endlist() {
+    if (stack_.empty()  ||  stack_.back().node->numfields() >= 0) {
+      throw std::invalid_argument(
+        std::string("called 'endlist' without 'beginlist' at the same level")
+        + FILENAME(__LINE__));
+    }
+    stack_.back().node->endlist(stack_.back().start);
+    stack_.pop_back();
+  }
+
+  void
+  TypedArrayBuilder::begintuple(int64_t numfields) {
+    Node* node = resolve(target());
+    if (!node->istuple()  ||  node->numfields() != numfields) {
+      throw node->mismatch(std::string("tuple with ")
+                           + std::to_string(numfields) + std::string(" fields"));
+    }
+    pushframe(node);
+  }
+
+  void
+  TypedArrayBuilder::index(int64_t index) {
+    if (stack_.empty()  ||  !stack_.back().node->istuple()) {
+      throw std::invalid_argument(
+        std::string("called 'index' without 'begintuple' at the same level")
+        + FILENAME(__LINE__));
+    }
+    if (index < 0  ||  index >= stack_.back().node->numfields()) {
+      throw std::invalid_argument(
+        std::string("tuple index ") + std::to_string(index)
+        + std::string(" out of range") + FILENAME(__LINE__));
+    }
+    stack_.back().field = index;
+  }
+
+  void
+  TypedArrayBuilder::endtuple() {
+    if (stack_.empty()  ||  !stack_.back().node->istuple()) {
+      throw std::invalid_argument(
+        std::string("called 'endtuple' without 'begintuple' at the same level")
+        + FILENAME(__LINE__));
+    }
+    stack_.back().node->endrecord();
+    stack_.pop_back();
+  }
+
+  void
+  TypedArrayBuilder::beginrecord() {
+    Node* node = resolve(target());
+    if (node->numfields() < 0  ||  node->istuple()) {
+      throw node->mismatch("record");
+    }
+    pushframe(node);
+  }
+
+  void
+  TypedArrayBuilder::field_check(const char* key) {
+    if (stack_.empty()  ||  stack_.back().node->numfields() < 0  ||
+        stack_.back().node->istuple()) {
+      throw std::invalid_argument(
+        std::string("called 'field' without 'beginrecord' at the same level")
+        + FILENAME(__LINE__));
+    }
+    Frame& frame = stack_.back();
+    int64_t fieldindex = frame.node->fieldindex(key, frame.field);
+    if (fieldindex < 0) {
+      throw frame.node->mismatch(std::string("field \"") + std::string(key)
+                                 + std::string("\""));
+    }
+    frame.field = fieldindex;
+  }
+
+  void
+  TypedArrayBuilder::endrecord() {
+    if (stack_.empty()  ||  stack_.back().node->numfields() < 0  ||
+        stack_.back().node->istuple()) {
+      throw std::invalid_argument(
+        std::string("called 'endrecord' without 'beginrecord' at the same "
+                    "level") + FILENAME(__LINE__));
+    }
+    stack_.back().node->endrecord();
+    stack_.pop_back();
+  }
+}
+
+////////// extern C interface
+
+uint8_t awkward_TypedArrayBuilder_length(void* typedarraybuilder,
+                                         int64_t* result) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    *result = obj->length();
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_clear(void* typedarraybuilder) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->clear();
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_null(void* typedarraybuilder) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->null();
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_boolean(void* typedarraybuilder,
+                                          bool x) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->boolean(x);
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_integer(void* typedarraybuilder,
+                                          int64_t x) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->integer(x);
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_real(void* typedarraybuilder,
+                                       double x) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->real(x);
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_bytestring_length(void* typedarraybuilder,
+                                                    const char* x,
+                                                    int64_t length) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->bytestring(x, length);
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_string_length(void* typedarraybuilder,
+                                                const char* x,
+                                                int64_t length) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->string(x, length);
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_beginlist(void* typedarraybuilder) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->beginlist();
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_endlist(void* typedarraybuilder) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->endlist();
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_begintuple(void* typedarraybuilder,
+                                             int64_t numfields) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->begintuple(numfields);
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_index(void* typedarraybuilder,
+                                        int64_t index) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->index(index);
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_endtuple(void* typedarraybuilder) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->endtuple();
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_beginrecord(void* typedarraybuilder) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->beginrecord();
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_field_check(void* typedarraybuilder,
+                                              const char* key) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->field_check(key);
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
+
+uint8_t awkward_TypedArrayBuilder_endrecord(void* typedarraybuilder) {
+  awkward::TypedArrayBuilder* obj =
+    reinterpret_cast<awkward::TypedArrayBuilder*>(typedarraybuilder);
+  try {
+    obj->endrecord();
+  }
+  catch (...) {
+    return 1;
+  }
+  return 0;
+}
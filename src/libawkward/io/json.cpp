@@ -9,10 +9,21 @@
 #include "rapidjson/stringbuffer.h"
 #include "rapidjson/filereadstream.h"
 #include "rapidjson/filewritestream.h"
+#include "rapidjson/memorystream.h"
 #include "rapidjson/error/en.h"
 
+#include "simdjson.h"
+
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <cstring>
+#include <mutex>
+
 #include "awkward/builder/ArrayBuilder.h"
+#include "awkward/builder/TypedArrayBuilder.h"
 #include "awkward/Content.h"
+#include "awkward/util.h"
 
 #include "awkward/io/json.h"
 
@@ -467,22 +478,44 @@ namespace awkward {
 
   ////////// reading from JSON
 
-  class Handler: public rj::BaseReaderHandler<rj::UTF8<>, Handler> {
-  public:
-    Handler(const ArrayBuilderOptions& options)
-        : builder_(options)
-        , depth_(0) { }
+  namespace {
+    /// @brief Adds a JSON integer that was read as unsigned: ArrayBuilder
+    /// only has 64-bit signed integers, but a TypedArrayBuilder can check
+    /// it against (or store it in) a `uint64` Form.
+    void
+    unsigned_integer(ArrayBuilder& builder, uint64_t x) {
+      builder.integer((int64_t)x);
+    }
 
-    const ContentPtr snapshot() const {
-      return builder_.snapshot();
+    void
+    unsigned_integer(TypedArrayBuilder& builder, uint64_t x) {
+      builder.unsigned_integer(x);
     }
+  }
+
+  /// @brief Drives an ArrayBuilder or a TypedArrayBuilder with rapidjson's
+  /// SAX events.
+  ///
+  /// A top-level array is the output array. ArrayBuilder wraps a top-level
+  /// object in a list of length 1; TypedArrayBuilder does not, because its
+  /// Form describes the items, so a top-level object is an array of length 1.
+  ///
+  /// Starting at `depth = 1` makes every top-level value an item, as in
+  /// JSON-Lines.
+  template <typename BUILDER>
+  class Handler: public rj::BaseReaderHandler<rj::UTF8<>, Handler<BUILDER>> {
+  public:
+    Handler(BUILDER& builder, bool wraprecord, int64_t depth)
+        : builder_(builder)
+        , wraprecord_(wraprecord)
+        , depth_(depth) { }
 
     bool Null()               { builder_.null();              return true; }
     bool Bool(bool x)         { builder_.boolean(x);          return true; }
     bool Int(int x)           { builder_.integer((int64_t)x); return true; }
     bool Uint(unsigned int x) { builder_.integer((int64_t)x); return true; }
     bool Int64(int64_t x)     { builder_.integer(x);          return true; }
-    bool Uint64(uint64_t x)   { builder_.integer((int64_t)x); return true; }
+    bool Uint64(uint64_t x)   { unsigned_integer(builder_, x); return true; }
     bool Double(double x)     { builder_.real(x);             return true; }
 
     bool
@@ -511,7 +544,7 @@ namespace awkward {
 
     bool
     StartObject() {
-      if (depth_ == 0) {
+      if (depth_ == 0  &&  wraprecord_) {
         builder_.beginlist();
       }
       depth_++;
@@ -523,7 +556,7 @@ namespace awkward {
     EndObject(rj::SizeType numfields) {
       depth_--;
       builder_.endrecord();
-      if (depth_ == 0) {
+      if (depth_ == 0  &&  wraprecord_) {
         builder_.endlist();
       }
       return true;
@@ -536,19 +569,17 @@ namespace awkward {
     }
 
   private:
-    ArrayBuilder builder_;
+    BUILDER& builder_;
+    bool wraprecord_;
     int64_t depth_;
   };
 
-  const ContentPtr
-  FromJsonString(const char* source, const ArrayBuilderOptions& options) {
-    Handler handler(options);
+  template <typename BUILDER, typename STREAM>
+  void
+  fromrapidjson(BUILDER& builder, bool wraprecord, STREAM& stream) {
+    Handler<BUILDER> handler(builder, wraprecord, 0);
     rj::Reader reader;
-    rj::StringStream stream(source);
-    if (reader.Parse(stream, handler)) {
-      return handler.snapshot();
-    }
-    else {
+    if (!reader.Parse(stream, handler)) {
       throw std::invalid_argument(
         std::string("JSON error at char ")
         + std::to_string(reader.GetErrorOffset()) + std::string(": ")
@@ -557,27 +588,641 @@ namespace awkward {
     }
   }
 
+  const ContentPtr
+  FromJsonString(const char* source, const ArrayBuilderOptions& options) {
+    ArrayBuilder builder(options);
+    rj::StringStream stream(source);
+    fromrapidjson(builder, true, stream);
+    return builder.snapshot();
+  }
+
+  const ContentPtr
+  FromJsonString(const char* source,
+                 const FormPtr& form,
+                 const ArrayBuilderOptions& options) {
+    TypedArrayBuilder builder(form, options);
+    rj::StringStream stream(source);
+    fromrapidjson(builder, false, stream);
+    return builder.snapshot();
+  }
+
   const ContentPtr
   FromJsonFile(FILE* source,
                const ArrayBuilderOptions& options,
                int64_t buffersize) {
-    Handler handler(options);
-    rj::Reader reader;
+    ArrayBuilder builder(options);
     std::shared_ptr<char> buffer(new char[(size_t)buffersize],
                                  kernel::array_deleter<char>());
     rj::FileReadStream stream(source,
                               buffer.get(),
                               ((size_t)buffersize)*sizeof(char));
-    if (reader.Parse(stream, handler)) {
-      return handler.snapshot();
+    fromrapidjson(builder, true, stream);
+    return builder.snapshot();
+  }
+
+  const ContentPtr
+  FromJsonFile(FILE* source,
+               const FormPtr& form,
+               const ArrayBuilderOptions& options,
+               int64_t buffersize) {
+    TypedArrayBuilder builder(form, options);
+    std::shared_ptr<char> buffer(new char[(size_t)buffersize],
+                                 kernel::array_deleter<char>());
+    rj::FileReadStream stream(source,
+                              buffer.get(),
+                              ((size_t)buffersize)*sizeof(char));
+    fromrapidjson(builder, false, stream);
+    return builder.snapshot();
+  }
+
+  namespace sj = simdjson::ondemand;
+
+  template <typename T, typename BUILDER>
+  void
+  fromsimdjson_scalar(T& value, BUILDER& builder) {
+    switch (value.type()) {
+      case sj::json_type::number:
+        switch (value.get_number_type()) {
+          case sj::number_type::signed_integer:
+            builder.integer(value.get_int64());
+            break;
+          case sj::number_type::unsigned_integer:
+            unsigned_integer(builder, value.get_uint64().value());
+            break;
+          default:
+            builder.real(value.get_double());
+        }
+        break;
+      case sj::json_type::string: {
+        std::string_view x = value.get_string();
+        builder.string(x.data(), (int64_t)x.length());
+        break;
+      }
+      case sj::json_type::boolean:
+        builder.boolean(value.get_bool());
+        break;
+      case sj::json_type::null:
+        value.is_null();
+        builder.null();
+        break;
+      default:
+        throw std::invalid_argument(
+          std::string("JSON error: unexpected value type")
+          + FILENAME(__LINE__));
+    }
+  }
+
+  template <typename BUILDER>
+  void
+  fromsimdjson(sj::value value, BUILDER& builder) {
+    switch (value.type()) {
+      case sj::json_type::array:
+        builder.beginlist();
+        for (auto item : value.get_array()) {
+          fromsimdjson(item.value(), builder);
+        }
+        builder.endlist();
+        break;
+      case sj::json_type::object: {
+        std::string key;
+        builder.beginrecord();
+        for (auto field : value.get_object()) {
+          std::string_view x = field.unescaped_key();
+          key.assign(x.data(), x.length());
+          builder.field_check(key.c_str());
+          fromsimdjson(field.value(), builder);
+        }
+        builder.endrecord();
+        break;
+      }
+      default:
+        fromsimdjson_scalar(value, builder);
+    }
+  }
+
+  template <typename BUILDER>
+  void
+  fromsimdjson_document(BUILDER& builder,
+                        bool wraprecord,
+                        const simdjson::padded_string& source) {
+    sj::parser parser;
+    try {
+      sj::document doc = parser.iterate(source);
+      switch (doc.type()) {
+        // same top-level handling as Handler
+        case sj::json_type::array:
+          for (auto item : doc.get_array()) {
+            fromsimdjson(item.value(), builder);
+          }
+          break;
+        case sj::json_type::object:
+          if (wraprecord) {
+            builder.beginlist();
+          }
+          fromsimdjson(doc.get_value(), builder);
+          if (wraprecord) {
+            builder.endlist();
+          }
+          break;
+        default:
+          fromsimdjson_scalar(doc, builder);
+      }
+      if (!doc.at_end()) {
+        throw std::invalid_argument(
+          std::string("JSON error at char ")
+          + std::to_string(doc.current_location().value() - source.data())
+          + std::string(": The document root must not be followed by other "
+                        "values.") + FILENAME(__LINE__));
+      }
+    }
+    catch (simdjson::simdjson_error& err) {
+      throw std::invalid_argument(
+        std::string("JSON error: ") + std::string(err.what())
+        + FILENAME(__LINE__));
+    }
+  }
+
+  const ContentPtr
+  fromsimdjson_padded(const simdjson::padded_string& padded,
+                      const FormPtr& form,
+                      const ArrayBuilderOptions& options) {
+    if (form.get() == nullptr) {
+      ArrayBuilder builder(options);
+      fromsimdjson_document(builder, true, padded);
+      return builder.snapshot();
     }
     else {
+      TypedArrayBuilder builder(form, options);
+      fromsimdjson_document(builder, false, padded);
+      return builder.snapshot();
+    }
+  }
+
+  const ContentPtr
+  FromJsonStringSimdjson(const char* source,
+                         int64_t length,
+                         const FormPtr& form,
+                         const ArrayBuilderOptions& options) {
+    simdjson::padded_string padded(source, (size_t)length);
+    return fromsimdjson_padded(padded, form, options);
+  }
+
+  const ContentPtr
+  FromJsonFileSimdjson(const std::string& filename,
+                       const FormPtr& form,
+                       const ArrayBuilderOptions& options) {
+    simdjson::padded_string padded;
+    if (simdjson::padded_string::load(filename).get(padded)) {
       throw std::invalid_argument(
-        std::string("JSON error at char ")
-        + std::to_string(reader.GetErrorOffset()) + std::string(": ")
-        + std::string(rj::GetParseError_En(reader.GetParseErrorCode()))
+        std::string("file \"") + filename
+        + std::string("\" could not be opened for reading")
+        + FILENAME(__LINE__));
+    }
+    return fromsimdjson_padded(padded, form, options);
+  }
+
+  template <typename BUILDER>
+  void
+  fromsimdjson_lines(BUILDER& builder,
+                     const simdjson::padded_string& source,
+                     int64_t offset) {
+    sj::parser parser;
+    try {
+      sj::document_stream documents = parser.iterate_many(
+        source, std::max(source.size(), (size_t)1000000));
+      for (auto document : documents) {
+        sj::document_reference doc = document.value();
+        switch (doc.type()) {
+          case sj::json_type::array:
+          case sj::json_type::object:
+            fromsimdjson(doc.get_value(), builder);
+            break;
+          default:
+            fromsimdjson_scalar(doc, builder);
+        }
+      }
+    }
+    catch (simdjson::simdjson_error& err) {
+      throw std::invalid_argument(
+        std::string("JSON error in the line-delimited chunk starting at char ")
+        + std::to_string(offset) + std::string(": ")
+        + std::string(err.what()) + FILENAME(__LINE__));
+    }
+  }
+
+  ////////// reading JSON-Lines in parallel
+
+  /// @brief Bytes of a JSON-Lines source, which each chunk reads
+  /// independently (so that chunks can be read in parallel).
+  class LinesSource {
+  public:
+    virtual ~LinesSource() = default;
+    virtual int64_t
+      size() const = 0;
+    virtual void
+      read(int64_t start, int64_t stop, char* out) const = 0;
+  };
+
+  class LinesString: public LinesSource {
+  public:
+    LinesString(const char* source, int64_t length)
+        : source_(source)
+        , length_(length) { }
+
+    int64_t
+      size() const override {
+      return length_;
+    }
+
+    void
+      read(int64_t start, int64_t stop, char* out) const override {
+      std::memcpy(out, source_ + start, (size_t)(stop - start));
+    }
+
+  private:
+    const char* source_;
+    int64_t length_;
+  };
+
+  class LinesFile: public LinesSource {
+  public:
+    LinesFile(const std::string& filename)
+        : filename_(filename) {
+      FILE* file = open();
+      seek(file, 0, SEEK_END);
+#ifdef _MSC_VER
+      size_ = (int64_t)_ftelli64(file);
+#else
+      size_ = (int64_t)ftello(file);
+#endif
+      fclose(file);
+    }
+
+    int64_t
+      size() const override {
+      return size_;
+    }
+
+    void
+      read(int64_t start, int64_t stop, char* out) const override {
+      FILE* file = open();
+      seek(file, start, SEEK_SET);
+      size_t length = (size_t)(stop - start);
+      size_t got = fread(out, 1, length, file);
+      fclose(file);
+      if (got != length) {
+        throw std::invalid_argument(
+          std::string("could not read bytes ") + std::to_string(start)
+          + std::string(" to ") + std::to_string(stop)
+          + std::string(" of file \"") + filename_ + std::string("\"")
+          + FILENAME(__LINE__));
+      }
+    }
+
+  private:
+    FILE*
+      open() const {
+#ifdef _MSC_VER
+      FILE* file;
+      if (fopen_s(&file, filename_.c_str(), "rb") != 0) {
+#else
+      FILE* file = fopen(filename_.c_str(), "rb");
+      if (file == nullptr) {
+#endif
+        throw std::invalid_argument(
+          std::string("file \"") + filename_
+          + std::string("\" could not be opened for reading")
+          + FILENAME(__LINE__));
+      }
+      return file;
+    }
+
+    static void
+      seek(FILE* file, int64_t offset, int origin) {
+#ifdef _MSC_VER
+      _fseeki64(file, offset, origin);
+#else
+      fseeko(file, (off_t)offset, origin);
+#endif
+    }
+
+    const std::string filename_;
+    int64_t size_;
+  };
+
+  /// @brief Returns the first position at or after `pos` that starts a
+  /// line (or the end of the source).
+  int64_t
+  nextline(const LinesSource& source, int64_t pos) {
+    int64_t size = source.size();
+    if (pos <= 0) {
+      return 0;
+    }
+    char buffer[4096];
+    int64_t start = pos - 1;
+    while (start < size) {
+      int64_t stop = std::min(start + (int64_t)sizeof(buffer), size);
+      source.read(start, stop, buffer);
+      for (int64_t i = 0;  i < stop - start;  i++) {
+        if (buffer[i] == '\n') {
+          return start + i + 1;
+        }
+      }
+      start = stop;
+    }
+    return size;
+  }
+
+  template <typename BUILDER>
+  void
+  fromrapidjson_lines(BUILDER& builder,
+                      const char* source,
+                      int64_t length,
+                      int64_t offset) {
+    Handler<BUILDER> handler(builder, false, 1);
+    rj::Reader reader;
+    rj::MemoryStream stream(source, (size_t)length);
+    while (true) {
+      rj::SkipWhitespace(stream);
+      if (stream.Tell() == (size_t)length) {
+        break;
+      }
+      if (!reader.Parse<rj::kParseStopWhenDoneFlag>(stream, handler)) {
+        throw std::invalid_argument(
+          std::string("JSON error at char ")
+          + std::to_string(offset + (int64_t)reader.GetErrorOffset())
+          + std::string(": ")
+          + std::string(rj::GetParseError_En(reader.GetParseErrorCode()))
+          + FILENAME(__LINE__));
+      }
+    }
+  }
+
+  template <typename BUILDER>
+  const ContentPtr
+  fromjsonlines_chunk(BUILDER& builder,
+                      const LinesSource& source,
+                      int64_t start,
+                      int64_t stop,
+                      bool simdjson) {
+    if (simdjson) {
+      simdjson::padded_string buffer((size_t)(stop - start));
+      source.read(start, stop, buffer.data());
+      fromsimdjson_lines(builder, buffer, start);
+    }
+    else {
+      std::vector<char> buffer((size_t)(stop - start));
+      source.read(start, stop, buffer.data());
+      fromrapidjson_lines(builder, buffer.data(), stop - start, start);
+    }
+    return builder.snapshot();
+  }
+
+  const std::vector<ContentPtr>
+  fromjsonlines(const LinesSource& source,
+                const FormPtr& form,
+                const ArrayBuilderOptions& options,
+                int64_t chunksize,
+                int64_t numthreads,
+                bool simdjson) {
+    if (numthreads < 1) {
+      throw std::invalid_argument(
+        std::string("number of threads must be at least 1")
+        + FILENAME(__LINE__));
+    }
+    int64_t size = source.size();
+    if (chunksize <= 0) {
+      chunksize = std::max((size + numthreads - 1) / numthreads, (int64_t)1);
+    }
+    std::vector<int64_t> boundaries = { 0 };
+    for (int64_t pos = chunksize;  pos < size;  pos += chunksize) {
+      int64_t boundary = nextline(source, pos);
+      if (boundary > boundaries.back()  &&  boundary < size) {
+        boundaries.push_back(boundary);
+      }
+    }
+    boundaries.push_back(size);
+
+    int64_t numchunks = (int64_t)boundaries.size() - 1;
+    std::vector<ContentPtr> out((size_t)numchunks);
+    std::atomic<int64_t> next{0};
+    std::atomic<bool> failed{false};
+    util::run_parallel(
+      std::min(numthreads, numchunks),
+      [&](int64_t thread) -> void {
+        while (!failed.load()) {
+          int64_t i = next++;
+          if (i >= numchunks) {
+            return;
+          }
+          try {
+            if (form.get() == nullptr) {
+              ArrayBuilder builder(options);
+              out[(size_t)i] = fromjsonlines_chunk(
+                builder, source, boundaries[(size_t)i],
+                boundaries[(size_t)i + 1], simdjson);
+            }
+            else {
+              TypedArrayBuilder builder(form, options);
+              out[(size_t)i] = fromjsonlines_chunk(
+                builder, source, boundaries[(size_t)i],
+                boundaries[(size_t)i + 1], simdjson);
+            }
+          }
+          catch (...) {
+            failed.store(true);
+            throw;
+          }
+        }
+      });
+    return out;
+  }
+
+  const std::vector<ContentPtr>
+  FromJsonLinesString(const char* source,
+                      int64_t length,
+                      const FormPtr& form,
+                      const ArrayBuilderOptions& options,
+                      int64_t chunksize,
+                      int64_t numthreads,
+                      bool simdjson) {
+    LinesString lines(source, length);
+    return fromjsonlines(
+      lines, form, options, chunksize, numthreads, simdjson);
+  }
+
+  const std::vector<ContentPtr>
+  FromJsonLinesFile(const std::string& filename,
+                    const FormPtr& form,
+                    const ArrayBuilderOptions& options,
+                    int64_t chunksize,
+                    int64_t numthreads,
+                    bool simdjson) {
+    LinesFile lines(filename);
+    return fromjsonlines(
+      lines, form, options, chunksize, numthreads, simdjson);
+  }
+
+  ////////// writing JSON Lines
+
+  /// @brief ToJson that ends a line (and starts a new JSON document)
+  /// whenever a top-level value is complete.
+  class ToJsonLinesString: public ToJson {
+  public:
+    ToJsonLinesString(int64_t maxdecimals)
+        : buffer_()
+        , writer_(buffer_)
+        , depth_(0) {
+      if (maxdecimals >= 0) {
+        writer_.SetMaxDecimalPlaces((int)maxdecimals);
+      }
+    }
+    void null() override { writer_.Null(); enditem(); }
+    void boolean(bool x) override { writer_.Bool(x); enditem(); }
+    void integer(int64_t x) override { writer_.Int64(x); enditem(); }
+    void real(double x) override { writer_.Double(x); enditem(); }
+    void string(const char* x, int64_t length) override {
+      writer_.String(x, (rj::SizeType)length);
+      enditem();
+    }
+    void beginlist() override { writer_.StartArray(); depth_++; }
+    void endlist() override { writer_.EndArray(); depth_--; enditem(); }
+    void beginrecord() override { writer_.StartObject(); depth_++; }
+    void field(const char* x) override { writer_.Key(x); }
+    void endrecord() override { writer_.EndObject(); depth_--; enditem(); }
+    void json(const char* data) override {
+      rj::Document doc;
+      doc.Parse<rj::kParseNanAndInfFlag>(data);
+      copyjson(doc, writer_);
+      enditem();
+    }
+    const std::string tostring() {
+      return std::string(buffer_.GetString(), buffer_.GetSize());
+    }
+  private:
+    void enditem() {
+      if (depth_ == 0) {
+        buffer_.Put('\n');
+        writer_.Reset(buffer_);
+      }
+    }
+    rj::StringBuffer buffer_;
+    rj::Writer<rj::StringBuffer> writer_;
+    int64_t depth_;
+  };
+
+  const std::string
+  tojsonlines_chunk(const ContentPtr& content,
+                    int64_t start,
+                    int64_t stop,
+                    int64_t maxdecimals) {
+    ToJsonLinesString builder(maxdecimals);
+    content.get()->getitem_range_nowrap(start, stop).get()->tojson_part(
+      builder, false);
+    return builder.tostring();
+  }
+
+  void
+  ToJsonLines(const ContentPtr& content,
+              int64_t maxdecimals,
+              int64_t chunksize,
+              int64_t numthreads,
+              const std::function<void(const std::string&)>& write) {
+    if (numthreads < 1) {
+      throw std::invalid_argument(
+        std::string("number of threads must be at least 1")
+        + FILENAME(__LINE__));
+    }
+    if (chunksize < 1) {
+      throw std::invalid_argument(
+        std::string("chunk size must be at least 1")
         + FILENAME(__LINE__));
     }
-    return handler.snapshot();
+    int64_t length = content.get()->length();
+    int64_t numchunks = (length + chunksize - 1) / chunksize;
+
+    if (numthreads == 1  ||  numchunks <= 1) {
+      for (int64_t i = 0;  i < numchunks;  i++) {
+        write(tojsonlines_chunk(content,
+                                i * chunksize,
+                                std::min((i + 1) * chunksize, length),
+                                maxdecimals));
+      }
+      return;
+    }
+
+    // Workers format chunks into a ring of slots; the calling thread writes
+    // them in order. At most "capacity" chunks are held in memory at a time.
+    int64_t capacity = 2 * numthreads;
+    std::vector<std::string> slots((size_t)capacity);
+    std::vector<bool> ready((size_t)capacity, false);
+    int64_t written = 0;
+    int64_t next = 0;
+    bool failed = false;
+    std::mutex mutex;
+    std::condition_variable changed;
+
+    util::run_parallel(
+      numthreads + 1,
+      [&](int64_t thread) -> void {
+        try {
+          if (thread == 0) {
+            for (int64_t i = 0;  i < numchunks;  i++) {
+              std::string data;
+              {
+                std::unique_lock<std::mutex> lock(mutex);
+                changed.wait(lock, [&]() -> bool {
+                  return failed  ||  ready[(size_t)(i % capacity)];
+                });
+                if (failed) {
+                  return;
+                }
+                data.swap(slots[(size_t)(i % capacity)]);
+                ready[(size_t)(i % capacity)] = false;
+                written = i + 1;
+              }
+              changed.notify_all();
+              write(data);
+            }
+          }
+          else {
+            while (true) {
+              int64_t i;
+              {
+                std::unique_lock<std::mutex> lock(mutex);
+                if (failed  ||  next >= numchunks) {
+                  return;
+                }
+                i = next++;
+                changed.wait(lock, [&]() -> bool {
+                  return failed  ||  i < written + capacity;
+                });
+                if (failed) {
+                  return;
+                }
+              }
+              std::string data = tojsonlines_chunk(
+                content,
+                i * chunksize,
+                std::min((i + 1) * chunksize, length),
+                maxdecimals);
+              {
+                std::lock_guard<std::mutex> lock(mutex);
+                slots[(size_t)(i % capacity)].swap(data);
+                ready[(size_t)(i % capacity)] = true;
+              }
+              changed.notify_all();
+            }
+          }
+        }
+        catch (...) {
+          {
+            std::lock_guard<std::mutex> lock(mutex);
+            failed = true;
+          }
+          changed.notify_all();
+          throw;
+        }
+      });
   }
 }
@@ -2,8 +2,10 @@
 
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/util.cpp", line)
 
+#include <exception>
 #include <sstream>
 #include <set>
+#include <thread>
 
 #include "rapidjson/document.h"
 
@@ -453,6 +455,37 @@ namespace awkward {
 
     template IndexOf<int64_t> make_stops(const IndexOf<int64_t> &offsets);
 
+    void
+    run_parallel(int64_t numthreads,
+                 const std::function<void(int64_t)>& fcn) {
+      std::vector<std::exception_ptr> errors((size_t)numthreads, nullptr);
+      std::vector<std::thread> threads;
+      for (int64_t k = 1;  k < numthreads;  k++) {
+        threads.emplace_back([k, &fcn, &errors]() -> void {
+          try {
+            fcn(k);
+          }
+          catch (...) {
+            errors[(size_t)k] = std::current_exception();
+          }
+        });
+      }
+      try {
+        fcn(0);
+      }
+      catch (...) {
+        errors[0] = std::current_exception();
+      }
+      for (auto& thread : threads) {
+        thread.join();
+      }
+      for (auto error : errors) {
+        if (error != nullptr) {
+          std::rethrow_exception(error);
+        }
+      }
+    }
+
     std::string
     quote(const std::string &x, bool doublequote) {
       // TODO: escape characters, possibly using RapidJSON.
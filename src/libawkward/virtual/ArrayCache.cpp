@@ -1,6 +1,9 @@
 // BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
 
+#define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/libawkward/virtual/ArrayCache.cpp", line)
+
 #include <atomic>
+#include <sstream>
 
 #include "awkward/virtual/ArrayCache.h"
 
@@ -14,7 +17,232 @@ namespace awkward {
     return out;
   }
 
+  ////////// CacheStatistics
+
+  std::atomic<int64_t> cachestatistics_hits{0};
+  std::atomic<int64_t> cachestatistics_misses{0};
+  std::atomic<int64_t> cachestatistics_nanoseconds{0};
+  std::atomic<int64_t> cachestatistics_bytes_generated{0};
+  std::atomic<int64_t> cachestatistics_evictions{0};
+  std::atomic<int64_t> cachestatistics_bytes_evicted{0};
+  std::atomic<bool> cachestatistics_per_key{false};
+  std::map<std::string, CacheStatistics::KeyCounts> cachestatistics_keys;
+  std::mutex cachestatistics_mutex;
+
+  void
+  CacheStatistics::hit(const std::string& key) {
+    cachestatistics_hits++;
+    if (cachestatistics_per_key) {
+      std::lock_guard<std::mutex> lock(cachestatistics_mutex);
+      cachestatistics_keys[key].hits++;
+    }
+  }
+
+  void
+  CacheStatistics::miss(const std::string& key,
+                        int64_t nanoseconds,
+                        int64_t nbytes) {
+    cachestatistics_misses++;
+    cachestatistics_nanoseconds += nanoseconds;
+    cachestatistics_bytes_generated += nbytes;
+    if (cachestatistics_per_key) {
+      std::lock_guard<std::mutex> lock(cachestatistics_mutex);
+      KeyCounts& counts = cachestatistics_keys[key];
+      counts.misses++;
+      counts.generate_nanoseconds += nanoseconds;
+    }
+  }
+
+  void
+  CacheStatistics::eviction(const std::string& key, int64_t nbytes) {
+    cachestatistics_evictions++;
+    cachestatistics_bytes_evicted += nbytes;
+    if (cachestatistics_per_key) {
+      std::lock_guard<std::mutex> lock(cachestatistics_mutex);
+      KeyCounts& counts = cachestatistics_keys[key];
+      counts.evictions++;
+      counts.bytes_evicted += nbytes;
+    }
+  }
+
+  int64_t
+  CacheStatistics::hits() {
+    return cachestatistics_hits;
+  }
+
+  int64_t
+  CacheStatistics::misses() {
+    return cachestatistics_misses;
+  }
+
+  int64_t
+  CacheStatistics::generate_nanoseconds() {
+    return cachestatistics_nanoseconds;
+  }
+
+  int64_t
+  CacheStatistics::bytes_generated() {
+    return cachestatistics_bytes_generated;
+  }
+
+  int64_t
+  CacheStatistics::evictions() {
+    return cachestatistics_evictions;
+  }
+
+  int64_t
+  CacheStatistics::bytes_evicted() {
+    return cachestatistics_bytes_evicted;
+  }
+
+  bool
+  CacheStatistics::per_key() {
+    return cachestatistics_per_key;
+  }
+
+  void
+  CacheStatistics::set_per_key(bool per_key) {
+    cachestatistics_per_key = per_key;
+  }
+
+  const std::map<std::string, CacheStatistics::KeyCounts>
+  CacheStatistics::key_counts() {
+    std::lock_guard<std::mutex> lock(cachestatistics_mutex);
+    return cachestatistics_keys;
+  }
+
+  void
+  CacheStatistics::reset() {
+    cachestatistics_hits = 0;
+    cachestatistics_misses = 0;
+    cachestatistics_nanoseconds = 0;
+    cachestatistics_bytes_generated = 0;
+    cachestatistics_evictions = 0;
+    cachestatistics_bytes_evicted = 0;
+    std::lock_guard<std::mutex> lock(cachestatistics_mutex);
+    cachestatistics_keys.clear();
+  }
+
   // Note: if you're creating a pure C++ cache (and it's not ridiculously
   // large), define it in
   // include/awkward/virtual/ArrayCache.h and implement it in this file.
+
+  ////////// LRUArrayCache
+
+  LRUArrayCache::LRUArrayCache(int64_t max_bytes)
+      : max_bytes_(max_bytes)
+      , nbytes_(0) {
+    if (max_bytes < 0) {
+      throw std::invalid_argument(
+        std::string("LRUArrayCache max_bytes must be non-negative")
+        + FILENAME(__LINE__));
+    }
+  }
+
+  int64_t
+  LRUArrayCache::max_bytes() const {
+    return max_bytes_;
+  }
+
+  int64_t
+  LRUArrayCache::nbytes() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return nbytes_;
+  }
+
+  int64_t
+  LRUArrayCache::length() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return (int64_t)entries_.size();
+  }
+
+  const std::vector<std::string>
+  LRUArrayCache::keys() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    std::vector<std::string> out;
+    for (auto& entry : entries_) {
+      out.push_back(entry.first);
+    }
+    return out;
+  }
+
+  bool
+  LRUArrayCache::has(const std::string& key) const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return lookup_.find(key) != lookup_.end();
+  }
+
+  ContentPtr
+  LRUArrayCache::get(const std::string& key) const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto found = lookup_.find(key);
+    if (found == lookup_.end()) {
+      return ContentPtr(nullptr);
+    }
+    entries_.splice(entries_.begin(), entries_, found->second);
+    return found->second->second.first;
+  }
+
+  void
+  LRUArrayCache::set(const std::string& key, const ContentPtr& value) {
+    int64_t size = value.get()->nbytes();
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto found = lookup_.find(key);
+    if (found != lookup_.end()) {
+      nbytes_ -= found->second->second.second;
+      entries_.erase(found->second);
+      lookup_.erase(found);
+    }
+    if (size <= max_bytes_) {
+      entries_.push_front(Entry(key, std::pair<ContentPtr, int64_t>(value,
+                                                                    size)));
+      lookup_[key] = entries_.begin();
+      nbytes_ += size;
+      evict();
+    }
+  }
+
+  bool
+  LRUArrayCache::remove(const std::string& key) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto found = lookup_.find(key);
+    if (found == lookup_.end()) {
+      return false;
+    }
+    nbytes_ -= found->second->second.second;
+    entries_.erase(found->second);
+    lookup_.erase(found);
+    return true;
+  }
+
+  void
+  LRUArrayCache::clear() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    entries_.clear();
+    lookup_.clear();
+    nbytes_ = 0;
+  }
+
+  const std::string
+  LRUArrayCache::tostring_part(const std::string& indent,
+                               const std::string& pre,
+                               const std::string& post) const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    std::stringstream out;
+    out << indent << pre << "<LRUArrayCache max_bytes=\"" << max_bytes_
+        << "\" nbytes=\"" << nbytes_ << "\" length=\"" << entries_.size()
+        << "\"/>" << post;
+    return out.str();
+  }
+
+  void
+  LRUArrayCache::evict() {
+    while (nbytes_ > max_bytes_  &&  !entries_.empty()) {
+      Entry& last = entries_.back();
+      nbytes_ -= last.second.second;
+      CacheStatistics::eviction(last.first, last.second.second);
+      lookup_.erase(last.first);
+      entries_.pop_back();
+    }
+  }
 }
@@ -4,6 +4,9 @@
 
 #include <pybind11/pybind11.h>
 
+#include "awkward/Content.h"
+#include "awkward/io/json.h"
+
 #include "awkward/python/startup.h"
 #include "awkward/python/kernel_utils.h"
 #include "awkward/python/index.h"
@@ -48,6 +51,7 @@ PYBIND11_MODULE(_ext, m) {
 
   make_Iterator(m, "Iterator");
   make_ArrayBuilder(m, "ArrayBuilder");
+  make_TypedArrayBuilder(m, "TypedArrayBuilder");
   make_PersistentSharedPtr(m, "_PersistentSharedPtr");
   make_Content(m, "Content");
 
@@ -88,6 +92,58 @@ PYBIND11_MODULE(_ext, m) {
     return toslice(obj).tostring();
   });
 
+  m.def("_reducer_parallel", []() -> py::tuple {
+    return py::make_tuple(ak::Reducer::parallel_threads(),
+                          ak::Reducer::parallel_threshold());
+  });
+
+  m.def("_set_reducer_parallel", [](int64_t threads,
+                                    int64_t threshold) -> void {
+    ak::Reducer::set_parallel(threads, threshold);
+  }, py::arg("threads"), py::arg("threshold"));
+
+  m.def("_sort_parallel", []() -> py::tuple {
+    return py::make_tuple(ak::NumpyArray::sort_parallel_threads(),
+                          ak::NumpyArray::sort_parallel_threshold());
+  });
+
+  m.def("_set_sort_parallel", [](int64_t threads,
+                                 int64_t threshold) -> void {
+    ak::NumpyArray::set_sort_parallel(threads, threshold);
+  }, py::arg("threads"), py::arg("threshold"));
+
+  m.def("_cache_statistics", []() -> py::dict {
+    py::dict keys;
+    for (auto pair : ak::CacheStatistics::key_counts()) {
+      py::dict counts;
+      counts["hits"] = py::cast(pair.second.hits);
+      counts["misses"] = py::cast(pair.second.misses);
+      counts["generate_seconds"] =
+        py::cast(1e-9 * (double)pair.second.generate_nanoseconds);
+      counts["evictions"] = py::cast(pair.second.evictions);
+      counts["bytes_evicted"] = py::cast(pair.second.bytes_evicted);
+      keys[py::str(pair.first)] = counts;
+    }
+    py::dict out;
+    out["hits"] = py::cast(ak::CacheStatistics::hits());
+    out["misses"] = py::cast(ak::CacheStatistics::misses());
+    out["generate_seconds"] =
+      py::cast(1e-9 * (double)ak::CacheStatistics::generate_nanoseconds());
+    out["bytes_generated"] = py::cast(ak::CacheStatistics::bytes_generated());
+    out["evictions"] = py::cast(ak::CacheStatistics::evictions());
+    out["bytes_evicted"] = py::cast(ak::CacheStatistics::bytes_evicted());
+    out["keys"] = keys;
+    return out;
+  });
+
+  m.def("_set_cache_statistics_per_key", [](bool per_key) -> void {
+    ak::CacheStatistics::set_per_key(per_key);
+  }, py::arg("per_key"));
+
+  m.def("_reset_cache_statistics", []() -> void {
+    ak::CacheStatistics::reset();
+  });
+
   ////////// types.h
 
   make_Type(m, "Type");
@@ -122,10 +178,13 @@ PYBIND11_MODULE(_ext, m) {
   make_PyArrayGenerator(m, "ArrayGenerator");
   make_SliceGenerator(m, "SliceGenerator");
   make_PyArrayCache(m, "ArrayCache");
+  make_LRUArrayCache(m, "LRUArrayCache");
 
   ////////// io.h
 
   make_fromjson(m, "fromjson");
+  make_fromjsonlines(m, "fromjsonlines");
+  make_tojsonlines(m, "tojsonlines");
   make_fromroot_nestedvector(m, "fromroot_nestedvector");
 
   ////////// partition.h
@@ -767,13 +767,475 @@ getitem(const T& self, const py::object& obj) {
   return box(self.getitem(toslice(obj)));
 }
 
+////////// tolist
+
+py::list
+tolist_content(const ak::ContentPtr& content);
+
+/// @brief Converts every item of a list-type node (RegularArray, ListArray,
+/// ListOffsetArray) into Python lists, str, or bytes, converting its content
+/// in a single pass.
+template <typename T>
+py::list
+tolist_lists(const T* raw) {
+  int64_t length = raw->length();
+  ak::ContentPtr compact = raw->toListOffsetArray64(true);
+  ak::ListOffsetArray64* lists =
+    dynamic_cast<ak::ListOffsetArray64*>(compact.get());
+  const int64_t* offsets = lists->offsets().data();
+  int64_t start = offsets[0];
+  ak::ContentPtr content =
+    lists->content().get()->getitem_range_nowrap(start, offsets[length]);
+
+  bool isstring = (raw->parameter_equals("__array__", "\"string\"")  ||
+                   content.get()->parameter_equals("__array__", "\"char\""));
+  bool isbytes = (raw->parameter_equals("__array__", "\"bytestring\"")  ||
+                  content.get()->parameter_equals("__array__", "\"byte\""));
+
+  py::list out(length);
+  if (isstring  ||  isbytes) {
+    if (ak::VirtualArray* virt =
+        dynamic_cast<ak::VirtualArray*>(content.get())) {
+      content = virt->array();
+    }
+    ak::NumpyArray* chars = dynamic_cast<ak::NumpyArray*>(content.get());
+    if (chars == nullptr  ||  chars->itemsize() != 1  ||  chars->ndim() != 1) {
+      throw std::invalid_argument(
+        std::string("content of strings must be a one-dimensional "
+                    "NumpyArray of bytes, not ") + content.get()->classname()
+        + FILENAME(__LINE__));
+    }
+    ak::NumpyArray contiguous = chars->contiguous();
+    const char* data = reinterpret_cast<const char*>(contiguous.data());
+    for (int64_t i = 0;  i < length;  i++) {
+      const char* item = data + (offsets[i] - start);
+      Py_ssize_t size = (Py_ssize_t)(offsets[i + 1] - offsets[i]);
+      PyObject* obj = (isstring ? PyUnicode_DecodeUTF8(item,
+                                                       size,
+                                                       "surrogateescape")
+                                : PyBytes_FromStringAndSize(item, size));
+      if (obj == nullptr) {
+        throw py::error_already_set();
+      }
+      PyList_SET_ITEM(out.ptr(), (Py_ssize_t)i, obj);
+    }
+  }
+  else {
+    py::list items = tolist_content(content);
+    for (int64_t i = 0;  i < length;  i++) {
+      Py_ssize_t size = (Py_ssize_t)(offsets[i + 1] - offsets[i]);
+      PyObject* sublist = PyList_New(size);
+      if (sublist == nullptr) {
+        throw py::error_already_set();
+      }
+      PyObject** source = &PySequence_Fast_ITEMS(items.ptr())[offsets[i] - start];
+      for (Py_ssize_t j = 0;  j < size;  j++) {
+        Py_INCREF(source[j]);
+        PyList_SET_ITEM(sublist, j, source[j]);
+      }
+      PyList_SET_ITEM(out.ptr(), (Py_ssize_t)i, sublist);
+    }
+  }
+  return out;
+}
+
+/// @brief Converts every item of an option-type node into Python objects or
+/// `None`, converting the non-missing values of its content in a single
+/// pass.
+template <typename T>
+py::list
+tolist_option(const T* raw) {
+  int64_t length = raw->length();
+  ak::Index8 mask = raw->bytemask();
+  const int8_t* missing = mask.data();
+  py::list items = tolist_content(raw->project());
+  PyObject** source = PySequence_Fast_ITEMS(items.ptr());
+  py::list out(length);
+  for (int64_t i = 0;  i < length;  i++) {
+    PyObject* obj = (missing[i] ? Py_None : *source++);
+    Py_INCREF(obj);
+    PyList_SET_ITEM(out.ptr(), (Py_ssize_t)i, obj);
+  }
+  return out;
+}
+
+/// @brief Converts every item of a UnionArray into Python objects,
+/// converting each of its contents in a single pass.
+template <typename T, typename I>
+py::list
+tolist_union(const ak::UnionArrayOf<T, I>* raw) {
+  int64_t length = raw->length();
+  const T* tags = raw->tags().data();
+  std::vector<py::list> contents;
+  std::vector<PyObject**> sources;
+  for (int64_t k = 0;  k < raw->numcontents();  k++) {
+    contents.push_back(tolist_content(raw->project(k)));
+    sources.push_back(PySequence_Fast_ITEMS(contents.back().ptr()));
+  }
+  py::list out(length);
+  for (int64_t i = 0;  i < length;  i++) {
+    PyObject* obj = *sources[(size_t)tags[i]]++;
+    Py_INCREF(obj);
+    PyList_SET_ITEM(out.ptr(), (Py_ssize_t)i, obj);
+  }
+  return out;
+}
+
+/// @brief Converts every item of a RecordArray into Python tuples or dicts,
+/// converting each of its fields in a single pass.
+py::list
+tolist_records(const ak::RecordArray* raw) {
+  int64_t length = raw->length();
+  int64_t numfields = raw->numfields();
+  std::vector<py::list> fields;
+  std::vector<PyObject**> sources;
+  for (int64_t k = 0;  k < numfields;  k++) {
+    fields.push_back(tolist_content(
+      raw->field(k).get()->getitem_range_nowrap(0, length)));
+    sources.push_back(PySequence_Fast_ITEMS(fields.back().ptr()));
+  }
+  std::vector<py::str> keys;
+  if (!raw->istuple()) {
+    for (auto key : raw->keys()) {
+      keys.push_back(py::str(key));
+    }
+  }
+  py::list out(length);
+  for (int64_t i = 0;  i < length;  i++) {
+    PyObject* obj;
+    if (raw->istuple()) {
+      obj = PyTuple_New((Py_ssize_t)numfields);
+      if (obj == nullptr) {
+        throw py::error_already_set();
+      }
+      for (int64_t k = 0;  k < numfields;  k++) {
+        Py_INCREF(sources[(size_t)k][i]);
+        PyTuple_SET_ITEM(obj, (Py_ssize_t)k, sources[(size_t)k][i]);
+      }
+    }
+    else {
+      obj = PyDict_New();
+      if (obj == nullptr) {
+        throw py::error_already_set();
+      }
+      for (int64_t k = 0;  k < numfields;  k++) {
+        if (PyDict_SetItem(obj,
+                           keys[(size_t)k].ptr(),
+                           sources[(size_t)k][i]) != 0) {
+          Py_DECREF(obj);
+          throw py::error_already_set();
+        }
+      }
+    }
+    PyList_SET_ITEM(out.ptr(), (Py_ssize_t)i, obj);
+  }
+  return out;
+}
+
+/// @brief Converts all items of `content` into a Python list.
+///
+/// Unlike iterating over the array, each node is visited only once, with
+/// all of its items at a time, so the cost is dominated by creating the
+/// Python objects themselves.
+py::list
+tolist_content(const ak::ContentPtr& content) {
+  if (ak::NumpyArray* raw =
+      dynamic_cast<ak::NumpyArray*>(content.get())) {
+    if (raw->ndim() != 1) {
+      return tolist_content(raw->toRegularArray());
+    }
+    py::object array = py::module::import("numpy").attr("asarray")(
+      box(content));
+    return array.attr("tolist")();
+  }
+  else if (dynamic_cast<ak::EmptyArray*>(content.get())) {
+    return py::list();
+  }
+  else if (ak::RegularArray* raw =
+           dynamic_cast<ak::RegularArray*>(content.get())) {
+    return tolist_lists(raw);
+  }
+  else if (ak::ListArray32* raw =
+           dynamic_cast<ak::ListArray32*>(content.get())) {
+    return tolist_lists(raw);
+  }
+  else if (ak::ListArrayU32* raw =
+           dynamic_cast<ak::ListArrayU32*>(content.get())) {
+    return tolist_lists(raw);
+  }
+  else if (ak::ListArray64* raw =
+           dynamic_cast<ak::ListArray64*>(content.get())) {
+    return tolist_lists(raw);
+  }
+  else if (ak::ListOffsetArray32* raw =
+           dynamic_cast<ak::ListOffsetArray32*>(content.get())) {
+    return tolist_lists(raw);
+  }
+  else if (ak::ListOffsetArrayU32* raw =
+           dynamic_cast<ak::ListOffsetArrayU32*>(content.get())) {
+    return tolist_lists(raw);
+  }
+  else if (ak::ListOffsetArray64* raw =
+           dynamic_cast<ak::ListOffsetArray64*>(content.get())) {
+    return tolist_lists(raw);
+  }
+  else if (ak::IndexedArray32* raw =
+           dynamic_cast<ak::IndexedArray32*>(content.get())) {
+    return tolist_content(raw->project());
+  }
+  else if (ak::IndexedArrayU32* raw =
+           dynamic_cast<ak::IndexedArrayU32*>(content.get())) {
+    return tolist_content(raw->project());
+  }
+  else if (ak::IndexedArray64* raw =
+           dynamic_cast<ak::IndexedArray64*>(content.get())) {
+    return tolist_content(raw->project());
+  }
+  else if (ak::IndexedOptionArray32* raw =
+           dynamic_cast<ak::IndexedOptionArray32*>(content.get())) {
+    return tolist_option(raw);
+  }
+  else if (ak::IndexedOptionArray64* raw =
+           dynamic_cast<ak::IndexedOptionArray64*>(content.get())) {
+    return tolist_option(raw);
+  }
+  else if (ak::ByteMaskedArray* raw =
+           dynamic_cast<ak::ByteMaskedArray*>(content.get())) {
+    return tolist_option(raw);
+  }
+  else if (ak::BitMaskedArray* raw =
+           dynamic_cast<ak::BitMaskedArray*>(content.get())) {
+    return tolist_option(raw);
+  }
+  else if (ak::UnmaskedArray* raw =
+           dynamic_cast<ak::UnmaskedArray*>(content.get())) {
+    return tolist_content(
+      raw->content().get()->getitem_range_nowrap(0, raw->length()));
+  }
+  else if (ak::RecordArray* raw =
+           dynamic_cast<ak::RecordArray*>(content.get())) {
+    return tolist_records(raw);
+  }
+  else if (ak::UnionArray8_32* raw =
+           dynamic_cast<ak::UnionArray8_32*>(content.get())) {
+    return tolist_union(raw);
+  }
+  else if (ak::UnionArray8_U32* raw =
+           dynamic_cast<ak::UnionArray8_U32*>(content.get())) {
+    return tolist_union(raw);
+  }
+  else if (ak::UnionArray8_64* raw =
+           dynamic_cast<ak::UnionArray8_64*>(content.get())) {
+    return tolist_union(raw);
+  }
+  else if (ak::VirtualArray* raw =
+           dynamic_cast<ak::VirtualArray*>(content.get())) {
+    return tolist_content(raw->array());
+  }
+  else {
+    throw std::invalid_argument(
+      std::string("cannot convert ") + content.get()->classname()
+      + std::string(" to Python objects") + FILENAME(__LINE__));
+  }
+}
+
+/// @brief Prepares a layout for #tolist_content: the nodes (but not the
+/// buffers) are copied so that identities, which are not needed to make
+/// Python objects, can be dropped without touching the original, and
+/// VirtualArrays are materialized.
+ak::ContentPtr
+tolist_prepare(const ak::Content& self) {
+  ak::ContentPtr out = self.deep_copy(false, false, false);
+  out.get()->setidentities(ak::IdentitiesPtr(nullptr));
+  return out.get()->copy_to(ak::kernel::lib::cpu);
+}
+
+template <typename T>
+py::list
+tolist(const T& self) {
+  return tolist_content(tolist_prepare(self));
+}
+
+py::object
+tolist_record(const ak::Record& self) {
+  ak::ContentPtr array = tolist_prepare(*self.array().get());
+  py::list out = tolist_content(
+    array.get()->getitem_range_nowrap(self.at(), self.at() + 1));
+  return out[0];
+}
+
 ////////// ArrayBuilder
 
+template <typename BUILDER>
 void
-builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
-  if (obj.is(py::none())) {
+builder_fromiter(BUILDER& self, const py::handle& obj);
+
+/// @brief Fills `self` with every item of `obj`, which is a list or tuple
+/// (without per-item pybind11 overhead) or any other iterable.
+template <typename BUILDER>
+void
+builder_fromiter_items(BUILDER& self, const py::handle& obj) {
+  if (PyList_CheckExact(obj.ptr())  ||  PyTuple_CheckExact(obj.ptr())) {
+    // items are borrowed references; a list can be resized by __del__
+    // methods, so its length and items are fetched on every iteration
+    for (Py_ssize_t i = 0;  i < PySequence_Fast_GET_SIZE(obj.ptr());  i++) {
+      builder_fromiter(self,
+                       py::handle(PySequence_Fast_GET_ITEM(obj.ptr(), i)));
+    }
+  }
+  else {
+    for (auto x : obj) {
+      builder_fromiter(self, x);
+    }
+  }
+}
+
+/// @brief Fills `self` with the numbers in a NumPy array of booleans,
+/// integers, or floating-point numbers, reading them directly from its
+/// buffer. Returns false (and fills nothing) if the array is not one of
+/// these types.
+template <typename BUILDER>
+bool
+builder_fromarray(BUILDER& self, const py::array& array) {
+  char kind = array.dtype().kind();
+  ssize_t itemsize = array.itemsize();
+  if (array.ndim() == 0  ||
+      !array.dtype().attr("isnative").cast<bool>()  ||
+      !((kind == 'b'  &&  itemsize == 1)  ||
+        ((kind == 'i'  ||  kind == 'u')  &&
+         (itemsize == 1  ||  itemsize == 2  ||  itemsize == 4  ||
+          itemsize == 8))  ||
+        (kind == 'f'  &&  (itemsize == 4  ||  itemsize == 8)))) {
+    return false;
+  }
+  std::vector<ssize_t> shape(array.shape(), array.shape() + array.ndim());
+  std::vector<ssize_t> strides(array.strides(),
+                               array.strides() + array.ndim());
+  std::function<void(const char*, size_t)> fill =
+    [&](const char* data, size_t dim) -> void {
+    self.beginlist();
+    if (dim + 1 < shape.size()) {
+      for (ssize_t i = 0;  i < shape[dim];  i++) {
+        fill(data + i*strides[dim], dim + 1);
+      }
+    }
+    else {
+      for (ssize_t i = 0;  i < shape[dim];  i++) {
+        const char* item = data + i*strides[dim];
+        switch (kind) {
+          case 'b':
+            self.boolean(*reinterpret_cast<const bool*>(item));
+            break;
+          case 'i':
+            switch (itemsize) {
+              case 1:
+                self.integer(*reinterpret_cast<const int8_t*>(item));
+                break;
+              case 2:
+                self.integer(*reinterpret_cast<const int16_t*>(item));
+                break;
+              case 4:
+                self.integer(*reinterpret_cast<const int32_t*>(item));
+                break;
+              default:
+                self.integer(*reinterpret_cast<const int64_t*>(item));
+            }
+            break;
+          case 'u':
+            switch (itemsize) {
+              case 1:
+                self.integer(*reinterpret_cast<const uint8_t*>(item));
+                break;
+              case 2:
+                self.integer(*reinterpret_cast<const uint16_t*>(item));
+                break;
+              case 4:
+                self.integer(*reinterpret_cast<const uint32_t*>(item));
+                break;
+              default: {
+                uint64_t x = *reinterpret_cast<const uint64_t*>(item);
+                if (x > (uint64_t)INT64_MAX) {
+                  throw std::invalid_argument(
+                    std::string("cannot convert uint64 value ")
+                    + std::to_string(x)
+                    + std::string(" to a 64-bit signed integer")
+                    + FILENAME(__LINE__));
+                }
+                self.integer((int64_t)x);
+              }
+            }
+            break;
+          default:
+            if (itemsize == 4) {
+              self.real(*reinterpret_cast<const float*>(item));
+            }
+            else {
+              self.real(*reinterpret_cast<const double*>(item));
+            }
+        }
+      }
+    }
+    self.endlist();
+  };
+  fill(reinterpret_cast<const char*>(array.data()), 0);
+  return true;
+}
+
+template <typename BUILDER>
+void
+builder_fromiter(BUILDER& self, const py::handle& obj) {
+  PyObject* ptr = obj.ptr();
+  // fast path: exact built-in types, checked without pybind11 casts
+  if (ptr == Py_None) {
     self.null();
   }
+  else if (PyBool_Check(ptr)) {
+    self.boolean(ptr == Py_True);
+  }
+  else if (PyFloat_CheckExact(ptr)) {
+    self.real(PyFloat_AS_DOUBLE(ptr));
+  }
+  else if (PyLong_CheckExact(ptr)) {
+    int64_t x = (int64_t)PyLong_AsLongLong(ptr);
+    if (x == -1  &&  PyErr_Occurred()) {
+      throw py::error_already_set();
+    }
+    self.integer(x);
+  }
+  else if (PyUnicode_CheckExact(ptr)) {
+    Py_ssize_t length;
+    const char* x = PyUnicode_AsUTF8AndSize(ptr, &length);
+    if (x == nullptr) {
+      throw py::error_already_set();
+    }
+    self.string(x, (int64_t)length);
+  }
+  else if (PyDict_CheckExact(ptr)) {
+    PyObject* key;
+    PyObject* value;
+    Py_ssize_t pos = 0;
+    self.beginrecord();
+    while (PyDict_Next(ptr, &pos, &key, &value)) {
+      if (!PyUnicode_Check(key)) {
+        throw std::invalid_argument(
+          std::string("keys of dicts in 'fromiter' must all be strings")
+          + FILENAME(__LINE__));
+      }
+      const char* x = PyUnicode_AsUTF8(key);
+      if (x == nullptr) {
+        throw py::error_already_set();
+      }
+      self.field_check(x);
+      builder_fromiter(self, py::handle(value));
+    }
+    self.endrecord();
+  }
+  else if (PyList_CheckExact(ptr)) {
+    self.beginlist();
+    builder_fromiter_items(self, obj);
+    self.endlist();
+  }
+  // everything else, including subclasses of the above
   else if (py::isinstance<py::bool_>(obj)) {
     self.boolean(obj.cast<bool>());
   }
@@ -784,10 +1246,12 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     self.real(obj.cast<double>());
   }
   else if (py::isinstance<py::bytes>(obj)) {
-    self.bytestring(obj.cast<std::string>());
+    std::string x = obj.cast<std::string>();
+    self.bytestring(x.c_str(), (int64_t)x.length());
   }
   else if (py::isinstance<py::str>(obj)) {
-    self.string(obj.cast<std::string>());
+    std::string x = obj.cast<std::string>();
+    self.string(x.c_str(), (int64_t)x.length());
   }
   else if (py::isinstance<py::tuple>(obj)) {
     py::tuple tup = obj.cast<py::tuple>();
@@ -813,12 +1277,13 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     }
     self.endrecord();
   }
+  else if (py::isinstance<py::array>(obj)  &&
+           builder_fromarray(self, py::reinterpret_borrow<py::array>(obj))) {
+    return;
+  }
   else if (py::isinstance<py::iterable>(obj)) {
-    py::iterable seq = obj.cast<py::iterable>();
     self.beginlist();
-    for (auto x : seq) {
-      builder_fromiter(self, x);
-    }
+    builder_fromiter_items(self, obj);
     self.endlist();
   }
   else if (py::isinstance<py::array>(obj)) {
@@ -850,9 +1315,14 @@ builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
 py::class_<ak::ArrayBuilder>
 make_ArrayBuilder(const py::handle& m, const std::string& name) {
   return (py::class_<ak::ArrayBuilder>(m, name.c_str())
-      .def(py::init([](int64_t initial, double resize) -> ak::ArrayBuilder {
-        return ak::ArrayBuilder(ak::ArrayBuilderOptions(initial, resize));
-      }), py::arg("initial") = 1024, py::arg("resize") = 1.5)
+      .def(py::init([](int64_t initial,
+                       double resize,
+                       bool chunked) -> ak::ArrayBuilder {
+        return ak::ArrayBuilder(
+          ak::ArrayBuilderOptions(initial, resize, chunked));
+      }), py::arg("initial") = 1024,
+          py::arg("resize") = 1.5,
+          py::arg("chunked") = false)
       .def_property_readonly("_ptr",
                              [](const ak::ArrayBuilder* self) -> size_t {
         return reinterpret_cast<size_t>(self);
@@ -909,7 +1379,82 @@ make_ArrayBuilder(const py::handle& m, const std::string& name) {
               const std::shared_ptr<ak::Content>& array) {
         self.extend(array);
       })
-      .def("fromiter", &builder_fromiter)
+      .def("fromiter", &builder_fromiter<ak::ArrayBuilder>)
+      .def("fromiter_items", &builder_fromiter_items<ak::ArrayBuilder>)
+  );
+}
+
+////////// TypedArrayBuilder
+
+py::class_<ak::TypedArrayBuilder>
+make_TypedArrayBuilder(const py::handle& m, const std::string& name) {
+  return (py::class_<ak::TypedArrayBuilder>(m, name.c_str())
+      .def(py::init([](const std::shared_ptr<ak::Form>& form,
+                       int64_t initial,
+                       double resize,
+                       bool chunked) -> ak::TypedArrayBuilder {
+        return ak::TypedArrayBuilder(
+          form, ak::ArrayBuilderOptions(initial, resize, chunked));
+      }), py::arg("form"),
+          py::arg("initial") = 1024,
+          py::arg("resize") = 1.5,
+          py::arg("chunked") = false)
+      .def_property_readonly("_ptr",
+                             [](const ak::TypedArrayBuilder* self) -> size_t {
+        return reinterpret_cast<size_t>(self);
+      })
+      .def_property_readonly("form", &ak::TypedArrayBuilder::form)
+      .def("__repr__", &ak::TypedArrayBuilder::tostring)
+      .def("__len__", &ak::TypedArrayBuilder::length)
+      .def("clear", &ak::TypedArrayBuilder::clear)
+      .def("type",
+           [](const ak::TypedArrayBuilder& self,
+              const std::map<std::string, std::string>& typestrs)
+           -> std::shared_ptr<ak::Type> {
+        return self.snapshot().get()->type(typestrs);
+      })
+      .def("snapshot", [](const ak::TypedArrayBuilder& self) -> py::object {
+        return box(self.snapshot());
+      })
+      .def("__getitem__",
+           [](const ak::TypedArrayBuilder& self,
+              const py::object& obj) -> py::object {
+        return getitem<ak::Content>(*self.snapshot(), obj);
+      })
+      .def("__iter__", [](const ak::TypedArrayBuilder& self) -> ak::Iterator {
+        return ak::Iterator(self.snapshot());
+      })
+      .def("null", &ak::TypedArrayBuilder::null)
+      .def("boolean", &ak::TypedArrayBuilder::boolean)
+      .def("integer", &ak::TypedArrayBuilder::integer)
+      .def("real", &ak::TypedArrayBuilder::real)
+      .def("bytestring",
+           [](ak::TypedArrayBuilder& self, const py::bytes& x) -> void {
+        std::string cppx = x.cast<std::string>();
+        self.bytestring(cppx.c_str(), (int64_t)cppx.length());
+      })
+      .def("string",
+           [](ak::TypedArrayBuilder& self, const py::str& x) -> void {
+        std::string cppx = x.cast<std::string>();
+        self.string(cppx.c_str(), (int64_t)cppx.length());
+      })
+      .def("beginlist", &ak::TypedArrayBuilder::beginlist)
+      .def("endlist", &ak::TypedArrayBuilder::endlist)
+      .def("begintuple", &ak::TypedArrayBuilder::begintuple)
+      .def("index", &ak::TypedArrayBuilder::index)
+      .def("endtuple", &ak::TypedArrayBuilder::endtuple)
+      .def("beginrecord",
+           [](ak::TypedArrayBuilder& self, const py::object& name) -> void {
+        // the record name is determined by the Form
+        self.beginrecord();
+      }, py::arg("name") = py::none())
+      .def("field",
+           [](ak::TypedArrayBuilder& self, const std::string& x) -> void {
+        self.field_check(x.c_str());
+      })
+      .def("endrecord", &ak::TypedArrayBuilder::endrecord)
+      .def("fromiter", &builder_fromiter<ak::TypedArrayBuilder>)
+      .def("fromiter_items", &builder_fromiter_items<ak::TypedArrayBuilder>)
   );
 }
 
@@ -1147,6 +1692,7 @@ content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
           .def("__len__", &len<T>)
           .def("__getitem__", &getitem<T>)
           .def("__iter__", &iter<T>)
+          .def("tolist", &tolist<T>)
           .def("tojson",
                &tojson_string<T>,
                py::arg("pretty") = false,
@@ -1924,6 +2470,7 @@ make_Record(const py::handle& m, const std::string& name) {
       .def("setparameter", &setparameter<ak::Record>)
       .def("parameter", &parameter<ak::Record>)
       .def("purelist_parameter", &purelist_parameter<ak::Record>)
+      .def("tolist", &tolist_record)
       .def("tojson",
            &tojson_string<ak::Record>,
            py::arg("pretty") = false,
@@ -2288,15 +2835,20 @@ make_VirtualArray(const py::handle& m, const std::string& name) {
                           "SliceGenerator") + FILENAME(__LINE__));
           }
         }
-        std::shared_ptr<PyArrayCache> cppcache(nullptr);
+        std::shared_ptr<ak::ArrayCache> cppcache(nullptr);
         if (!cache.is(py::none())) {
           try {
             cppcache = cache.cast<std::shared_ptr<PyArrayCache>>();
           }
           catch (py::cast_error err) {
-            throw std::invalid_argument(
-              std::string("VirtualArray 'cache' must be an ArrayCache or None")
-              + FILENAME(__LINE__));
+            try {
+              cppcache = cache.cast<std::shared_ptr<ak::LRUArrayCache>>();
+            }
+            catch (py::cast_error err) {
+              throw std::invalid_argument(
+                std::string("VirtualArray 'cache' must be an ArrayCache, an "
+                            "LRUArrayCache, or None") + FILENAME(__LINE__));
+            }
           }
         }
         if (!cache_key.is(py::none())) {
@@ -2355,9 +2907,14 @@ make_VirtualArray(const py::handle& m, const std::string& name) {
                std::dynamic_pointer_cast<PyArrayCache>(cache)) {
           return py::cast(ptr);
         }
+        else if (std::shared_ptr<ak::LRUArrayCache> ptr =
+               std::dynamic_pointer_cast<ak::LRUArrayCache>(cache)) {
+          return py::cast(ptr);
+        }
         else {
           throw std::invalid_argument(
-            std::string("VirtualArray's cache is not a Python MutableMapping")
+            std::string("VirtualArray's cache is not a Python MutableMapping "
+                        "or an LRUArrayCache")
             + FILENAME(__LINE__));
         }
       })
@@ -6,11 +6,22 @@
 
 #include "awkward/Content.h"
 #include "awkward/Index.h"
+#include "awkward/array/BitMaskedArray.h"
+#include "awkward/array/ByteMaskedArray.h"
+#include "awkward/array/IndexedArray.h"
+#include "awkward/array/ListArray.h"
+#include "awkward/array/ListOffsetArray.h"
 #include "awkward/array/NumpyArray.h"
+#include "awkward/array/RecordArray.h"
+#include "awkward/array/RegularArray.h"
+#include "awkward/array/UnionArray.h"
+#include "awkward/array/UnmaskedArray.h"
+#include "awkward/array/VirtualArray.h"
 #include "awkward/builder/ArrayBuilderOptions.h"
 #include "awkward/io/json.h"
 #include "awkward/io/root.h"
 
+#include "awkward/python/content.h"
 #include "awkward/python/io.h"
 
 namespace ak = awkward;
@@ -23,7 +34,23 @@ make_fromjson(py::module& m, const std::string& name) {
         [](const std::string& source,
            int64_t initial,
            double resize,
-           int64_t buffersize) -> std::shared_ptr<ak::Content> {
+           int64_t buffersize,
+           const std::string& engine,
+           const std::shared_ptr<ak::Form>& form)
+        -> std::shared_ptr<ak::Content> {
+    bool simdjson;
+    if (engine == std::string("rapidjson")) {
+      simdjson = false;
+    }
+    else if (engine == std::string("simdjson")) {
+      simdjson = true;
+    }
+    else {
+      throw std::invalid_argument(
+        std::string("JSON engine must be \"rapidjson\" or \"simdjson\", not \"")
+        + engine + std::string("\"") + FILENAME(__LINE__));
+    }
+    ak::ArrayBuilderOptions options(initial, resize);
     bool isarray = false;
     bool isrecord = false;
     for (char const &x: source) {
@@ -37,14 +64,28 @@ make_fromjson(py::module& m, const std::string& name) {
         break;
       }
     }
-    if (isarray) {
-      return ak::FromJsonString(
-        source.c_str(), ak::ArrayBuilderOptions(initial, resize));
+    if (isarray  ||  isrecord) {
+      std::shared_ptr<ak::Content> out;
+      if (simdjson) {
+        out = ak::FromJsonStringSimdjson(
+          source.c_str(), (int64_t)source.length(), form, options);
+      }
+      else if (form.get() == nullptr) {
+        out = ak::FromJsonString(source.c_str(), options);
+      }
+      else {
+        out = ak::FromJsonString(source.c_str(), form, options);
+      }
+      if (isrecord  &&  form.get() == nullptr) {
+        return out.get()->getitem_at_nowrap(0).get()->getitem_at_nowrap(0);
+      }
+      else if (isrecord) {
+        return out.get()->getitem_at_nowrap(0);
+      }
+      return out;
     }
-    if (isrecord) {
-      return ak::FromJsonString(
-        source.c_str(), ak::ArrayBuilderOptions(initial, resize)
-      ).get()->getitem_at_nowrap(0).get()->getitem_at_nowrap(0);
+    else if (simdjson) {
+      return ak::FromJsonFileSimdjson(source, form, options);
     }
     else {
 #ifdef _MSC_VER
@@ -61,9 +102,12 @@ make_fromjson(py::module& m, const std::string& name) {
       }
       std::shared_ptr<ak::Content> out(nullptr);
       try {
-        out = FromJsonFile(file,
-                           ak::ArrayBuilderOptions(initial, resize),
-                           buffersize);
+        if (form.get() == nullptr) {
+          out = FromJsonFile(file, options, buffersize);
+        }
+        else {
+          out = FromJsonFile(file, form, options, buffersize);
+        }
       }
       catch (...) {
         fclose(file);
@@ -75,7 +119,160 @@ make_fromjson(py::module& m, const std::string& name) {
   }, py::arg("source"),
       py::arg("initial") = 1024,
       py::arg("resize") = 1.5,
-      py::arg("buffersize") = 65536);
+      py::arg("buffersize") = 65536,
+      py::arg("engine") = "rapidjson",
+      py::arg("form") = py::none());
+}
+
+////////// fromjsonlines
+
+void
+make_fromjsonlines(py::module& m, const std::string& name) {
+  m.def(name.c_str(),
+        [](const std::string& source,
+           int64_t initial,
+           double resize,
+           int64_t chunksize,
+           int64_t threads,
+           const std::string& engine,
+           const std::shared_ptr<ak::Form>& form) -> py::list {
+    bool simdjson;
+    if (engine == std::string("rapidjson")) {
+      simdjson = false;
+    }
+    else if (engine == std::string("simdjson")) {
+      simdjson = true;
+    }
+    else {
+      throw std::invalid_argument(
+        std::string("JSON engine must be \"rapidjson\" or \"simdjson\", not \"")
+        + engine + std::string("\"") + FILENAME(__LINE__));
+    }
+    ak::ArrayBuilderOptions options(initial, resize);
+    bool istext = (source.find('\n') != std::string::npos);
+    for (char const &x: source) {
+      if (x != 9  &&  x != 10  &&  x != 13  &&  x != 32) {  // whitespace
+        istext = istext  ||  x == 91  ||  x == 123;     // [ or {
+        break;
+      }
+    }
+    std::vector<std::shared_ptr<ak::Content>> chunks;
+    {
+      py::gil_scoped_release release;
+      if (istext) {
+        chunks = ak::FromJsonLinesString(source.c_str(),
+                                         (int64_t)source.length(),
+                                         form,
+                                         options,
+                                         chunksize,
+                                         threads,
+                                         simdjson);
+      }
+      else {
+        chunks = ak::FromJsonLinesFile(source,
+                                       form,
+                                       options,
+                                       chunksize,
+                                       threads,
+                                       simdjson);
+      }
+    }
+    py::list out;
+    for (auto chunk : chunks) {
+      out.append(box(chunk));
+    }
+    return out;
+  }, py::arg("source"),
+      py::arg("initial") = 1024,
+      py::arg("resize") = 1.5,
+      py::arg("chunksize") = 0,
+      py::arg("threads") = 1,
+      py::arg("engine") = "rapidjson",
+      py::arg("form") = py::none());
+}
+
+////////// tojsonlines
+
+bool
+form_has_virtual(const ak::FormPtr& form) {
+  ak::Form* raw = form.get();
+  if (raw == nullptr  ||  dynamic_cast<ak::VirtualForm*>(raw)) {
+    return true;
+  }
+  else if (ak::BitMaskedForm* x = dynamic_cast<ak::BitMaskedForm*>(raw)) {
+    return form_has_virtual(x->content());
+  }
+  else if (ak::ByteMaskedForm* x = dynamic_cast<ak::ByteMaskedForm*>(raw)) {
+    return form_has_virtual(x->content());
+  }
+  else if (ak::IndexedForm* x = dynamic_cast<ak::IndexedForm*>(raw)) {
+    return form_has_virtual(x->content());
+  }
+  else if (ak::IndexedOptionForm* x =
+           dynamic_cast<ak::IndexedOptionForm*>(raw)) {
+    return form_has_virtual(x->content());
+  }
+  else if (ak::ListForm* x = dynamic_cast<ak::ListForm*>(raw)) {
+    return form_has_virtual(x->content());
+  }
+  else if (ak::ListOffsetForm* x = dynamic_cast<ak::ListOffsetForm*>(raw)) {
+    return form_has_virtual(x->content());
+  }
+  else if (ak::RegularForm* x = dynamic_cast<ak::RegularForm*>(raw)) {
+    return form_has_virtual(x->content());
+  }
+  else if (ak::UnmaskedForm* x = dynamic_cast<ak::UnmaskedForm*>(raw)) {
+    return form_has_virtual(x->content());
+  }
+  else if (ak::RecordForm* x = dynamic_cast<ak::RecordForm*>(raw)) {
+    for (auto content : x->contents()) {
+      if (form_has_virtual(content)) {
+        return true;
+      }
+    }
+    return false;
+  }
+  else if (ak::UnionForm* x = dynamic_cast<ak::UnionForm*>(raw)) {
+    for (auto content : x->contents()) {
+      if (form_has_virtual(content)) {
+        return true;
+      }
+    }
+    return false;
+  }
+  else {
+    return false;
+  }
+}
+
+void
+make_tojsonlines(py::module& m, const std::string& name) {
+  m.def(name.c_str(),
+        [](const py::object& array,
+           const py::object& write,
+           const py::object& maxdecimals,
+           int64_t chunksize,
+           int64_t threads) -> void {
+    std::shared_ptr<ak::Content> content = unbox_content(array);
+    int64_t decimals = check_maxdecimals(maxdecimals);
+    auto writer = [&write](const std::string& data) -> void {
+      py::gil_scoped_acquire acquire;
+      write(py::bytes(data));
+    };
+    if (form_has_virtual(content.get()->form(false))) {
+      // VirtualArrays call their Python generators and caches while being
+      // sliced and serialized, so they need the GIL (and only one thread)
+      ak::ToJsonLines(content, decimals, chunksize, 1, writer);
+    }
+    else {
+      py::gil_scoped_release release;
+      ak::ToJsonLines(content, decimals, chunksize, threads, writer);
+    }
+  }, py::arg("array"),
+     py::arg("write"),
+     py::arg("maxdecimals") = py::none(),
+     py::arg("chunksize") = 10000,
+     py::arg("threads") = 1);
 }
 
 ////////// fromroot
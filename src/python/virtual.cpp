@@ -371,6 +371,24 @@ make_PyArrayCache(const py::handle& m, const std::string& name) {
       .def(py::init<const py::object&>(),
            py::arg("mutablemapping"))
       .def_property_readonly("mutablemapping", &PyArrayCache::mutablemapping)
+      .def_property_readonly("nbytes", [](const PyArrayCache& self)
+                                       -> int64_t {
+        int64_t out = 0;
+        py::object mutablemapping = self.mutablemapping();
+        for (auto key : mutablemapping) {
+          py::object value;
+          try {
+            value = mutablemapping.attr("__getitem__")(key);
+          }
+          catch (py::error_already_set err) {
+            continue;
+          }
+          if (py::isinstance<ak::Content>(value)) {
+            out += unbox_content(value).get()->nbytes();
+          }
+        }
+        return out;
+      })
       .def("__repr__", [](const PyArrayCache& self) -> std::string {
         return self.tostring_part("", "", "");
       })
@@ -396,3 +414,54 @@ make_PyArrayCache(const py::handle& m, const std::string& name) {
 
   );
 }
+
+////////// LRUArrayCache
+
+py::class_<ak::LRUArrayCache, std::shared_ptr<ak::LRUArrayCache>>
+make_LRUArrayCache(const py::handle& m, const std::string& name) {
+  return (py::class_<ak::LRUArrayCache,
+                     std::shared_ptr<ak::LRUArrayCache>>(m, name.c_str())
+      .def(py::init<int64_t>(),
+           py::arg("max_bytes"))
+      .def_property_readonly("max_bytes", &ak::LRUArrayCache::max_bytes)
+      .def_property_readonly("nbytes", &ak::LRUArrayCache::nbytes)
+      .def("__repr__", [](const ak::LRUArrayCache& self) -> std::string {
+        return self.tostring_part("", "", "");
+      })
+      .def("__getitem__", [](const ak::LRUArrayCache& self,
+                             const std::string& key) -> py::object {
+        ak::ContentPtr out = self.get(key);
+        if (out.get() == nullptr) {
+          throw py::key_error(key);
+        }
+        return box(out);
+      })
+      .def("__setitem__", [](ak::LRUArrayCache& self,
+                             const std::string& key,
+                             const py::object& value) -> void {
+        self.set(key, unbox_content(value));
+      })
+      .def("__delitem__", [](ak::LRUArrayCache& self,
+                             const std::string& key) -> void {
+        if (!self.remove(key)) {
+          throw py::key_error(key);
+        }
+      })
+      .def("__contains__", [](const ak::LRUArrayCache& self,
+                              const py::object& key) -> bool {
+        try {
+          return self.has(key.cast<std::string>());
+        }
+        catch (py::cast_error err) {
+          return false;
+        }
+      })
+      .def("__iter__", [](const ak::LRUArrayCache& self) -> py::object {
+        return py::iter(py::cast(self.keys()));
+      })
+      .def("__len__", &ak::LRUArrayCache::length)
+      .def("keys", &ak::LRUArrayCache::keys)
+      .def("clear", &ak::LRUArrayCache::clear)
+
+  );
+}
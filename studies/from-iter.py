@@ -0,0 +1,53 @@
+# Compares ak.from_iter, which hands the whole sequence to the builder in
+# one call, with the old way of calling ArrayBuilder.fromiter on each
+# top-level item, for a list of dicts and a list of NumPy arrays.
+#
+#     python studies/from-iter.py [number of records]
+
+import random
+import sys
+import time
+
+import numpy
+
+import awkward1
+
+def records(n):
+    random.seed(12345)
+    return [
+        {
+            "id": i,
+            "latency": random.expovariate(0.1),
+            "ok": random.random() < 0.99,
+            "host": "node{0:03d}".format(random.randint(0, 999)),
+            "hits": [random.randint(0, 1000) for j in range(random.randint(0, 4))],
+        }
+        for i in range(n)
+    ]
+
+def per_item(data):
+    builder = awkward1.layout.ArrayBuilder()
+    for x in data:
+        builder.fromiter(x)
+    return builder.snapshot()
+
+def best_of(repeat, function):
+    out = None
+    for i in range(repeat):
+        start = time.time()
+        function()
+        elapsed = time.time() - start
+        if out is None or elapsed < out:
+            out = elapsed
+    return out
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    dicts = records(n)
+    arrays = [numpy.random.normal(0, 1, i % 10) for i in range(n // 5)]
+
+    for name, data in [("{0} dicts".format(n), dicts), ("{0} arrays".format(len(arrays)), arrays)]:
+        old = best_of(3, lambda: per_item(data))
+        new = best_of(3, lambda: awkward1.from_iter(data, highlevel=False))
+        print("{0:15s} per item {1:7.3f} s   bulk {2:7.3f} s   speedup {3:5.1f}x".format(
+            name, old, new, old / new))
@@ -0,0 +1,73 @@
+# Compares the "rapidjson" and "simdjson" engines of ak.from_json end to end
+# (parsing and building the Awkward Array) on synthetic log-like records:
+# a JSON array from a string and from a file, the same with a Form, and
+# JSON Lines with one and several threads.
+#
+#     python studies/json-engines.py [number of records] [threads]
+
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+import awkward1
+
+def records(n):
+    random.seed(12345)
+    for i in range(n):
+        yield {
+            "id": i,
+            "host": "node{0:03d}".format(random.randint(0, 999)),
+            "latency": random.expovariate(0.1),
+            "ok": random.random() < 0.99,
+            "tags": ["t{0}".format(random.randint(0, 9)) for j in range(random.randint(0, 4))],
+            "hits": [random.randint(0, 1000) for j in range(random.randint(0, 8))],
+        }
+
+def best_of(repeat, function):
+    out = None
+    for i in range(repeat):
+        start = time.time()
+        function()
+        elapsed = time.time() - start
+        if out is None or elapsed < out:
+            out = elapsed
+    return out
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count()
+
+    data = list(records(n))
+    source = json.dumps(data)
+    lines = "".join(json.dumps(x) + "\n" for x in data)
+    form = awkward1.from_iter(data[:1000], highlevel=False).form
+    print("{0} records, {1:.1f} MB".format(n, len(source) / 1e6))
+
+    fd, filename = tempfile.mkstemp(suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(source)
+
+        cases = [
+            ("string", len(source), lambda engine: awkward1.from_json(source, engine=engine)),
+            ("file", len(source), lambda engine: awkward1.from_json(filename, engine=engine)),
+            ("string+form", len(source), lambda engine: awkward1.from_json(source, engine=engine, form=form)),
+            ("lines", len(lines), lambda engine: awkward1.from_json(lines, engine=engine, lines=True, threads=1)),
+            ("lines x{0}".format(threads), len(lines), lambda engine: awkward1.from_json(lines, engine=engine, lines=True, threads=threads)),
+        ]
+
+        print("{0:14s} {1:>18s} {2:>18s} {3:>8s}".format("", "rapidjson", "simdjson", "speedup"))
+        for name, size, function in cases:
+            rapidjson = best_of(3, lambda: function("rapidjson"))
+            simdjson = best_of(3, lambda: function("simdjson"))
+            print("{0:14s} {1:7.3f} s {2:5.0f} MB/s {3:7.3f} s {4:5.0f} MB/s {5:7.2f}x".format(
+                name,
+                rapidjson, size / 1e6 / rapidjson,
+                simdjson, size / 1e6 / simdjson,
+                rapidjson / simdjson))
+    finally:
+        os.remove(filename)
@@ -0,0 +1,67 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+
+import pytest
+import numpy
+
+import awkward1
+
+@pytest.fixture
+def parallel():
+    previous = awkward1.parallel_reducers(threads=4, threshold=0)
+    yield
+    awkward1.parallel_reducers(*previous)
+
+def jagged():
+    numpy.random.seed(12345)
+    counts = numpy.random.poisson(3.5, 1000)
+    offsets = numpy.empty(len(counts) + 1, numpy.int64)
+    offsets[0] = 0
+    numpy.cumsum(counts, out=offsets[1:])
+    content = numpy.random.normal(0, 1, offsets[-1])
+    return awkward1.Array(awkward1.layout.ListOffsetArray64(
+        awkward1.layout.Index64(offsets),
+        awkward1.layout.NumpyArray(content)))
+
+def test_settings():
+    previous = awkward1.parallel_reducers(threads=3, threshold=123)
+    try:
+        assert awkward1.parallel_reducers() == (3, 123)
+        awkward1.parallel_reducers(threshold=456)
+        assert awkward1.parallel_reducers() == (3, 456)
+        # 0 (one thread per hardware thread) is kept, not resolved
+        awkward1.parallel_reducers(threads=0)
+        assert awkward1.parallel_reducers(*awkward1.parallel_reducers()) == (0, 456)
+        with pytest.raises(ValueError):
+            awkward1.parallel_reducers(threads=-1)
+    finally:
+        awkward1.parallel_reducers(*previous)
+    assert awkward1.parallel_reducers() == previous
+
+def test_innermost(parallel):
+    array = jagged()
+    expected = [sum(x) for x in awkward1.to_list(array)]
+    assert awkward1.to_list(awkward1.sum(array, axis=-1)) == expected
+    assert awkward1.to_list(awkward1.count(array, axis=-1)) == [len(x) for x in awkward1.to_list(array)]
+    assert awkward1.to_list(awkward1.max(array, axis=-1)) == [max(x) if len(x) > 0 else None for x in awkward1.to_list(array)]
+
+def test_positions(parallel):
+    array = jagged()
+    expected = [int(numpy.argmax(x)) if len(x) > 0 else None for x in awkward1.to_list(array)]
+    assert awkward1.to_list(awkward1.argmax(array, axis=-1)) == expected
+    expected = [int(numpy.argmin(x)) if len(x) > 0 else None for x in awkward1.to_list(array)]
+    assert awkward1.to_list(awkward1.argmin(array, axis=-1)) == expected
+
+def test_same_as_serial():
+    array = jagged()
+    previous = awkward1.parallel_reducers(threads=1)
+    try:
+        serial = [awkward1.to_list(awkward1.sum(array, axis=axis)) for axis in (0, 1, None)]
+        awkward1.parallel_reducers(threads=4, threshold=0)
+        parallel = [awkward1.to_list(awkward1.sum(array, axis=axis)) for axis in (0, 1, None)]
+    finally:
+        awkward1.parallel_reducers(*previous)
+    assert serial == parallel
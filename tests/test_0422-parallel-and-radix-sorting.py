@@ -0,0 +1,57 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+
+import pytest
+import numpy
+
+import awkward1
+
+def jagged(dtype, mean, length):
+    numpy.random.seed(12345)
+    counts = numpy.random.poisson(mean, length)
+    offsets = numpy.empty(len(counts) + 1, numpy.int64)
+    offsets[0] = 0
+    numpy.cumsum(counts, out=offsets[1:])
+    content = numpy.random.randint(-50, 50, offsets[-1]).astype(dtype)
+    return awkward1.Array(awkward1.layout.ListOffsetArray64(
+        awkward1.layout.Index64(offsets),
+        awkward1.layout.NumpyArray(content)))
+
+def test_settings():
+    previous = awkward1.parallel_sorting(threads=3, threshold=123)
+    try:
+        assert awkward1.parallel_sorting() == (3, 123)
+        # 0 (one thread per hardware thread) is kept, not resolved
+        awkward1.parallel_sorting(threads=0)
+        assert awkward1.parallel_sorting(*awkward1.parallel_sorting()) == (0, 123)
+        with pytest.raises(ValueError):
+            awkward1.parallel_sorting(threshold=-1)
+    finally:
+        awkward1.parallel_sorting(*previous)
+    assert awkward1.parallel_sorting() == previous
+
+@pytest.mark.parametrize("dtype", [numpy.int8, numpy.uint8, numpy.int32, numpy.int64, numpy.uint64, numpy.float64])
+@pytest.mark.parametrize("mean,length", [(3.5, 200), (1000, 8)])
+def test_sort(dtype, mean, length):
+    array = jagged(dtype, mean, length)
+    lists = awkward1.to_list(array)
+    previous = awkward1.parallel_sorting(threads=4, threshold=0)
+    try:
+        for ascending in (True, False):
+            expected = [sorted(x, reverse=not ascending) for x in lists]
+            assert awkward1.to_list(awkward1.sort(array, ascending=ascending)) == expected
+            index = awkward1.argsort(array, ascending=ascending)
+            assert awkward1.to_list(array[index]) == expected
+    finally:
+        awkward1.parallel_sorting(*previous)
+
+def test_radix_flat():
+    numpy.random.seed(12345)
+    for dtype in (numpy.int16, numpy.uint32, numpy.int64):
+        data = numpy.random.randint(0, 1000, 10000).astype(dtype)
+        array = awkward1.Array(data)
+        assert awkward1.to_list(awkward1.sort(array)) == numpy.sort(data).tolist()
+        assert awkward1.to_list(awkward1.argsort(array, stable=True)) == numpy.argsort(data, kind="stable").tolist()
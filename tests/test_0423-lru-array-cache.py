@@ -0,0 +1,86 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_eviction():
+    cache = awkward1.layout.LRUArrayCache(200)
+    assert cache.max_bytes == 200
+    assert len(cache) == 0
+
+    one = awkward1.layout.NumpyArray(numpy.arange(10, dtype=numpy.int64))
+    two = awkward1.layout.NumpyArray(numpy.arange(10, dtype=numpy.float64))
+    cache["one"] = one
+    cache["two"] = two
+    assert cache.nbytes == 160
+    assert list(cache) == ["two", "one"]
+
+    assert awkward1.to_list(cache["one"]) == list(range(10))
+    assert list(cache) == ["one", "two"]
+
+    cache["three"] = awkward1.layout.NumpyArray(numpy.arange(6, dtype=numpy.int64))
+    assert set(cache) == set(["three", "one"])
+    assert "two" not in cache
+    assert cache.nbytes == 128
+    with pytest.raises(KeyError):
+        cache["two"]
+
+    cache["big"] = awkward1.layout.NumpyArray(numpy.arange(100, dtype=numpy.int64))
+    assert "big" not in cache
+    assert len(cache) == 2
+
+    del cache["one"]
+    assert cache.nbytes == 48
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+    with pytest.raises(ValueError):
+        awkward1.layout.LRUArrayCache(-1)
+
+def test_virtual():
+    calls = []
+
+    def generate(i):
+        calls.append(i)
+        return awkward1.Array(numpy.arange(10, dtype=numpy.int64) * i)
+
+    cache = awkward1.layout.LRUArrayCache(160)
+    arrays = [
+        awkward1.virtual(generate, (i,), length=10, form="int64", cache=cache)
+        for i in range(3)
+    ]
+    assert arrays[0].layout.cache is cache
+    assert awkward1.to_list(arrays[0]) == [0] * 10
+    assert awkward1.to_list(arrays[1]) == list(range(10))
+    assert awkward1.to_list(arrays[0]) == [0] * 10
+    assert calls == [0, 1]
+
+    assert awkward1.to_list(arrays[2]) == list(range(0, 20, 2))
+    assert awkward1.to_list(arrays[0]) == [0] * 10
+    assert awkward1.to_list(arrays[1]) == list(range(10))
+    assert calls == [0, 1, 2, 1]
+
+def test_with_cache():
+    array = awkward1.virtual(lambda: awkward1.Array([1, 2, 3]), length=3)
+    cache = awkward1.layout.LRUArrayCache(1000)
+    array2 = awkward1.with_cache(array, cache)
+    assert awkward1.to_list(array2) == [1, 2, 3]
+    assert len(cache) == 1
+
+def test_arrayset():
+    array = awkward1.Array([{"x": [1.1, 2.2], "y": 1}, {"x": [], "y": 2}])
+    form, container, num_partitions = awkward1.to_arrayset(array)
+    cache = awkward1.layout.LRUArrayCache(1024)
+    lazy = awkward1.from_arrayset(
+        form, container, lazy=True, lazy_cache=cache, lazy_lengths=2
+    )
+    assert awkward1.to_list(lazy) == awkward1.to_list(array)
+    assert len(cache) > 0
+    assert cache.nbytes <= 1024
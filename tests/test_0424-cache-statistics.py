@@ -0,0 +1,113 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_hits_and_misses():
+    awkward1.cache_statistics(reset=True, per_key=True)
+    try:
+        calls = []
+        def generate(name, n):
+            calls.append(name)
+            return awkward1.layout.NumpyArray(numpy.arange(n, dtype=numpy.int64))
+        form = awkward1.forms.Form.fromjson('"int64"')
+
+        cache = awkward1.layout.ArrayCache({})
+        cached = awkward1.layout.VirtualArray(
+            awkward1.layout.ArrayGenerator(generate, ("one", 10), form=form, length=10),
+            cache,
+            cache_key="one",
+        )
+        uncached = awkward1.layout.VirtualArray(
+            awkward1.layout.ArrayGenerator(generate, ("two", 3), form=form, length=3),
+            cache_key="two",
+        )
+        for i in range(3):
+            assert awkward1.to_list(cached.array) == list(range(10))
+        for i in range(2):
+            assert awkward1.to_list(uncached.array) == [0, 1, 2]
+        assert calls == ["one", "two", "two"]
+
+        stats = awkward1.cache_statistics()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+        assert stats["bytes_generated"] == 80 + 2 * 24
+        assert stats["generate_seconds"] >= 0
+        assert set(stats["keys"]) == set(["one", "two"])
+        assert stats["keys"]["one"]["hits"] == 2
+        assert stats["keys"]["one"]["misses"] == 1
+        assert stats["keys"]["two"]["hits"] == 0
+        assert stats["keys"]["two"]["misses"] == 2
+
+        assert cache.nbytes == 80
+    finally:
+        awkward1.cache_statistics(reset=True, per_key=False)
+
+    stats = awkward1.cache_statistics()
+    assert stats["hits"] == 0 and stats["misses"] == 0 and stats["keys"] == {}
+
+def test_evictions():
+    awkward1.cache_statistics(reset=True)
+    cache = awkward1.layout.LRUArrayCache(100)
+    cache["one"] = awkward1.layout.NumpyArray(numpy.arange(10, dtype=numpy.int64))
+    cache["two"] = awkward1.layout.NumpyArray(numpy.arange(10, dtype=numpy.int64))
+    stats = awkward1.cache_statistics(reset=True)
+    assert stats["evictions"] == 1
+    assert stats["bytes_evicted"] == 80
+    assert stats["keys"] == {}
+
+def test_evictions_per_key():
+    awkward1.cache_statistics(reset=True, per_key=True)
+    try:
+        cache = awkward1.layout.LRUArrayCache(100)
+        cache["one"] = awkward1.layout.NumpyArray(numpy.arange(10, dtype=numpy.int64))
+        cache["two"] = awkward1.layout.NumpyArray(numpy.arange(5, dtype=numpy.int64))
+        cache["three"] = awkward1.layout.NumpyArray(numpy.arange(6, dtype=numpy.int64))
+        stats = awkward1.cache_statistics()
+        assert stats["evictions"] == 1
+        assert stats["keys"]["one"]["evictions"] == 1
+        assert stats["keys"]["one"]["bytes_evicted"] == 80
+        assert "two" not in stats["keys"]
+    finally:
+        awkward1.cache_statistics(reset=True, per_key=False)
+
+def test_evictions_same_key():
+    awkward1.cache_statistics(reset=True, per_key=True)
+    try:
+        form = awkward1.forms.Form.fromjson('"int64"')
+        cache = awkward1.layout.LRUArrayCache(100)
+        one = awkward1.layout.VirtualArray(
+            awkward1.layout.ArrayGenerator(lambda: awkward1.layout.NumpyArray(numpy.arange(10, dtype=numpy.int64)), form=form, length=10),
+            cache,
+            cache_key="one",
+        )
+        two = awkward1.layout.VirtualArray(
+            awkward1.layout.ArrayGenerator(lambda: awkward1.layout.NumpyArray(numpy.arange(5, dtype=numpy.int64)), form=form, length=5),
+            cache,
+            cache_key="two",
+        )
+        one.array
+        one.array
+        two.array    # evicts "one"
+        one.array    # generated again
+
+        stats = awkward1.cache_statistics()
+        assert stats["keys"]["one"] == {
+            "hits": 1,
+            "misses": 2,
+            "generate_seconds": stats["keys"]["one"]["generate_seconds"],
+            "evictions": 1,
+            "bytes_evicted": 80,
+        }
+        assert stats["keys"]["two"]["misses"] == 1
+        assert stats["keys"]["two"]["evictions"] == 1
+        assert set(stats["keys"]) == set(["one", "two"])
+    finally:
+        awkward1.cache_statistics(reset=True, per_key=False)
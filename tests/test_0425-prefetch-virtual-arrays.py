@@ -0,0 +1,52 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+import os
+import threading
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_prefetch():
+    generated = []
+    lock = threading.Lock()
+
+    def generate(partitionid, field):
+        with lock:
+            generated.append((partitionid, field))
+        return awkward1.Array(numpy.arange(5, dtype=numpy.int64) + 10 * partitionid)
+
+    cache = awkward1.layout.LRUArrayCache(2**20)
+    partitions = []
+    for partitionid in range(4):
+        fields = [
+            awkward1.virtual(generate, (partitionid, field), length=5, form="int64", cache=cache, highlevel=False)
+            for field in ("x", "y")
+        ]
+        partitions.append(awkward1.layout.RecordArray(fields, ["x", "y"], 5))
+    array = awkward1.partitioned(lambda i: partitions[i], 4)
+
+    results = []
+    for i, partition in enumerate(awkward1.prefetch(array, columns=["x"], ahead=2, threads=2)):
+        assert isinstance(partition, awkward1.Array)
+        assert all((j, "x") in generated for j in range(i + 1))
+        results.extend(awkward1.to_list(partition.x))
+
+    assert results == [i * 10 + j for i in range(4) for j in range(5)]
+    assert sorted(generated) == [(i, "x") for i in range(4)]
+
+def test_early_exit():
+    cache = {}
+    array = awkward1.partitioned(
+        lambda i: awkward1.virtual(lambda: numpy.arange(3) + i, length=3, cache=cache), 10
+    )
+    for partition in awkward1.prefetch(array, ahead=3):
+        break
+    assert 1 <= len(cache) <= 10
+
+    with pytest.raises(ValueError):
+        awkward1.prefetch(array, threads=0)
@@ -0,0 +1,86 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+def table():
+    out = pyarrow.Table.from_arrays(
+        [
+            pyarrow.array([1, 2, None]),
+            pyarrow.array([True, None, False]),
+            pyarrow.array(["a", "bc", None]),
+            pyarrow.array([[[1.5]], [[], None], [[None]]]),
+            pyarrow.array([{"x": 1, "y": "z"}, None, {"x": None, "y": "w"}]),
+            pyarrow.array(["q", "r", "q"]).dictionary_encode(),
+            pyarrow.array([1.1, 2.2, 3.3]),
+        ],
+        ["i", "b", "s", "ll", "r", "d", "f"],
+    )
+    schema = out.schema.set(6, pyarrow.field("f", pyarrow.float64(), False))
+    return out.cast(schema)
+
+
+def test_from_arrow():
+    array = awkward1.from_arrow(table(), highlevel=False)
+    forms = awkward1.operations.convert._arrow_schema_to_forms(table().schema)
+    for key in array.keys():
+        assert array[key].form == forms[key]
+
+
+def test_lazy_type(tmp_path):
+    filename = os.path.join(str(tmp_path), "test0426.parquet")
+    pyarrow_parquet.write_table(table(), filename)
+
+    eager = awkward1.from_parquet(filename)
+    awkward1.cache_statistics(reset=True)
+    lazy = awkward1.from_parquet(filename, lazy=True)
+    assert awkward1.type(lazy) == awkward1.type(eager)
+    assert awkward1.keys(lazy) == ["i", "b", "s", "ll", "r", "d", "f"]
+    assert awkward1.cache_statistics()["misses"] == 0
+
+    assert awkward1.to_list(lazy) == awkward1.to_list(eager)
+    assert awkward1.to_list(lazy.d) == ["q", "r", "q"]
+    assert awkward1.to_list(lazy.ll) == [[[1.5]], [[], None], [[None]]]
+
+
+def test_null_dictionary_values():
+    dictionary = pyarrow.array(["one", None, "three"])
+    indices = pyarrow.array([0, 1, None, 2, 1])
+    array = pyarrow.DictionaryArray.from_arrays(indices, dictionary)
+    assert awkward1.to_list(awkward1.from_arrow(array)) == ["one", None, None, "three", None]
+
+
+def test_dictionary_nullability(tmp_path):
+    dictionary = pyarrow.array(["q", "r", "q"]).dictionary_encode()
+    nullable = pyarrow.field("d", dictionary.type, True)
+    required = pyarrow.field("d", dictionary.type, False)
+
+    for field, expected in [
+        (nullable, "option[categorical[type=string]]"),
+        (required, "categorical[type=string]"),
+    ]:
+        table = pyarrow.Table.from_arrays([dictionary], schema=pyarrow.schema([field]))
+        array = awkward1.from_arrow(table)
+        assert str(awkward1.type(array.d)) == "3 * " + expected
+        forms = awkward1.operations.convert._arrow_schema_to_forms(table.schema)
+        assert array.d.layout.form == forms["d"]
+
+        filename = os.path.join(str(tmp_path), "test0426-{0}.parquet".format(field.nullable))
+        pyarrow_parquet.write_table(table, filename)
+        eager = awkward1.from_parquet(filename)
+        lazy = awkward1.from_parquet(filename, lazy=True)
+        assert awkward1.type(lazy) == awkward1.type(eager)
+        assert awkward1.to_list(lazy.d) == ["q", "r", "q"]
+
+    assert str(awkward1.type(awkward1.from_arrow(dictionary))) == "3 * categorical[type=string]"
@@ -0,0 +1,41 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+def test_threads(tmp_path):
+    filename = os.path.join(str(tmp_path), "test0427.parquet")
+    array = awkward1.Array(
+        [{"x": i, "y": [i] * (i % 4)} for i in range(100)]
+    )
+    awkward1.to_parquet(awkward1.repartition(array, 10), filename)
+
+    serial = awkward1.from_parquet(filename)
+    assert awkward1.partitions(serial) is None
+    parallel = awkward1.from_parquet(filename, threads=3)
+    assert awkward1.partitions(parallel) == [10] * 10
+    assert awkward1.to_list(parallel) == awkward1.to_list(serial)
+    assert awkward1.to_list(parallel) == awkward1.to_list(array)
+
+
+def test_row_groups(tmp_path):
+    filename = os.path.join(str(tmp_path), "test0427.parquet")
+    array = awkward1.Array(numpy.arange(100))
+    awkward1.to_parquet(awkward1.repartition(array, 10), filename)
+
+    assert awkward1.to_list(awkward1.from_parquet(filename, row_groups=3)) == list(range(30, 40))
+    assert awkward1.to_list(awkward1.from_parquet(filename, row_groups=[5, 1])) == list(range(50, 60)) + list(range(10, 20))
+    assert awkward1.to_list(awkward1.from_parquet(filename, row_groups=[5, 1], threads=2)) == list(range(50, 60)) + list(range(10, 20))
+    assert awkward1.to_list(awkward1.from_parquet(filename, row_groups=[5, 1], lazy=True)) == list(range(50, 60)) + list(range(10, 20))
+    with pytest.raises(ValueError):
+        awkward1.from_parquet(filename, row_groups=[10])
@@ -0,0 +1,55 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def filename(tmp_path):
+    out = os.path.join(str(tmp_path), "test0428.parquet")
+    table = pyarrow.Table.from_arrays(
+        [
+            pyarrow.array(numpy.arange(100)),
+            pyarrow.array(numpy.arange(100) % 7),
+            pyarrow.array([[i] for i in range(100)]),
+        ],
+        ["x", "y", "z"],
+    )
+    pyarrow_parquet.write_table(table, out, row_group_size=10)
+    return out
+
+
+def test_pruning(filename):
+    def xs(**kwargs):
+        return awkward1.to_list(awkward1.from_parquet(filename, **kwargs).x)
+
+    assert xs(filter=[("x", ">=", 85)]) == list(range(80, 100))
+    assert xs(filter=("x", "<", 10)) == list(range(10))
+    assert xs(filter=[("x", "==", 55)]) == list(range(50, 60))
+    assert xs(filter=[("x", "in", [5, 95])]) == list(range(10)) + list(range(90, 100))
+    assert xs(filter=[("x", ">", 20), ("x", "<", 30)]) == list(range(20, 30))
+    assert xs(filter=[[("x", "<", 10)], [("x", ">", 89)]]) == list(range(10)) + list(range(90, 100))
+    assert xs(filter=[("y", "==", 3)]) == list(range(100))
+    assert xs(filter=[("z", "==", 3)]) == list(range(100))
+    assert xs(filter=[("x", ">", 1000)]) == []
+    assert xs(filter=[]) == list(range(100))
+    assert xs(filter=()) == list(range(100))
+    assert xs(filter=[("x", ">=", 85)], lazy=True) == list(range(80, 100))
+    assert xs(filter=[("x", ">=", 85)], threads=2) == list(range(80, 100))
+
+
+def test_errors(filename):
+    with pytest.raises(ValueError):
+        awkward1.from_parquet(filename, filter=[("x", "~", 3)])
+    with pytest.raises(ValueError):
+        awkward1.from_parquet(filename, filter=[("nope", "==", 3)])
@@ -0,0 +1,69 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def filename(tmp_path):
+    out = os.path.join(str(tmp_path), "test0429.parquet")
+    table = pyarrow.Table.from_arrays(
+        [
+            pyarrow.array(numpy.arange(100)),
+            pyarrow.array([[i] * (i % 3) for i in range(100)]),
+        ],
+        ["x", "y"],
+    )
+    pyarrow_parquet.write_table(table, out, row_group_size=30)
+    return out
+
+
+def test_rows(filename):
+    expected = awkward1.to_list(awkward1.from_parquet(filename))
+
+    for step_size in (1, 7, 30, 45, 1000):
+        chunks = list(awkward1.iterate_parquet(filename, step_size=step_size))
+        assert all(isinstance(x, awkward1.Array) for x in chunks)
+        assert [len(x) for x in chunks[:-1]] == [step_size] * (len(chunks) - 1)
+        assert [y for x in chunks for y in awkward1.to_list(x)] == expected
+
+    chunks = list(awkward1.iterate_parquet(filename, ["y"], 40, row_groups=[3, 0]))
+    assert [len(x) for x in chunks] == [40]
+    assert awkward1.keys(chunks[0]) == ["y"]
+
+
+def test_bytes(filename):
+    chunks = list(awkward1.iterate_parquet(filename, ["x"], step_size="200 B"))
+    assert [len(x) for x in chunks[:-1]] == [24] * (len(chunks) - 1)
+    assert [y for x in chunks for y in awkward1.to_list(x.x)] == list(range(100))
+
+    with pytest.raises(ValueError):
+        awkward1.iterate_parquet(filename, step_size="lots")
+
+
+def test_bytes_sliced_and_lazy(tmp_path):
+    plain = os.path.join(str(tmp_path), "plain.parquet")
+    awkward1.to_parquet(awkward1.Array(numpy.arange(100, dtype=numpy.float64)), plain)
+    expected = [len(x) for x in awkward1.iterate_parquet(plain, step_size="200 B")]
+
+    sliced = os.path.join(str(tmp_path), "sliced.parquet")
+    array = awkward1.Array(numpy.arange(100000, dtype=numpy.float64))[:100]
+    awkward1.to_parquet(array, sliced)
+    assert [len(x) for x in awkward1.iterate_parquet(sliced, step_size="200 B")] == expected
+
+    lazy = os.path.join(str(tmp_path), "lazy.parquet")
+    form = awkward1.forms.Form.fromjson('"float64"')
+    array = awkward1.virtual(lambda: awkward1.layout.NumpyArray(numpy.arange(100, dtype=numpy.float64)), length=100, form=form)
+    awkward1.to_parquet(array, lazy)
+    assert [len(x) for x in awkward1.iterate_parquet(lazy, step_size="200 B")] == expected
+    assert len(expected) > 1
@@ -0,0 +1,62 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+def test_rows(tmp_path):
+    filename = os.path.join(str(tmp_path), "rows.parquet")
+    array = awkward1.Array([[i] * (i % 4) for i in range(100)])
+    awkward1.to_parquet(array, filename, row_group_size=30)
+    assert pyarrow_parquet.ParquetFile(filename).num_row_groups == 4
+    assert awkward1.to_list(awkward1.from_parquet(filename)) == awkward1.to_list(array)
+
+def test_bytes(tmp_path):
+    filename = os.path.join(str(tmp_path), "bytes.parquet")
+    array = awkward1.Array(numpy.arange(1000, dtype=numpy.float64))
+    awkward1.to_parquet(array, filename, row_group_size="1 kB")
+    assert pyarrow_parquet.ParquetFile(filename).num_row_groups == 8
+    assert awkward1.to_list(awkward1.from_parquet(filename)) == list(range(1000))
+
+def test_partitioned_records_overlap(tmp_path):
+    filename = os.path.join(str(tmp_path), "overlap.parquet")
+    array = awkward1.repartition(awkward1.Array([{"x": i, "y": [i] * (i % 3)} for i in range(50)]), 20)
+    awkward1.to_parquet(array, filename, row_group_size=7, overlap=True)
+    assert pyarrow_parquet.ParquetFile(filename).num_row_groups == 3 + 3 + 2
+    assert awkward1.to_list(awkward1.from_parquet(filename)) == awkward1.to_list(array)
+
+def test_errors(tmp_path):
+    filename = os.path.join(str(tmp_path), "errors.parquet")
+    with pytest.raises(ValueError):
+        awkward1.to_parquet(awkward1.Array([1, 2, 3]), filename, row_group_size=0)
+    with pytest.raises(ValueError):
+        awkward1.to_parquet(awkward1.Array([1, 2, 3]), filename, row_group_size="lots")
+
+def test_bytes_sliced_and_lazy(tmp_path):
+    # only the reachable part of a sliced array counts, not its whole buffer
+    filename = os.path.join(str(tmp_path), "sliced.parquet")
+    array = awkward1.Array(numpy.arange(100000, dtype=numpy.float64))[1000:2000]
+    awkward1.to_parquet(array, filename, row_group_size="1 kB")
+    assert pyarrow_parquet.ParquetFile(filename).num_row_groups == 8
+    assert awkward1.to_list(awkward1.from_parquet(filename)) == list(range(1000, 2000))
+
+    filename = os.path.join(str(tmp_path), "sliced-lists.parquet")
+    array = awkward1.Array([[i] * 2 for i in range(10000)])[5000:5100]
+    awkward1.to_parquet(array, filename, row_group_size="1 kB")
+    assert pyarrow_parquet.ParquetFile(filename).num_row_groups == 3
+    assert awkward1.to_list(awkward1.from_parquet(filename)) == awkward1.to_list(array)
+
+    # a VirtualArray's nbytes is 0 until it is materialized
+    filename = os.path.join(str(tmp_path), "lazy.parquet")
+    form = awkward1.forms.Form.fromjson('"float64"')
+    array = awkward1.virtual(lambda: awkward1.layout.NumpyArray(numpy.arange(1000, dtype=numpy.float64)), length=1000, form=form)
+    awkward1.to_parquet(array, filename, row_group_size="1 kB")
+    assert pyarrow_parquet.ParquetFile(filename).num_row_groups == 8
+    assert awkward1.to_list(awkward1.from_parquet(filename)) == list(range(1000))
@@ -0,0 +1,38 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+
+source = '[{"x": 1, "y": [1.1, 2, null]}, {"x": 18446744073709551615, "y": []}, {"x": -3, "y": [true, "hey", {"z": "\\u00e9"}]}]'
+
+def test_same_as_rapidjson():
+    for text in (source, '[[1, 2, 3], [], [4.5]]', '{"a": 1, "b": [1, 2]}', '[]'):
+        expected = awkward1.from_json(text)
+        result = awkward1.from_json(text, engine="simdjson")
+        assert awkward1.to_list(result) == awkward1.to_list(expected)
+        assert str(awkward1.type(result)) == str(awkward1.type(expected))
+
+def test_file(tmp_path):
+    filename = os.path.join(str(tmp_path), "test.json")
+    with open(filename, "w") as file:
+        file.write(source)
+    assert awkward1.to_list(awkward1.from_json(filename, engine="simdjson")) == awkward1.to_list(awkward1.from_json(source))
+
+def test_errors():
+    with pytest.raises(ValueError):
+        awkward1.from_json('[1, 2', engine="simdjson")
+    with pytest.raises(ValueError):
+        awkward1.from_json('[1, 2] [3]', engine="simdjson")
+    with pytest.raises(ValueError):
+        awkward1.from_json("/does/not/exist.json", engine="simdjson")
+
+def test_engine_name():
+    with pytest.raises(ValueError):
+        awkward1.from_json('[1, 2, 3]', engine="yajl")
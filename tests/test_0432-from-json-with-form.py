@@ -0,0 +1,118 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+records = {
+    "class": "RecordArray",
+    "contents": {
+        "x": "float64",
+        "y": {"class": "ListOffsetArray64", "offsets": "i64", "content": "int32"},
+        "z": {"class": "ByteMaskedArray", "mask": "i8", "valid_when": True, "content": {
+            "class": "ListOffsetArray64", "offsets": "i64", "content": {
+                "class": "NumpyArray", "format": "B", "itemsize": 1, "primitive": "uint8",
+                "parameters": {"__array__": "char"}},
+            "parameters": {"__array__": "string"}}},
+    },
+}
+
+def test_records():
+    source = '[{"x": 1, "y": [1, 2], "z": "one"}, {"y": [], "x": 2.2, "z": null}, {"x": 3, "y": [3]}]'
+    array = awkward1.from_json(source, form=records)
+    assert awkward1.to_list(array) == [
+        {"x": 1.0, "y": [1, 2], "z": "one"},
+        {"x": 2.2, "y": [], "z": None},
+        {"x": 3.0, "y": [3], "z": None},
+    ]
+    assert str(awkward1.type(array)) == '3 * {"x": float64, "y": var * int32, "z": option[string]}'
+    assert isinstance(array.layout, awkward1.layout.RecordArray)
+    assert isinstance(array.layout.field("z"), awkward1.layout.ByteMaskedArray)
+    assert numpy.asarray(array.layout.field("y").content).dtype == numpy.dtype(numpy.int32)
+
+def test_record_and_file(tmp_path):
+    record = awkward1.from_json('{"x": 1, "y": [], "z": "hey"}', form=records)
+    assert isinstance(record, awkward1.Record)
+    assert awkward1.to_list(record) == {"x": 1.0, "y": [], "z": "hey"}
+
+    filename = os.path.join(str(tmp_path), "test.json")
+    with open(filename, "w") as file:
+        file.write("[[1, 2, 3], [], [4, 5]]")
+    form = awkward1.forms.Form.fromjson('{"class": "ListArray32", "starts": "i32", "stops": "i32", "content": "int16"}')
+    array = awkward1.from_json(filename, form=form)
+    assert isinstance(array.layout, awkward1.layout.ListArray32)
+    assert awkward1.to_list(array) == [[1, 2, 3], [], [4, 5]]
+
+@pytest.mark.parametrize("form", [
+    '{"class": "IndexedOptionArray32", "index": "i32", "content": "int64"}',
+    '{"class": "BitMaskedArray", "mask": "u8", "valid_when": false, "lsb_order": true, "content": "int64"}',
+    '{"class": "UnmaskedArray", "content": "int64"}',
+    '{"class": "IndexedArrayU32", "index": "u32", "content": "int64"}',
+])
+def test_options(form):
+    expected = awkward1.forms.Form.fromjson(form)
+    if "Unmasked" in form or "Indexed" in form and "Option" not in form:
+        array = awkward1.from_json("[1, 2, 3, 4, 5, 6, 7, 8, 9]", form=form)
+        assert awkward1.to_list(array) == list(range(1, 10))
+    else:
+        array = awkward1.from_json("[1, null, 3, 4, 5, null, 7, 8, 9]", form=form)
+        assert awkward1.to_list(array) == [1, None, 3, 4, 5, None, 7, 8, 9]
+    assert array.layout.form.tojson() == expected.tojson()
+
+def test_regular():
+    form = '{"class": "RegularArray", "size": 2, "content": "bool"}'
+    array = awkward1.from_json("[[true, false], [false, false]]", form=form)
+    assert isinstance(array.layout, awkward1.layout.RegularArray)
+    assert awkward1.to_list(array) == [[True, False], [False, False]]
+    with pytest.raises(ValueError):
+        awkward1.from_json("[[true, false], [false]]", form=form)
+
+def test_mismatches():
+    with pytest.raises(ValueError):
+        awkward1.from_json("[1, 2.5]", form='"int64"')
+    with pytest.raises(ValueError):
+        awkward1.from_json("[1, null]", form='"int64"')
+    with pytest.raises(ValueError):
+        awkward1.from_json('[1, "two"]', form='"float64"')
+    with pytest.raises(ValueError):
+        awkward1.from_json('[{"x": 1, "y": [], "w": 3}]', form=records)
+    with pytest.raises(ValueError):
+        awkward1.from_json('[{"y": []}]', form=records)
+    with pytest.raises(ValueError):
+        awkward1.from_json('[[1, 2]]', form=records)
+    with pytest.raises(ValueError):
+        awkward1.from_json('[1]', form='{"class": "UnionArray8_64", "tags": "i8", "index": "i64", "contents": ["int64", "bool"]}')
+
+def test_integer_range():
+    assert awkward1.to_list(awkward1.from_json("[-128, 127]", form='"int8"')) == [-128, 127]
+    assert awkward1.to_list(awkward1.from_json("[0, 255]", form='"uint8"')) == [0, 255]
+    assert awkward1.to_list(awkward1.from_json("[18446744073709551615]", form='"uint64"')) == [18446744073709551615]
+    for source, form in [
+        ("[1, 128]", '"int8"'),
+        ("[1, -129]", '"int8"'),
+        ("[1, 300]", '"uint8"'),
+        ("[1, -1]", '"uint32"'),
+        ("[1, 4294967296]", '"uint32"'),
+        ("[1, -1]", '"uint64"'),
+        ("[18446744073709551615]", '"int64"'),
+    ]:
+        for engine in ("rapidjson", "simdjson"):
+            with pytest.raises(ValueError):
+                awkward1.from_json(source, form=form, engine=engine)
+
+def test_string_content():
+    form = '{"class": "ListOffsetArray64", "offsets": "i64", "content": "bool", "parameters": {"__array__": "string"}}'
+    with pytest.raises(ValueError):
+        awkward1.from_json('["one"]', form=form)
+
+def test_simdjson():
+    source = '[{"x": 1, "y": [1, 2], "z": "one"}, {"y": [], "x": 2.2, "z": null}, {"x": 3, "y": [3]}]'
+    expected = awkward1.from_json(source, form=records)
+    array = awkward1.from_json(source, form=records, engine="simdjson")
+    assert awkward1.to_list(array) == awkward1.to_list(expected)
+    assert array.layout.form.tojson() == expected.layout.form.tojson()
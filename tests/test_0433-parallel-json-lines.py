@@ -0,0 +1,86 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+import json
+
+import pytest
+import numpy
+
+import awkward1
+
+def records(n):
+    return [{"x": i, "y": list(range(i % 5))} for i in range(n)]
+
+def jsonlines(data):
+    return "\n".join(json.dumps(x) for x in data) + "\n"
+
+form = {
+    "class": "RecordArray",
+    "contents": {
+        "x": "int64",
+        "y": {"class": "ListOffsetArray64", "offsets": "i64", "content": "int64"},
+    },
+}
+
+def test_string():
+    data = records(10)
+    array = awkward1.from_json(jsonlines(data), lines=True)
+    assert isinstance(array.layout, awkward1.layout.RecordArray)
+    assert awkward1.to_list(array) == data
+    assert awkward1.to_list(awkward1.from_json('{"x": 1}\n\n{"x": 2}', lines=True)) == [{"x": 1}, {"x": 2}]
+    assert awkward1.to_list(awkward1.from_json("1\n2.5\n[3]\n", lines=True)) == [1, 2.5, [3]]
+
+@pytest.mark.parametrize("threads", [1, 3])
+def test_chunks(threads):
+    data = records(1000)
+    source = jsonlines(data)
+    array = awkward1.from_json(source, lines=True, threads=threads, chunk_size=1000)
+    assert isinstance(array.layout, awkward1.partition.IrregularlyPartitionedArray)
+    assert awkward1.to_list(array) == data
+    array = awkward1.from_json(source, lines=True, threads=threads, chunk_size="1 kB", partitioned=False)
+    assert isinstance(array.layout, awkward1.layout.RecordArray)
+    assert awkward1.to_list(array) == data
+    array = awkward1.from_json(source, lines=True, threads=threads)
+    assert awkward1.to_list(array) == data
+
+def test_form():
+    data = records(100)
+    array = awkward1.from_json(jsonlines(data), lines=True, threads=4, chunk_size=100, form=form)
+    assert isinstance(array.layout, awkward1.partition.IrregularlyPartitionedArray)
+    expected = awkward1.forms.Form.fromjson(json.dumps(form))
+    assert all(x.form == expected for x in array.layout.partitions)
+    assert awkward1.to_list(array) == data
+
+def test_mixed_types():
+    source = "\n".join(["1"] * 100 + ["2.5"] * 100)
+    array = awkward1.from_json(source, lines=True, threads=2, chunk_size=100)
+    assert str(awkward1.type(array)) == "200 * float64"
+    assert awkward1.to_list(array) == [1] * 100 + [2.5] * 100
+
+def test_file(tmp_path):
+    data = records(500)
+    filename = os.path.join(str(tmp_path), "test.jsonl")
+    with open(filename, "w") as file:
+        file.write(jsonlines(data))
+    array = awkward1.from_json(filename, lines=True, threads=2, chunk_size=512)
+    assert awkward1.to_list(array) == data
+
+def test_errors():
+    source = '{"x": 1}\n{"x": 2}\n{"x": \n{"x": 4}\n'
+    with pytest.raises(ValueError) as err:
+        awkward1.from_json(source, lines=True, threads=2, chunk_size=9)
+    assert "JSON error at char" in str(err.value)
+    with pytest.raises(ValueError):
+        awkward1.from_json('{"x": 1}\n{"x": "one"}\n', lines=True, form=form)
+    with pytest.raises(ValueError):
+        awkward1.from_json('{"x": 1}\n', lines=True, threads=0)
+
+def test_simdjson():
+    data = records(1000)
+    source = jsonlines(data)
+    array = awkward1.from_json(source, lines=True, threads=3, chunk_size=1000, engine="simdjson")
+    assert awkward1.to_list(array) == data
+    array = awkward1.from_json(source, lines=True, threads=3, chunk_size=1000, engine="simdjson", form=form)
+    assert awkward1.to_list(array) == data
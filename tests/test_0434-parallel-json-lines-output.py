@@ -0,0 +1,92 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+import io
+import json
+import gzip
+
+import pytest
+import numpy
+
+import awkward1
+
+def records(n):
+    return [{"x": i, "y": list(range(i % 5)), "z": None if i % 3 == 0 else "s" * (i % 4)} for i in range(n)]
+
+def expected(data):
+    return "".join(json.dumps(x, separators=(",", ":")) + "\n" for x in data)
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_string(threads):
+    data = records(1000)
+    array = awkward1.Array(data)
+    assert awkward1.to_json(array, lines=True, threads=threads, chunk_size=7) == expected(data)
+    assert awkward1.to_json(array[:0], lines=True, threads=threads) == ""
+    assert awkward1.to_json(awkward1.Array([1, 2.5, [3]]), lines=True, threads=threads, chunk_size=1) == "1.0\n2.5\n[3]\n"
+
+def test_partitioned():
+    data = records(100)
+    array = awkward1.repartition(awkward1.Array(data), 30)
+    assert isinstance(array.layout, awkward1.partition.PartitionedArray)
+    assert awkward1.to_json(array, lines=True, threads=3, chunk_size=8) == expected(data)
+
+def test_streams(tmp_path):
+    data = records(500)
+    array = awkward1.Array(data)
+
+    binary = io.BytesIO()
+    awkward1.to_json(array, binary, lines=True, threads=2, chunk_size=16)
+    assert binary.getvalue().decode("utf-8") == expected(data)
+
+    text = io.StringIO()
+    awkward1.to_json(array, text, lines=True, threads=2, chunk_size=16)
+    assert text.getvalue() == expected(data)
+
+    filename = os.path.join(str(tmp_path), "test.jsonl.gz")
+    with gzip.open(filename, "wb") as file:
+        awkward1.to_json(array, file, lines=True, threads=2, chunk_size=16)
+    with gzip.open(filename, "rb") as file:
+        assert file.read().decode("utf-8") == expected(data)
+
+    filename = os.path.join(str(tmp_path), "test.jsonl")
+    awkward1.to_json(array, filename, lines=True, threads=2, chunk_size=16)
+    assert awkward1.to_list(awkward1.from_json(filename, lines=True)) == data
+
+    text = io.StringIO()
+    awkward1.to_json(array, text)
+    assert json.loads(text.getvalue()) == data
+
+def test_errors():
+    array = awkward1.Array(records(100))
+
+    class Failing(object):
+        def __init__(self):
+            self.count = 0
+        def write(self, data):
+            self.count += 1
+            if self.count == 3:
+                raise IOError("disk full")
+
+    with pytest.raises(IOError):
+        awkward1.to_json(array, Failing(), lines=True, threads=4, chunk_size=5)
+    with pytest.raises(ValueError):
+        awkward1.to_json(array[0], lines=True)
+    with pytest.raises(ValueError):
+        awkward1.to_json(array, lines=True, pretty=True)
+    with pytest.raises(ValueError):
+        awkward1.to_json(array, lines=True, chunk_size=0)
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_virtual(threads):
+    form = awkward1.forms.Form.fromjson('"int64"')
+    array = awkward1.virtual(lambda: awkward1.layout.NumpyArray(numpy.arange(3)), length=3, form=form)
+    assert awkward1.to_json(array, lines=True, threads=threads) == "0\n1\n2\n"
+
+    data = records(100)
+    form, container, num_partitions = awkward1.to_arrayset(awkward1.Array(data))
+    lazy = awkward1.from_arrayset(form, container, lazy=True, lazy_lengths=100)
+    assert awkward1.to_json(lazy, lines=True, threads=threads, chunk_size=7) == expected(data)
+    lazy = awkward1.from_arrayset(form, container, lazy=True, lazy_lengths=100)
+    assert awkward1.to_json(lazy.y, lines=True, threads=threads, chunk_size=7) == expected([x["y"] for x in data])
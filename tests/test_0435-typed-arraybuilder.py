@@ -0,0 +1,95 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import json
+
+import pytest
+import numpy
+
+import awkward1
+
+form = {
+    "class": "RecordArray",
+    "contents": {
+        "x": "float64",
+        "y": {"class": "ListOffsetArray64", "offsets": "i64", "content": "int32"},
+        "z": {
+            "class": "ByteMaskedArray",
+            "mask": "i8",
+            "valid_when": True,
+            "content": {
+                "class": "ListOffsetArray64",
+                "offsets": "i64",
+                "content": {
+                    "class": "NumpyArray",
+                    "format": "B",
+                    "itemsize": 1,
+                    "primitive": "uint8",
+                    "parameters": {"__array__": "char"},
+                },
+                "parameters": {"__array__": "string"},
+            },
+        },
+    },
+}
+
+data = [
+    {"x": 1, "y": [1, 2], "z": "one"},
+    {"x": 2.2, "y": [], "z": None},
+    {"x": 3.3, "y": [3], "z": "three"},
+]
+
+def test_commands():
+    builder = awkward1.ArrayBuilder(form=form)
+    assert isinstance(builder._layout, awkward1.layout.TypedArrayBuilder)
+    for item in data:
+        builder.begin_record()
+        builder.field("x").real(item["x"])
+        builder.field("y").begin_list()
+        for y in item["y"]:
+            builder.integer(y)
+        builder.end_list()
+        if item["z"] is not None:
+            builder.field("z").string(item["z"])
+        builder.end_record()
+    assert len(builder) == 3
+    assert awkward1.to_list(builder.snapshot()) == [
+        {"x": 1.0, "y": [1, 2], "z": "one"},
+        {"x": 2.2, "y": [], "z": None},
+        {"x": 3.3, "y": [3], "z": "three"},
+    ]
+    assert str(awkward1.type(builder.snapshot())) == '3 * {"x": float64, "y": var * int32, "z": option[string]}'
+
+def test_append():
+    builder = awkward1.ArrayBuilder(form=form)
+    for item in data:
+        builder.append(item)
+    assert awkward1.to_list(builder) == awkward1.to_list(awkward1.Array(data))
+    with pytest.raises(TypeError):
+        builder.append(awkward1.Array(data)[0])
+    with pytest.raises(TypeError):
+        builder.extend(awkward1.Array(data))
+
+def test_from_iter():
+    array = awkward1.from_iter(data, form=form)
+    assert array.layout.form == awkward1.forms.Form.fromjson(json.dumps(form))
+    assert awkward1.to_list(array) == awkward1.to_list(awkward1.Array(data))
+    regular = '{"class": "RegularArray", "size": 2, "content": "int16"}'
+    array = awkward1.from_iter([[1, 2], numpy.array([3, 4])], form=regular)
+    assert str(awkward1.type(array)) == "2 * 2 * int16"
+    assert awkward1.to_list(array) == [[1, 2], [3, 4]]
+    record = awkward1.from_iter(data[0], form=form)
+    assert isinstance(record, awkward1.Record)
+    assert record.x == 1.0
+
+def test_errors():
+    builder = awkward1.ArrayBuilder(form='"int64"')
+    builder.integer(1)
+    with pytest.raises(ValueError):
+        builder.null()
+    with pytest.raises(ValueError):
+        builder.real(1.5)
+    with pytest.raises(ValueError):
+        awkward1.from_iter([{"x": 1, "y": [], "w": 2}], form=form)
+    assert awkward1.to_list(builder) == [1]
@@ -0,0 +1,65 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+numba = pytest.importorskip("numba")
+
+form = {
+    "class": "RecordArray",
+    "contents": {
+        "x": "float64",
+        "y": {"class": "ListOffsetArray64", "offsets": "i64", "content": "int32"},
+    },
+}
+
+def test_fill():
+    @numba.njit
+    def f1(builder, n):
+        for i in range(n):
+            builder.begin_record()
+            builder.field("x").real(i)
+            builder.field("y").begin_list()
+            for j in range(i):
+                builder.integer(j)
+            builder.end_list()
+            builder.end_record()
+        return builder
+
+    builder = awkward1.ArrayBuilder(form=form)
+    assert builder.numba_type.typed
+    out = f1(builder, 4)
+    assert isinstance(out._layout, awkward1.layout.TypedArrayBuilder)
+    assert awkward1.to_list(out.snapshot()) == [
+        {"x": 0.0, "y": []},
+        {"x": 1.0, "y": [0]},
+        {"x": 2.0, "y": [0, 1]},
+        {"x": 3.0, "y": [0, 1, 2]},
+    ]
+    assert str(awkward1.type(out.snapshot())) == '4 * {"x": float64, "y": var * int32}'
+
+def test_append():
+    @numba.njit
+    def f2(builder):
+        builder.append(1)
+        builder.append(None)
+        builder.append(2.5)
+        return len(builder)
+
+    builder = awkward1.ArrayBuilder(
+        form={"class": "IndexedOptionArray64", "index": "i64", "content": "float64"}
+    )
+    assert f2(builder) == 3
+    assert awkward1.to_list(builder.snapshot()) == [1.0, None, 2.5]
+
+def test_error():
+    @numba.njit
+    def f3(builder):
+        builder.null()
+
+    with pytest.raises(ValueError):
+        f3(awkward1.ArrayBuilder(form='"float64"'))
@@ -0,0 +1,35 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_builder():
+    data = [{"x": i * 1.1, "y": list(range(i % 7)), "z": None if i % 3 == 0 else i} for i in range(1000)]
+    builder = awkward1.ArrayBuilder(initial=8, chunked=True)
+    for i, item in enumerate(data):
+        builder.append(item)
+        if i == 500:
+            assert awkward1.to_list(builder.snapshot()) == data[:501]
+    assert awkward1.to_list(builder.snapshot()) == data
+    assert awkward1.to_list(builder.snapshot()) == data
+    assert builder.snapshot().layout.form == awkward1.from_iter(data).layout.form
+
+def test_promotion():
+    builder = awkward1.ArrayBuilder(initial=4, resize=2, chunked=True)
+    for i in range(100):
+        builder.integer(i)
+    builder.real(0.5)
+    builder.null()
+    assert awkward1.to_list(builder.snapshot()) == list(range(100)) + [0.5, None]
+
+def test_from_iter():
+    data = [[i] * (i % 4) for i in range(500)]
+    assert awkward1.to_list(awkward1.from_iter(data, initial=2, chunked=True)) == data
+    form = '{"class": "ListOffsetArray64", "offsets": "i64", "content": "int32"}'
+    array = awkward1.from_iter(data, initial=2, chunked=True, form=form)
+    assert str(awkward1.type(array)) == "500 * var * int32"
+    assert awkward1.to_list(array) == data
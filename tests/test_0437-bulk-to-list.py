@@ -0,0 +1,97 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+def iterated(layout):
+    if isinstance(layout, awkward1.layout.Record):
+        if layout.istuple:
+            return tuple(iterated(x) for x in layout.fields())
+        else:
+            return {n: iterated(x) for n, x in layout.fielditems()}
+    elif isinstance(layout, awkward1.layout.Content):
+        return [iterated(x) for x in layout]
+    else:
+        return layout
+
+def test_data():
+    data = [
+        {"x": 1, "y": [1.1, 2.2], "z": "one", "w": b"ONE", "v": None},
+        {"x": 2, "y": [], "z": "", "w": b"", "v": (1, [2])},
+        {"x": 3, "y": [3.3], "z": "thrée", "w": b"\xff", "v": None},
+    ]
+    array = awkward1.Array(data)
+    assert array.layout.tolist() == data
+    assert awkward1.to_list(array) == data
+    assert array.tolist() == data
+    assert awkward1.to_list(array[1]) == data[1]
+    assert awkward1.to_list(array[1:]) == data[1:]
+    assert awkward1.to_list(array[::-1]) == data[::-1]
+    assert awkward1.to_list(array[[2, 0, 2]]) == [data[2], data[0], data[2]]
+    assert awkward1.to_list(array.y[array.y > 2]) == [[2.2], [], [3.3]]
+
+def test_options_and_unions():
+    content = awkward1.layout.NumpyArray(numpy.arange(5, dtype=numpy.int32))
+    mask = awkward1.layout.Index8(numpy.array([0, 1, 0, 1, 1], numpy.int8))
+    bytemasked = awkward1.layout.ByteMaskedArray(mask, content, valid_when=False)
+    assert bytemasked.tolist() == [0, None, 2, None, None]
+    bits = awkward1.layout.IndexU8(numpy.packbits(numpy.array([1, 0, 1, 0, 0], numpy.uint8), bitorder="little"))
+    bitmasked = awkward1.layout.BitMaskedArray(bits, content, valid_when=True, length=5, lsb_order=True)
+    assert bitmasked.tolist() == [0, None, 2, None, None]
+    assert bitmasked[1:4].tolist() == [None, 2, None]
+    assert awkward1.layout.UnmaskedArray(content).tolist() == [0, 1, 2, 3, 4]
+
+    index = awkward1.layout.Index64(numpy.array([4, -1, 0, 0], numpy.int64))
+    assert awkward1.layout.IndexedOptionArray64(index, content).tolist() == [4, None, 0, 0]
+
+    union = awkward1.Array([1, "two", [3], 4.5, None, {"x": 6}])
+    assert awkward1.to_list(union) == [1, "two", [3], 4.5, None, {"x": 6}]
+    assert awkward1.to_list(union[::-2]) == [{"x": 6}, 4.5, "two"]
+
+def test_regular_and_numpy():
+    data = numpy.arange(2 * 3 * 4).reshape(2, 3, 4)
+    assert awkward1.Array(data).layout.tolist() == data.tolist()
+    assert awkward1.Array(data[:, ::2, 1:]).layout.tolist() == data[:, ::2, 1:].tolist()
+    regular = awkward1.layout.RegularArray(awkward1.layout.NumpyArray(data.ravel()), 6)
+    assert regular.tolist() == data.reshape(4, 6).tolist()
+    assert awkward1.layout.EmptyArray().tolist() == []
+    assert awkward1.Array(numpy.array([True, False])).layout.tolist() == [True, False]
+    strings = awkward1.Array(numpy.array([b"ab", b"c"]))
+    assert awkward1.to_list(strings) == [b"ab", b"c"]
+
+def test_partitioned():
+    data = [[i] * (i % 4) for i in range(100)]
+    array = awkward1.repartition(awkward1.Array(data), 17)
+    assert isinstance(array.layout, awkward1.partition.PartitionedArray)
+    assert awkward1.to_list(array) == data
+
+def test_virtual():
+    generator = awkward1.layout.ArrayGenerator(lambda: awkward1.Array([[1, 2], [3]]).layout)
+    virtual = awkward1.layout.VirtualArray(generator)
+    assert virtual.tolist() == [[1, 2], [3]]
+    record = awkward1.layout.RecordArray([virtual], ["x"])
+    assert awkward1.to_list(record) == [{"x": [1, 2]}, {"x": [3]}]
+
+def test_identities():
+    array = awkward1.Array([[1, 2], [], [3]])
+    layout = array.layout
+    layout.setidentities()
+    assert layout.tolist() == [[1, 2], [], [3]]
+    assert layout.identities is not None
+    assert layout.content.identities is not None
+
+def test_agrees_with_iteration():
+    numpy.random.seed(12345)
+    counts = numpy.random.poisson(2.5, 200)
+    offsets = numpy.concatenate([[0], numpy.cumsum(counts)])
+    array = awkward1.Array(awkward1.layout.ListOffsetArray64(
+        awkward1.layout.Index64(offsets),
+        awkward1.layout.NumpyArray(numpy.random.normal(0, 1, offsets[-1]))))
+    records = awkward1.zip({"a": array, "b": awkward1.num(array)}, depth_limit=1)
+    masked = awkward1.mask(records, awkward1.num(array) > 1)
+    for layout in (array.layout, records.layout, masked.layout):
+        assert layout.tolist() == [iterated(x) for x in layout]
@@ -0,0 +1,70 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import collections
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_builtins():
+    data = [{"x": i, "y": i * 1.1, "z": i % 2 == 0, "s": "é" * (i % 3), "l": list(range(i % 4))} for i in range(100)]
+    array = awkward1.from_iter(data)
+    assert str(awkward1.type(array)) == '100 * {"x": int64, "y": float64, "z": bool, "s": string, "l": var * int64}'
+    assert awkward1.to_list(array) == data
+    assert awkward1.to_list(awkward1.from_iter(x for x in data)) == data
+    assert awkward1.to_list(awkward1.from_iter(tuple(data))) == data
+    assert awkward1.to_list(awkward1.from_iter([(1, [None, b"x"]), (2, [])])) == [(1, [None, b"x"]), (2, [])]
+
+def test_subclasses():
+    class Int(int):
+        pass
+    class Str(str):
+        pass
+    class List(list):
+        pass
+    data = [collections.OrderedDict([("x", Int(1)), ("y", Str("one"))]), {"x": True, "y": "two"}]
+    assert awkward1.to_list(awkward1.from_iter(data)) == [{"x": 1, "y": "one"}, {"x": True, "y": "two"}]
+    assert awkward1.to_list(awkward1.from_iter(List([List([1, 2]), []]))) == [[1, 2], []]
+    assert awkward1.to_list(awkward1.from_iter([numpy.int32(3), numpy.float32(1.5), numpy.bool_(True)])) == [3, 1.5, True]
+
+@pytest.mark.parametrize("dtype", [numpy.bool_, numpy.int8, numpy.uint16, numpy.int32, numpy.uint64, numpy.float32, numpy.float64])
+def test_numpy(dtype):
+    arrays = [numpy.arange(i % 5).astype(dtype) for i in range(20)]
+    assert awkward1.to_list(awkward1.from_iter(arrays)) == [x.tolist() for x in arrays]
+
+def test_numpy_layouts():
+    data = numpy.arange(2 * 3 * 4, dtype=numpy.int16).reshape(2, 3, 4)
+    assert awkward1.to_list(awkward1.from_iter([data, data[:, ::2, ::-1]])) == [data.tolist(), data[:, ::2, ::-1].tolist()]
+    swapped = numpy.arange(5, dtype=">i4")
+    assert awkward1.to_list(awkward1.from_iter([swapped])) == [[0, 1, 2, 3, 4]]
+    halves = numpy.array([1.5, 2.5], numpy.float16)
+    assert awkward1.to_list(awkward1.from_iter([halves])) == [[1.5, 2.5]]
+    strings = numpy.array(["a", "bc"])
+    assert awkward1.to_list(awkward1.from_iter([strings])) == [["a", "bc"]]
+    assert awkward1.to_list(awkward1.from_iter([{"x": numpy.array([1.1, 2.2])}])) == [{"x": [1.1, 2.2]}]
+
+def test_typed():
+    form = {
+        "class": "RecordArray",
+        "contents": {
+            "x": "int64",
+            "y": {"class": "ListOffsetArray64", "offsets": "i64", "content": "float64"},
+        },
+    }
+    data = [{"x": i, "y": numpy.arange(i % 3, dtype=numpy.int32)} for i in range(10)]
+    array = awkward1.from_iter(data, form=form)
+    assert awkward1.to_list(array) == [{"x": i, "y": list(range(i % 3))} for i in range(10)]
+    assert str(awkward1.type(array)) == '10 * {"x": int64, "y": var * float64}'
+
+def test_errors():
+    with pytest.raises(ValueError):
+        awkward1.from_iter([numpy.array([2**63], numpy.uint64)])
+    with pytest.raises(OverflowError):
+        awkward1.from_iter([2**64])
+    with pytest.raises(ValueError):
+        awkward1.from_iter([{1: 2}])
+    with pytest.raises(ValueError):
+        awkward1.from_iter([object()])
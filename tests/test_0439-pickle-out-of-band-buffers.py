@@ -0,0 +1,57 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pickle
+
+import pytest
+import numpy
+
+import awkward1
+
+pytestmark = pytest.mark.skipif(not hasattr(pickle, "PickleBuffer"), reason="pickle protocol 5 requires Python 3.8")
+
+def test_array():
+    data = [{"x": [1, 2, 3], "y": "one"}, {"x": [], "y": None}, {"x": [4], "y": "three"}]
+    array = awkward1.Array(data)
+
+    buffers = []
+    stream = pickle.dumps(array, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == len(awkward1.to_arrayset(array)[1])
+    result = pickle.loads(stream, buffers=buffers)
+    assert isinstance(result, awkward1.Array)
+    assert awkward1.to_list(result) == data
+
+    assert awkward1.to_list(pickle.loads(pickle.dumps(array, protocol=5))) == data
+    assert awkward1.to_list(pickle.loads(pickle.dumps(array, protocol=4))) == data
+
+def test_zero_copy():
+    content = numpy.arange(1000000, dtype=numpy.float64)
+    array = awkward1.Array(content)
+
+    buffers = []
+    stream = pickle.dumps(array, protocol=5, buffer_callback=buffers.append)
+    assert len(stream) < 10000
+    assert len(buffers) == 1
+    assert numpy.shares_memory(numpy.asarray(buffers[0].raw()).view(numpy.float64), content)
+
+    result = pickle.loads(stream, buffers=buffers)
+    assert numpy.shares_memory(numpy.asarray(result), content)
+    assert awkward1.to_list(result[-3:]) == [999997.0, 999998.0, 999999.0]
+
+def test_record_and_partitions():
+    array = awkward1.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": []}])
+
+    buffers = []
+    stream = pickle.dumps(array[1], protocol=5, buffer_callback=buffers.append)
+    result = pickle.loads(stream, buffers=buffers)
+    assert isinstance(result, awkward1.Record)
+    assert awkward1.to_list(result) == {"x": 2, "y": []}
+
+    partitioned = awkward1.repartition(awkward1.Array(list(range(10))), 3)
+    buffers = []
+    stream = pickle.dumps(partitioned, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 4
+    result = pickle.loads(stream, buffers=buffers)
+    assert isinstance(result.layout, awkward1.partition.PartitionedArray)
+    assert awkward1.to_list(result) == list(range(10))
@@ -0,0 +1,77 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+data = [
+    {"x": 1, "y": [1.1, 2.2], "z": "one"},
+    {"x": 2, "y": [], "z": None},
+    {"x": 3, "y": [3.3], "z": "three"},
+]
+
+@pytest.mark.parametrize("directory", [False, True])
+def test_roundtrip(tmp_path, directory):
+    filename = os.path.join(str(tmp_path), "array.akset")
+    awkward1.to_arrayset_file(awkward1.Array(data), filename, directory=directory)
+    assert os.path.isdir(filename) == directory
+
+    array = awkward1.from_arrayset_file(filename)
+    assert awkward1.to_list(array) == data
+    assert str(awkward1.type(array)) == str(awkward1.type(awkward1.Array(data)))
+
+    lazy = awkward1.from_arrayset_file(filename, lazy=True)
+    assert len(lazy) == 3
+    assert awkward1.to_list(lazy.y) == [[1.1, 2.2], [], [3.3]]
+
+def test_memmap(tmp_path):
+    filename = os.path.join(str(tmp_path), "array.akset")
+    content = numpy.arange(100000, dtype=numpy.float64)
+    awkward1.to_arrayset_file(awkward1.Array(content), filename, alignment=4096)
+
+    array = awkward1.from_arrayset_file(filename, highlevel=False)
+    assert awkward1.to_list(array[-2:]) == [99998.0, 99999.0]
+
+    with open(filename, "rb") as file:
+        assert file.read(8) == b"AKARRSET"
+        file.seek(4096)
+        assert file.read(16) == content[:2].tobytes()
+
+    # the array is a view of the file, not a copy of it
+    if os.name != "nt":
+        with open(filename, "r+b") as file:
+            file.seek(4096)
+            file.write(numpy.array([123.0]).tobytes())
+        assert awkward1.to_list(array[:2]) == [123.0, 1.0]
+
+def test_partitioned(tmp_path):
+    filename = os.path.join(str(tmp_path), "array.akset")
+    array = awkward1.repartition(awkward1.Array(data * 10), 7)
+    awkward1.to_arrayset_file(array, filename)
+
+    result = awkward1.from_arrayset_file(filename)
+    assert isinstance(result.layout, awkward1.partition.IrregularlyPartitionedArray)
+    assert [len(x) for x in result.layout.partitions] == [7, 7, 7, 7, 2]
+    assert awkward1.to_list(result) == data * 10
+
+    lazy = awkward1.from_arrayset_file(filename, lazy=True)
+    assert awkward1.to_list(lazy.x) == [1, 2, 3] * 10
+
+def test_empty_buffers(tmp_path):
+    filename = os.path.join(str(tmp_path), "array.akset")
+    awkward1.to_arrayset_file(awkward1.Array([[], []]), filename)
+    assert awkward1.to_list(awkward1.from_arrayset_file(filename)) == [[], []]
+
+def test_errors(tmp_path):
+    filename = os.path.join(str(tmp_path), "other")
+    with open(filename, "wb") as file:
+        file.write(b"this is not an arrayset file at all")
+    with pytest.raises(ValueError):
+        awkward1.from_arrayset_file(filename)
+    with pytest.raises(ValueError):
+        awkward1.to_arrayset_file(awkward1.Array(data), filename, alignment=0)
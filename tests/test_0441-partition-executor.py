@@ -0,0 +1,110 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import functools
+
+import pytest
+import numpy
+
+import awkward1
+
+futures = pytest.importorskip("concurrent.futures")
+
+class Counting(object):
+    def __init__(self):
+        self.calls = 0
+        self.items = 0
+    def map(self, function, items):
+        items = list(items)
+        self.calls += 1
+        self.items += len(items)
+        return [function(x) for x in items]
+
+def partitioned():
+    data = [{"x": i, "y": list(range(i % 4))} for i in range(20)]
+    return data, awkward1.repartition(awkward1.Array(data), 6)
+
+def test_settings():
+    previous = awkward1.partition.set_executor("serial")
+    try:
+        assert awkward1.partition.set_executor("threads") == "serial"
+        with awkward1.partition.executor(None):
+            assert awkward1.partition.set_executor(None) is None
+            awkward1.partition.set_executor("processes")
+        assert awkward1.partition.set_executor("serial") == "threads"
+        with pytest.raises(ValueError):
+            awkward1.partition.set_executor("gpus")
+    finally:
+        awkward1.partition.set_executor(previous)
+
+def test_operations_use_executor():
+    data, array = partitioned()
+    counting = Counting()
+    with awkward1.partition.executor(counting):
+        assert awkward1.to_list(array.x + 1) == [x["x"] + 1 for x in data]
+        assert awkward1.to_list(numpy.sqrt(array.x)) == pytest.approx([numpy.sqrt(x["x"]) for x in data])
+        assert awkward1.to_list(awkward1.sum(array.y, axis=1)) == [sum(x["y"]) for x in data]
+        assert awkward1.to_list(array.y[:, :1]) == [x["y"][:1] for x in data]
+        assert awkward1.to_list(array[["x"]]) == [{"x": x["x"]} for x in data]
+        assert awkward1.to_list(awkward1.num(array.y)) == [len(x["y"]) for x in data]
+    assert counting.calls >= 6
+    assert counting.items % 4 == 0
+
+@pytest.mark.parametrize("executor", ["serial", "threads"])
+def test_results_agree(executor):
+    data, array = partitioned()
+    with awkward1.partition.executor(executor):
+        out = awkward1.partition.apply(
+            lambda x: awkward1.to_layout(awkward1.sum(awkward1.Array(x).y, axis=1)), array.layout
+        )
+        assert awkward1.to_list(out) == [sum(x["y"]) for x in data]
+
+        # nested partitioned operations inside a worker must not deadlock
+        out = awkward1.partition.apply(
+            lambda x: awkward1.to_layout(
+                awkward1.Array(awkward1.repartition(awkward1.Array(x), 1)).x * 2
+            ).toContent(),
+            array.layout,
+        )
+        assert awkward1.to_list(out) == [x["x"] * 2 for x in data]
+
+def test_nested_user_executor():
+    data, array = partitioned()
+    pool = futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        with awkward1.partition.executor(pool):
+            # the inner operation would wait forever for the only worker
+            out = awkward1.partition.apply(
+                lambda x: awkward1.to_layout(
+                    awkward1.Array(awkward1.repartition(awkward1.Array(x), 1)).x * 2
+                ).toContent(),
+                array.layout,
+            )
+            assert awkward1.to_list(out) == [x["x"] * 2 for x in data]
+    finally:
+        pool.shutdown()
+
+def test_worker_flag_restored():
+    inner = awkward1.partition._InWorker(lambda x: awkward1.partition._executor_local.inside)
+    outer = awkward1.partition._InWorker(lambda x: (inner(x), awkward1.partition._executor_local.inside))
+    assert outer(None) == (True, True)
+    assert not getattr(awkward1.partition._executor_local, "inside", False)
+
+def test_errors_propagate():
+    data, array = partitioned()
+    def fail(x):
+        raise ZeroDivisionError("boom")
+    with awkward1.partition.executor("threads"):
+        with pytest.raises(ZeroDivisionError):
+            awkward1.partition.apply(fail, array.layout)
+
+def test_processes():
+    data, array = partitioned()
+    function = functools.partial(awkward1.num, axis=1, highlevel=False)
+    with futures.ProcessPoolExecutor(2) as pool:
+        out = awkward1.partition.apply(function, array.y.layout, executor=pool)
+        assert awkward1.to_list(out) == [len(x["y"]) for x in data]
+        with awkward1.partition.executor(pool):
+            # closures are not sent to processes
+            assert awkward1.to_list(array.x * 2) == [x["x"] * 2 for x in data]
@@ -0,0 +1,67 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+shared_memory = pytest.importorskip("multiprocessing.shared_memory")
+
+def squares(array):
+    return array.x ** 2
+
+def prefix_names(array):
+    return awkward1.Array([{"name": "<" + x["z"] + ">", "n": len(x["y"])} for x in array])
+
+def keep_input(array):
+    keep_input.kept = array
+    return array.y
+
+def fail(array):
+    raise ZeroDivisionError("boom")
+
+def fail_one(array):
+    if array.x[0] == 6:
+        raise ZeroDivisionError("boom")
+    return array.x
+
+data = [{"x": i, "y": list(range(i % 4)), "z": str(i)} for i in range(20)]
+
+def test_partitioned():
+    array = awkward1.repartition(awkward1.Array(data), 6)
+    out = awkward1.partition.map_processes(squares, array, workers=2)
+    assert isinstance(out.layout, awkward1.partition.IrregularlyPartitionedArray)
+    assert [len(x) for x in out.layout.partitions] == [6, 6, 6, 2]
+    assert awkward1.to_list(out) == [x["x"] ** 2 for x in data]
+
+    out = awkward1.partition.map_processes(prefix_names, array, workers=2, highlevel=False)
+    assert isinstance(out, awkward1.partition.IrregularlyPartitionedArray)
+    assert awkward1.to_list(out) == [{"name": "<" + x["z"] + ">", "n": len(x["y"])} for x in data]
+
+def test_unpartitioned():
+    out = awkward1.partition.map_processes(squares, awkward1.Array(data), workers=1)
+    assert awkward1.to_list(out) == [x["x"] ** 2 for x in data]
+    out = awkward1.partition.map_processes(squares, awkward1.Array([{"x": 1}])[:0])
+    assert awkward1.to_list(out) == []
+
+def test_errors():
+    array = awkward1.repartition(awkward1.Array(data), 6)
+    with pytest.raises(ZeroDivisionError):
+        awkward1.partition.map_processes(fail, array, workers=2)
+
+    # a function that keeps a view of its input cannot release the segment
+    with pytest.raises(BufferError):
+        awkward1.partition.map_processes(keep_input, array, workers=1)
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs /dev/shm to list segments")
+def test_cleanup():
+    before = set(os.listdir("/dev/shm"))
+    array = awkward1.repartition(awkward1.Array(data), 3)
+    with pytest.raises(ZeroDivisionError):
+        awkward1.partition.map_processes(fail_one, array, workers=2)
+    awkward1.partition.map_processes(squares, array, workers=2)
+    assert set(os.listdir("/dev/shm")) - before == set()
@@ -0,0 +1,74 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+numpy.random.seed(12345)
+xdata = [list(numpy.random.normal(5, 2, i % 5)) for i in range(103)]
+ydata = [[x * 2 + numpy.random.normal() for x in xs] for xs in xdata]
+wdata = [[abs(numpy.random.normal()) for x in xs] for xs in xdata]
+
+x, y, w = awkward1.Array(xdata), awkward1.Array(ydata), awkward1.Array(wdata)
+px, py, pw = [awkward1.repartition(a, 10) for a in (x, y, w)]
+
+class Counting(object):
+    def __init__(self):
+        self.items = 0
+    def map(self, function, items):
+        items = list(items)
+        self.items += len(items)
+        return [function(x) for x in items]
+
+@pytest.mark.parametrize("name", ["count", "count_nonzero", "sum", "prod", "any", "all", "min", "max", "argmin", "argmax"])
+def test_reducers(name):
+    reducer = getattr(awkward1, name)
+    counting = Counting()
+    with awkward1.partition.executor(counting):
+        assert reducer(px) == pytest.approx(reducer(x))
+    assert counting.items == len(px.layout.partitions)
+
+def test_sliced_partitions():
+    array = awkward1.Array([[1, 2], [3], [4, 5, 6]])
+    assert awkward1.sum(array[:1]) == 3
+    assert awkward1.count(awkward1.repartition(array, 1)) == 6
+    assert awkward1.argmax(awkward1.repartition(array, 2)) == 5
+    regular = awkward1.Array(numpy.arange(12).reshape(4, 3))
+    assert awkward1.sum(regular[1:2]) == 12
+
+def test_empty_partitions():
+    array = awkward1.repartition(awkward1.Array([[], [1.5], [], [], [0.5, 2.5]]), 2)
+    assert awkward1.min(array) == 0.5
+    assert awkward1.argmin(array) == 1
+    assert awkward1.argmax(array) == 2
+    assert awkward1.mean(array) == 1.5
+    assert awkward1.var(array) == pytest.approx(2.0 / 3.0)
+    empty = awkward1.repartition(awkward1.Array([[], []]), 1)
+    assert awkward1.min(empty) is None
+    assert awkward1.argmin(empty) is None
+    assert awkward1.sum(empty) == 0
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_statistics(weighted):
+    kwargs = {"weight": w} if weighted else {}
+    pkwargs = {"weight": pw} if weighted else {}
+    assert awkward1.mean(px, **pkwargs) == pytest.approx(awkward1.mean(x, **kwargs))
+    assert awkward1.moment(px, 2, **pkwargs) == pytest.approx(awkward1.moment(x, 2, **kwargs))
+    assert awkward1.var(px, **pkwargs) == pytest.approx(awkward1.var(x, **kwargs))
+    assert awkward1.var(px, ddof=1, **pkwargs) == pytest.approx(awkward1.var(x, ddof=1, **kwargs))
+    assert awkward1.std(px, **pkwargs) == pytest.approx(awkward1.std(x, **kwargs))
+    assert awkward1.covar(px, py, **pkwargs) == pytest.approx(awkward1.covar(x, y, **kwargs))
+    assert awkward1.corr(px, py, **pkwargs) == pytest.approx(awkward1.corr(x, y, **kwargs))
+    expected = awkward1.to_list(awkward1.linear_fit(x, y, **kwargs))
+    result = awkward1.to_list(awkward1.linear_fit(px, py, **pkwargs))
+    assert list(result.keys()) == list(expected.keys())
+    for key in expected:
+        assert result[key] == pytest.approx(expected[key])
+
+def test_mixed_partitioning():
+    assert awkward1.mean(px, weight=w) == pytest.approx(awkward1.mean(x, weight=w))
+    assert awkward1.covar(px, y) == pytest.approx(awkward1.covar(x, y))
+    assert awkward1.mean(px, weight=2) == pytest.approx(awkward1.mean(x))
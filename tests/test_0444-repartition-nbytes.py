@@ -0,0 +1,62 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_estimate():
+    array = awkward1.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    assert awkward1._util.estimate_nbytes(array.layout) == 4 * 8 + 5 * 8
+    assert awkward1._util.estimate_nbytes(array.layout[1:]) == 3 * 8 + 2 * 8
+    assert awkward1._util.estimate_nbytes(awkward1.Array(numpy.zeros((4, 3))).layout) == 96
+    assert awkward1._util.estimate_nbytes(awkward1.Array([1, None, 3]).layout) == 40
+    assert awkward1._util.estimate_nbytes(awkward1.Array([1, "a", [2]]).layout) > 0
+
+def test_repartition():
+    data = [{"x": i, "y": [1.5] * (i % 7), "z": None if i % 3 == 0 else "s" * (i % 4)} for i in range(1000)]
+    array = awkward1.Array(data)
+    # merging partitions may change the representation (e.g. to ListArray)
+    for original, high in [(array, 4500), (awkward1.repartition(array, [10, 500, 490]), 5500)]:
+        out = awkward1.repartition(original, nbytes=4000)
+        assert awkward1.to_list(out) == data
+        sizes = [awkward1._util.estimate_nbytes(x) for x in out.layout.partitions]
+        assert all(3500 < x < high for x in sizes[:-1])
+        assert sizes[-1] < high
+
+    assert awkward1.repartition(awkward1.Array([[], []]), nbytes=10, highlevel=False).lengths == [1, 1]
+    assert awkward1.repartition(awkward1.Array([]), nbytes=10, highlevel=False).lengths == [0]
+    with pytest.raises(ValueError):
+        awkward1.repartition(array, 10, nbytes=10)
+    with pytest.raises(ValueError):
+        awkward1.repartition(array, nbytes=0)
+
+def test_lazy():
+    calls = []
+    def generate(i):
+        calls.append(i)
+        return awkward1.layout.RecordArray(
+            [awkward1.layout.NumpyArray(numpy.arange(1000.0)), awkward1.layout.NumpyArray(numpy.arange(1000, dtype=numpy.int32))],
+            ["x", "y"],
+        )
+    form = awkward1.forms.Form.fromjson('{"class": "RecordArray", "contents": {"x": "float64", "y": "int32"}}')
+    lazy = awkward1.partition.IrregularlyPartitionedArray([
+        awkward1.layout.VirtualArray(awkward1.layout.ArrayGenerator(generate, (i,), form=form, length=1000))
+        for i in range(5)
+    ])
+    assert awkward1._util.estimate_nbytes(lazy) == 5 * 1000 * 12
+    assert calls == []
+
+    out = awkward1.repartition(lazy, nbytes=3000 * 12, highlevel=False)
+    assert out.lengths == [3000, 2000]
+    assert awkward1.to_list(out[2999]) == {"x": 999.0, "y": 999}
+
+def test_lazy_arrayset():
+    array = awkward1.repartition(awkward1.Array({"x": numpy.arange(100.0), "y": numpy.arange(100)}), 30)
+    form, container, num_partitions = awkward1.to_arrayset(array)
+    lazy = awkward1.from_arrayset(form, container, num_partitions, lazy=True, lazy_lengths=[30, 30, 30, 10])
+    out = awkward1.repartition(lazy, nbytes=40 * 16)
+    assert out.layout.lengths == [40, 40, 20]
+    assert awkward1.to_list(out.y) == list(range(100))
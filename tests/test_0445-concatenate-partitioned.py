@@ -0,0 +1,111 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_partitioned():
+    one = awkward1.Array([[1.1, 2.2], [], [3.3]])
+    two = awkward1.Array([[4.4], [5.5, 6.6]])
+    out = awkward1.concatenate([one, awkward1.Array([[1.1]])[:0], two], partitioned=True)
+    assert isinstance(out.layout, awkward1.partition.IrregularlyPartitionedArray)
+    assert out.layout.lengths == [3, 2]
+    assert awkward1.to_list(out) == [[1.1, 2.2], [], [3.3], [4.4], [5.5, 6.6]]
+
+    # the partitions are the original arrays, not copies
+    content = numpy.asarray(out.layout.partitions[0].content)
+    assert numpy.shares_memory(content, numpy.asarray(one.layout.content))
+
+    nested = awkward1.concatenate([out, two], highlevel=False)
+    assert nested.lengths == [3, 2, 2]
+
+    empty = awkward1.concatenate([one[:0], two[:0]], partitioned=True)
+    assert len(empty) == 0
+
+def test_types():
+    one = awkward1.Array([1, 2, 3])
+    other = awkward1.Array([[1], [2]])
+    with pytest.raises(ValueError):
+        awkward1.concatenate([one, other], partitioned=True)
+    assert awkward1.to_list(awkward1.concatenate([one, other])) == [1, 2, 3, [1], [2]]
+
+    # same type, different representations
+    listarray = awkward1.Array([[1, 2], [3]]).layout[[1, 0]]
+    out = awkward1.concatenate([awkward1.Array([[4]]), listarray], partitioned=True)
+    assert awkward1.to_list(out) == [[4], [3], [1, 2]]
+
+def test_mixed_partitions():
+    mixed = awkward1.partition.IrregularlyPartitionedArray([
+        awkward1.Array([1, 2, 3]).layout,
+        awkward1.Array([[4], [5, 6]]).layout,
+    ])
+    other = awkward1.Array([7.7])
+    out = awkward1.concatenate([awkward1.Array(mixed), other])
+    assert awkward1.to_list(out) == [1, 2, 3, [4], [5, 6], 7.7]
+    assert not isinstance(out.layout, awkward1.partition.PartitionedArray)
+    with pytest.raises(ValueError):
+        awkward1.concatenate([awkward1.Array(mixed), other], partitioned=True)
+
+def test_automatic():
+    small = awkward1.Array(numpy.arange(10))
+    assert isinstance(awkward1.concatenate([small, small], highlevel=False), awkward1.layout.NumpyArray)
+    assert isinstance(awkward1.concatenate([small, small], partitioned=False, highlevel=False), awkward1.layout.NumpyArray)
+
+    partitioned = awkward1.repartition(small, 3)
+    out = awkward1.concatenate([partitioned, small], highlevel=False)
+    assert out.lengths == [3, 3, 3, 1, 10]
+    assert isinstance(awkward1.concatenate([partitioned, small], partitioned=False, highlevel=False), awkward1.layout.NumpyArray)
+
+    previous = awkward1.operations.structure._concatenate_partitioned_nbytes
+    awkward1.operations.structure._concatenate_partitioned_nbytes = 100
+    try:
+        out = awkward1.concatenate([small, small], highlevel=False)
+        assert isinstance(out, awkward1.partition.IrregularlyPartitionedArray)
+        assert awkward1.to_list(out) == list(range(10)) * 2
+    finally:
+        awkward1.operations.structure._concatenate_partitioned_nbytes = previous
+
+def test_lazy():
+    calls = []
+    def generate(i):
+        calls.append(i)
+        return awkward1.layout.NumpyArray(numpy.arange(5.0) + i)
+    form = awkward1.forms.Form.fromjson('"float64"')
+    lazy = [
+        awkward1.Array(awkward1.layout.VirtualArray(awkward1.layout.ArrayGenerator(generate, (i,), form=form, length=5)))
+        for i in range(3)
+    ]
+    out = awkward1.concatenate(lazy, partitioned=True)
+    assert calls == []
+    assert awkward1.to_list(out[5:7]) == [1.0, 2.0]
+
+def test_internal_callers(monkeypatch, tmp_path):
+    monkeypatch.setattr(awkward1.operations.structure, "_concatenate_partitioned_nbytes", 1)
+    pyarrow = pytest.importorskip("pyarrow")
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+    chunked = pyarrow.chunked_array([pyarrow.array([1, 2, 3]), pyarrow.array([4, 5])])
+    out = awkward1.from_arrow(chunked, highlevel=False)
+    assert not isinstance(out, awkward1.partition.PartitionedArray)
+    assert awkward1.to_list(out) == [1, 2, 3, 4, 5]
+
+    table = pyarrow.Table.from_batches([
+        pyarrow.RecordBatch.from_arrays([pyarrow.array([1, 2])], ["x"]),
+        pyarrow.RecordBatch.from_arrays([pyarrow.array([3])], ["x"]),
+    ])
+    out = awkward1.from_arrow(table, highlevel=False)
+    assert not isinstance(out, awkward1.partition.PartitionedArray)
+    assert awkward1.to_list(out) == [{"x": 1}, {"x": 2}, {"x": 3}]
+
+    out = awkward1.from_json("1\n2\n3\n4\n", lines=True, chunk_size=2, partitioned=False, highlevel=False)
+    assert not isinstance(out, awkward1.partition.PartitionedArray)
+    assert awkward1.to_list(out) == [1, 2, 3, 4]
+
+    filename = str(tmp_path / "test.parquet")
+    awkward1.to_parquet(awkward1.Array(numpy.arange(10)), filename, row_group_size=3)
+    for out in awkward1.iterate_parquet(filename, step_size=7, highlevel=False):
+        assert not isinstance(out, awkward1.partition.PartitionedArray)
+    assert [len(x) for x in awkward1.iterate_parquet(filename, step_size=7)] == [7, 3]